@@ -54,6 +54,14 @@ def create_app():
         import traceback
         traceback.print_exc()
     
+    # 모델 백그라운드 워밍업 (선택사항, MODEL_WARMUP_ENABLED=true)
+    # VectorSearchService를 백그라운드 스레드에서 미리 로딩하고 더미 임베딩 1회 실행
+    # 준비 상태는 /api/ready에서 확인 (로드밸런서 헬스체크용)
+    from app.services.common.warmup import is_warmup_enabled, schedule_background_warmup
+    if is_warmup_enabled():
+        schedule_background_warmup()
+        print("[INFO] VectorSearchService 백그라운드 워밍업 예약됨")
+    
     # 라우트 등록
     # 1. 통합 검색 엔드포인트 (SearchService 기반)
     #    - /api/search: 자연어 질의 → 자동 전략 선택 → 검색 실행
@@ -85,4 +93,8 @@ def create_app():
     from app.routes import export_routes
     app.register_blueprint(export_routes.bp)
     
+    # 준비 상태 라우트 (/api/ready)
+    from app.routes import health_routes
+    app.register_blueprint(health_routes.bp)
+    
     return app
@@ -10,6 +10,21 @@ from app.config import Config
 _connection_pool: Optional[pool.ThreadedConnectionPool] = None
 _last_db_config: Optional[Dict[str, Any]] = None
 
+POOL_MAX_CONN = 20
+
+
+def _get_pool_minconn() -> int:
+    """
+    풀이 유지하는 유휴 연결 수 (DB_POOL_MINCONN 환경변수)
+    - ThreadedConnectionPool은 유휴 연결이 minconn개를 넘으면 반환된 연결을 닫음
+    - DB_PREPARED_STATEMENTS=true이면 기본값을 maxconn으로 두어 연결(과 준비된 statement)을 닫지 않고 재사용
+    - 그 외 기본값 1
+    """
+    import os
+    prepared = os.environ.get("DB_PREPARED_STATEMENTS", "false").lower() in ("1", "true", "yes")
+    default = POOL_MAX_CONN if prepared else 1
+    return min(max(int(os.environ.get("DB_POOL_MINCONN", str(default))), 1), POOL_MAX_CONN)
+
 
 def get_db_connection() -> connection:
     """데이터베이스 연결 풀에서 연결 가져오기"""
@@ -32,8 +47,8 @@ def get_db_connection() -> connection:
             print(f"[DEBUG] DB 연결 시도: host={db_config['host']}, port={db_config['port']}, database={db_config['database']}, user={db_config['user']}, sslmode={ssl_mode}")
             
             _connection_pool = pool.ThreadedConnectionPool(
-                minconn=1,
-                maxconn=20,
+                minconn=_get_pool_minconn(),
+                maxconn=POOL_MAX_CONN,
                 host=db_config['host'],
                 port=db_config['port'],
                 database=db_config['database'],
@@ -0,0 +1,62 @@
+"""
+pgvector 파라미터 어댑터 (psycopg2)
+- numpy 배열을 PgVector로 감싸 쿼리 파라미터로 넘기면 '[...]'::vector 리터럴로 직렬화
+- psycopg2는 파라미터를 항상 클라이언트에서 텍스트 리터럴로 치환하므로 (바이너리 전송 미지원)
+  float32를 정확히 복원하는 최소 유효자릿수(9자리)로 한 번에 포맷하여 직렬화 CPU와 쿼리 크기를 줄임
+  (기존 str(float) 방식은 float32 → float64 변환 때문에 값마다 17자리 이상 출력)
+- 저장된 벡터를 읽을 때는 vector_send / halfvec_send(bytea)로 pgvector 바이너리 형식을 받아 디코딩
+  (psycopg2는 결과를 텍스트로만 받으므로 ::text / register_vector 캐스터는 768개 실수를 문자열로 파싱)
+"""
+from typing import Any
+import numpy as np
+from pgvector import HalfVector, Vector
+from psycopg2.extensions import AsIs, register_adapter
+
+
+_ALLOWED_TYPES = {"vector", "halfvec"}
+_BINARY_TYPES = {"vector": Vector, "halfvec": HalfVector}
+
+
+class PgVector:
+    """pgvector 파라미터 래퍼 (float32 1차원 배열)"""
+
+    __slots__ = ("values", "type_name")
+
+    def __init__(self, values: Any, type_name: str = "vector"):
+        if type_name not in _ALLOWED_TYPES:
+            raise ValueError(f"지원하지 않는 벡터 타입: {type_name}")
+        arr = np.asarray(values, dtype=np.float32).ravel()
+        if arr.size == 0:
+            raise ValueError("빈 벡터는 사용할 수 없습니다.")
+        if not np.all(np.isfinite(arr)):
+            raise ValueError("벡터에 NaN/Inf 값이 포함되어 있습니다.")
+        self.values = arr
+        self.type_name = type_name
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    def to_text(self) -> str:
+        """pgvector 텍스트 표현 '[v1,v2,...]'"""
+        n = self.values.size
+        return "[" + (("%.9g," * n)[:-1] % tuple(self.values.tolist())) + "]"
+
+
+def _adapt_pg_vector(vector: PgVector) -> AsIs:
+    # 숫자/부호/지수 문자만 포함되므로 별도 이스케이프 불필요
+    return AsIs(f"'{vector.to_text()}'::{vector.type_name}")
+
+
+register_adapter(PgVector, _adapt_pg_vector)
+
+
+def binary_select(column: str, type_name: str = "vector") -> str:
+    """저장된 벡터 컬럼을 pgvector 바이너리 형식(bytea)으로 조회하는 SELECT 식"""
+    if type_name not in _ALLOWED_TYPES:
+        raise ValueError(f"지원하지 않는 벡터 타입: {type_name}")
+    return f"{type_name}_send({column})"
+
+
+def from_binary(data: Any, type_name: str = "vector") -> np.ndarray:
+    """binary_select로 받은 bytea(memoryview) → float32 1차원 배열"""
+    return _BINARY_TYPES[type_name].from_binary(data).to_numpy().astype(np.float32, copy=False)
@@ -0,0 +1,71 @@
+"""
+준비 상태(readiness) 엔드포인트
+- /api/ready: DB 연결 풀, 임베딩 모델, Autoencoder 준비 상태를 컴포넌트별로 반환
+- 로드밸런서/오케스트레이션은 200 응답을 받은 워커에만 트래픽을 보내도록 설정
+- 주의: search_routes.py의 /api/panel/health는 데이터 품질 진단용 (다른 역할)
+"""
+from flask import Blueprint, jsonify
+from app.services.common.warmup import get_warmup_state, is_warmup_enabled, start_background_warmup
+
+
+bp = Blueprint('health', __name__, url_prefix='/api')
+
+
+def _check_db_pool() -> dict:
+    """DB 연결 풀에서 연결을 받아 SELECT 1 실행"""
+    try:
+        from app.services.data.executor import execute_sql_safe
+        execute_sql_safe("SELECT 1 AS ok", limit=1, statement_timeout_ms=2000)
+        return {"ready": True}
+    except Exception as e:
+        return {"ready": False, "error": str(e)}
+
+
+@bp.route('/ready', methods=['GET'])
+def ready():
+    """
+    준비 상태 조회
+
+    - DB 연결 풀은 항상 필수
+    - 임베딩 모델/Autoencoder는 MODEL_WARMUP_ENABLED=true일 때만 필수
+      (비활성화 시에는 첫 semantic 요청에서 로딩되므로 상태만 보고)
+
+    응답 (준비 완료 200, 미완료 503):
+    {
+        "ready": true,
+        "components": {
+            "db_pool": {"ready": true, "required": true},
+            "embedding_model": {"ready": true, "required": true, "init_duration_ms": 12000.0},
+            "encoder": {"ready": true, "required": true, "backend": "numpy"}
+        },
+        "warmup": {"status": "done", "duration_ms": 12345.6, ...}
+    }
+    """
+    from app.services.data.vector import VectorSearchService
+
+    models_required = is_warmup_enabled()
+    if models_required:
+        # 워밍업 스레드가 아직 시작되지 않은 프로세스라면 여기서 시작 (중복 시작은 무시됨)
+        start_background_warmup()
+
+    model_readiness = VectorSearchService.get_readiness()
+    components = {
+        "db_pool": dict(_check_db_pool(), required=True),
+        "embedding_model": {
+            "ready": model_readiness["embedding_model"],
+            "required": models_required,
+            "init_duration_ms": model_readiness["init_duration_ms"],
+        },
+        "encoder": {
+            "ready": model_readiness["encoder"],
+            "required": models_required,
+            "backend": model_readiness["encoder_backend"],
+        },
+    }
+    is_ready = all(c["ready"] for c in components.values() if c["required"])
+
+    return jsonify({
+        "ready": is_ready,
+        "components": components,
+        "warmup": get_warmup_state(),
+    }), 200 if is_ready else 503
@@ -4,7 +4,7 @@
 """
 from flask import Blueprint, request, jsonify
 from app.services.search.service import SearchService
-from app.services.semantic.features import extract_panel_features, PanelFeatures
+from app.services.semantic.features import extract_panel_features_batch, PanelFeatures
 from app.services.semantic.match_reason import generate_match_reasons
 from app.services.semantic.common_insights import generate_common_features
 from app.services.semantic.semantic_keywords import generate_semantic_keywords
@@ -173,11 +173,8 @@ def semantic_search():
         top_n = min(50, len(transformed_panels))
         top_panels_slice = transformed_panels[:top_n]
 
-        panel_features_list: List[PanelFeatures] = []
-        for idx, p in enumerate(top_panels_slice):
-            raw_panel = panels[idx] if idx < len(panels) else {}
-            features = extract_panel_features(raw_panel)
-            panel_features_list.append(features)
+        # 상위 N명 한 번에 추출 (feature 저장소 조회 / json_doc 스캔을 batch로 처리)
+        panel_features_list: List[PanelFeatures] = extract_panel_features_batch(panels[:len(top_panels_slice)])
 
         # 공통 특징 생성
         common_features = generate_common_features(panel_features_list) if panel_features_list else []
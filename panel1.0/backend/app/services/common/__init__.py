@@ -1,5 +1,5 @@
 """공통 유틸리티 모듈"""
-from app.services.common.singleton import Singleton
+from app.services.common.singleton import Singleton, singleton_init
 
-__all__ = ['Singleton']
+__all__ = ['Singleton', 'singleton_init']
 
@@ -1,29 +1,114 @@
 """
 Singleton 패턴 유틸리티
 - LlmService와 VectorSearchService를 Singleton으로 관리
+- 인스턴스 생성과 __init__(모델 로딩 등)은 Lock으로 보호되어 프로세스당 최대 1회만 실행
+- 동시에 들어온 첫 요청들은 진행 중인 초기화가 끝날 때까지 대기
 """
-from typing import Optional, TypeVar, Type
+from typing import Any, Callable, Dict, Optional, TypeVar
+import functools
+import threading
+import time
 
 T = TypeVar('T')
 
 
+class _InitState:
+    """클래스별 초기화 상태"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+
 class Singleton:
     """Singleton 메타클래스"""
     _instances: dict = {}
-    
+    _init_states: Dict[type, _InitState] = {}
+    _registry_lock = threading.Lock()
+
     def __new__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__new__(cls)
-        return cls._instances[cls]
-    
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with Singleton._registry_lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super(Singleton, cls).__new__(cls)
+                    cls._instances[cls] = instance
+        return instance
+
+    @classmethod
+    def _get_init_state(cls) -> _InitState:
+        state = Singleton._init_states.get(cls)
+        if state is None:
+            with Singleton._registry_lock:
+                state = Singleton._init_states.setdefault(cls, _InitState())
+        return state
+
     @classmethod
     def get_instance(cls) -> Optional[T]:
         """Singleton 인스턴스 반환"""
         return cls._instances.get(cls)
-    
+
+    @classmethod
+    def is_initialized(cls) -> bool:
+        """__init__이 성공적으로 완료되었는지 여부"""
+        return cls._get_init_state().done.is_set()
+
+    @classmethod
+    def wait_until_initialized(cls, timeout: Optional[float] = None) -> bool:
+        """
+        진행 중인 초기화가 끝날 때까지 대기
+
+        Returns:
+            timeout 안에 초기화가 완료되었으면 True
+        """
+        return cls._get_init_state().done.wait(timeout)
+
+    @classmethod
+    def get_init_stats(cls) -> Dict[str, Any]:
+        """초기화 소요 시간 / 마지막 오류 (콜드 스타트 비용 추적용)"""
+        state = cls._get_init_state()
+        return {
+            "initialized": state.done.is_set(),
+            "duration_ms": state.duration_ms,
+            "error": state.error,
+        }
+
     @classmethod
     def reset_instance(cls):
         """Singleton 인스턴스 초기화 (테스트용)"""
-        if cls in cls._instances:
-            del cls._instances[cls]
+        with Singleton._registry_lock:
+            if cls in cls._instances:
+                del cls._instances[cls]
+            Singleton._init_states.pop(cls, None)
+
 
+def singleton_init(init: Callable[..., None]) -> Callable[..., None]:
+    """
+    Singleton 서브클래스의 __init__ 데코레이터
+    - 첫 호출만 실제 초기화를 실행하고 이후 호출은 즉시 반환
+    - 동시에 호출되면 한 스레드만 초기화하고 나머지는 Lock에서 대기
+    - 초기화가 예외로 실패하면 완료로 표시하지 않으므로 다음 호출에서 재시도
+    """
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        cls = type(self)
+        state = cls._get_init_state()
+        if state.done.is_set():
+            return
+        with state.lock:
+            if state.done.is_set():
+                return
+            started = time.perf_counter()
+            try:
+                init(self, *args, **kwargs)
+            except Exception as e:
+                state.error = str(e)
+                raise
+            state.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            state.error = None
+            state.done.set()
+            print(f"[INFO] [SINGLETON] {cls.__name__} 초기화 완료 ({state.duration_ms}ms)")
+    return wrapper
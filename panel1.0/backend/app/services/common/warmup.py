@@ -0,0 +1,105 @@
+"""
+모델 백그라운드 워밍업
+- VectorSearchService(KoSimCSE + Autoencoder)를 백그라운드 스레드에서 미리 로딩하고
+  더미 질의를 한 번 임베딩하여 첫 semantic/hybrid 요청의 지연을 제거
+- 진행 상태는 /api/ready 엔드포인트에서 조회
+"""
+from typing import Any, Dict, Optional
+import os
+import sys
+import threading
+import time
+
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_thread_pid: Optional[int] = None
+_state: Dict[str, Any] = {
+    "status": "disabled",  # disabled | pending | running | done | failed
+    "started_at": None,
+    "finished_at": None,
+    "duration_ms": None,
+    "error": None,
+}
+
+
+def is_warmup_enabled() -> bool:
+    """MODEL_WARMUP_ENABLED 환경변수 (기본값: false)"""
+    return os.environ.get("MODEL_WARMUP_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def get_warmup_state() -> Dict[str, Any]:
+    """워밍업 진행 상태 반환"""
+    with _lock:
+        return dict(_state)
+
+
+def _run_warmup() -> None:
+    started = time.monotonic()
+    with _lock:
+        _state.update(status="running", started_at=time.time(), finished_at=None, duration_ms=None, error=None)
+    print("[INFO] [WARMUP] 모델 워밍업 시작 (VectorSearchService)")
+    try:
+        from app.services.data.vector import VectorSearchService
+        vector_service = VectorSearchService()
+        vector_service.warm_up()
+        status, error = "done", None
+        print(f"[OK] [WARMUP] 모델 워밍업 완료 ({(time.monotonic() - started) * 1000:.0f}ms)")
+    except Exception as e:
+        import traceback
+        status, error = "failed", str(e)
+        print(f"[ERROR] [WARMUP] 모델 워밍업 실패: {e}")
+        print(traceback.format_exc())
+    with _lock:
+        _state.update(
+            status=status,
+            finished_at=time.time(),
+            duration_ms=round((time.monotonic() - started) * 1000, 1),
+            error=error,
+        )
+
+
+def start_background_warmup() -> Optional[threading.Thread]:
+    """
+    워밍업 스레드 시작 (프로세스당 1회, 이미 실행 중이거나 완료되었으면 무시)
+
+    Returns:
+        새로 시작한 스레드 (이미 시작된 경우 None)
+    """
+    global _thread, _thread_pid
+    pid = os.getpid()
+    with _lock:
+        if _thread is not None and _thread_pid == pid:
+            return None
+        _state.update(status="pending", error=None)
+        _thread = threading.Thread(target=_run_warmup, name="model-warmup", daemon=True)
+        _thread_pid = pid
+    _thread.start()
+    return _thread
+
+
+def _is_gunicorn_preload() -> bool:
+    """gunicorn --preload 마스터 프로세스에서 앱을 로드하는 중인지 확인"""
+    argv = " ".join(sys.argv)
+    if "gunicorn" not in argv:
+        return False
+    return "--preload" in argv or "--preload" in os.environ.get("GUNICORN_CMD_ARGS", "")
+
+
+def schedule_background_warmup() -> None:
+    """
+    앱 팩토리에서 호출: 워밍업이 활성화된 경우에만 스레드 시작
+    gunicorn --preload 환경에서는 마스터에서 시작한 스레드가 fork 후 워커에 남지 않으므로
+    각 워커 프로세스가 fork된 직후에 시작한다
+    """
+    if not is_warmup_enabled():
+        return
+
+    if _is_gunicorn_preload() and hasattr(os, "register_at_fork"):
+        with _lock:
+            _state.update(status="pending")
+        os.register_at_fork(after_in_child=start_background_warmup)
+        print("[INFO] [WARMUP] gunicorn --preload 감지: 워커 fork 후 워밍업 시작")
+        return
+
+    start_background_warmup()
@@ -0,0 +1,309 @@
+"""
+인구통계 컬럼형 인메모리 테이블 (필터 개수 / 분포 / id 목록용)
+- core_v2.respondent의 gender, birth_year, region, district, interests를 NumPy 배열로 스냅샷
+  (gender/region/district는 사전 인코딩, interests는 관심사별 비트셋)
+- 필터는 불리언 마스크, 분포는 np.bincount로 계산하므로 Postgres 왕복 없이 처리
+- pg_stat_user_tables의 변경 카운터(버전 스탬프)가 바뀌면 다시 적재
+- DEMOGRAPHIC_TABLE_ENABLED=true일 때 SQLBuilder / calculate_panel_count가 get_demographic_snapshot()으로 사용
+  (비활성화 또는 적재 실패 시 기존 SQL 경로)
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import os
+import threading
+import time
+from datetime import datetime
+import numpy as np
+from app.services.data.filter_compiler import normalize_gender, parse_age_ranges
+
+
+SNAPSHOT_SQL = """
+    SELECT respondent_id, gender, birth_year, region, district, interests
+    FROM core_v2.respondent
+    ORDER BY respondent_id
+"""
+
+# INSERT/UPDATE/DELETE 누적 카운터 (통계 초기화 시에도 값이 바뀌므로 다시 적재됨)
+VERSION_SQL = """
+    SELECT n_tup_ins, n_tup_upd, n_tup_del
+    FROM pg_stat_user_tables
+    WHERE schemaname = 'core_v2' AND relname = 'respondent'
+"""
+
+AGE_GROUPS = ["10대", "20대", "30대", "40대", "50대", "60대", "70대", "80대"]
+
+
+def is_demographic_table_enabled() -> bool:
+    """DEMOGRAPHIC_TABLE_ENABLED 환경변수 (기본값: false)"""
+    return os.environ.get("DEMOGRAPHIC_TABLE_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def _dictionary_encode(values: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """값 목록 → (코드 배열, 사전) (None은 -1)"""
+    dictionary: Dict[Any, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+        else:
+            codes[i] = dictionary.setdefault(value, len(dictionary))
+    return codes, list(dictionary)
+
+
+class DemographicSnapshot:
+    """
+    respondent 인구통계 컬럼 스냅샷 (적재 후 변경하지 않으므로 여러 스레드에서 그대로 읽음)
+    """
+
+    def __init__(self, rows: Sequence[Tuple[Any, ...]], version: Optional[Tuple[Any, ...]] = None):
+        """(respondent_id, gender, birth_year, region, district, interests) 행으로 컬럼 배열 생성"""
+        self.version = version
+        self.ids = np.array([row[0] for row in rows], dtype=object)
+        self.gender_codes, self.genders = _dictionary_encode([row[1] for row in rows])
+        self.birth_years = np.array([row[2] if row[2] is not None else 0 for row in rows], dtype=np.int32)
+        self.region_codes, self.regions = _dictionary_encode([row[3] for row in rows])
+        self.district_codes, self.districts = _dictionary_encode([row[4] for row in rows])
+
+        # region의 첫 단어 (SPLIT_PART(region, ' ', 1)) 사전
+        main_codes_by_region, self.main_regions = _dictionary_encode([region.split(" ")[0] for region in self.regions])
+        self.main_region_codes = np.full(len(rows), -1, dtype=np.int32)
+        has_region = self.region_codes >= 0
+        self.main_region_codes[has_region] = main_codes_by_region[self.region_codes[has_region]]
+
+        # 관심사 비트셋: 소문자 관심사 → 비트 번호, 행마다 uint64 워드 배열
+        self.interest_index: Dict[str, int] = {}
+        self.interests = np.empty(len(rows), dtype=object)
+        for i, row in enumerate(rows):
+            values = tuple(row[5] or ())
+            self.interests[i] = values
+            for value in values:
+                if value:
+                    self.interest_index.setdefault(str(value).lower(), len(self.interest_index))
+        self.interest_bits = np.zeros((len(rows), max(1, (len(self.interest_index) + 63) // 64)), dtype=np.uint64)
+        for i, values in enumerate(self.interests):
+            for value in values:
+                if value:
+                    bit = self.interest_index[str(value).lower()]
+                    self.interest_bits[i, bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    # ------------------------------------------------------------------
+    # 마스크
+    # ------------------------------------------------------------------
+    def _ages(self) -> np.ndarray:
+        """만 나이 대신 EXTRACT(YEAR FROM CURRENT_DATE) - birth_year (birth_year 없으면 -1)"""
+        return np.where(self.birth_years > 0, datetime.now().year - self.birth_years, -1)
+
+    def _codes_matching(self, dictionary: List[Any], predicate) -> np.ndarray:
+        return np.array([code for code, value in enumerate(dictionary) if predicate(value)], dtype=np.int32)
+
+    def mask(
+        self,
+        gender: Optional[str] = None,
+        age_ranges: Optional[Sequence[Tuple[int, Optional[int]]]] = None,
+        region_contains: Optional[str] = None,
+        main_region: Optional[str] = None,
+        tags: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        조건을 모두 만족하는 행의 불리언 마스크
+        - gender: 값 일치
+        - age_ranges: 구간 중 하나에 포함 (OR)
+        - region_contains: region LIKE '%값%'
+        - main_region: SPLIT_PART(region, ' ', 1) = 값
+        - tags: 관심사 중 하나라도 대소문자 무시 일치 (OR)
+        """
+        result = np.ones(self.size, dtype=bool)
+        if gender is not None:
+            code = self.genders.index(gender) if gender in self.genders else -2
+            result &= self.gender_codes == code
+        if age_ranges:
+            ages = self._ages()
+            age_mask = np.zeros(self.size, dtype=bool)
+            for lo, hi in age_ranges:
+                age_mask |= (ages >= lo) & ((ages <= hi) if hi is not None else True) & (ages >= 0)
+            result &= age_mask
+        if region_contains:
+            result &= np.isin(self.region_codes, self._codes_matching(self.regions, lambda r: region_contains in r))
+        if main_region:
+            code = self.main_regions.index(main_region) if main_region in self.main_regions else -2
+            result &= self.main_region_codes == code
+        if tags is not None:
+            tag_mask = np.zeros(self.size, dtype=bool)
+            for tag in tags:
+                bit = self.interest_index.get(str(tag).strip().lower())
+                if bit is not None:
+                    tag_mask |= (self.interest_bits[:, bit // 64] & (np.uint64(1) << np.uint64(bit % 64))) != 0
+            result &= tag_mask
+        return result
+
+    def mask_from_filters(self, filters: Optional[Dict[str, Any]]) -> np.ndarray:
+        """filter_compiler.compile_demographic_filters와 같은 의미의 필터 딕셔너리 → 마스크"""
+        filters = filters or {}
+        tags = filters.get("tags")
+        clean_tags = None
+        if tags and isinstance(tags, list):
+            clean_tags = [tag.strip() for tag in tags if tag and tag.strip()] or None
+        return self.mask(
+            gender=normalize_gender(filters.get("gender")),
+            age_ranges=parse_age_ranges(filters.get("age") or filters.get("age_range")),
+            region_contains=filters.get("region") or None,
+            main_region=filters.get("main_region") or None,
+            tags=clean_tags
+        )
+
+    # ------------------------------------------------------------------
+    # 개수 / 분포 / 행
+    # ------------------------------------------------------------------
+    def count(self, mask: np.ndarray) -> int:
+        return int(np.count_nonzero(mask))
+
+    def ids_for(self, mask: np.ndarray, limit: Optional[int] = None) -> List[Any]:
+        indices = np.flatnonzero(mask)
+        if limit is not None:
+            indices = indices[:limit]
+        return self.ids[indices].tolist()
+
+    def rows_for(self, mask: np.ndarray, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """execute_filter_query 결과와 같은 형태의 행 (respondent_id, gender, birth_year, region, district, interests)"""
+        indices = np.flatnonzero(mask)
+        if limit is not None:
+            indices = indices[:limit]
+
+        def decode(codes, dictionary, i):
+            code = codes[i]
+            return dictionary[code] if code >= 0 else None
+
+        return [
+            {
+                "respondent_id": self.ids[i],
+                "gender": decode(self.gender_codes, self.genders, i),
+                "birth_year": int(self.birth_years[i]) or None,
+                "region": decode(self.region_codes, self.regions, i),
+                "district": decode(self.district_codes, self.districts, i),
+                "interests": list(self.interests[i]),
+            }
+            for i in indices
+        ]
+
+    @staticmethod
+    def _value_counts(codes: np.ndarray, dictionary: List[Any], mask: np.ndarray,
+                      top: Optional[int] = None) -> List[Tuple[Any, int]]:
+        selected = codes[mask & (codes >= 0)]
+        counts = np.bincount(selected, minlength=len(dictionary)) if len(dictionary) else np.zeros(0, dtype=np.int64)
+        order = np.argsort(-counts, kind="stable")
+        pairs = [(dictionary[code], int(counts[code])) for code in order if counts[code] > 0]
+        return pairs[:top] if top is not None else pairs
+
+    def gender_counts(self, mask: np.ndarray) -> List[Tuple[str, int]]:
+        """gender IS NOT NULL GROUP BY gender (개수 내림차순)"""
+        return self._value_counts(self.gender_codes, self.genders, mask)
+
+    def region_counts(self, mask: np.ndarray, top: Optional[int] = None) -> List[Tuple[str, int]]:
+        """GROUP BY region (개수 내림차순, NULL 제외)"""
+        return self._value_counts(self.region_codes, self.regions, mask, top)
+
+    def main_region_counts(self, mask: np.ndarray, top: Optional[int] = None) -> List[Tuple[str, int]]:
+        """GROUP BY SPLIT_PART(region, ' ', 1) (개수 내림차순, NULL 제외)"""
+        return self._value_counts(self.main_region_codes, self.main_regions, mask, top)
+
+    def age_group_counts(self, mask: np.ndarray, include_unknown: bool = True) -> List[Tuple[str, int]]:
+        """
+        10년 단위 연령대 분포 (SQL CASE와 같은 구간: 10대~70대, 80대 이상, 그 외 '기타')
+        include_unknown=False면 birth_year가 없는 행 제외
+        """
+        ages = self._ages()[mask]
+        if not include_unknown:
+            ages = ages[ages >= 0]
+        group_index = np.where(ages >= 10, np.minimum(ages // 10, 8) - 1, len(AGE_GROUPS))
+        counts = np.bincount(group_index, minlength=len(AGE_GROUPS) + 1)
+        labels = AGE_GROUPS + ["기타"]
+        order = np.argsort(-counts, kind="stable")
+        return [(labels[i], int(counts[i])) for i in order if counts[i] > 0]
+
+
+class DemographicTable:
+    """
+    최신 DemographicSnapshot 관리 (버전 스탬프 확인은 check_interval_seconds마다 한 번)
+    재적재 중에도 읽는 쪽은 이전 스냅샷을 그대로 사용하고, 완성된 스냅샷으로 참조만 교체
+    """
+
+    def __init__(self, check_interval_seconds: float = 30.0):
+        self.check_interval_seconds = check_interval_seconds
+        self._refresh_lock = threading.Lock()
+        self._snapshot: Optional[DemographicSnapshot] = None
+        self._checked_at: Optional[float] = None
+
+    @property
+    def snapshot(self) -> Optional[DemographicSnapshot]:
+        return self._snapshot
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None and self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.check_interval_seconds
+        )
+
+    def refresh_if_changed(self, cur, force: bool = False) -> bool:
+        """
+        버전 스탬프가 바뀌었으면 주어진 커서로 다시 적재 (동시에 한 스레드만)
+
+        Returns:
+            새로 적재했으면 True
+        """
+        if not force and self._is_fresh():
+            return False
+        with self._refresh_lock:
+            if not force and self._is_fresh():
+                return False
+            cur.execute(VERSION_SQL)
+            row = cur.fetchone()
+            version = tuple(row) if row else None
+            self._checked_at = time.monotonic()
+            if not force and self._snapshot is not None and version == self._snapshot.version:
+                return False
+            started = time.perf_counter()
+            cur.execute(SNAPSHOT_SQL)
+            snapshot = DemographicSnapshot(cur.fetchall(), version)
+            self._snapshot = snapshot
+            print(f"[INFO] 인구통계 컬럼 테이블 적재: {snapshot.size}명, 관심사 {len(snapshot.interest_index)}개 "
+                  f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+            return True
+
+
+_table: Optional[DemographicTable] = None
+_table_lock = threading.Lock()
+
+
+def get_demographic_snapshot() -> Optional[DemographicSnapshot]:
+    """
+    최신 인구통계 스냅샷 (DEMOGRAPHIC_TABLE_ENABLED=false거나 적재 실패 시 None → 호출 측은 SQL 경로 사용)
+    버전 확인은 DEMOGRAPHIC_TABLE_CHECK_SECONDS(기본 30초)마다 한 번
+    """
+    global _table
+    if not is_demographic_table_enabled():
+        return None
+    with _table_lock:
+        if _table is None:
+            _table = DemographicTable(
+                check_interval_seconds=float(os.environ.get("DEMOGRAPHIC_TABLE_CHECK_SECONDS", "30"))
+            )
+        table = _table
+    if table._is_fresh():
+        return table.snapshot
+    try:
+        from app.db.connection import get_db_connection, return_db_connection
+        from app.utils.panel_schema import ensure_interests_column_exists
+        if table.snapshot is None:
+            ensure_interests_column_exists()
+        conn = get_db_connection()
+        try:
+            with conn.cursor() as cur:
+                table.refresh_if_changed(cur)
+        finally:
+            return_db_connection(conn)
+    except Exception as e:
+        print(f"[WARN] 인구통계 컬럼 테이블 갱신 실패: {e}")
+    return table.snapshot
@@ -0,0 +1,118 @@
+"""
+Autoencoder 인코더 NumPy 추론 (768차원 → 256차원)
+- encoder_tf_256.keras는 Dense(512, relu) → Dense(384, relu) → Dense(256, linear) 구조
+- 가중치를 .npz로 한 번 내보내 두면 TensorFlow 없이 NumPy 행렬곱만으로 추론 가능
+- TensorFlow/tf_keras는 .npz가 없을 때의 fallback으로만 사용
+"""
+from typing import Any, Dict, List, Sequence
+import os
+import numpy as np
+
+
+_ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0.0, out=x),
+    "tanh": lambda x: np.tanh(x, out=x),
+    "sigmoid": lambda x: np.divide(1.0, 1.0 + np.exp(-x), out=x),
+}
+
+
+class NumpyDenseEncoder:
+    """
+    Dense 레이어 스택 NumPy 추론기
+    keras 모델과 같은 predict(x, verbose=0) 시그니처를 제공하여 그대로 교체 가능
+    """
+
+    def __init__(
+        self,
+        kernels: Sequence[np.ndarray],
+        biases: Sequence[np.ndarray],
+        activations: Sequence[str]
+    ):
+        if not (len(kernels) == len(biases) == len(activations)) or not kernels:
+            raise ValueError("kernels/biases/activations 개수가 일치하지 않습니다.")
+
+        for activation in activations:
+            if activation not in _ACTIVATIONS:
+                raise ValueError(f"지원하지 않는 활성화 함수: {activation}")
+
+        self.kernels = [np.ascontiguousarray(k, dtype=np.float32) for k in kernels]
+        self.biases = [np.ascontiguousarray(b, dtype=np.float32) for b in biases]
+        self.activations = [str(a) for a in activations]
+
+        for idx in range(1, len(self.kernels)):
+            if self.kernels[idx - 1].shape[1] != self.kernels[idx].shape[0]:
+                raise ValueError(f"레이어 {idx}의 입력 차원이 이전 레이어 출력과 다릅니다.")
+
+    @property
+    def input_dim(self) -> int:
+        return self.kernels[0].shape[0]
+
+    @property
+    def output_dim(self) -> int:
+        return self.kernels[-1].shape[1]
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyDenseEncoder":
+        """export_dense_weights로 저장한 .npz 파일 로드"""
+        with np.load(path, allow_pickle=False) as data:
+            activations = [str(a) for a in data["activations"]]
+            kernels = [data[f"kernel_{i}"] for i in range(len(activations))]
+            biases = [data[f"bias_{i}"] for i in range(len(activations))]
+        return cls(kernels, biases, activations)
+
+    def predict(self, x: Any, verbose: int = 0) -> np.ndarray:
+        """
+        (N, input_dim) → (N, output_dim) 추론
+        verbose는 keras predict 호환용 (무시)
+        """
+        h = np.asarray(x, dtype=np.float32)
+        if h.ndim == 1:
+            h = h.reshape(1, -1)
+        for kernel, bias, activation in zip(self.kernels, self.biases, self.activations):
+            h = h @ kernel
+            h += bias
+            h = _ACTIVATIONS[activation](h)
+        return h
+
+
+def export_dense_weights(
+    path: str,
+    kernels: Sequence[np.ndarray],
+    biases: Sequence[np.ndarray],
+    activations: Sequence[str]
+) -> str:
+    """Dense 레이어 가중치를 .npz로 저장 (NumpyDenseEncoder.load 형식)"""
+    # 저장 전에 구조 검증
+    NumpyDenseEncoder(kernels, biases, activations)
+
+    arrays: Dict[str, np.ndarray] = {"activations": np.array([str(a) for a in activations])}
+    for idx, (kernel, bias) in enumerate(zip(kernels, biases)):
+        arrays[f"kernel_{idx}"] = np.asarray(kernel, dtype=np.float32)
+        arrays[f"bias_{idx}"] = np.asarray(bias, dtype=np.float32)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    np.savez(path, **arrays)
+    return path
+
+
+def extract_keras_dense_weights(model: Any) -> Dict[str, List[Any]]:
+    """
+    로드된 keras 모델에서 Dense 레이어 가중치/활성화 추출
+
+    Returns:
+        {"kernels": [...], "biases": [...], "activations": [...]}
+    """
+    kernels, biases, activations = [], [], []
+    for layer in model.layers:
+        weights = layer.get_weights()
+        if not weights:
+            # InputLayer 등 가중치 없는 레이어
+            continue
+        if len(weights) != 2:
+            raise ValueError(f"Dense(use_bias=True) 레이어만 지원합니다: {layer.name}")
+        kernels.append(weights[0])
+        biases.append(weights[1])
+        activations.append(layer.get_config().get("activation", "linear"))
+    return {"kernels": kernels, "biases": biases, "activations": activations}
@@ -1,7 +1,12 @@
 """SQL 실행 유틸리티 (SELECT 전용, 안전장치 포함)"""
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Set, Tuple
+import hashlib
+import os
 import re
+import threading
+import weakref
 from contextlib import contextmanager
+from functools import lru_cache
 from app.db.connection import get_db_connection, return_db_connection
 
 
@@ -14,6 +19,20 @@ _FORBIDDEN_PATTERNS = [
 
 _ALLOWED_FIRST_WORDS = {"select", "with"}
 
+# prepared statement 오류 코드 (psycopg2.errors.InvalidSqlStatementName / DuplicatePreparedStatement)
+_INVALID_STATEMENT_NAME = "26000"
+_DUPLICATE_PREPARED_STATEMENT = "42P05"
+
+# 연결 객체별로 이미 PREPARE한 statement 이름 - 풀 연결마다 한 번만 준비
+# (연결이 닫혀 사라지면 기록도 함께 정리되고, 재사용된 pid의 새 연결은 빈 상태에서 시작)
+_prepared_by_conn: "weakref.WeakKeyDictionary[Any, Set[str]]" = weakref.WeakKeyDictionary()
+_prepared_lock = threading.Lock()
+
+
+def is_prepared_statements_enabled() -> bool:
+    """DB_PREPARED_STATEMENTS 환경변수 (기본값: false, PgBouncer transaction 모드에서는 켜지 않음)"""
+    return os.environ.get("DB_PREPARED_STATEMENTS", "false").lower() in ("1", "true", "yes")
+
 
 def _assert_safe_select(query: str) -> None:
     normalized = query.strip().lower()
@@ -42,6 +61,7 @@ def execute_sql_safe(
     *,
     limit: int = 200,
     statement_timeout_ms: int = 5000,
+    prepare: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     안전한 읽기 전용 SQL 실행 함수.
@@ -49,6 +69,8 @@ def execute_sql_safe(
     - 세미콜론/주석 차단
     - 서버측 statement_timeout 적용
     - 결과는 최대 limit 행으로 제한
+    - prepare=True이고 DB_PREPARED_STATEMENTS=true이면 서버측 prepared statement로 실행
+      (값이 모두 파라미터인 고정 SQL 텍스트만 - filter_compiler가 만든 조건 등)
     """
     if not query:
         raise ValueError("쿼리가 비어 있습니다.")
@@ -57,6 +79,12 @@ def execute_sql_safe(
 
     limited_query = f"WITH _orig AS ({query}) SELECT * FROM _orig LIMIT {int(limit)}"
 
+    if prepare and is_prepared_statements_enabled() and (params is None or isinstance(params, dict)):
+        with _db_cursor_with_timeout(statement_timeout_ms) as (conn, cur):
+            _execute_prepared(conn, cur, query, params or {}, limit, statement_timeout_ms)
+            columns = [desc[0] for desc in cur.description]
+            return [dict(zip(columns, row)) for row in cur.fetchall()]
+
     with _db_cursor_with_timeout(statement_timeout_ms) as (conn, cur):
         cur.execute(limited_query, params or None)
         columns = [desc[0] for desc in cur.description]
@@ -64,3 +92,51 @@ def execute_sql_safe(
         result = [dict(zip(columns, row)) for row in rows]
         return result
 
+
+
+@lru_cache(maxsize=512)
+def _prepared_template(query: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    %(name)s 파라미터 쿼리 → (statement 이름, $n 위치 파라미터 SQL, 파라미터 이름 순서)
+    결과 행 제한(LIMIT)도 파라미터로 두어 limit 값이 달라도 같은 statement를 재사용
+    """
+    names: List[str] = []
+
+    def _positional(match: "re.Match") -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    body = re.sub(r"%\((\w+)\)s", _positional, query).replace("%%", "%")
+    prepared_sql = f"WITH _orig AS ({body}) SELECT * FROM _orig LIMIT ${len(names) + 1}"
+    name = "panel_" + hashlib.sha1(prepared_sql.encode("utf-8")).hexdigest()[:16]
+    return name, prepared_sql, tuple(names)
+
+
+def _execute_prepared(conn, cur, query: str, params: Dict[str, Any], limit: int, statement_timeout_ms: int) -> None:
+    """연결(백엔드 세션)에 처음 쓰는 statement만 PREPARE 후 EXECUTE"""
+    name, prepared_sql, names = _prepared_template(query)
+    args = [params[param_name] for param_name in names] + [int(limit)]
+    execute_sql = f"EXECUTE {name}({', '.join(['%s'] * len(args))})"
+    with _prepared_lock:
+        prepared = name in _prepared_by_conn.setdefault(conn, set())
+
+    try:
+        if not prepared:
+            cur.execute(f"PREPARE {name} AS {prepared_sql}")
+        cur.execute(execute_sql, args)
+    except Exception as e:
+        pgcode = getattr(e, "pgcode", None)
+        if pgcode not in (_INVALID_STATEMENT_NAME, _DUPLICATE_PREPARED_STATEMENT):
+            raise
+        # 연결이 다시 만들어져 준비 상태를 잃었거나(26000), 기록과 달리 이미 준비된 경우(42P05) 한 번만 재시도
+        print(f"[WARN] prepared statement {name} 상태 불일치({pgcode}) - 재시도")
+        conn.rollback()
+        cur.execute(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}")
+        if pgcode == _INVALID_STATEMENT_NAME:
+            cur.execute(f"PREPARE {name} AS {prepared_sql}")
+        cur.execute(execute_sql, args)
+
+    with _prepared_lock:
+        _prepared_by_conn.setdefault(conn, set()).add(name)
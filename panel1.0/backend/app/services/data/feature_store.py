@@ -0,0 +1,67 @@
+"""
+응답자별 휴리스틱 feature 저장소 (core_v2.respondent_feature)
+- semantic/features.py의 휴리스틱 feature(device_brand, lifestyle_tags, spending_level, tech_usage_level,
+  category_affinity, sentiment_profile)는 응답자 본인의 json_doc에만 의존하므로
+  ETL(scripts/build_panel_features.py)에서 미리 계산해 저장
+- 적재 시 json_doc의 md5(source_hash)와 FEATURE_VERSION을 함께 저장 → 다시 실행하면 새 응답자 / 답변이 바뀐 응답자 /
+  규칙 버전이 다른 행만 다시 계산
+- respondent_json의 json_doc이 바뀌거나 행이 삭제되면 트리거가 feature 행을 지우고, TRUNCATE(재적재)되면 feature 테이블도 비움
+  (적재 전까지 검색은 오래된 값 대신 json_doc으로 계산)
+- 조회 시 현재 json_doc의 md5와 source_hash가 같은 행만 사용 → 트리거가 없던 시점의 적재 / COPY 등으로 답변이 바뀌어도
+  오래된 feature를 읽지 않음
+- PANEL_FEATURE_STORE=true일 때 extract_panel_features(_batch)가 respondent_id로 먼저 조회하고,
+  저장된 값이 없는 패널만 json_doc에서 계산
+"""
+from typing import Any, Dict, Sequence
+import os
+
+FEATURE_TABLE = "core_v2.respondent_feature"
+
+# 휴리스틱 규칙(features.py의 키워드 사전 / 추론식)을 바꾸면 올림 → 이전 버전 행은 읽지 않고, 다음 적재 때 다시 계산
+FEATURE_VERSION = 1
+
+FEATURE_COLUMNS = [
+    "device_brand", "lifestyle_tags", "spending_level",
+    "tech_usage_level", "category_affinity", "sentiment_profile",
+]
+
+
+def is_feature_store_enabled() -> bool:
+    """PANEL_FEATURE_STORE 환경변수 (기본값: false)"""
+    return os.environ.get("PANEL_FEATURE_STORE", "false").lower() in ("1", "true", "yes")
+
+
+def fetch_feature_records(cur, respondent_ids: Sequence[Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    respondent_id 목록 → {respondent_id: {feature 컬럼: 값}} (한 번 조회)
+    현재 FEATURE_VERSION이고 source_hash가 현재 json_doc의 md5와 같은 행만 (나머지는 json_doc으로 계산)
+    category_affinity / sentiment_profile은 dict (jsonb)
+    """
+    if not respondent_ids:
+        return {}
+    cur.execute(
+        f"SELECT f.respondent_id, {', '.join(f'f.{column}' for column in FEATURE_COLUMNS)} FROM {FEATURE_TABLE} f "
+        f"JOIN core_v2.respondent_json r ON r.respondent_id = f.respondent_id "
+        f"WHERE f.respondent_id = ANY(%(ids)s) AND f.feature_version = %(version)s "
+        f"AND f.source_hash = md5(r.json_doc::text)",
+        {"ids": list(respondent_ids), "version": FEATURE_VERSION}
+    )
+    return {row[0]: dict(zip(FEATURE_COLUMNS, row[1:])) for row in cur.fetchall()}
+
+
+def load_feature_records(respondent_ids: Sequence[Any]) -> Dict[Any, Dict[str, Any]]:
+    """풀 연결로 fetch_feature_records 실행 (실패 시 경고 후 빈 결과 → json_doc으로 계산)"""
+    ids = [respondent_id for respondent_id in dict.fromkeys(respondent_ids) if respondent_id is not None]
+    if not ids:
+        return {}
+    try:
+        from app.db.connection import get_db_connection, return_db_connection
+        conn = get_db_connection()
+        try:
+            with conn.cursor() as cur:
+                return fetch_feature_records(cur, ids)
+        finally:
+            return_db_connection(conn)
+    except Exception as e:
+        print(f"[WARN] feature 저장소 조회 실패 (json_doc으로 계산): {e}")
+        return {}
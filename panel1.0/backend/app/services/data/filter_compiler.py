@@ -0,0 +1,185 @@
+"""
+인구통계 필터 컴파일러 (core_v2.respondent)
+- 연령대 필터를 요청마다 Python에서 birth_year 범위로 한 번 변환
+  (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 20 AND 29
+  → birth_year BETWEEN 올해-29 AND 올해-20
+  컬럼에 식을 씌우지 않으므로 birth_year B-tree / 복합 인덱스를 사용할 수 있음 (scripts/migrate_demographic_indexes.py)
+- 성별/지역/태그 조건까지 SQLBuilder, VectorSearchService, calculate_panel_count가 같은 규칙으로 사용
+- 필터 "모양"(연령 구간 수/종류, 성별·지역 유무, 태그 수)이 같으면 항상 같은 SQL 조각을 반환
+  (조각은 모양별로 캐시, 값은 파라미터) → executor의 prepared statement를 연결마다 한 번만 준비해 재사용
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+
+
+def parse_age_ranges(age_range: Any) -> List[Tuple[int, Optional[int]]]:
+    """
+    연령 필터 → [(최소 나이, 최대 나이|None)]
+    - "10s"~"50s": 해당 10년 구간
+    - "60s", "60s+", "70s", "80s": 해당 나이 이상
+    - "30s,40s": 여러 구간 OR
+    - "30대"처럼 한글 표기도 같은 의미
+    """
+    if not age_range or not isinstance(age_range, str):
+        return []
+    ranges = []
+    for token in age_range.split(","):
+        token = token.strip().rstrip("+")
+        if token[-1:] not in ("s", "대") or not token[:-1].isdigit():
+            continue
+        decade = int(token[:-1])
+        ranges.append((decade, None) if decade >= 60 else (decade, decade + 9))
+    return ranges
+
+
+def normalize_gender(gender: Any) -> Optional[str]:
+    """M/F/남/여(남성/여성, 남자/여자) → '남'/'여' (그 외는 None)"""
+    if gender in ("M", "남", "남성", "남자"):
+        return "남"
+    if gender in ("F", "여", "여성", "여자"):
+        return "여"
+    return None
+
+
+def birth_year_bounds(
+    age_min: int,
+    age_max: Optional[int],
+    current_year: Optional[int] = None
+) -> Tuple[Optional[int], int]:
+    """
+    나이 구간 → birth_year 구간 (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year와 같은 연 단위 나이)
+
+    Returns:
+        (최소 birth_year|None, 최대 birth_year) - age_max가 None이면 하한 없음
+    """
+    current_year = current_year or datetime.now().year
+    low = current_year - age_max if age_max is not None else None
+    return low, current_year - age_min
+
+
+@lru_cache(maxsize=256)
+def _age_condition_template(column: str, bounded: Tuple[bool, ...], param_prefix: str) -> Optional[str]:
+    """연령 구간 모양(구간별 상한 유무) → 조건 SQL 조각 (모양별 캐시)"""
+    conditions = []
+    for idx, has_low in enumerate(bounded):
+        high_param = f"{param_prefix}_max_{idx}"
+        if has_low:
+            conditions.append(f"{column} BETWEEN %({param_prefix}_min_{idx})s AND %({high_param})s")
+        else:
+            conditions.append(f"{column} <= %({high_param})s")
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return f"({' OR '.join(conditions)})"
+
+
+def compile_age_condition(
+    age_range: Any,
+    column: str = "birth_year",
+    current_year: Optional[int] = None,
+    param_prefix: str = "birth_year"
+) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    연령 필터 → sargable birth_year 조건
+
+    Returns:
+        (조건 문자열|None, params) - 여러 구간이면 OR로 묶은 하나의 조건
+    """
+    current_year = current_year or datetime.now().year
+    bounds = [birth_year_bounds(age_min, age_max, current_year) for age_min, age_max in parse_age_ranges(age_range)]
+    params = {}
+    for idx, (low, high) in enumerate(bounds):
+        params[f"{param_prefix}_max_{idx}"] = high
+        if low is not None:
+            params[f"{param_prefix}_min_{idx}"] = low
+    condition = _age_condition_template(column, tuple(low is not None for low, _ in bounds), param_prefix)
+    return condition, (params if condition else {})
+
+
+@lru_cache(maxsize=256)
+def _filter_conditions_template(
+    prefix: str,
+    has_gender: bool,
+    has_region: bool,
+    has_main_region: bool,
+    tag_count: int
+) -> Tuple[str, ...]:
+    """성별/지역/태그 필터 모양 → 조건 SQL 조각 (모양별 캐시)"""
+    conditions = []
+    if has_gender:
+        conditions.append(f"{prefix}gender = %(gender)s")
+    if has_region:
+        conditions.append(f"{prefix}region LIKE %(region)s")
+    if has_main_region:
+        # 대표 지역(첫 단어) 일치 - get_filtered_stats / 지역 분포 drill-down
+        conditions.append(f"SPLIT_PART({prefix}region, ' ', 1) = %(main_region)s")
+    if tag_count:
+        # 대소문자 구분 없이 매칭하기 위해 EXISTS 서브쿼리 사용 (개행 없이 한 줄 - SQL 안전성 검사 통과)
+        tag_conditions = [
+            f"EXISTS (SELECT 1 FROM unnest({prefix}interests) AS interest WHERE LOWER(interest) = LOWER(%(tag_{i})s))"
+            for i in range(tag_count)
+        ]
+        conditions.append(f"({prefix}interests IS NOT NULL AND ({' OR '.join(tag_conditions)}))")
+    return tuple(conditions)
+
+
+def compile_demographic_filters(
+    filters: Optional[Dict[str, Any]],
+    alias: str = "",
+    current_year: Optional[int] = None,
+    include_tags: bool = True
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    필터 딕셔너리 → core_v2.respondent WHERE 조건 목록과 파라미터
+
+    Args:
+        filters: {
+                    "age"|"age_range": "20s,30s" | "30대",
+                    "gender": "M"|"F"|"남"|"여",
+                    "region": "서울" (부분 일치),
+                    "main_region": "서울" (첫 단어 일치),
+                    "tags": [...]
+                 }
+        alias: respondent 테이블 별칭 (예: "r_info")
+        current_year: 나이 계산 기준 연도 (기본: 올해)
+        include_tags: interests 태그 조건 포함 여부
+
+    Returns:
+        (where_conditions, params) 튜플 - 같은 필터 모양이면 조건 문자열이 항상 동일
+    """
+    filters = filters or {}
+    prefix = f"{alias}." if alias else ""
+    where_conditions = []
+    params = {}
+
+    # 연령 필터 (birth_year 범위) - 여러 연령대 지원 (예: "30s,40s")
+    age_condition, age_params = compile_age_condition(
+        filters.get("age") or filters.get("age_range"),
+        column=f"{prefix}birth_year",
+        current_year=current_year
+    )
+    if age_condition:
+        where_conditions.append(age_condition)
+        params.update(age_params)
+
+    gender = normalize_gender(filters.get("gender"))
+    if gender:
+        params["gender"] = gender
+    if filters.get("region"):
+        params["region"] = f"%{filters['region']}%"
+    if filters.get("main_region"):
+        params["main_region"] = filters["main_region"]
+
+    tags = filters.get("tags")
+    clean_tags = []
+    if include_tags and tags and isinstance(tags, list):
+        clean_tags = [tag.strip() for tag in tags if tag and tag.strip()]
+    for i, tag in enumerate(clean_tags):
+        params[f"tag_{i}"] = tag
+
+    where_conditions.extend(_filter_conditions_template(
+        prefix, bool(gender), bool(filters.get("region")), bool(filters.get("main_region")), len(clean_tags)
+    ))
+    return where_conditions, params
@@ -0,0 +1,110 @@
+"""
+인구통계 히스토그램 (필터 선택도 추정용)
+- core_v2.respondent를 (gender, birth_year, region) 단위로 집계하여 메모리에 캐시
+- 하이브리드 검색 WHERE 조건의 파라미터(filter_compiler가 만든 gender, birth_year_min_N/birth_year_max_N,
+  region, main_region)로 선택도를 추정하여
+  벡터 검색 실행 방식(exact / hnsw / overfetch)을 고르는 데 사용
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+
+
+HISTOGRAM_SQL = """
+    SELECT gender, birth_year, region, COUNT(*) AS cnt
+    FROM core_v2.respondent
+    GROUP BY gender, birth_year, region
+"""
+
+
+class DemographicHistogram:
+    """(gender, birth_year, region) → 응답자 수 히스토그램 (TTL 캐시, thread-safe)"""
+
+    def __init__(self, ttl_seconds: float = 3600.0):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._buckets: List[Tuple[Optional[str], Optional[int], Optional[str], int]] = []
+        self._total = 0
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or (time.monotonic() - self._loaded_at) > self.ttl_seconds
+
+    def load_rows(self, rows: List[Tuple[Any, Any, Any, Any]]) -> None:
+        """집계 행 (gender, birth_year, region, cnt)으로 히스토그램 교체"""
+        buckets = [
+            (gender, int(birth_year) if birth_year is not None else None, region, int(cnt))
+            for gender, birth_year, region, cnt in rows
+        ]
+        with self._lock:
+            self._buckets = buckets
+            self._total = sum(bucket[3] for bucket in buckets)
+            self._loaded_at = time.monotonic()
+
+    def refresh_if_stale(self, cur) -> None:
+        """TTL이 지났으면 주어진 커서로 다시 집계"""
+        if not self.is_stale():
+            return
+        cur.execute(HISTOGRAM_SQL)
+        self.load_rows(cur.fetchall())
+        print(f"[INFO] 인구통계 히스토그램 갱신: {len(self._buckets)}개 구간, 전체 {self._total}명")
+
+    @staticmethod
+    def _birth_year_ranges(params: Dict[str, Any]) -> List[Tuple[Optional[int], int]]:
+        """WHERE 파라미터의 birth_year_max_N/birth_year_min_N 쌍 → [(최소 birth_year|None, 최대 birth_year)]"""
+        ranges = []
+        for key, value in params.items():
+            if key.startswith("birth_year_max_"):
+                suffix = key[len("birth_year_max_"):]
+                low = params.get(f"birth_year_min_{suffix}")
+                ranges.append((int(low) if low is not None else None, int(value)))
+        return ranges
+
+    def estimate_matches(self, params: Dict[str, Any]) -> Optional[int]:
+        """
+        구조화 필터 파라미터를 만족하는 응답자 수 추정
+
+        Args:
+            params: compile_demographic_filters가 만든 파라미터
+                    (gender, birth_year_min_N, birth_year_max_N, region=%지역%, main_region)
+
+        Returns:
+            추정 응답자 수 (히스토그램이 비어 있으면 None)
+        """
+        with self._lock:
+            buckets = self._buckets
+        if not buckets:
+            return None
+
+        gender = params.get("gender")
+        region = params.get("region")
+        region_term = region.strip("%") if isinstance(region, str) else None
+        main_region = params.get("main_region")
+        birth_year_ranges = self._birth_year_ranges(params)
+
+        matched = 0
+        for bucket_gender, birth_year, bucket_region, cnt in buckets:
+            if gender is not None and bucket_gender != gender:
+                continue
+            if region_term is not None and (bucket_region is None or region_term not in bucket_region):
+                continue
+            if main_region is not None and (bucket_region is None or bucket_region.split(" ", 1)[0] != main_region):
+                continue
+            if birth_year_ranges:
+                if birth_year is None:
+                    continue
+                if not any((lo is None or birth_year >= lo) and birth_year <= hi for lo, hi in birth_year_ranges):
+                    continue
+            matched += cnt
+        return matched
+
+    def estimate_selectivity(self, params: Dict[str, Any]) -> Optional[float]:
+        """필터를 만족하는 비율 (0~1, 히스토그램이 비어 있으면 None)"""
+        matched = self.estimate_matches(params)
+        if matched is None or self._total == 0:
+            return None
+        return matched / self._total
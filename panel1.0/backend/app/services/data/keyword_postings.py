@@ -0,0 +1,167 @@
+"""
+답변 키워드 포스팅 (core_v2.keyword_posting)
+- ETL(scripts/build_keyword_postings.py)에서 respondent_json.json_doc을 한 번만 토큰화해 (term, respondent_id, weight) 행으로 저장
+- 부정 표현은 답변(문장/항목) 단위로 판정 - 부정 답변의 단어는 포스팅에 넣지 않음 ("반려동물을 키워본 적 없다")
+- 질문 텍스트가 아닌 답변 값만 토큰화
+- 검색 시 키워드 조건 / 키워드 매칭 점수는 json_doc 문자열 스캔 대신 포스팅 조회(인덱스 조인)로 계산
+- term과 검색 키워드는 같은 규칙(조사 제거, 2글자 이상, 소문자)으로 정규화하고 접두 일치로 비교
+  (키워드 "아이폰" → term "아이폰", "아이폰15")
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import json
+import re
+
+POSTINGS_TABLE = "core_v2.keyword_posting"
+
+# 키워드 정제용 불용어 / 조사
+STOP_WORDS = {
+    '사용', '하는', '하는데', '한다', '한다고', '한다는', '한다면',
+    '을', '를', '이', '가', '은', '는', '에', '에서', '로', '으로',
+    '와', '과', '의', '도', '만', '부터', '까지', '보다', '처럼',
+    '같이', '만큼', '정도', '여부', '경험', '전제품', '해주', '주세요'
+}
+PARTICLES = ['을', '를', '이', '가', '은', '는', '에', '에서', '로', '으로', '와', '과', '의', '도', '만']
+
+# 답변 구분자 / 부정 표현 (scripts/migrate_keyword_index.py의 search_tsv 규칙과 동일)
+_ANSWER_SEPARATOR = re.compile(r'[.!?\n\r",;{}\[\]]+')
+_NEGATION_PATTERN = re.compile(r'(없다|없음|없습|없어|없었|않|못했|못함|못해|(^|\s)안\s|(^|\s)못\s|적\s*없)')
+_WORD_PATTERN = re.compile(r'\w+')
+
+# 질문 텍스트를 담는 JSON 키 (답변이 아니므로 토큰화하지 않음)
+_QUESTION_KEYS = {"question", "question_text", "q", "질문"}
+
+
+def normalize_term(word: str) -> Optional[str]:
+    """단어 → 검색어 (조사 제거, 2글자 미만/불용어는 None)"""
+    word_clean = word.strip()
+    # 조사 제거 (예: "아이폰을" → "아이폰")
+    for particle in PARTICLES:
+        if word_clean.endswith(particle):
+            word_clean = word_clean[:-len(particle)]
+            break
+    if word_clean and len(word_clean) >= 2 and word_clean not in STOP_WORDS:
+        return word_clean
+    return None
+
+
+def clean_search_keywords(semantic_keywords: Optional[List[str]]) -> List[str]:
+    """
+    의미 키워드 → 검색 단어 목록 (중복 제거, 순서 유지)
+    예: ["아이폰을 사용"] → ["아이폰"] (단어 단위 분리, 조사 제거, 2글자 미만/불용어 제외)
+    """
+    words = []
+    for kw in semantic_keywords or []:
+        if not kw or not kw.strip():
+            continue
+        for word in kw.strip().split():
+            term = normalize_term(word)
+            if term:
+                words.append(term)
+    return list(dict.fromkeys(words))
+
+
+def is_negated_answer(answer: str) -> bool:
+    """답변(문장/항목)에 부정 표현이 있는지"""
+    return bool(_NEGATION_PATTERN.search(f" {answer} "))
+
+
+def extract_answers(json_doc: Any) -> List[str]:
+    """
+    json_doc → 답변 목록
+    JSON이면 질문 키를 제외한 값만, 아니면 텍스트 전체를 문장/항목 단위로 분리
+    """
+    if not json_doc:
+        return []
+    doc = json_doc
+    if isinstance(doc, str):
+        try:
+            doc = json.loads(doc)
+        except ValueError:
+            pass
+
+    values = []
+    stack = [doc]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(v for k, v in value.items() if str(k).lower() not in _QUESTION_KEYS)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif value is not None and not isinstance(value, bool):
+            values.append(str(value))
+
+    answers = []
+    for value in reversed(values):
+        answers.extend(part.strip() for part in _ANSWER_SEPARATOR.split(value.lower()) if part.strip())
+    return answers
+
+
+def build_postings(json_doc: Any) -> Dict[str, float]:
+    """
+    json_doc → {term: weight}
+    weight는 term이 나온 부정 표현 없는 답변 수 (부정 답변에만 나온 term은 제외)
+    """
+    postings: Dict[str, float] = {}
+    for answer in extract_answers(json_doc):
+        if is_negated_answer(answer):
+            continue
+        terms = {term for term in (normalize_term(word) for word in _WORD_PATTERN.findall(answer)) if term}
+        for term in terms:
+            postings[term] = postings.get(term, 0.0) + 1.0
+    return postings
+
+
+def match_keywords(terms: Iterable[str], keywords: Sequence[str]) -> Set[str]:
+    """term 집합 중 접두 일치하는 키워드 집합"""
+    terms = list(terms)
+    return {keyword for keyword in keywords if any(term.startswith(keyword) for term in terms)}
+
+
+def _like_prefix(keyword: str) -> str:
+    """키워드 → LIKE 접두 패턴 (%, _, \\ 이스케이프)"""
+    return re.sub(r'([\\%_])', r'\\\1', keyword) + '%'
+
+
+def _term_conditions(keywords: Sequence[str], param_prefix: str) -> Tuple[str, Dict[str, str]]:
+    """키워드 → kp.term 접두 일치 조건 (키워드 간 OR)"""
+    params = {f"{param_prefix}_{i}": _like_prefix(keyword.lower()) for i, keyword in enumerate(keywords)}
+    return f"({' OR '.join(f'kp.term LIKE %({name})s' for name in params)})", params
+
+
+def build_postings_condition(
+    keywords: Sequence[str],
+    id_column: str = "pe.respondent_id",
+    param_prefix: str = "keyword_prefix"
+) -> Tuple[str, Dict[str, str]]:
+    """
+    키워드 → 포스팅 EXISTS 조건 (키워드 중 하나라도 일치하면 참)
+
+    Returns:
+        (조건 문자열, params)
+    """
+    term_condition, params = _term_conditions(keywords, param_prefix)
+    condition = (
+        f"EXISTS (SELECT 1 FROM {POSTINGS_TABLE} kp "
+        f"WHERE kp.respondent_id = {id_column} AND {term_condition})"
+    )
+    return condition, params
+
+
+def fetch_keyword_matches(cur, respondent_ids: Sequence[Any], keywords: Sequence[str]) -> Dict[Any, Set[str]]:
+    """
+    respondent_id 목록 → {respondent_id: 일치한 키워드 집합} (포스팅 한 번 조회)
+    """
+    keywords = [keyword.lower() for keyword in keywords]
+    if not respondent_ids or not keywords:
+        return {}
+    term_condition, params = _term_conditions(keywords, "keyword_prefix")
+    params["ids"] = list(respondent_ids)
+    cur.execute(
+        f"SELECT kp.respondent_id, kp.term FROM {POSTINGS_TABLE} kp "
+        f"WHERE kp.respondent_id = ANY(%(ids)s) AND {term_condition}",
+        params
+    )
+    terms_by_id: Dict[Any, List[str]] = {}
+    for respondent_id, term in cur.fetchall():
+        terms_by_id.setdefault(respondent_id, []).append(term)
+    return {respondent_id: match_keywords(terms, keywords) for respondent_id, terms in terms_by_id.items()}
@@ -0,0 +1,189 @@
+"""
+프로세스 내 메모리 매핑 벡터 인덱스 (읽기 위주 의미 검색용)
+- 패널 코퍼스는 ETL 실행 시에만 바뀌므로 respondent_id + embedding_256 행렬을 .npy로 내보내 두고
+  질의마다 Postgres 거리 계산 대신 NumPy 행렬-벡터 곱으로 top-k를 계산
+- .npy는 np.load(mmap_mode="r")로 열어 gunicorn 워커들이 OS 페이지 캐시를 공유
+- version.json(버전 스탬프)이 바뀌면 다음 검색 때 새 파일로 교체 (ETL 후 export만 다시 실행)
+
+파일 구성 (index_dir):
+    version.json                      {"version", "rows", "dim", "created_at", "embeddings", "ids"}
+    embeddings_<version>.npy          (N, 256) float32, 행 단위 L2 정규화
+    ids_<version>.npy                 (N,) 유니코드 respondent_id
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import os
+import threading
+import time
+from datetime import datetime
+import numpy as np
+
+
+VERSION_FILE = "version.json"
+
+# 기본 위치: backend/vector_index (VECTOR_LOCAL_INDEX_DIR로 변경 가능)
+DEFAULT_INDEX_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "vector_index"
+)
+
+
+def export_vector_index(
+    index_dir: str,
+    respondent_ids: Sequence[Any],
+    embeddings: Any,
+    keep_versions: int = 2
+) -> Dict[str, Any]:
+    """
+    respondent_id와 임베딩 행렬을 LocalVectorIndex 형식으로 저장
+    - 데이터 파일을 먼저 쓰고 version.json을 마지막에 원자적으로 교체하므로 읽는 쪽은 항상 완전한 버전만 봄
+    - 최근 keep_versions개 버전의 데이터 파일만 남김 (이전 버전을 매핑 중인 워커 보호)
+
+    Returns:
+        저장한 version.json 내용
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.shape[0] != len(respondent_ids):
+        raise ValueError(f"임베딩 행렬 크기 {matrix.shape}와 respondent_id 개수 {len(respondent_ids)}가 다릅니다.")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.where(norms == 0, 1.0, norms)
+
+    os.makedirs(index_dir, exist_ok=True)
+    version = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    names = {"embeddings": f"embeddings_{version}.npy", "ids": f"ids_{version}.npy"}
+    for key, array in (("embeddings", matrix), ("ids", np.array([str(rid) for rid in respondent_ids]))):
+        tmp_path = os.path.join(index_dir, names[key] + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, array, allow_pickle=False)
+        os.replace(tmp_path, os.path.join(index_dir, names[key]))
+
+    meta = {
+        "version": version,
+        "rows": int(matrix.shape[0]),
+        "dim": int(matrix.shape[1]),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        **names,
+    }
+    tmp_path = os.path.join(index_dir, VERSION_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(index_dir, VERSION_FILE))
+
+    versions = sorted(
+        {name.split("_", 1)[1][:-len(".npy")] for name in os.listdir(index_dir)
+         if name.endswith(".npy") and name.startswith(("embeddings_", "ids_"))},
+        reverse=True
+    )
+    for old_version in versions[max(keep_versions, 1):]:
+        for prefix in ("embeddings_", "ids_"):
+            try:
+                os.remove(os.path.join(index_dir, f"{prefix}{old_version}.npy"))
+            except OSError:
+                pass
+    return meta
+
+
+class LocalVectorIndex:
+    """
+    메모리 매핑 .npy 기반 코사인 거리 top-k 검색 (thread-safe)
+    버전 스탬프 확인은 check_interval_seconds마다 한 번 (stat 1회)
+    """
+
+    def __init__(self, index_dir: str, check_interval_seconds: float = 30.0):
+        self.index_dir = index_dir
+        self.check_interval_seconds = check_interval_seconds
+        self._lock = threading.Lock()
+        self._meta: Optional[Dict[str, Any]] = None
+        self._embeddings: Optional[np.ndarray] = None
+        self._ids: Optional[np.ndarray] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._checked_at: Optional[float] = None
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._meta["version"] if self._meta else None
+
+    @property
+    def rows(self) -> int:
+        return len(self._ids) if self._ids is not None else 0
+
+    def is_available(self) -> bool:
+        """인덱스 파일이 있고 로드 가능한지 (필요하면 새 버전으로 교체)"""
+        self.reload_if_changed()
+        return self._embeddings is not None
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """
+        version.json이 바뀌었으면 새 버전 매핑
+
+        Returns:
+            새로 로드했으면 True
+        """
+        now = time.monotonic()
+        if not force and self._checked_at is not None and now - self._checked_at < self.check_interval_seconds:
+            return False
+        with self._lock:
+            self._checked_at = now
+            version_path = os.path.join(self.index_dir, VERSION_FILE)
+            try:
+                stat = os.stat(version_path)
+            except OSError:
+                return False
+            # os.replace로 교체되므로 inode까지 비교 (같은 시각/크기의 연속 내보내기 구분)
+            stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if not force and stamp == self._stamp:
+                return False
+            try:
+                with open(version_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                embeddings = np.load(os.path.join(self.index_dir, meta["embeddings"]), mmap_mode="r", allow_pickle=False)
+                ids = np.load(os.path.join(self.index_dir, meta["ids"]), mmap_mode="r", allow_pickle=False)
+                if embeddings.ndim != 2 or embeddings.shape[0] != ids.shape[0]:
+                    raise ValueError(f"인덱스 파일 크기 불일치: embeddings={embeddings.shape}, ids={ids.shape}")
+            except Exception as e:
+                print(f"[WARN] 로컬 벡터 인덱스 로드 실패 ({version_path}): {e}")
+                return False
+            self._meta, self._embeddings, self._ids, self._stamp = meta, embeddings, ids, stamp
+            print(f"[INFO] 로컬 벡터 인덱스 로드: 버전 {meta['version']}, {ids.shape[0]}행 × {embeddings.shape[1]}차원")
+            return True
+
+    def search(
+        self,
+        query: Any,
+        limit: int,
+        distance_threshold: Optional[float] = None
+    ) -> Tuple[List[Tuple[str, float]], int]:
+        """
+        코사인 거리 top-k
+
+        Args:
+            query: 질의 벡터 (인덱스와 같은 차원)
+            limit: 반환할 최대 개수
+            distance_threshold: 코사인 거리 상한 (미만만 반환, None이면 제한 없음)
+
+        Returns:
+            ([(respondent_id, distance), ...] 거리 오름차순, 임계값을 만족하는 전체 행 수)
+        """
+        self.reload_if_changed()
+        with self._lock:
+            embeddings, ids = self._embeddings, self._ids
+        if embeddings is None:
+            raise RuntimeError(f"로컬 벡터 인덱스가 없습니다: {self.index_dir}")
+
+        q = np.asarray(query, dtype=np.float32).ravel()
+        if q.shape[0] != embeddings.shape[1]:
+            raise ValueError(f"질의 차원 {q.shape[0]}이 인덱스 차원 {embeddings.shape[1]}과 다릅니다.")
+        q = q / (np.linalg.norm(q) or 1.0)
+        distances = 1.0 - embeddings @ q
+
+        if distance_threshold is not None:
+            candidates = np.flatnonzero(distances < distance_threshold)
+        else:
+            candidates = np.arange(distances.shape[0])
+        total = int(candidates.shape[0])
+        if limit <= 0:
+            return [], total
+        if limit < total:
+            candidates = candidates[np.argpartition(distances[candidates], limit - 1)[:limit]]
+        order = candidates[np.argsort(distances[candidates], kind="stable")]
+        return [(str(ids[i]), float(distances[i])) for i in order], total
@@ -209,7 +209,7 @@ class PanelDataService:
                             '  COUNT(*) AS cnt '
                             'FROM "core_v2"."respondent" '
                             'WHERE birth_year IS NOT NULL '
-                            '  AND (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 10 AND 120 '
+                            '  AND birth_year BETWEEN EXTRACT(YEAR FROM CURRENT_DATE) - 120 AND EXTRACT(YEAR FROM CURRENT_DATE) - 10 '
                             'GROUP BY 1 '
                             'HAVING 1 IS NOT NULL '
                             'ORDER BY 1'
@@ -1,13 +1,142 @@
 """
 SQL 쿼리 빌더 (core_v2 스키마)
 """
+from dataclasses import dataclass, field, asdict
 from typing import Dict, Any, List, Optional, Tuple
 from app.services.data.executor import execute_sql_safe
+from app.services.data.demographic_table import DemographicSnapshot, get_demographic_snapshot
+from app.services.data.filter_compiler import compile_demographic_filters
+
+
+# 연령대 버킷 (10년 단위, 미상/10세 미만은 '기타')
+AGE_GROUP_SQL = """CASE
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 10 AND 19 THEN '10대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 20 AND 29 THEN '20대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 30 AND 39 THEN '30대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 40 AND 49 THEN '40대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 50 AND 59 THEN '50대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 60 AND 69 THEN '60대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 70 AND 79 THEN '70대'
+                WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= 80 THEN '80대'
+                ELSE '기타'
+            END"""
+
+# 필터 결과 분포를 한 번의 스캔으로 계산하는 집계 쿼리
+# - GROUPING SETS: 전체 / 성별 / 지역 / 대표 지역(첫 단어) / 연령대 분포를 한 번에
+# - FILTER: 전체 데이터셋(기준 집단)과 필터 결과를 같은 스캔에서 함께 집계 (include_dataset=True)
+FILTER_STATS_SQL = """
+    WITH base AS (
+        SELECT
+            gender,
+            region,
+            SPLIT_PART(region, ' ', 1) AS main_region,
+            {age_group} AS age_group,
+            birth_year IS NOT NULL AS has_birth_year,
+            {matched} AS matched
+        FROM "core_v2"."respondent"
+        {where_clause}
+    )
+    SELECT
+        GROUPING(gender, region, main_region, age_group) AS grouping_id,
+        gender,
+        region,
+        main_region,
+        age_group,
+        COUNT(*) FILTER (WHERE matched) AS filtered_count,
+        COUNT(*) AS dataset_count,
+        COUNT(*) FILTER (WHERE has_birth_year) AS dataset_aged_count
+    FROM base
+    GROUP BY GROUPING SETS ((), (gender), (region), (main_region), (age_group))
+"""
+
+# GROUPING(gender, region, main_region, age_group) 비트값 → 그룹 종류
+_GROUPING_KINDS = {15: "total", 7: "gender", 11: "region", 13: "main_region", 14: "age_group"}
+
+
+@dataclass
+class FilterStats:
+    """
+    필터 결과 분포 (결과 행과 별도로 반환)
+    
+    gender_stats/region_stats/age_stats 항목 형식은 기존 응답과 동일
+    ({"gender", "gender_count"}, {"region", "region_count"}, {"age_group", "age_count"})
+    dataset_stats는 get_total_dataset_stats()와 같은 형식 (include_dataset=True일 때만 채워짐)
+    """
+    total_count: int = 0
+    gender_stats: List[Dict[str, Any]] = field(default_factory=list)
+    region_stats: List[Dict[str, Any]] = field(default_factory=list)
+    age_stats: List[Dict[str, Any]] = field(default_factory=list)
+    dataset_stats: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_grouping_rows(cls, rows: List[Dict[str, Any]], include_dataset: bool = False) -> "FilterStats":
+        """FILTER_STATS_SQL 결과 행 → FilterStats (0건 그룹 제외, 건수 내림차순)"""
+        groups = {kind: [] for kind in _GROUPING_KINDS.values()}
+        for row in rows:
+            kind = _GROUPING_KINDS.get(row.get("grouping_id"))
+            if kind:
+                groups[kind].append(row)
+        
+        def top(kind, key, count_key="filtered_count", n=None, skip_null=False):
+            items = [
+                (row.get(key), row.get(count_key) or 0) for row in groups[kind]
+                if (row.get(count_key) or 0) > 0 and not (skip_null and row.get(key) is None)
+            ]
+            items.sort(key=lambda item: item[1], reverse=True)
+            return items[:n] if n else items
+        
+        total_row = groups["total"][0] if groups["total"] else {}
+        stats = cls(
+            total_count=total_row.get("filtered_count") or 0,
+            gender_stats=[
+                {"gender": gender, "gender_count": count}
+                for gender, count in top("gender", "gender", skip_null=True)
+            ],
+            region_stats=[
+                {"region": region, "region_count": count}
+                for region, count in top("region", "region", n=10)
+            ],
+            age_stats=[
+                {"age_group": group, "age_count": count}
+                for group, count in top("age_group", "age_group", n=10)
+            ]
+        )
+        if include_dataset:
+            stats.dataset_stats = {
+                "total_count": total_row.get("dataset_count") or 0,
+                "gender_stats": [
+                    {"gender": gender, "count": count}
+                    for gender, count in top("gender", "gender", "dataset_count", skip_null=True)
+                ],
+                "age_stats": [
+                    {"age_group": group, "count": count}
+                    for group, count in top("age_group", "age_group", "dataset_aged_count", n=10)
+                ],
+                "region_stats": [
+                    {"region": region, "count": count}
+                    for region, count in top("main_region", "main_region", "dataset_count", n=10, skip_null=True)
+                ]
+            }
+        return stats
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 class SQLBuilder:
     """SQL 쿼리 빌더 (core_v2 스키마 전용)"""
     
+    @staticmethod
+    def build_where_conditions(filters: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        필터 → WHERE 조건 목록과 파라미터 (build_filter_query / 통계 쿼리 공용)
+        
+        Returns:
+            (where_conditions, params) 튜플
+        """
+        # 연령대는 birth_year 범위로 변환 (인덱스 사용 가능한 sargable 조건)
+        return compile_demographic_filters(filters)
+    
     @staticmethod
     def build_filter_query(
         filters: Dict[str, Any],
@@ -30,134 +159,7 @@ class SQLBuilder:
         Returns:
             (query, params) 튜플
         """
-        where_conditions = []
-        params = {}
-        
-        # 연령 필터 (birth_year 사용) - 여러 연령대 지원 (예: "30s,40s")
-        if filters.get("age") or filters.get("age_range"):
-            age_range = filters.get("age") or filters.get("age_range")
-            
-            # 여러 연령대가 쉼표로 구분된 경우 처리
-            if isinstance(age_range, str) and "," in age_range:
-                age_ranges = [a.strip() for a in age_range.split(",")]
-                age_conditions = []
-                
-                for idx, age_r in enumerate(age_ranges):
-                    param_suffix = f"_{idx}"
-                    if age_r == "20s":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 20
-                        params[f"age_max{param_suffix}"] = 29
-                    elif age_r == "30s":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 30
-                        params[f"age_max{param_suffix}"] = 39
-                    elif age_r == "40s":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 40
-                        params[f"age_max{param_suffix}"] = 49
-                    elif age_r == "50s":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 50
-                        params[f"age_max{param_suffix}"] = 59
-                    elif age_r == "60s" or age_r == "60s+":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 60
-                    elif age_r == "70s" or age_r == "70s+":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 70
-                    elif age_r == "80s" or age_r == "80s+":
-                        age_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min" + param_suffix + ")s"
-                        )
-                        params[f"age_min{param_suffix}"] = 80
-                
-                if age_conditions:
-                    where_conditions.append(f"({' OR '.join(age_conditions)})")
-            else:
-                # 단일 연령대 처리 (기존 로직)
-                if age_range == "20s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    params["age_min"] = 20
-                    params["age_max"] = 29
-                elif age_range == "30s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    params["age_min"] = 30
-                    params["age_max"] = 39
-                elif age_range == "40s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    params["age_min"] = 40
-                    params["age_max"] = 49
-                elif age_range == "50s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    params["age_min"] = 50
-                    params["age_max"] = 59
-                elif age_range == "60s" or age_range == "60s+":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min)s"
-                    )
-                    params["age_min"] = 60
-                elif age_range == "70s" or age_range == "70s+":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min)s"
-                    )
-                    params["age_min"] = 70
-                elif age_range == "80s" or age_range == "80s+":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min)s"
-                    )
-                    params["age_min"] = 80
-        
-        # 성별 필터
-        if filters.get("gender"):
-            gender = filters["gender"]
-            if gender in ["M", "남"]:
-                where_conditions.append("gender = %(gender)s")
-                params["gender"] = "남"
-            elif gender in ["F", "여"]:
-                where_conditions.append("gender = %(gender)s")
-                params["gender"] = "여"
-        
-        # 지역 필터
-        if filters.get("region"):
-            region = filters["region"]
-            where_conditions.append("region LIKE %(region)s")
-            params["region"] = f"%{region}%"
-        
-        # 태그 필터 (interests 배열과 교집합)
-        # 대소문자 구분 없이 매칭하기 위해 EXISTS 서브쿼리 사용
-        if filters.get("tags") and isinstance(filters["tags"], list) and len(filters["tags"]) > 0:
-            tags = [tag.strip() for tag in filters["tags"] if tag and tag.strip()]
-            if tags:
-                tag_conditions = []
-                for i, tag in enumerate(tags):
-                    param_name = f"tag_{i}"
-                    # 개행 제거하여 SQL 안전성 검사 통과
-                    tag_conditions.append(f"EXISTS (SELECT 1 FROM unnest(interests) AS interest WHERE LOWER(interest) = LOWER(%({param_name})s))")
-                    params[param_name] = tag
-                
-                if tag_conditions:
-                    where_conditions.append(f"(interests IS NOT NULL AND ({' OR '.join(tag_conditions)}))")
+        where_conditions, params = SQLBuilder.build_where_conditions(filters)
         
         # WHERE 절 구성
         where_clause = ""
@@ -191,6 +193,78 @@ class SQLBuilder:
         
         return query, params
     
+    @staticmethod
+    def build_filter_stats_query(
+        filters: Dict[str, Any],
+        include_dataset: bool = False
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        필터 결과 분포 집계 쿼리 생성 (FILTER_STATS_SQL)
+        
+        include_dataset=False: 필터를 WHERE로 적용 (인덱스 사용 가능, 필터 결과만 스캔)
+        include_dataset=True: 전체 테이블을 한 번 스캔하며 필터 조건은 FILTER 집계로 적용
+                              → 기준 집단(전체 데이터셋) 분포까지 같은 쿼리로 계산
+        """
+        where_conditions, params = SQLBuilder.build_where_conditions(filters)
+        condition = " AND ".join(where_conditions) if where_conditions else "TRUE"
+        if include_dataset:
+            matched, where_clause = f"({condition})", ""
+        else:
+            matched, where_clause = "TRUE", f"WHERE {condition}" if where_conditions else ""
+        query = FILTER_STATS_SQL.format(
+            age_group=AGE_GROUP_SQL,
+            matched=matched,
+            where_clause=where_clause
+        ).strip()
+        return query, params
+    
+    @staticmethod
+    def get_filter_stats(
+        filters: Dict[str, Any],
+        include_dataset: bool = False
+    ) -> FilterStats:
+        """
+        필터 결과의 전체 개수 / 성별 / 지역 / 연령대 분포를 단일 집계 쿼리로 계산
+        
+        Args:
+            filters: 필터 딕셔너리 (build_filter_query와 동일)
+            include_dataset: True면 전체 데이터셋 통계(dataset_stats)도 같은 스캔에서 계산
+        """
+        snapshot = get_demographic_snapshot()
+        if snapshot is not None:
+            return SQLBuilder._get_filter_stats_in_memory(snapshot, filters, include_dataset)
+        
+        query, params = SQLBuilder.build_filter_stats_query(filters, include_dataset)
+        try:
+            # 지역(region) 그룹 수만큼 행이 나오므로 limit을 넉넉하게
+            rows = execute_sql_safe(query=query, params=params, limit=10000, prepare=True)
+        except Exception as e:
+            print(f"[WARN] 필터 통계 계산 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return FilterStats(dataset_stats=SQLBuilder._empty_dataset_stats() if include_dataset else None)
+        
+        stats = FilterStats.from_grouping_rows(rows, include_dataset)
+        print(f"[DEBUG] 필터 통계 (단일 집계): 전체 {stats.total_count}개, 성별 {len(stats.gender_stats)}, "
+              f"지역 {len(stats.region_stats)}, 연령대 {len(stats.age_stats)}")
+        return stats
+    
+    @staticmethod
+    def execute_filter_search(
+        filters: Dict[str, Any],
+        limit: Optional[int] = None,
+        include_dataset_stats: bool = False
+    ) -> Tuple[List[Dict[str, Any]], FilterStats]:
+        """
+        필터 검색: 결과 행 + 분포 통계 (FilterFirstSearch용)
+        
+        Returns:
+            (results, stats) 튜플 - 통계는 행에 복사하지 않고 FilterStats로 별도 반환
+        """
+        stats = SQLBuilder.get_filter_stats(filters, include_dataset=include_dataset_stats)
+        results = SQLBuilder.execute_filter_query(filters, limit)
+        return results, stats
+    
     @staticmethod
     def execute_filter_query(
         filters: Dict[str, Any],
@@ -199,267 +273,97 @@ class SQLBuilder:
         """
         필터 쿼리 실행 (core_v2 스키마)
         
+        전체 개수/분포가 필요하면 execute_filter_search 또는 get_filter_stats 사용
+        
         Returns:
             검색 결과 리스트
         """
-        query, params = SQLBuilder.build_filter_query(filters, limit)
-        
-        print(f"[DEBUG] SQLBuilder.execute_filter_query:")
-        print(f"  filters: {filters}")
-        print(f"  limit: {limit}")
-        print(f"  generated SQL: {query}")
-        print(f"  params: {params}")
+        # 통계 정확도를 위해 DEFAULT_LIMIT = 1000 설정
+        # SQL 필터링은 매우 빠르므로 1000개도 성능에 거의 영향 없음
+        DEFAULT_LIMIT = 1000
+        effective_limit = limit if limit is not None else DEFAULT_LIMIT
         
-        try:
-            # WHERE 절 재구성 (build_filter_query에서 생성한 params 재사용)
-            where_conditions = []
-            where_params = params.copy()
-            
-            # 연령 필터
-            if filters.get("age") or filters.get("age_range"):
-                age_range = filters.get("age") or filters.get("age_range")
-                if age_range == "20s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    where_params["age_min"] = 20
-                    where_params["age_max"] = 29
-                elif age_range == "30s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    where_params["age_min"] = 30
-                    where_params["age_max"] = 39
-                elif age_range == "40s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    where_params["age_min"] = 40
-                    where_params["age_max"] = 49
-                elif age_range == "50s":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    where_params["age_min"] = 50
-                    where_params["age_max"] = 59
-                elif age_range == "60s" or age_range == "60s+":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min)s"
-                    )
-                    where_params["age_min"] = 60
-                elif age_range == "70s" or age_range == "70s+":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min)s"
-                    )
-                    where_params["age_min"] = 70
-                elif age_range == "80s" or age_range == "80s+":
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= %(age_min)s"
-                    )
-                    where_params["age_min"] = 80
-            
-            # 성별 필터
-            if filters.get("gender"):
-                gender = filters["gender"]
-                if gender in ["M", "남"]:
-                    where_conditions.append("gender = %(gender)s")
-                    where_params["gender"] = "남"
-                elif gender in ["F", "여"]:
-                    where_conditions.append("gender = %(gender)s")
-                    where_params["gender"] = "여"
-            
-            # 지역 필터
-            if filters.get("region"):
-                region = filters["region"]
-                where_conditions.append("region LIKE %(region)s")
-                where_params["region"] = f"%{region}%"
-            
-            # 태그 필터 (interests 배열과 교집합)
-            # 대소문자 구분 없이 매칭하기 위해 EXISTS 서브쿼리 사용
-            if filters.get("tags") and isinstance(filters["tags"], list) and len(filters["tags"]) > 0:
-                tags = [tag.strip() for tag in filters["tags"] if tag and tag.strip()]
-                if tags:
-                    tag_conditions = []
-                    for i, tag in enumerate(tags):
-                        param_name = f"tag_{i}"
-                        # 개행 제거하여 SQL 안전성 검사 통과
-                        tag_conditions.append(f"EXISTS (SELECT 1 FROM unnest(interests) AS interest WHERE LOWER(interest) = LOWER(%({param_name})s))")
-                        where_params[param_name] = tag
-                    
-                    if tag_conditions:
-                        where_conditions.append(f"(interests IS NOT NULL AND ({' OR '.join(tag_conditions)}))")
-            
+        # 인구통계 컬럼 테이블이 켜져 있으면 메모리에서 마스크 계산 (DEMOGRAPHIC_TABLE_ENABLED)
+        snapshot = get_demographic_snapshot()
+        if snapshot is not None:
+            results = snapshot.rows_for(snapshot.mask_from_filters(filters), effective_limit)
+        else:
+            where_conditions, where_params = SQLBuilder.build_where_conditions(filters)
             where_clause = ""
             if where_conditions:
                 where_clause = "WHERE " + " AND ".join(where_conditions)
             
-            # 테이블명 스키마 분리 및 따옴표 처리
-            table_name_used = "core_v2.respondent"  # 기본 테이블명
-            if '.' in table_name_used:
-                schema, table = table_name_used.split('.', 1)
-                quoted_table = f'"{schema}"."{table}"'
-            else:
-                quoted_table = f'"{table_name_used}"'
-            
-            # ★ Window Function을 사용하여 COUNT와 SELECT를 한 번에 처리
-            # 별도의 COUNT 쿼리 제거 - 성능 최적화
-            
-            # 전체 검색 결과에 대한 성별 통계 계산 (LIMIT 없이)
-            gender_stats_result = []
-            try:
-                gender_where = "WHERE gender IS NOT NULL"
-                if where_clause:
-                    gender_where = f"{where_clause} AND gender IS NOT NULL"
-                gender_stats_query = f"""
-                    SELECT 
-                        gender,
-                        COUNT(*) as gender_count
-                    FROM {quoted_table}
-                    {gender_where}
-                    GROUP BY gender
-                    ORDER BY gender_count DESC
-                """.strip()
-                
-                gender_stats_result = execute_sql_safe(
-                    query=gender_stats_query,
-                    params=where_params,
-                    limit=10
-                )
-                print(f"[DEBUG] 성별 통계: {len(gender_stats_result)}개 성별")
-            except Exception as e:
-                print(f"[WARN] 성별 통계 계산 실패: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            # 전체 검색 결과에 대한 지역별 통계 계산 (LIMIT 없이)
-            region_stats_result = []
-            try:
-                region_stats_query = f"""
-                    SELECT 
-                        region,
-                        COUNT(*) as region_count
-                    FROM {quoted_table}
-                    {where_clause}
-                    GROUP BY region
-                    ORDER BY region_count DESC
-                    LIMIT 10
-                """.strip()
-                
-                region_stats_result = execute_sql_safe(
-                    query=region_stats_query,
-                    params=where_params,
-                    limit=10
-                )
-                print(f"[DEBUG] 지역별 통계: {len(region_stats_result)}개 지역")
-            except Exception as e:
-                print(f"[WARN] 지역별 통계 계산 실패: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            # 전체 검색 결과에 대한 연령대별 통계 계산 (LIMIT 없이)
-            age_stats_result = []
-            try:
-                # 연령대를 10년 단위로 그룹핑 (20세-29세 → 20대, 30세-39세 → 30대)
-                age_stats_query = f"""
-                    SELECT 
-                        CASE 
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 10 AND 19 THEN '10대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 20 AND 29 THEN '20대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 30 AND 39 THEN '30대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 40 AND 49 THEN '40대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 50 AND 59 THEN '50대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 60 AND 69 THEN '60대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 70 AND 79 THEN '70대'
-                            WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= 80 THEN '80대'
-                            ELSE '기타'
-                        END as age_group,
-                        COUNT(*) as age_count
-                    FROM {quoted_table}
-                    {where_clause}
-                    GROUP BY age_group
-                    ORDER BY age_count DESC
-                    LIMIT 10
-                """.strip()
-                
-                age_stats_result = execute_sql_safe(
-                    query=age_stats_query,
-                    params=where_params,
-                    limit=10
-                )
-                print(f"[DEBUG] 연령대별 통계: {len(age_stats_result)}개 연령대")
-            except Exception as e:
-                print(f"[WARN] 연령대별 통계 계산 실패: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            # ★ Window Function을 사용하여 COUNT와 SELECT를 한 번에 처리
-            # 실제 데이터 조회 (limit 적용) - Window Function으로 total_count 포함
-            # 통계 정확도를 위해 DEFAULT_LIMIT = 1000 설정
-            # SQL 필터링은 매우 빠르므로 1000개도 성능에 거의 영향 없음
-            DEFAULT_LIMIT = 1000
-            effective_limit = limit if limit is not None else DEFAULT_LIMIT
-            
-            # Window Function을 사용한 최적화된 쿼리
-            # COUNT(*) OVER()를 사용하여 별도의 COUNT 쿼리 없이 한 번에 처리
-            optimized_query = f"""
+            query = f"""
                 SELECT 
                     respondent_id,
                     gender,
                     birth_year,
                     region,
                     district,
-                    COALESCE(interests, ARRAY[]::text[]) as interests,
-                    COUNT(*) OVER() as total_count
-                FROM {quoted_table}
+                    COALESCE(interests, ARRAY[]::text[]) as interests
+                FROM "core_v2"."respondent"
                 {where_clause}
                 LIMIT %(limit)s
             """.strip()
-            
             where_params['limit'] = effective_limit
             
-            results = execute_sql_safe(
-                query=optimized_query,
-                params=where_params,
-                limit=effective_limit
-            )
-            
-            # total_count 추출 (첫 번째 행에서)
-            total_count = 0
-            if results and len(results) > 0:
-                total_count = results[0].get('total_count', 0)
-                # total_count 필드 제거 (메타데이터이므로)
-                for result in results:
-                    if 'total_count' in result:
-                        del result['total_count']
-            
-            # 프론트엔드 호환성을 위해 응답 형식 변환
-            # birth_year → age_text 변환
-            from datetime import datetime
-            current_year = datetime.now().year
-            for result in results:
-                if 'birth_year' in result and result['birth_year']:
-                    age = current_year - result['birth_year']
-                    # 년생 정보 제거하고 나이만 표시
-                    result['age_text'] = f"만 {age}세"
-                # doc_id 필드 추가 (하위 호환성)
-                if 'respondent_id' in result:
-                    result['doc_id'] = result['respondent_id']
-                # 전체 개수를 메타데이터로 추가
-                result['_total_count'] = total_count
-                # 성별 통계를 메타데이터로 추가
-                result['_gender_stats'] = gender_stats_result
-                # 지역별 통계를 메타데이터로 추가
-                result['_region_stats'] = region_stats_result
-                # 연령대별 통계를 메타데이터로 추가
-                result['_age_stats'] = age_stats_result
+            print(f"[DEBUG] SQLBuilder.execute_filter_query:")
+            print(f"  filters: {filters}")
+            print(f"  limit: {limit}")
+            print(f"  generated SQL: {query}")
+            print(f"  params: {where_params}")
             
-            print(f"[DEBUG] SQL 실행 결과: {len(results)}개 (전체: {total_count}개) - Window Function 사용")
-            return results
-        except Exception as e:
-            print(f"[ERROR] 필터 쿼리 실행 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            try:
+                results = execute_sql_safe(
+                    query=query,
+                    params=where_params,
+                    limit=effective_limit,
+                    prepare=True
+                )
+            except Exception as e:
+                print(f"[ERROR] 필터 쿼리 실행 실패: {e}")
+                import traceback
+                traceback.print_exc()
+                return []
+        
+        # 프론트엔드 호환성을 위해 응답 형식 변환
+        # birth_year → age_text 변환
+        from datetime import datetime
+        current_year = datetime.now().year
+        for result in results:
+            if result.get('birth_year'):
+                # 년생 정보 제거하고 나이만 표시
+                result['age_text'] = f"만 {current_year - result['birth_year']}세"
+            # doc_id 필드 추가 (하위 호환성)
+            if 'respondent_id' in result:
+                result['doc_id'] = result['respondent_id']
+        
+        print(f"[DEBUG] 필터 쿼리 결과: {len(results)}개")
+        return results
+    
+    @staticmethod
+    def _get_filter_stats_in_memory(
+        snapshot: DemographicSnapshot,
+        filters: Dict[str, Any],
+        include_dataset: bool = False
+    ) -> FilterStats:
+        """get_filter_stats의 인구통계 컬럼 테이블 버전 (형식은 SQL 경로와 동일)"""
+        mask = snapshot.mask_from_filters(filters)
+        stats = FilterStats(
+            total_count=snapshot.count(mask),
+            gender_stats=[
+                {"gender": gender, "gender_count": count} for gender, count in snapshot.gender_counts(mask)
+            ],
+            region_stats=[
+                {"region": region, "region_count": count} for region, count in snapshot.region_counts(mask, top=10)
+            ],
+            age_stats=[
+                {"age_group": group, "age_count": count} for group, count in snapshot.age_group_counts(mask)[:10]
+            ]
+        )
+        if include_dataset:
+            stats.dataset_stats = SQLBuilder.get_total_dataset_stats()
+        return stats
     
     @staticmethod
     def get_total_dataset_stats() -> Dict[str, Any]:
@@ -475,99 +379,36 @@ class SQLBuilder:
             }
         """
         print("[DEBUG] get_total_dataset_stats() 호출 시작")
-        try:
-            quoted_table = '"core_v2"."respondent"'
-            
-            # 전체 개수
-            total_count_query = f"""
-                SELECT COUNT(*) as total_count
-                FROM {quoted_table}
-            """.strip()
-            
-            total_result = execute_sql_safe(query=total_count_query, params={}, limit=1)
-            total_count = total_result[0].get('total_count', 0) if total_result else 0
-            print(f"[DEBUG] 전체 데이터셋 개수: {total_count}")
-            
-            # 성별 통계
-            gender_stats_query = f"""
-                SELECT 
-                    gender,
-                    COUNT(*) as count
-                FROM {quoted_table}
-                WHERE gender IS NOT NULL
-                GROUP BY gender
-                ORDER BY count DESC
-            """.strip()
-            
-            gender_stats_result = execute_sql_safe(query=gender_stats_query, params={}, limit=10)
-            gender_stats = [
-                {"gender": row.get("gender", ""), "count": row.get("count", 0)}
-                for row in gender_stats_result
-            ]
-            
-            # 연령대 통계
-            age_stats_query = f"""
-                SELECT 
-                    CASE 
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 10 AND 19 THEN '10대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 20 AND 29 THEN '20대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 30 AND 39 THEN '30대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 40 AND 49 THEN '40대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 50 AND 59 THEN '50대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 60 AND 69 THEN '60대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 70 AND 79 THEN '70대'
-                        WHEN (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= 80 THEN '80대'
-                        ELSE '기타'
-                    END as age_group,
-                    COUNT(*) as count
-                FROM {quoted_table}
-                WHERE birth_year IS NOT NULL
-                GROUP BY age_group
-                ORDER BY count DESC
-            """.strip()
-            
-            age_stats_result = execute_sql_safe(query=age_stats_query, params={}, limit=10)
-            age_stats = [
-                {"age_group": row.get("age_group", ""), "count": row.get("count", 0)}
-                for row in age_stats_result
-            ]
-            
-            # 지역 통계 (첫 단어 기준)
-            region_stats_query = f"""
-                SELECT 
-                    SPLIT_PART(region, ' ', 1) as main_region,
-                    COUNT(*) as count
-                FROM {quoted_table}
-                WHERE region IS NOT NULL
-                GROUP BY main_region
-                ORDER BY count DESC
-                LIMIT 10
-            """.strip()
-            
-            region_stats_result = execute_sql_safe(query=region_stats_query, params={}, limit=10)
-            region_stats = [
-                {"region": row.get("main_region", ""), "count": row.get("count", 0)}
-                for row in region_stats_result
-            ]
-            
-            result = {
-                "total_count": total_count,
-                "gender_stats": gender_stats,
-                "age_stats": age_stats,
-                "region_stats": region_stats
-            }
-            print(f"[DEBUG] get_total_dataset_stats() 완료: total_count={total_count}, gender={len(gender_stats)}, age={len(age_stats)}, region={len(region_stats)}")
-            return result
-        except Exception as e:
-            print(f"[WARN] 전체 데이터셋 통계 계산 실패: {e}")
-            import traceback
-            traceback.print_exc()
+        snapshot = get_demographic_snapshot()
+        if snapshot is not None:
+            mask = snapshot.mask()
             return {
-                "total_count": 0,
-                "gender_stats": [],
-                "age_stats": [],
-                "region_stats": []
+                "total_count": snapshot.count(mask),
+                "gender_stats": [
+                    {"gender": gender, "count": count} for gender, count in snapshot.gender_counts(mask)
+                ],
+                "age_stats": [
+                    {"age_group": group, "count": count}
+                    for group, count in snapshot.age_group_counts(mask, include_unknown=False)
+                ],
+                "region_stats": [
+                    {"region": region, "count": count} for region, count in snapshot.main_region_counts(mask, top=10)
+                ]
             }
+        # 전체 개수 / 성별 / 연령대 / 대표 지역 분포를 단일 집계 쿼리로 계산
+        stats = SQLBuilder.get_filter_stats({}, include_dataset=True)
+        result = stats.dataset_stats or SQLBuilder._empty_dataset_stats()
+        print(f"[DEBUG] get_total_dataset_stats() 완료: total_count={result['total_count']}, gender={len(result['gender_stats'])}, age={len(result['age_stats'])}, region={len(result['region_stats'])}")
+        return result
+    
+    @staticmethod
+    def _empty_dataset_stats() -> Dict[str, Any]:
+        return {
+            "total_count": 0,
+            "gender_stats": [],
+            "age_stats": [],
+            "region_stats": []
+        }
     
     @staticmethod
     def get_filtered_stats(filters: Dict[str, Any]) -> Dict[str, Any]:
@@ -586,47 +427,23 @@ class SQLBuilder:
             }
         """
         print(f"[DEBUG] get_filtered_stats() 호출: filters={filters}")
+        # 지역은 대표 지역(첫 단어) 일치, 연령대는 "30s" / "30대" 모두 지원
+        compiled_filters = {
+            "main_region": filters.get("region"),
+            "gender": filters.get("gender"),
+            "age": filters.get("age") or filters.get("age_group")
+        }
+        snapshot = get_demographic_snapshot()
+        if snapshot is not None:
+            return {
+                "total_count": snapshot.count(snapshot.mask_from_filters(compiled_filters)),
+                "gender_stats": [],
+                "age_stats": [],
+                "region_stats": []
+            }
         try:
             quoted_table = '"core_v2"."respondent"'
-            
-            # WHERE 조건 생성
-            where_conditions = []
-            params = {}
-            
-            # 지역 필터
-            if filters.get("region"):
-                region = filters["region"]
-                where_conditions.append("SPLIT_PART(region, ' ', 1) = %(region)s")
-                params["region"] = region
-            
-            # 성별 필터
-            if filters.get("gender"):
-                gender = filters["gender"]
-                if gender in ["M", "남", "남성", "남자"]:
-                    params["gender"] = "남"
-                elif gender in ["F", "여", "여성", "여자"]:
-                    params["gender"] = "여"
-                else:
-                    params["gender"] = gender
-                where_conditions.append("gender = %(gender)s")
-            
-            # 연령 필터
-            if filters.get("age") or filters.get("age_group"):
-                age_range = filters.get("age") or filters.get("age_group")
-                if age_range.endswith("s"):
-                    decade = int(age_range.replace("s", ""))
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    params["age_min"] = decade
-                    params["age_max"] = decade + 9
-                elif age_range.endswith("대"):
-                    decade = int(age_range.replace("대", ""))
-                    where_conditions.append(
-                        "(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                    )
-                    params["age_min"] = decade
-                    params["age_max"] = decade + 9
+            where_conditions, params = compile_demographic_filters(compiled_filters)
             
             where_clause = ""
             if where_conditions:
@@ -639,7 +456,7 @@ class SQLBuilder:
                 {where_clause}
             """.strip()
             
-            total_result = execute_sql_safe(query=total_count_query, params=params, limit=1)
+            total_result = execute_sql_safe(query=total_count_query, params=params, limit=1, prepare=True)
             total_count = total_result[0].get('total_count', 0) if total_result else 0
             
             result = {
@@ -2,11 +2,26 @@
 벡터 검색 서비스 (core_v2 스키마 사용)
 768차원 → 256차원 Autoencoder를 사용한 압축 검색
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Sequence
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
 import os
+import queue
+import re
+import threading
+import time
+import unicodedata
 import numpy as np
+from app.db.vector_adapter import PgVector, binary_select, from_binary
 from app.services.data.executor import execute_sql_safe
-from app.services.common.singleton import Singleton
+from app.services.data.encoder import NumpyDenseEncoder
+from app.services.data.histogram import DemographicHistogram
+from app.services.data.filter_compiler import compile_demographic_filters
+from app.services.data.keyword_postings import build_postings_condition, clean_search_keywords, fetch_keyword_matches
+from app.services.data.local_index import DEFAULT_INDEX_DIR, LocalVectorIndex
+from app.services.semantic.keyword_matcher import get_keyword_matcher
+from app.services.common.singleton import Singleton, singleton_init
 
 # TensorFlow 로그 레벨 설정 (콘솔 정리)
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # 0=all, 1=info, 2=warnings, 3=errors only
@@ -18,20 +33,344 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     print("[ERROR] sentence-transformers 라이브러리가 설치되지 않았습니다.")
 
-try:
-    import tensorflow as tf
-    # tf-keras를 사용하여 Keras 3 호환성 문제 해결
+
+
+def _import_keras():
+    """
+    tf_keras(또는 tensorflow.keras) 지연 import
+    NumPy 인코더(.npz)를 사용할 때는 TensorFlow를 로드하지 않음 (콜드 스타트/메모리 절감)
+    """
     try:
-        import tf_keras as keras
+        import tensorflow as tf
+        # tf-keras를 사용하여 Keras 3 호환성 문제 해결
+        try:
+            import tf_keras as keras
+        except ImportError:
+            # tf-keras가 없으면 tensorflow.keras 사용
+            from tensorflow import keras
+        # TensorFlow 경고 메시지 억제
+        tf.get_logger().setLevel('ERROR')
+        return keras
     except ImportError:
-        # tf-keras가 없으면 tensorflow.keras 사용
-        from tensorflow import keras
-    TENSORFLOW_AVAILABLE = True
-    # TensorFlow 경고 메시지 억제
-    tf.get_logger().setLevel('ERROR')
-except ImportError:
-    TENSORFLOW_AVAILABLE = False
-    print("[ERROR] tensorflow 라이브러리가 설치되지 않았습니다.")
+        return None
+
+
+def _find_model_file(filename: str) -> Tuple[Optional[str], List[str]]:
+    """
+    모델 파일 경로 찾기
+    vector.py 위치: backend/app/services/data/vector.py → 목표: backend/scripts/<filename>
+    
+    Returns:
+        (찾은 경로 또는 None, 시도한 경로 리스트)
+    """
+    current_file = os.path.abspath(__file__)
+    # backend/app/services/data -> backend/app/services -> backend/app -> backend
+    backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(current_file))))
+    possible_paths = [
+        os.path.join(backend_dir, "scripts", filename),  # backend/scripts/<filename>
+        os.path.join(backend_dir, filename),  # backend/<filename>
+        os.path.join(os.path.dirname(backend_dir), "scripts", filename),  # panel1.0/scripts/<filename>
+    ]
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path, possible_paths
+    return None, possible_paths
+
+
+class QueryEmbeddingCache:
+    """
+    질의 임베딩 LRU 캐시 (768차원 → 256차원 파이프라인 결과 캐싱)
+    - 정규화된 질의 텍스트를 키로 사용
+    - 최대 개수(max_size) 초과 시 가장 오래 사용되지 않은 항목 제거
+    - TTL(ttl_seconds)이 지난 항목은 조회 시 제거
+    - 여러 요청 스레드에서 동시에 사용 가능 (Lock 보호)
+    """
+    
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 600.0):
+        self.max_size = max(0, int(max_size))
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def normalize_key(text: str) -> str:
+        """캐시 키 정규화 (유니코드 NFC + 공백 정리)"""
+        if not text:
+            return ""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+    
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        if self.max_size == 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds > 0 and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key: str, value: Any) -> None:
+        """캐시 저장 (용량 초과 시 LRU 제거)"""
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """캐시 비우기 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 반환 (hit/miss 카운터 포함)"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+
+class EmbeddingBatchScheduler:
+    """
+    임베딩 마이크로 배칭 스케줄러
+    - 여러 요청 스레드가 동시에 제출한 질의 텍스트를 최대 max_wait_ms 동안 모아서
+      encode_batch_fn으로 한 번에 임베딩 (SentenceTransformer + Autoencoder 배치 1회)
+    - 각 호출자는 Future로 자신의 결과를 받음
+    - 같은 배치 안의 동일 텍스트는 한 번만 임베딩
+    """
+    
+    def __init__(
+        self,
+        encode_batch_fn: Callable[[List[str]], Sequence[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0
+    ):
+        self.encode_batch_fn = encode_batch_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_seconds = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+        self.batches = 0
+        self.items = 0
+    
+    def submit(self, text: str) -> Future:
+        """질의 텍스트 제출 → 결과 Future 반환"""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+    
+    def embed(self, text: str, timeout: Optional[float] = None) -> Any:
+        """질의 텍스트 제출 후 결과가 나올 때까지 대기"""
+        return self.submit(text).result(timeout=timeout)
+    
+    def stats(self) -> Dict[str, Any]:
+        """배칭 통계 (평균 배치 크기 등)"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_seconds * 1000.0,
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": (self.items / self.batches) if self.batches else 0.0,
+        }
+    
+    def _ensure_worker(self) -> None:
+        # gunicorn fork 이후에는 부모 프로세스의 스레드가 없으므로 다시 시작
+        pid = os.getpid()
+        if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+                return
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._run, name="embedding-batch-scheduler", daemon=True
+            )
+            self._worker_pid = pid
+            self._worker.start()
+    
+    def _collect_batch(self) -> List[Tuple[str, Future]]:
+        """첫 항목을 기다린 뒤, max_wait 동안 max_batch_size까지 추가로 수집"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            # 취소된 요청은 제외하고, 동일 텍스트는 하나로 묶음
+            pending: "OrderedDict[str, List[Future]]" = OrderedDict()
+            for text, future in batch:
+                if future.set_running_or_notify_cancel():
+                    pending.setdefault(text, []).append(future)
+            if not pending:
+                continue
+            
+            texts = list(pending.keys())
+            try:
+                outputs = self.encode_batch_fn(texts)
+                if len(outputs) != len(texts):
+                    raise RuntimeError(f"배치 임베딩 결과 개수 불일치: {len(outputs)} != {len(texts)}")
+            except Exception as e:
+                for futures in pending.values():
+                    for future in futures:
+                        future.set_exception(e)
+                continue
+            
+            self.batches += 1
+            self.items += len(texts)
+            for text, output in zip(texts, outputs):
+                for future in pending[text]:
+                    future.set_result(output)
+
+
+COUNT_MODES = ("exact", "estimate", "none")
+
+_count_executor: Optional[ThreadPoolExecutor] = None
+_count_executor_pid: Optional[int] = None
+_count_executor_lock = threading.Lock()
+
+
+def get_default_count_mode() -> str:
+    """VECTOR_COUNT_MODE 환경변수 (기본값: exact)"""
+    return os.environ.get("VECTOR_COUNT_MODE", "exact").lower()
+
+
+# 벡터 저장 방식별 컬럼 (halfvec: scripts/migrate_halfvec.py로 생성한 float16 사본)
+VECTOR_STORAGE_COLUMNS = {
+    "vector": {"embedding_256": "embedding_256", "embedding_768": "embedding_768"},
+    "halfvec": {"embedding_256": "embedding_256_half", "embedding_768": "embedding_768_half"},
+}
+
+
+def get_vector_storage() -> str:
+    """VECTOR_STORAGE 환경변수 (vector | halfvec, 기본값: vector)"""
+    storage = os.environ.get("VECTOR_STORAGE", "vector").lower()
+    if storage not in VECTOR_STORAGE_COLUMNS:
+        raise ValueError(f"지원하지 않는 VECTOR_STORAGE: {storage} (허용: {', '.join(VECTOR_STORAGE_COLUMNS)})")
+    return storage
+
+
+# embedding_256의 부호 비트(binary_quantize) 사본 (scripts/migrate_binary_quantize.py로 생성)
+BINARY_QUANTIZED_COLUMN = "embedding_256_bit"
+
+
+def _is_local_index_enabled() -> bool:
+    """VECTOR_LOCAL_INDEX 환경변수 (기본값: false)"""
+    return os.environ.get("VECTOR_LOCAL_INDEX", "false").lower() in ("1", "true", "yes")
+
+
+# respondent_json 키워드 검색 컬럼 (scripts/migrate_keyword_index.py: 부정 표현 문장을 뺀 답변 텍스트의 tsvector + GIN)
+KEYWORD_SEARCH_COLUMN = "search_tsv"
+
+
+# 재랭킹 시 키워드 주변(앞뒤 50자)에서 찾는 부정 표현
+RERANK_NEGATION_PATTERNS = ('없다', '없음', '없습니다', '없어요', '안', '하지않', '못', '키워본적없')
+
+
+def _is_keyword_index_enabled() -> bool:
+    """VECTOR_KEYWORD_INDEX 환경변수 (기본값: false, migrate_keyword_index.py 적용 후 사용)"""
+    return os.environ.get("VECTOR_KEYWORD_INDEX", "false").lower() in ("1", "true", "yes")
+
+
+def _is_keyword_postings_enabled() -> bool:
+    """VECTOR_KEYWORD_POSTINGS 환경변수 (기본값: false, scripts/build_keyword_postings.py 적재 후 사용)"""
+    return os.environ.get("VECTOR_KEYWORD_POSTINGS", "false").lower() in ("1", "true", "yes")
+
+
+def build_keyword_tsquery(keywords: List[str]) -> Optional[str]:
+    """
+    키워드 → to_tsquery('simple', ...) 문자열 (키워드 간 OR, 접두 일치)
+    'simple' 사전은 공백 단위로 토큰을 나누므로 "아이폰:*"이 "아이폰을", "아이폰으로" 등 조사가 붙은 토큰과 일치
+    """
+    terms = []
+    for keyword in keywords:
+        # tsquery 연산자 / 따옴표 제거 후 따옴표로 감싸 하나의 어휘로 취급
+        lexeme = re.sub(r"[\\'&|!():*<>]", "", keyword).strip()
+        if lexeme:
+            terms.append(f"'{lexeme}':*")
+    return " | ".join(terms) if terms else None
+
+
+# 키워드 + 벡터 순위 결합 방식 (none: 키워드 필터 + 재랭킹, rrf: reciprocal rank fusion)
+FUSION_MODES = ("none", "rrf")
+
+
+def get_default_fusion_mode() -> str:
+    """VECTOR_FUSION_MODE 환경변수 (기본값: none)"""
+    return os.environ.get("VECTOR_FUSION_MODE", "none").lower()
+
+
+def get_default_json_doc_limit() -> Optional[int]:
+    """VECTOR_JSON_DOC_LIMIT 환경변수 (미설정 시 None = 전체 행 조회)"""
+    value = os.environ.get("VECTOR_JSON_DOC_LIMIT", "").strip()
+    return int(value) if value else None
+
+
+def ann_params_from_env(prefix: str) -> Dict[str, int]:
+    """
+    전략별 ANN 파라미터 환경변수 읽기
+    - {prefix}_HNSW_EF_SEARCH → ef_search
+    - {prefix}_IVFFLAT_PROBES → probes
+    (예: SEMANTIC_HNSW_EF_SEARCH=200, HYBRID_IVFFLAT_PROBES=10)
+    """
+    ann_params = {}
+    for env_suffix, key in (("HNSW_EF_SEARCH", "ef_search"), ("IVFFLAT_PROBES", "probes")):
+        value = os.environ.get(f"{prefix}_{env_suffix}", "").strip()
+        if value:
+            ann_params[key] = int(value)
+    return ann_params
+
+
+def _is_count_parallel_enabled() -> bool:
+    """VECTOR_COUNT_PARALLEL 환경변수 (기본값: false)"""
+    return os.environ.get("VECTOR_COUNT_PARALLEL", "false").lower() in ("1", "true", "yes")
+
+
+def _get_count_executor() -> ThreadPoolExecutor:
+    """병렬 COUNT 쿼리용 스레드 풀 (fork 이후에는 프로세스별로 새로 생성)"""
+    global _count_executor, _count_executor_pid
+    pid = os.getpid()
+    with _count_executor_lock:
+        if _count_executor is None or _count_executor_pid != pid:
+            _count_executor = ThreadPoolExecutor(
+                max_workers=int(os.environ.get("VECTOR_COUNT_WORKERS", "4")),
+                thread_name_prefix="vector-count"
+            )
+            _count_executor_pid = pid
+        return _count_executor
 
 
 class VectorSearchService(Singleton):
@@ -41,16 +380,29 @@ class VectorSearchService(Singleton):
     768차원 임베딩을 Autoencoder로 256차원으로 압축하여 검색
     """
     
-    _initialized = False
-    
+    @singleton_init
     def __init__(self):
-        if VectorSearchService._initialized:
-            return
-        
         self.local_embedding_model = None
         self.encoder_model = None
         self.local_model_name = os.environ.get("LOCAL_EMBEDDING_MODEL", "BM-K/KoSimCSE-roberta-multitask")
         
+        # 질의 임베딩 캐시 (동일 search_text 재임베딩 방지)
+        # EMBEDDING_CACHE_SIZE=0 이면 캐시 비활성화
+        self.embedding_cache = QueryEmbeddingCache(
+            max_size=int(os.environ.get("EMBEDDING_CACHE_SIZE", "512")),
+            ttl_seconds=float(os.environ.get("EMBEDDING_CACHE_TTL_SECONDS", "600"))
+        )
+        
+        # 임베딩 마이크로 배칭 (동시 요청을 한 번의 forward pass로 처리)
+        # EMBEDDING_BATCH_ENABLED=false 이면 요청 스레드에서 바로 임베딩
+        self.embedding_scheduler = None
+        if os.environ.get("EMBEDDING_BATCH_ENABLED", "true").lower() in ("1", "true", "yes"):
+            self.embedding_scheduler = EmbeddingBatchScheduler(
+                encode_batch_fn=self._encode_batch,
+                max_batch_size=int(os.environ.get("EMBEDDING_BATCH_MAX_SIZE", "16")),
+                max_wait_ms=float(os.environ.get("EMBEDDING_BATCH_MAX_WAIT_MS", "5"))
+            )
+        
         # DB에서 임베딩 차원 자동 감지
         self.db_embedding_dimension = self._detect_db_embedding_dimension()
         
@@ -83,29 +435,29 @@ class VectorSearchService(Singleton):
             raise RuntimeError(f"임베딩 모델({self.local_model_name}) 로딩에 실패했습니다.")
         
         # Autoencoder 모델 로딩 (768차원 → 256차원 압축용)
-        if TENSORFLOW_AVAILABLE:
+        # ENCODER_BACKEND=numpy(기본): encoder_tf_256.npz를 NumPy로 추론, 없으면 TensorFlow fallback
+        # ENCODER_BACKEND=tensorflow: 항상 encoder_tf_256.keras를 TensorFlow로 로드
+        self.encoder_backend = None
+        encoder_backend = os.environ.get("ENCODER_BACKEND", "numpy").lower()
+        if encoder_backend != "tensorflow":
+            npz_path, _ = _find_model_file("encoder_tf_256.npz")
+            if npz_path:
+                try:
+                    print(f"[INFO] [SINGLETON] Autoencoder 가중치 로딩 중 (NumPy): {npz_path}")
+                    self.encoder_model = NumpyDenseEncoder.load(npz_path)
+                    self.encoder_backend = "numpy"
+                    print(f"[OK] [SINGLETON] Autoencoder 초기화 완료 (NumPy, {self.encoder_model.input_dim}차원 → {self.encoder_model.output_dim}차원 압축)")
+                except Exception as e:
+                    print(f"[WARN] NumPy 인코더 로딩 실패, TensorFlow로 대체: {e}")
+            else:
+                print("[WARN] encoder_tf_256.npz 파일이 없어 TensorFlow로 대체합니다 (scripts/export_encoder_npz.py로 생성 가능)")
+        
+        if self.encoder_model is None:
+            keras = _import_keras()
+            if keras is None:
+                raise RuntimeError("tensorflow 라이브러리가 설치되지 않았습니다.")
             try:
-                # encoder_tf_256.keras 파일 경로 찾기
-                # vector.py 위치: backend/app/services/data/vector.py
-                # 목표: backend/scripts/encoder_tf_256.keras
-                current_file = os.path.abspath(__file__)
-                # backend/app/services/data -> backend/app/services -> backend/app -> backend
-                backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(current_file))))
-                encoder_path = os.path.join(backend_dir, "scripts", "encoder_tf_256.keras")
-                
-                # 대체 경로들 시도
-                possible_paths = [
-                    encoder_path,  # backend/scripts/encoder_tf_256.keras
-                    os.path.join(backend_dir, "encoder_tf_256.keras"),  # backend/encoder_tf_256.keras
-                    os.path.join(os.path.dirname(backend_dir), "scripts", "encoder_tf_256.keras"),  # panel1.0/scripts/encoder_tf_256.keras
-                ]
-                
-                encoder_path = None
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        encoder_path = path
-                        break
-                
+                encoder_path, possible_paths = _find_model_file("encoder_tf_256.keras")
                 if not encoder_path:
                     raise FileNotFoundError(
                         f"encoder_tf_256.keras 파일을 찾을 수 없습니다. 시도한 경로:\n" +
@@ -114,26 +466,24 @@ class VectorSearchService(Singleton):
                 
                 print(f"[INFO] [SINGLETON] Autoencoder 모델 로딩 중: {encoder_path}")
                 self.encoder_model = keras.models.load_model(encoder_path, compile=False)
+                self.encoder_backend = "tensorflow"
                 print(f"[OK] [SINGLETON] Autoencoder 모델 초기화 완료 (768차원 → 256차원 압축)")
             except Exception as e:
                 import traceback
                 print(f"[ERROR] Autoencoder 모델 로딩 실패: {e}")
                 print(traceback.format_exc())
                 raise RuntimeError(f"Autoencoder 모델 로딩에 실패했습니다: {e}")
-        else:
-            raise RuntimeError("tensorflow 라이브러리가 설치되지 않았습니다.")
         
         if not self.encoder_model:
             raise RuntimeError("Autoencoder 모델 로딩에 실패했습니다.")
-        
-        VectorSearchService._initialized = True
     
     def _detect_db_embedding_dimension(self) -> Optional[int]:
         """DB에 저장된 임베딩의 차원을 자동으로 감지 (embedding_256 컬럼)"""
         try:
+            # vector_dims()로 차원만 조회 (벡터 전체를 텍스트로 받아 파싱하지 않음)
             result = execute_sql_safe(
                 query="""
-                    SELECT embedding_256::text as embedding_str
+                    SELECT vector_dims(embedding_256) as dimension
                     FROM core_v2.doc_embedding
                     WHERE embedding_256 IS NOT NULL
                     LIMIT 1
@@ -141,12 +491,8 @@ class VectorSearchService(Singleton):
                 limit=1
             )
             
-            if result and result[0].get('embedding_str'):
-                embedding_str = result[0]['embedding_str']
-                embedding_str = embedding_str.strip('[]')
-                if embedding_str:
-                    dimension = len(embedding_str.split(','))
-                    return dimension
+            if result and result[0].get('dimension'):
+                return int(result[0]['dimension'])
             return None
         except Exception as e:
             print(f"[ERROR] DB 임베딩 차원 감지 실패: {e}")
@@ -157,6 +503,14 @@ class VectorSearchService(Singleton):
         if not query_text or not query_text.strip():
             return None
         
+        if self.local_embedding_model and self.encoder_model:
+            try:
+                embedding_768, _ = self.embed_query(query_text)
+                return embedding_768.tolist()
+            except Exception as e:
+                print(f"[ERROR] 로컬 임베딩 생성 실패: {e}")
+                return None
+        
         if self.local_embedding_model:
             try:
                 embedding = self.local_embedding_model.encode(query_text.strip()).tolist()
@@ -167,6 +521,86 @@ class VectorSearchService(Singleton):
         
         return None
     
+    def embed_query(self, query_text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        질의 텍스트 → (768차원 임베딩, 256차원 압축 임베딩)
+        동일한 정규화 텍스트는 캐시에서 반환 (KoSimCSE encode + Autoencoder predict 생략)
+        
+        Returns:
+            (embedding_768, embedding_256) - 읽기 전용 numpy 배열
+        """
+        key = QueryEmbeddingCache.normalize_key(query_text)
+        if not key:
+            raise ValueError("임베딩할 텍스트가 비어 있습니다.")
+        
+        cached = self.embedding_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if self.embedding_scheduler is not None:
+            value = self.embedding_scheduler.embed(key)
+        else:
+            value = self._encode_batch([key])[0]
+        
+        self.embedding_cache.put(key, value)
+        return value
+    
+    def _encode_batch(self, texts: List[str]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        질의 텍스트 배치 → [(embedding_768, embedding_256), ...]
+        SentenceTransformer encode와 Autoencoder predict를 배치 단위로 1회씩 실행
+        """
+        # 1. 768차원 임베딩 생성 (KoSimCSE) - (N, 768)
+        embeddings_768 = np.asarray(
+            self.local_embedding_model.encode(texts, batch_size=len(texts), show_progress_bar=False),
+            dtype=np.float32
+        ).reshape(len(texts), -1)
+        
+        # 2. 256차원으로 압축 (Autoencoder) - (N, 256)
+        embeddings_256 = np.asarray(
+            self.encoder_model.predict(embeddings_768, verbose=0),
+            dtype=np.float32
+        ).reshape(len(texts), -1)
+        
+        # 캐시된 배열이 호출자에 의해 변경되지 않도록 읽기 전용으로 설정
+        embeddings_768.setflags(write=False)
+        embeddings_256.setflags(write=False)
+        return [(embeddings_768[i], embeddings_256[i]) for i in range(len(texts))]
+    
+    def get_embedding_cache_stats(self) -> Dict[str, Any]:
+        """질의 임베딩 캐시 통계 (hit/miss 카운터)"""
+        return self.embedding_cache.stats()
+    
+    def get_embedding_scheduler_stats(self) -> Optional[Dict[str, Any]]:
+        """임베딩 마이크로 배칭 통계 (비활성화 시 None)"""
+        if self.embedding_scheduler is None:
+            return None
+        return self.embedding_scheduler.stats()
+    
+    def warm_up(self) -> None:
+        """
+        더미 질의를 한 번 임베딩하여 첫 forward pass 비용(커널 초기화 등)을 미리 지불
+        캐시/배칭 스케줄러를 거치지 않고 모델을 직접 호출
+        """
+        self._encode_batch(["패널 검색 워밍업 문장입니다."])
+    
+    @classmethod
+    def get_readiness(cls) -> Dict[str, Any]:
+        """
+        모델 로딩 상태 (인스턴스를 생성하지 않고 조회)
+        
+        Returns:
+            {"embedding_model": bool, "encoder": bool, "encoder_backend": "numpy" | "tensorflow" | None,
+             "init_duration_ms": float | None}
+        """
+        instance = cls.get_instance() if cls.is_initialized() else None
+        return {
+            "embedding_model": bool(instance is not None and instance.local_embedding_model is not None),
+            "encoder": bool(instance is not None and instance.encoder_model is not None),
+            "encoder_backend": getattr(instance, "encoder_backend", None) if instance is not None else None,
+            "init_duration_ms": cls.get_init_stats()["duration_ms"],
+        }
+    
     def execute_hybrid_search_sql(
         self,
         embedding_input: str,
@@ -174,7 +608,16 @@ class VectorSearchService(Singleton):
         limit: int = 5,
         distance_threshold: Optional[float] = None,
         semantic_keywords: Optional[List[str]] = None,
-        require_keyword_match: bool = False
+        require_keyword_match: bool = False,
+        count_mode: Optional[str] = None,
+        json_doc_limit: Optional[int] = None,
+        ann_params: Optional[Dict[str, int]] = None,
+        rerank_768: Optional[bool] = None,
+        binary_prefilter: Optional[bool] = None,
+        local_index: Optional[bool] = None,
+        keyword_index: Optional[bool] = None,
+        keyword_postings: Optional[bool] = None,
+        fusion: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         최적화된 하이브리드 검색 SQL 실행 (core_v2 스키마)
@@ -185,11 +628,44 @@ class VectorSearchService(Singleton):
             filters: 구조화된 필터 (gender, age_range, region)
             limit: 결과 제한 수
             distance_threshold: 유사도 임계값 (선택사항)
-            semantic_keywords: 키워드 리스트 (SQL ILIKE 필터링에 사용)
-            require_keyword_match: 키워드 매칭이 필수인지 여부 (False면 키워드 필터링 없이도 검색)
+            semantic_keywords: 키워드 리스트 (키워드 필터링 / 키워드 매칭 점수 재랭킹에 사용)
+            require_keyword_match: 키워드 매칭이 필수인지 여부
+                - True: 키워드 중 하나 이상과 일치하는 행만 검색 (keyword_index면 GIN 인덱스 조건)
+                - False: 키워드 조건 없이 벡터 검색 후 키워드 매칭 점수(소프트 점수)로 재랭킹만 수행
+            count_mode: 전체 개수 계산 방식 (None이면 VECTOR_COUNT_MODE 환경변수, 기본 exact)
+                - exact: 별도 COUNT 쿼리 (VECTOR_COUNT_PARALLEL=true면 top-k 쿼리와 병렬 실행)
+                - estimate: EXPLAIN 플래너 추정 행 수 (거리 임계값 조건은 추정이 부정확할 수 있음)
+                - none: 개수 계산 생략 (_total_count=None)
+            json_doc_limit: json_doc을 조회할 상위 행 수 (None이면 VECTOR_JSON_DOC_LIMIT 환경변수, 미설정 시 전체)
+                나머지 행은 json_doc/content가 None (fetch_json_docs로 나중에 조회 가능)
+                모든 반환 행에 json_doc이 필요하면(미설정 또는 키워드 재랭킹) top-k 쿼리에서 함께 조회 (추가 왕복 없음)
+            ann_params: ANN 인덱스 파라미터 {"ef_search": int, "probes": int} (검색 트랜잭션 안에서 SET LOCAL)
+            rerank_768: 2단계 검색 (None이면 VECTOR_RERANK_768 환경변수, 기본 false)
+                256차원 인덱스로 limit × VECTOR_RERANK_FACTOR(기본 5)개 후보를 가져온 뒤
+                상위 VECTOR_RERANK_MAX_CANDIDATES(기본 2000)개를 저장된 embedding_768과 원본 질의 임베딩으로 재정렬
+                재정렬된 행의 distance는 768차원 코사인 거리 (distance_256에 1단계 거리 보존)
+            binary_prefilter: 이진 양자화 사전 필터 (기본 false, semantic_first의 SEMANTIC_BINARY_PREFILTER로 켬)
+                embedding_256_bit의 해밍 거리로 limit × VECTOR_BINARY_OVERFETCH_FACTOR(기본 10)개 후보를 고른 뒤
+                후보만 embedding_256 코사인 거리로 재정렬
+                구조화 필터/키워드가 없는 검색만 해당 (필터는 해밍 후보를 뽑은 뒤에 적용되므로 결과가 누락될 수 있음)
+                거리 임계값 등으로 LIMIT을 채우지 못하면 exact로 재실행
+            local_index: 프로세스 내 메모리 매핑 인덱스 사용 (None이면 VECTOR_LOCAL_INDEX 환경변수, 기본 false)
+                구조화 필터/키워드가 없는 검색만 해당 - top-k와 임계값 개수를 NumPy로 계산하고
+                Postgres는 표시 컬럼/json_doc 조회에만 사용 (인덱스 파일이 없으면 DB 검색)
+            keyword_index: 키워드 조건을 respondent_json.search_tsv GIN 인덱스로 처리
+                (None이면 VECTOR_KEYWORD_INDEX 환경변수, 기본 false - false면 json_doc ILIKE 조건)
+            keyword_postings: 키워드 조건 / 재랭킹을 core_v2.keyword_posting 조회로 처리 (keyword_index보다 우선)
+                (None이면 VECTOR_KEYWORD_POSTINGS 환경변수, 기본 false)
+                재랭킹에 json_doc이 필요 없으므로 json_doc_limit이 키워드 검색에도 적용됨
+            fusion: 키워드 / 벡터 순위 결합 방식 (None이면 VECTOR_FUSION_MODE 환경변수, 기본 none)
+                - none: 키워드 조건으로 거른 뒤 벡터 거리순 top-k, 키워드 매칭 점수로 재랭킹
+                - rrf: 벡터 top-N(구조화 필터만)과 키워드 top-N(search_tsv ts_rank_cd)을 한 SQL에서
+                  reciprocal rank fusion으로 결합 (score = Σ 1/(VECTOR_RRF_K + rank), 결과에 _rrf_score 포함)
+                  N = max(limit, VECTOR_RRF_CANDIDATES), scripts/migrate_keyword_index.py 적용 필요
+                  키워드가 없으면 none과 같음 / 로컬 인덱스, rerank_768, 키워드 재랭킹은 사용하지 않음
         
         Returns:
-            검색 결과 리스트
+            검색 결과 리스트 (각 행에 _total_count, _total_count_mode 메타데이터 포함)
         """
         if not self.local_embedding_model:
             raise RuntimeError("임베딩 모델이 초기화되지 않았습니다.")
@@ -198,251 +674,98 @@ class VectorSearchService(Singleton):
             raise RuntimeError("Autoencoder 모델이 초기화되지 않았습니다.")
         
         try:
-            # 1. 768차원 임베딩 생성 (KoSimCSE)
-            embedding_768 = self.local_embedding_model.encode(embedding_input.strip())
-            
-            # 2. 256차원으로 압축 (Autoencoder)
-            # Reshape for model input: (1, 768)
-            embedding_768_reshaped = embedding_768.reshape(1, -1)
-            embedding_256 = self.encoder_model.predict(embedding_768_reshaped, verbose=0)[0]
-            
-            # numpy array를 list로 변환
-            embedding = embedding_256.tolist()
+            # 768차원 임베딩 생성 → 256차원 압축 (캐시 우선)
+            embedding_768, embedding_256 = self.embed_query(embedding_input)
         except Exception as e:
             raise RuntimeError(f"임베딩 생성 및 압축 실패: {str(e)}")
         
-        # 벡터를 PostgreSQL vector 타입 문자열로 변환
-        vector_str = '[' + ','.join(str(v) for v in embedding) + ']'
+        # 벡터 파라미터 (PgVector 어댑터가 '[...]'::vector 또는 '[...]'::halfvec 리터럴로 직렬화)
+        # VECTOR_STORAGE=halfvec이면 embedding_256_half 컬럼과 halfvec HNSW 인덱스를 사용
+        storage = get_vector_storage()
+        column_256 = VECTOR_STORAGE_COLUMNS[storage]["embedding_256"]
+        query_vector = PgVector(embedding_256, type_name=storage)
         
-        # WHERE 절 생성
-        where_conditions = ["1=1"]  # 기본 조건
-        params = {}
+        # WHERE 절 생성 (구조화 필터 + 키워드)
+        if keyword_postings is None:
+            keyword_postings = _is_keyword_postings_enabled()
+        fusion = (fusion or get_default_fusion_mode()).lower()
+        if fusion not in FUSION_MODES:
+            raise ValueError(f"지원하지 않는 fusion: {fusion} (허용: {', '.join(FUSION_MODES)})")
+        fusion_tsquery = build_keyword_tsquery(clean_search_keywords(semantic_keywords)) if fusion == "rrf" else None
         
-        if filters:
-            # 성별 필터
-            if filters.get("gender"):
-                gender = filters["gender"]
-                if gender in ["M", "남"]:
-                    where_conditions.append("r_info.gender = %(gender)s")
-                    params["gender"] = "남"
-                elif gender in ["F", "여"]:
-                    where_conditions.append("r_info.gender = %(gender)s")
-                    params["gender"] = "여"
-            
-            # 연령대 필터 (birth_year 사용) - 여러 연령대 지원 (예: "30s,40s")
-            # age 또는 age_range 모두 지원
-            age_range = filters.get("age_range") or filters.get("age")
-            if age_range:
-                # 여러 연령대가 쉼표로 구분된 경우 처리
-                if isinstance(age_range, str) and "," in age_range:
-                    age_ranges = [a.strip() for a in age_range.split(",")]
-                    age_conditions = []
-                    
-                    for idx, age_r in enumerate(age_ranges):
-                        param_suffix = f"_{idx}"
-                        if age_r == "10s":
-                            age_conditions.append(
-                                "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                            )
-                            params[f"age_min{param_suffix}"] = 10
-                            params[f"age_max{param_suffix}"] = 19
-                        elif age_r == "20s":
-                            age_conditions.append(
-                                "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                            )
-                            params[f"age_min{param_suffix}"] = 20
-                            params[f"age_max{param_suffix}"] = 29
-                        elif age_r == "30s":
-                            age_conditions.append(
-                                "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                            )
-                            params[f"age_min{param_suffix}"] = 30
-                            params[f"age_max{param_suffix}"] = 39
-                        elif age_r == "40s":
-                            age_conditions.append(
-                                "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                            )
-                            params[f"age_min{param_suffix}"] = 40
-                            params[f"age_max{param_suffix}"] = 49
-                        elif age_r == "50s":
-                            age_conditions.append(
-                                "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min" + param_suffix + ")s AND %(age_max" + param_suffix + ")s"
-                            )
-                            params[f"age_min{param_suffix}"] = 50
-                            params[f"age_max{param_suffix}"] = 59
-                        elif age_r in ["60s", "60s+"]:
-                            age_conditions.append(
-                                "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) >= %(age_min" + param_suffix + ")s"
-                            )
-                            params[f"age_min{param_suffix}"] = 60
-                    
-                    if age_conditions:
-                        where_conditions.append(f"({' OR '.join(age_conditions)})")
-                else:
-                    # 단일 연령대 처리 (기존 로직)
-                    if age_range == "10s":
-                        where_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                        )
-                        params["age_min"] = 10
-                        params["age_max"] = 19
-                    elif age_range == "20s":
-                        where_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                        )
-                        params["age_min"] = 20
-                        params["age_max"] = 29
-                    elif age_range == "30s":
-                        where_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                        )
-                        params["age_min"] = 30
-                        params["age_max"] = 39
-                    elif age_range == "40s":
-                        where_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                        )
-                        params["age_min"] = 40
-                        params["age_max"] = 49
-                    elif age_range == "50s":
-                        where_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN %(age_min)s AND %(age_max)s"
-                        )
-                        params["age_min"] = 50
-                        params["age_max"] = 59
-                    elif age_range in ["60s", "60s+"]:
-                        where_conditions.append(
-                            "(EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) >= %(age_min)s"
-                        )
-                        params["age_min"] = 60
-            
-            # 지역 필터
-            if filters.get("region"):
-                region = filters["region"]
-                where_conditions.append("r_info.region LIKE %(region)s")
-                params["region"] = f"%{region}%"
-        
-        # 키워드 필터링 (SQL ILIKE) - 정밀도 향상을 위한 키워드 매칭
-        # semantic_keywords가 있으면 json_doc에서 키워드 검색
-        # require_keyword_match가 False면 키워드 필터링은 선택사항 (벡터 검색으로도 충분히 의미 매칭 가능)
-        # 기본적으로는 키워드 필터링을 사용하되, 벡터 검색으로도 의미 매칭이 가능하므로 선택적으로 적용
-        if semantic_keywords and len(semantic_keywords) > 0:
-            # 키워드 정제 및 분리
-            # 예: "아이폰 사용" → ["아이폰", "사용"] (단어 단위로 분리)
-            # 불필요한 일반 동사/조사 제거
-            stop_words = {
-                '사용', '하는', '하는데', '한다', '한다고', '한다는', '한다면',
-                '하는', '하는데', '한다', '한다고', '한다는', '한다면',
-                '을', '를', '이', '가', '은', '는', '에', '에서', '로', '으로',
-                '와', '과', '의', '도', '만', '부터', '까지', '보다', '처럼',
-                '같이', '만큼', '정도', '여부', '경험', '전제품', '해주', '주세요'
-            }
-            
-            all_keywords = []
-            for kw in semantic_keywords:
-                if not kw or not kw.strip():
-                    continue
-                # 공백으로 단어 분리
-                words = kw.strip().split()
-                for word in words:
-                    word_clean = word.strip()
-                    # 조사 제거 (예: "아이폰을" → "아이폰")
-                    # 한국어 조사: 을, 를, 이, 가, 은, 는, 에, 에서, 로, 으로, 와, 과, 의, 도, 만
-                    for particle in ['을', '를', '이', '가', '은', '는', '에', '에서', '로', '으로', '와', '과', '의', '도', '만']:
-                        if word_clean.endswith(particle):
-                            word_clean = word_clean[:-len(particle)]
-                            break
-                    
-                    # 불필요한 단어 제거 (너무 짧거나 일반 동사/조사)
-                    if word_clean and len(word_clean) >= 2 and word_clean not in stop_words:
-                        all_keywords.append(word_clean)
-            
-            # 중복 제거
-            unique_keywords = list(dict.fromkeys(all_keywords))  # 순서 유지하면서 중복 제거
-            
-            if unique_keywords:
-                # 키워드 간 OR 조건으로 구성 (최소 하나라도 매칭되면 포함)
-                # ⚠️ 중요: 질문이 아닌 답변 내용만 매칭하도록 개선
-                # 부정 표현이 포함된 경우 제외 (예: "반려동물을 키워본 적 없다")
-                keyword_conditions = []
-                for i, keyword in enumerate(unique_keywords):
-                    param_name = f"keyword_{i}"
-                    params[param_name] = f"%{keyword}%"
-                    
-                    # 부정 표현 패턴: 더 정교한 부정 표현 감지
-                    # "없다", "없음", "없습니다", "없어요", "안 한다", "하지 않는다", "키워본 적 없" 등
-                    neg_patterns = [
-                        f"%{keyword}%없다%",
-                        f"%{keyword}%없음%",
-                        f"%{keyword}%없습니다%",
-                        f"%{keyword}%없어요%",
-                        f"%{keyword}%안%",
-                        f"%{keyword}%하지%않%",
-                        f"%{keyword}%못%",
-                        f"%키워본%적%없%",
-                        f"%키워본%적%없다%",
-                        f"%키워본%적%없음%",
-                        f"%키워본%적%없습니다%"
-                    ]
-                    # 여러 부정 패턴을 OR로 결합
-                    neg_conditions = [f"r_json.json_doc ILIKE %(neg_{param_name}_{j})s" for j in range(len(neg_patterns))]
-                    for j, pattern in enumerate(neg_patterns):
-                        params[f"neg_{param_name}_{j}"] = pattern
-                    
-                    # 키워드가 포함되어 있으면서, 부정 표현이 없는 경우만 매칭
-                    keyword_conditions.append(
-                        f"(r_json.json_doc ILIKE %({param_name})s AND "
-                        f"NOT ({' OR '.join(neg_conditions)}))"
-                    )
-                
-                if keyword_conditions:
-                    # OR 조건으로 결합: (keyword1 OR keyword2 OR ...)
-                    where_conditions.append(f"({' OR '.join(keyword_conditions)})")
-                    print(f"[DEBUG] 키워드 필터링 적용: {len(unique_keywords)}개 키워드 (OR 조건, 부정 표현 제외)")
-                    print(f"[DEBUG] 키워드 목록: {unique_keywords}")
-                    print(f"[DEBUG] 원본 semantic_keywords: {semantic_keywords}")
+        # rrf: 키워드는 WHERE 조건이 아니라 별도 키워드 순위로 반영 (벡터 후보는 구조화 필터만 적용)
+        where_conditions, params = self._build_search_conditions(
+            filters, semantic_keywords, require_keyword_match=require_keyword_match and not fusion_tsquery,
+            keyword_index=keyword_index, keyword_postings=keyword_postings
+        )
+        
+        # 로컬 인덱스는 조건이 기본 조건(1=1)뿐인 검색에만 사용 (임계값은 NumPy로 처리)
+        if local_index is None:
+            local_index = _is_local_index_enabled()
+        local_engine = (
+            self._get_local_index() if local_index and len(where_conditions) == 1 and not fusion_tsquery else None
+        )
+        if local_engine is not None and not local_engine.is_available():
+            local_engine = None
+        
+        # 이진 양자화 사전 필터도 조건이 기본 조건(1=1)뿐이고 키워드가 없는 검색에만 사용
+        if binary_prefilter and (len(where_conditions) > 1 or semantic_keywords or fusion_tsquery):
+            print("[DEBUG] 구조화 필터/키워드가 있어 이진 양자화 사전 필터 미사용")
+            binary_prefilter = False
         
         # 유사도 임계값 조건 추가
         if distance_threshold is not None:
-            vector_str_escaped = vector_str.replace("'", "''")
             where_conditions.append(
-                f"pe.embedding_256 <=> '{vector_str_escaped}'::vector < %(distance_threshold)s"
+                f"pe.{column_256} <=> %(vector)s < %(distance_threshold)s"
             )
             params["distance_threshold"] = distance_threshold
         
         where_clause = " AND ".join(where_conditions)
         
-        # ★ 최적화된 하이브리드 검색 SQL - Window Function 사용
-        # 프론트엔드 호환성을 위해 gender, region, district, birth_year, age_text도 함께 반환
-        # 키워드 필터링 + 벡터 정렬 결합
-        # COUNT(*) OVER()를 사용하여 별도의 COUNT 쿼리 없이 한 번에 처리
-        sql_query = f"""
-            SELECT 
-                pe.respondent_id,
-                r_json.json_doc,
-                r_info.gender,
-                r_info.region,
-                r_info.district,
-                r_info.birth_year,
-                (pe.embedding_256 <=> %(vector)s::vector) as distance,
-                COUNT(*) OVER() as total_count
-            FROM core_v2.doc_embedding pe
-            JOIN core_v2.respondent r_info ON pe.respondent_id = r_info.respondent_id
-            JOIN core_v2.respondent_json r_json ON pe.respondent_id = r_json.respondent_id
-            WHERE pe.embedding_256 IS NOT NULL AND r_json.json_doc IS NOT NULL AND {where_clause}
-            ORDER BY distance ASC
-            LIMIT %(limit)s
-        """
+        # ★ 하이브리드 검색 SQL - top-k 조회와 전체 개수(total_count) 조회를 분리
+        # COUNT(*) OVER()는 조건을 만족하는 모든 행의 거리를 계산/정렬해야 하므로 LIMIT의 이점이 사라짐
+        # top-k 쿼리는 ORDER BY distance LIMIT만 수행하고, 개수는 count_mode에 따라 별도로 구함
+        from_where_sql = self._build_from_where(where_clause)
+        
+        # 2단계 검색: 256차원 인덱스로 limit × VECTOR_RERANK_FACTOR개 후보를 가져온 뒤 768차원으로 정밀 재정렬
+        if rerank_768 is None:
+            rerank_768 = os.environ.get("VECTOR_RERANK_768", "false").lower() in ("1", "true", "yes")
+        rerank_768 = rerank_768 and not fusion_tsquery  # rrf 순위를 거리순으로 다시 섞지 않음
+        rerank_window = int(os.environ.get("VECTOR_RERANK_MAX_CANDIDATES", "2000"))
+        fetch_limit = limit
+        if rerank_768:
+            rerank_factor = float(os.environ.get("VECTOR_RERANK_FACTOR", "5"))
+            fetch_limit = max(limit, min(int(np.ceil(limit * rerank_factor)), rerank_window))
+        
+        params["vector"] = query_vector
+        params["limit"] = fetch_limit
         
-        params["vector"] = vector_str
-        params["limit"] = limit
+        # json_doc 조회 범위: 키워드 재랭킹은 모든 행의 json_doc이 필요 (포스팅으로 재랭킹하면 불필요)
+        # 반환하는 모든 행에 필요하고 rerank_768로 잘리지 않으면 top-k 쿼리의 바깥 SELECT에서 함께 조회하고,
+        # 일부 행만 필요하면 top-k 확정 후 해당 행만 별도 조회
+        if json_doc_limit is None:
+            json_doc_limit = get_default_json_doc_limit()
+        needs_all_docs = bool(semantic_keywords) and not keyword_postings and not fusion_tsquery
+        inline_json_doc = (needs_all_docs or json_doc_limit is None) and not rerank_768
+        
+        count_mode = (count_mode or get_default_count_mode()).lower()
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"지원하지 않는 count_mode: {count_mode} (허용: {', '.join(COUNT_MODES)})")
         
         # 디버깅: SQL 쿼리 로깅 (키워드 필터링 확인용)
         print(f"[DEBUG] 하이브리드 검색 SQL 쿼리:")
         print(f"  WHERE 절: {where_clause}")
+        print(f"  count_mode: {count_mode}")
         if semantic_keywords:
             print(f"  키워드 필터 파라미터: {[k for k in params.keys() if k.startswith('keyword_')]}")
         
+        # exact + 병렬 모드: 개수 쿼리를 별도 연결에서 top-k 쿼리와 동시에 실행
+        count_future = None
+        if count_mode == "exact" and _is_count_parallel_enabled():
+            count_future = _get_count_executor().submit(
+                self._count_matches, from_where_sql, dict(params), "exact"
+            )
+        
         try:
             from app.db.connection import get_db_connection, return_db_connection
             conn = get_db_connection()
@@ -450,21 +773,88 @@ class VectorSearchService(Singleton):
                 with conn.cursor() as cur:
                     cur.execute("SET LOCAL statement_timeout = 120000;")
                     
-                    # ★ Window Function을 사용하여 COUNT와 SELECT를 한 번에 처리
-                    # 별도의 COUNT 쿼리 제거 - 성능 최적화
-                    cur.execute(sql_query, params)
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    results = [dict(zip(columns, row)) for row in rows]
+                    # 필터 선택도에 따라 실행 방식 선택 (exact / hnsw / overfetch)
+                    # 이진 양자화 사전 필터를 쓰면 binary (pgvector 0.7 미만은 일반 실행 계획)
+                    search_plan = None
+                    local_count = None
+                    if local_engine is not None:
+                        search_plan = {"mode": "local", "reason": "local_index", "index_version": local_engine.version,
+                                       "rows": local_engine.rows}
+                        results, local_count = self._run_local_knn(cur, local_engine, embedding_256, fetch_limit,
+                                                                   distance_threshold, include_json_doc=inline_json_doc)
+                    else:
+                        # rrf: 벡터 후보 수(N) 기준으로 실행 계획 선택 (fetch_limit은 결합 후 반환 행 수)
+                        plan_limit = fetch_limit
+                        if fusion_tsquery:
+                            plan_limit = max(fetch_limit, int(os.environ.get("VECTOR_RRF_CANDIDATES", "200")))
+                            params["fusion_tsquery"] = fusion_tsquery
+                            params["fusion_candidates"] = plan_limit
+                            params["rrf_k"] = int(os.environ.get("VECTOR_RRF_K", "60"))
+                        if binary_prefilter:
+                            search_plan = self._choose_binary_plan(cur, plan_limit, ann_params)
+                        if search_plan is None:
+                            search_plan = self._choose_search_plan(cur, params, where_clause, plan_limit, ann_params)
+                        if fusion_tsquery:
+                            search_plan["fusion"] = {"mode": "rrf", "candidates": plan_limit, "k": params["rrf_k"]}
+                        search_plan["storage"] = storage
+                        results = self._run_knn_query(cur, search_plan, where_clause, from_where_sql, params,
+                                                      include_json_doc=inline_json_doc)
+                    print(f"[DEBUG] 벡터 검색 실행 계획: {search_plan}")
+                    
+                    # overfetch 후 필터링으로 LIMIT을 채우지 못하면 exact로 재실행 (결과 누락 방지)
+                    if search_plan["mode"] == "overfetch" and len(results) < fetch_limit:
+                        print(f"[DEBUG] overfetch 결과 부족 ({len(results)}/{fetch_limit}) → exact 재실행")
+                        search_plan = dict(search_plan, mode="exact", fallback_from="overfetch")
+                        results = self._run_knn_query(cur, search_plan, where_clause, from_where_sql, params,
+                                                      include_json_doc=inline_json_doc)
+                    
+                    # binary는 해밍 거리 후보 안에서만 찾으므로 LIMIT을 채우지 못하면(거리 임계값 등) exact로 재실행
+                    if search_plan["mode"] == "binary" and len(results) < fetch_limit:
+                        print(f"[DEBUG] binary 결과 부족 ({len(results)}/{fetch_limit}) → exact 재실행")
+                        search_plan = {"mode": "exact", "reason": "binary_shortfall", "storage": storage,
+                                       "fallback_from": "binary"}
+                        results = self._run_knn_query(cur, search_plan, where_clause, from_where_sql, params,
+                                                      include_json_doc=inline_json_doc)
                     
-                    # total_count 추출 (첫 번째 행에서 Window Function 결과)
-                    total_count = 0
-                    if results and len(results) > 0:
-                        total_count = results[0].get('total_count', 0)
-                        # total_count 필드 제거 (메타데이터이므로)
+                    # 후보를 모두 받았는지 (LIMIT 미만이면 조건을 만족하는 행 전체)
+                    candidates_exhausted = len(results) < fetch_limit
+                    candidate_count = len(results)
+                    
+                    if rerank_768 and results:
+                        results = self._rerank_with_768(cur, results, embedding_768, rerank_window)
+                        search_plan = dict(search_plan, rerank_768={
+                            "candidates": candidate_count,
+                            "reranked": min(candidate_count, rerank_window),
+                        })
+                        results = results[:limit]
+                    
+                    # json_doc을 top-k 쿼리에서 함께 받지 않았으면 확정된 행 중 필요한 행만 조회
+                    if not inline_json_doc:
+                        hydrate_rows = results if (needs_all_docs or json_doc_limit is None) else results[:json_doc_limit]
+                        json_docs = self._fetch_json_docs(cur, [row['respondent_id'] for row in hydrate_rows])
                         for result in results:
-                            if 'total_count' in result:
-                                del result['total_count']
+                            result['json_doc'] = json_docs.get(result['respondent_id'])
+                    
+                    # total_count 결정
+                    # - 후보가 LIMIT보다 적게 반환되었다면 조건을 만족하는 행을 모두 받은 것이므로 그대로 정확한 개수
+                    # - 그 외에는 count_mode에 따라 exact(COUNT 쿼리) / estimate(플래너 추정치) / none(None)
+                    # - 로컬 인덱스는 임계값을 만족하는 행 수를 NumPy로 함께 계산하므로 그대로 사용
+                    if local_count is not None:
+                        total_count, total_count_mode = local_count, "exact"
+                        if count_future is not None:
+                            count_future.cancel()
+                    elif candidates_exhausted:
+                        total_count, total_count_mode = candidate_count, "exact"
+                        if count_future is not None:
+                            count_future.cancel()
+                    elif count_future is not None:
+                        total_count, total_count_mode = count_future.result(), "exact"
+                    elif count_mode == "none":
+                        total_count, total_count_mode = None, "none"
+                    else:
+                        total_count, total_count_mode = self._count_matches(from_where_sql, params, count_mode), count_mode
+                    if total_count is None:
+                        total_count_mode = "none"  # 개수 계산 생략 또는 실패
                     
                     # 프론트엔드 호환성을 위해 응답 형식 변환
                     from datetime import datetime
@@ -504,25 +894,662 @@ class VectorSearchService(Singleton):
                         if 'region' not in result:
                             result['region'] = None
                         
-                        # total_count를 메타데이터로 추가
+                        # total_count를 메타데이터로 추가 (count_mode=none이면 None)
                         result['_total_count'] = total_count
+                        result['_total_count_mode'] = total_count_mode
+                        result['_search_plan'] = search_plan
                     
                     # ★ 결과 품질 검증 및 재랭킹 (키워드 매칭 빈도 고려)
-                    if semantic_keywords and len(semantic_keywords) > 0:
-                        # 키워드 매칭 빈도 계산 및 재랭킹
-                        results = self._rerank_by_keyword_match(results, semantic_keywords)
+                    if semantic_keywords and len(semantic_keywords) > 0 and not fusion_tsquery:
+                        # 키워드 매칭 빈도 계산 및 재랭킹 (포스팅 사용 시 결과 행 전체의 일치 키워드를 한 번에 조회)
+                        keyword_matches = None
+                        if keyword_postings:
+                            keyword_matches = fetch_keyword_matches(
+                                cur, [row['respondent_id'] for row in results], clean_search_keywords(semantic_keywords)
+                            )
+                        results = self._rerank_by_keyword_match(results, semantic_keywords, keyword_matches)
                     
-                    print(f"[INFO] 하이브리드 검색 완료: {len(results)}개 결과 (전체: {total_count}개) - Window Function 사용")
+                    print(f"[INFO] 하이브리드 검색 완료: {len(results)}개 결과 (전체: {total_count}개, {total_count_mode})")
                     return results
             finally:
                 return_db_connection(conn)
         except Exception as e:
             raise RuntimeError(f"SQL 실행 실패: {str(e)}")
     
+    def _build_search_conditions(
+        self,
+        filters: Optional[Dict[str, Any]],
+        semantic_keywords: Optional[List[str]],
+        require_keyword_match: bool = True,
+        keyword_index: Optional[bool] = None,
+        keyword_postings: Optional[bool] = None
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        하이브리드 검색 WHERE 조건 생성
+        - 구조화 필터 조건은 r_info(core_v2.respondent), 키워드 조건은 r_json(core_v2.respondent_json) 별칭 사용
+        - require_keyword_match=False면 키워드 조건 없음 (키워드는 _rerank_by_keyword_match 점수로만 반영)
+        - keyword_postings(None이면 VECTOR_KEYWORD_POSTINGS)면 core_v2.keyword_posting EXISTS 조건 하나,
+          keyword_index(None이면 VECTOR_KEYWORD_INDEX)면 search_tsv GIN 인덱스 조건 하나,
+          아니면 json_doc ILIKE + 부정 표현 ILIKE 조건
+        
+        Returns:
+            (WHERE 조건 리스트, 쿼리 파라미터)
+        """
+        # WHERE 절 생성
+        where_conditions = ["1=1"]  # 기본 조건
+        params = {}
+        
+        if filters:
+            # 성별 / 연령대(birth_year 범위, sargable) / 지역 필터 - SQLBuilder와 같은 필터 컴파일러 사용
+            filter_conditions, filter_params = compile_demographic_filters(filters, alias="r_info", include_tags=False)
+            where_conditions.extend(filter_conditions)
+            params.update(filter_params)
+        
+        # 키워드 필터링 - 정밀도 향상을 위한 키워드 매칭 (키워드 간 OR, 최소 하나라도 매칭되면 포함)
+        # require_keyword_match가 False면 SQL 필터 없이 벡터 검색 후 키워드 매칭 점수로 재랭킹만 수행
+        unique_keywords = clean_search_keywords(semantic_keywords) if require_keyword_match else []
+        if keyword_postings is None:
+            keyword_postings = _is_keyword_postings_enabled()
+        if keyword_index is None:
+            keyword_index = _is_keyword_index_enabled()
+        
+        if unique_keywords and keyword_postings:
+            # ETL에서 부정 답변을 제외하고 만든 포스팅 조회 (respondent_id, term 인덱스)
+            postings_condition, postings_params = build_postings_condition(unique_keywords)
+            where_conditions.append(postings_condition)
+            params.update(postings_params)
+            print(f"[DEBUG] 키워드 포스팅 필터링 적용: {len(unique_keywords)}개 키워드 ({unique_keywords})")
+        elif unique_keywords and keyword_index:
+            # 미리 계산된 tsvector(부정 표현 문장 제외)에 대한 GIN 인덱스 조건 하나
+            tsquery = build_keyword_tsquery(unique_keywords)
+            if tsquery:
+                where_conditions.append(f"r_json.{KEYWORD_SEARCH_COLUMN} @@ to_tsquery('simple', %(keyword_tsquery)s)")
+                params["keyword_tsquery"] = tsquery
+                print(f"[DEBUG] 키워드 인덱스 필터링 적용: {len(unique_keywords)}개 키워드 ({tsquery})")
+        elif unique_keywords:
+            # 인덱스 미적용 시: json_doc ILIKE 조건
+            # ⚠️ 중요: 질문이 아닌 답변 내용만 매칭하도록 개선
+            # 부정 표현이 포함된 경우 제외 (예: "반려동물을 키워본 적 없다")
+            keyword_conditions = []
+            for i, keyword in enumerate(unique_keywords):
+                param_name = f"keyword_{i}"
+                params[param_name] = f"%{keyword}%"
+                
+                # 부정 표현 패턴: 더 정교한 부정 표현 감지
+                # "없다", "없음", "없습니다", "없어요", "안 한다", "하지 않는다", "키워본 적 없" 등
+                neg_patterns = [
+                    f"%{keyword}%없다%",
+                    f"%{keyword}%없음%",
+                    f"%{keyword}%없습니다%",
+                    f"%{keyword}%없어요%",
+                    f"%{keyword}%안%",
+                    f"%{keyword}%하지%않%",
+                    f"%{keyword}%못%",
+                    f"%키워본%적%없%",
+                    f"%키워본%적%없다%",
+                    f"%키워본%적%없음%",
+                    f"%키워본%적%없습니다%"
+                ]
+                # 여러 부정 패턴을 OR로 결합
+                neg_conditions = [f"r_json.json_doc ILIKE %(neg_{param_name}_{j})s" for j in range(len(neg_patterns))]
+                for j, pattern in enumerate(neg_patterns):
+                    params[f"neg_{param_name}_{j}"] = pattern
+                
+                # 키워드가 포함되어 있으면서, 부정 표현이 없는 경우만 매칭
+                keyword_conditions.append(
+                    f"(r_json.json_doc ILIKE %({param_name})s AND "
+                    f"NOT ({' OR '.join(neg_conditions)}))"
+                )
+            
+            if keyword_conditions:
+                # OR 조건으로 결합: (keyword1 OR keyword2 OR ...)
+                where_conditions.append(f"({' OR '.join(keyword_conditions)})")
+                print(f"[DEBUG] 키워드 필터링 적용: {len(unique_keywords)}개 키워드 (OR 조건, 부정 표현 제외)")
+                print(f"[DEBUG] 키워드 목록: {unique_keywords}")
+                print(f"[DEBUG] 원본 semantic_keywords: {semantic_keywords}")
+        
+        return where_conditions, params
+    
+    def _build_from_where(self, where_clause: str, source_sql: str = "core_v2.doc_embedding pe") -> str:
+        """
+        검색 조건의 FROM ... WHERE ... 절 (top-k / COUNT / EXPLAIN 공용)
+        - 조건이 참조하는 테이블만 조인하고, json_doc 존재 여부는 EXISTS로 확인
+        """
+        joins = []
+        if "r_info." in where_clause:
+            joins.append("JOIN core_v2.respondent r_info ON pe.respondent_id = r_info.respondent_id")
+        if "r_json." in where_clause:
+            joins.append("JOIN core_v2.respondent_json r_json ON pe.respondent_id = r_json.respondent_id")
+            json_doc_condition = "r_json.json_doc IS NOT NULL"
+        else:
+            json_doc_condition = (
+                "EXISTS (SELECT 1 FROM core_v2.respondent_json r_json "
+                "WHERE r_json.respondent_id = pe.respondent_id AND r_json.json_doc IS NOT NULL)"
+            )
+        join_sql = "\n            ".join(joins)
+        column_256 = VECTOR_STORAGE_COLUMNS[get_vector_storage()]["embedding_256"]
+        
+        return f"""
+            FROM {source_sql}
+            {join_sql}
+            WHERE pe.{column_256} IS NOT NULL AND {json_doc_condition} AND {where_clause}
+        """
+    
+    def _build_knn_query(
+        self,
+        search_plan: Dict[str, Any],
+        where_clause: str,
+        from_where_sql: str,
+        include_json_doc: bool = False
+    ) -> str:
+        """
+        k-NN 우선 쿼리 생성
+        - knn CTE: core_v2.doc_embedding의 embedding_256(또는 embedding_256_half) ANN 인덱스 스캔으로 상위 후보를 먼저 확정
+          (overfetch 모드는 필터 없이 overfetch_limit개를 먼저 뽑고 필터를 나중에 적용)
+          (binary 모드는 embedding_256_bit 해밍 거리로 binary_candidates개를 뽑고 코사인 거리로 재정렬)
+        - 바깥 쿼리: 확정된 후보 id에 대해서만 인구통계 컬럼 조인
+          (include_json_doc이면 json_doc도 확정된 후보에 대해서만 조인, 아니면 별도 조회)
+        """
+        json_doc_column, json_doc_join = self._json_doc_select("knn.respondent_id", include_json_doc)
+        return self._build_knn_cte(search_plan, where_clause, from_where_sql) + f"""
+            SELECT 
+                knn.respondent_id,
+                r_info.gender,
+                r_info.region,
+                r_info.district,
+                r_info.birth_year,
+                knn.distance{json_doc_column}
+            FROM knn
+            JOIN core_v2.respondent r_info ON r_info.respondent_id = knn.respondent_id{json_doc_join}
+            ORDER BY knn.distance ASC
+        """
+    
+    def _json_doc_select(self, id_expr: str, include_json_doc: bool) -> Tuple[str, str]:
+        """바깥 SELECT에서 json_doc을 함께 조회할 때의 (컬럼, LEFT JOIN) 조각 (아니면 빈 문자열)"""
+        if not include_json_doc:
+            return "", ""
+        return (
+            ",\n                r_doc.json_doc",
+            f"\n            LEFT JOIN core_v2.respondent_json r_doc ON r_doc.respondent_id = {id_expr}"
+        )
+    
+    def _build_fusion_query(
+        self,
+        search_plan: Dict[str, Any],
+        where_clause: str,
+        from_where_sql: str,
+        include_json_doc: bool = False
+    ) -> str:
+        """
+        벡터 + 키워드 reciprocal rank fusion 쿼리 (한 번의 왕복)
+        - knn CTE: 실행 계획과 같은 벡터 top-N (%(limit)s = 후보 수 N, 구조화 필터만 적용)
+        - txt CTE: 같은 필터 + search_tsv @@ tsquery 행 중 ts_rank_cd 상위 N (GIN 인덱스)
+        - fused: 두 순위를 FULL OUTER JOIN 후 Σ 1/(rrf_k + rank) 순으로 %(fused_limit)s개
+        - 바깥 쿼리: 결합된 행에 대해서만 인구통계 컬럼 / 거리 계산 (키워드에서만 나온 행도 distance 포함)
+          (include_json_doc이면 json_doc도 함께 조인)
+        """
+        column_256 = VECTOR_STORAGE_COLUMNS[get_vector_storage()]["embedding_256"]
+        json_doc_column, json_doc_join = self._json_doc_select("fused.respondent_id", include_json_doc)
+        text_from_where = self._build_from_where(
+            f"{where_clause} AND r_json.{KEYWORD_SEARCH_COLUMN} @@ to_tsquery('simple', %(fusion_tsquery)s)"
+        )
+        return self._build_knn_cte(search_plan, where_clause, from_where_sql) + f""", txt AS (
+                SELECT r_json.respondent_id,
+                       ts_rank_cd(r_json.{KEYWORD_SEARCH_COLUMN}, to_tsquery('simple', %(fusion_tsquery)s)) AS text_score
+                {text_from_where}
+                ORDER BY text_score DESC
+                LIMIT %(limit)s
+            ), fused AS (
+                SELECT COALESCE(v.respondent_id, t.respondent_id) AS respondent_id,
+                       v.vector_rank,
+                       t.text_rank,
+                       COALESCE(1.0 / (%(rrf_k)s + v.vector_rank), 0)
+                           + COALESCE(1.0 / (%(rrf_k)s + t.text_rank), 0) AS rrf_score
+                FROM (
+                    SELECT respondent_id, ROW_NUMBER() OVER (ORDER BY distance) AS vector_rank FROM knn
+                ) v
+                FULL OUTER JOIN (
+                    SELECT respondent_id, ROW_NUMBER() OVER (ORDER BY text_score DESC) AS text_rank FROM txt
+                ) t ON t.respondent_id = v.respondent_id
+                ORDER BY rrf_score DESC
+                LIMIT %(fused_limit)s
+            )
+            SELECT 
+                fused.respondent_id,
+                r_info.gender,
+                r_info.region,
+                r_info.district,
+                r_info.birth_year,
+                (pe.{column_256} <=> %(vector)s) AS distance,
+                fused.rrf_score AS _rrf_score,
+                fused.vector_rank AS _vector_rank,
+                fused.text_rank AS _text_rank{json_doc_column}
+            FROM fused
+            JOIN core_v2.respondent r_info ON r_info.respondent_id = fused.respondent_id
+            JOIN core_v2.doc_embedding pe ON pe.respondent_id = fused.respondent_id{json_doc_join}
+            ORDER BY fused.rrf_score DESC, distance ASC
+        """
+    
+    def _build_knn_cte(self, search_plan: Dict[str, Any], where_clause: str, from_where_sql: str) -> str:
+        """실행 계획별 knn CTE (WITH ... knn AS (respondent_id, distance) - 거리순 상위 %(limit)s개)"""
+        column_256 = VECTOR_STORAGE_COLUMNS[get_vector_storage()]["embedding_256"]
+        if search_plan["mode"] == "binary":
+            post_filter_sql = self._build_from_where(
+                where_clause,
+                source_sql="bq JOIN core_v2.doc_embedding pe ON pe.respondent_id = bq.respondent_id"
+            )
+            knn_sql = f"""
+            WITH bq AS (
+                SELECT pe.respondent_id
+                FROM core_v2.doc_embedding pe
+                WHERE pe.{BINARY_QUANTIZED_COLUMN} IS NOT NULL
+                ORDER BY pe.{BINARY_QUANTIZED_COLUMN} <~> binary_quantize(%(vector)s)::bit(256)
+                LIMIT %(binary_candidates)s
+            ), knn AS (
+                SELECT pe.respondent_id, (pe.{column_256} <=> %(vector)s) AS distance
+                {post_filter_sql}
+                ORDER BY pe.{column_256} <=> %(vector)s
+                LIMIT %(limit)s
+            )"""
+        elif search_plan["mode"] == "overfetch":
+            post_filter_sql = self._build_from_where(
+                where_clause,
+                source_sql="ann JOIN core_v2.doc_embedding pe ON pe.respondent_id = ann.respondent_id"
+            )
+            knn_sql = f"""
+            WITH ann AS (
+                SELECT pe.respondent_id, (pe.{column_256} <=> %(vector)s) AS distance
+                FROM core_v2.doc_embedding pe
+                WHERE pe.{column_256} IS NOT NULL
+                ORDER BY pe.{column_256} <=> %(vector)s
+                LIMIT %(overfetch_limit)s
+            ), knn AS (
+                SELECT ann.respondent_id, ann.distance
+                {post_filter_sql}
+                ORDER BY ann.distance
+                LIMIT %(limit)s
+            )"""
+        else:
+            knn_sql = f"""
+            WITH knn AS (
+                SELECT pe.respondent_id, (pe.{column_256} <=> %(vector)s) AS distance
+                {from_where_sql}
+                ORDER BY pe.{column_256} <=> %(vector)s
+                LIMIT %(limit)s
+            )"""
+        return knn_sql
+    
+    def _run_knn_query(
+        self,
+        cur,
+        search_plan: Dict[str, Any],
+        where_clause: str,
+        from_where_sql: str,
+        params: Dict[str, Any],
+        include_json_doc: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        실행 계획에 맞는 세션 설정 후 top-k 쿼리 실행 (search_plan["fusion"]이 있으면 rrf 결합 쿼리)
+        include_json_doc이면 결과 행에 json_doc 포함
+        """
+        self._apply_search_plan_settings(cur, search_plan)
+        query_params = dict(params)
+        if search_plan.get("overfetch_limit"):
+            query_params["overfetch_limit"] = search_plan["overfetch_limit"]
+        if search_plan.get("binary_candidates"):
+            query_params["binary_candidates"] = search_plan["binary_candidates"]
+        if search_plan.get("fusion"):
+            # rrf: 각 순위 목록은 후보 수 N개, 결합 후 limit개 반환
+            query_params["fused_limit"] = params["limit"]
+            query_params["limit"] = params["fusion_candidates"]
+            query = self._build_fusion_query(search_plan, where_clause, from_where_sql, include_json_doc)
+        else:
+            query = self._build_knn_query(search_plan, where_clause, from_where_sql, include_json_doc)
+        cur.execute(query, query_params)
+        columns = [desc[0] for desc in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+    
+    def _get_local_index(self) -> LocalVectorIndex:
+        """메모리 매핑 로컬 벡터 인덱스 (인스턴스당 1개, VECTOR_LOCAL_INDEX_DIR)"""
+        engine = getattr(self, "_local_index", None)
+        if engine is None:
+            engine = LocalVectorIndex(
+                os.environ.get("VECTOR_LOCAL_INDEX_DIR") or DEFAULT_INDEX_DIR,
+                check_interval_seconds=float(os.environ.get("VECTOR_LOCAL_INDEX_CHECK_SECONDS", "30"))
+            )
+            self._local_index = engine
+        return engine
+    
+    def _run_local_knn(
+        self,
+        cur,
+        engine: LocalVectorIndex,
+        query_256: np.ndarray,
+        limit: int,
+        distance_threshold: Optional[float],
+        include_json_doc: bool = False
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        로컬 인덱스로 top-k 계산 후 인구통계 컬럼만 Postgres에서 조회 (include_json_doc이면 json_doc도 같은 쿼리로)
+        (인덱스 내보내기 이후 삭제된 응답자는 결과에서 제외)
+        
+        Returns:
+            (_run_knn_query와 같은 형태의 결과, 임계값을 만족하는 전체 행 수)
+        """
+        hits, total = engine.search(query_256, limit, distance_threshold)
+        if not hits:
+            return [], total
+        json_doc_column, json_doc_join = self._json_doc_select("r_info.respondent_id", include_json_doc)
+        cur.execute(
+            "SELECT r_info.respondent_id, r_info.gender, r_info.region, r_info.district, r_info.birth_year"
+            f"{json_doc_column} FROM core_v2.respondent r_info{json_doc_join} "
+            "WHERE r_info.respondent_id = ANY(%(ids)s)",
+            {"ids": [rid for rid, _ in hits]}
+        )
+        columns = [desc[0] for desc in cur.description]
+        rows = {row[0]: dict(zip(columns, row)) for row in cur.fetchall()}
+        results = []
+        for rid, distance in hits:
+            if rid in rows:
+                results.append(dict(rows[rid], distance=distance))
+        return results, total
+    
+    def _rerank_with_768(
+        self,
+        cur,
+        results: List[Dict[str, Any]],
+        query_768: np.ndarray,
+        window: int
+    ) -> List[Dict[str, Any]]:
+        """
+        1단계(256차원) 후보 중 상위 window개를 768차원 코사인 거리로 정밀 재정렬
+        - 후보의 embedding_768(halfvec 저장 시 embedding_768_half)은 id로 한 번에 조회하여 NumPy로 거리 계산
+          (텍스트 대신 pgvector 바이너리 형식으로 받아 파싱 비용 없이 배열로 변환)
+        - window 밖의 후보와 embedding_768이 없는 후보는 1단계 순서 그대로 뒤에 붙임
+        """
+        head, tail = results[:window], results[window:]
+        storage = get_vector_storage()
+        column_768 = VECTOR_STORAGE_COLUMNS[storage]["embedding_768"]
+        cur.execute(
+            f"SELECT respondent_id, {binary_select(column_768, storage)} FROM core_v2.doc_embedding "
+            f"WHERE respondent_id = ANY(%(ids)s) AND {column_768} IS NOT NULL",
+            {"ids": [row['respondent_id'] for row in head]}
+        )
+        vectors = {rid: data for rid, data in cur.fetchall()}
+        
+        with_768 = [row for row in head if row['respondent_id'] in vectors]
+        without_768 = [row for row in head if row['respondent_id'] not in vectors]
+        if not with_768:
+            return results
+        
+        matrix = np.stack([from_binary(vectors[row['respondent_id']], storage) for row in with_768])
+        query = np.asarray(query_768, dtype=np.float32).ravel()
+        norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query) or 1.0)
+        distances = 1.0 - (matrix @ query) / np.where(norms == 0, 1.0, norms)
+        
+        for row, distance in zip(with_768, distances.tolist()):
+            row['distance_256'] = row['distance']
+            row['distance'] = distance
+        order = np.argsort(distances, kind="stable")
+        return [with_768[i] for i in order] + without_768 + tail
+    
+    def _fetch_json_docs(self, cur, respondent_ids: Sequence[Any]) -> Dict[Any, Any]:
+        """respondent_id 목록의 json_doc 조회 (주어진 커서 사용)"""
+        if not respondent_ids:
+            return {}
+        cur.execute(
+            "SELECT respondent_id, json_doc FROM core_v2.respondent_json WHERE respondent_id = ANY(%(ids)s)",
+            {"ids": list(respondent_ids)}
+        )
+        return dict(cur.fetchall())
+    
+    def fetch_json_docs(self, respondent_ids: Sequence[Any]) -> Dict[Any, Any]:
+        """
+        respondent_id 목록의 json_doc 조회
+        json_doc_limit으로 생략된 행을 화면에 표시할 때 사용
+        
+        Returns:
+            {respondent_id: json_doc}
+        """
+        from app.db.connection import get_db_connection, return_db_connection
+        conn = get_db_connection()
+        try:
+            with conn.cursor() as cur:
+                return self._fetch_json_docs(cur, respondent_ids)
+        finally:
+            return_db_connection(conn)
+    
+    def _get_pgvector_version(self, cur) -> Tuple[int, ...]:
+        """설치된 pgvector 확장 버전 (연결마다 조회하지 않도록 캐시)"""
+        version = getattr(self, "_pgvector_version", None)
+        if version is None:
+            cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            row = cur.fetchone()
+            try:
+                version = tuple(int(part) for part in row[0].split(".")) if row else ()
+            except ValueError:
+                version = ()
+            self._pgvector_version = version
+        return version
+    
+    def _get_demographic_histogram(self) -> DemographicHistogram:
+        """필터 선택도 추정용 인구통계 히스토그램 (인스턴스당 1개)"""
+        histogram = getattr(self, "_demographic_histogram", None)
+        if histogram is None:
+            histogram = DemographicHistogram(
+                ttl_seconds=float(os.environ.get("DEMOGRAPHIC_HISTOGRAM_TTL_SECONDS", "3600"))
+            )
+            self._demographic_histogram = histogram
+        return histogram
+    
+    def _choose_search_plan(
+        self,
+        cur,
+        params: Dict[str, Any],
+        where_clause: str,
+        limit: int,
+        ann_params: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        필터 선택도에 따라 벡터 검색 실행 방식 선택
+        - exact: 필터를 만족하는 행이 VECTOR_EXACT_SCAN_MAX_ROWS 이하 → 인덱스 없이 전수 거리 계산
+        - hnsw: HNSW 인덱스 스캔 (pgvector 0.8+는 iterative scan으로 필터 통과 행이 LIMIT을 채울 때까지 스캔)
+        - overfetch: pgvector 0.8 미만에서 limit / 선택도 × VECTOR_OVERFETCH_FACTOR개를 먼저 뽑은 뒤 필터 적용
+          (ef_search 최대값 1000을 넘으면 exact)
+        VECTOR_SEARCH_PLAN=exact|hnsw|overfetch로 강제 가능 (기본 auto)
+        ann_params의 ef_search/probes는 전략/요청별 설정으로 자동 계산값보다 우선
+        (pgvector 0.8 미만 hnsw 모드에서는 결과가 잘리지 않도록 ef_search를 LIMIT 이상으로 유지)
+        
+        Returns:
+            {"mode", "reason", "selectivity", "estimated_rows", "ef_search", "probes", "max_scan_tuples", "overfetch_limit", "pgvector"}
+        """
+        version = self._get_pgvector_version(cur)
+        exact_max_rows = int(os.environ.get("VECTOR_EXACT_SCAN_MAX_ROWS", "20000"))
+        overfetch_factor = float(os.environ.get("VECTOR_OVERFETCH_FACTOR", "2.0"))
+        forced_mode = os.environ.get("VECTOR_SEARCH_PLAN", "auto").lower()
+        
+        has_demographic_filter = "r_info." in where_clause
+        has_keyword_filter = "r_json." in where_clause
+        
+        selectivity = None
+        estimated_rows = None
+        if has_demographic_filter:
+            try:
+                histogram = self._get_demographic_histogram()
+                histogram.refresh_if_stale(cur)
+                selectivity = histogram.estimate_selectivity(params)
+                if selectivity is not None:
+                    estimated_rows = int(round(selectivity * histogram.total))
+            except Exception as e:
+                print(f"[WARN] 인구통계 히스토그램 조회 실패 (선택도 미상으로 처리): {e}")
+        elif not has_keyword_filter:
+            selectivity = 1.0
+        
+        plan: Dict[str, Any] = {
+            "mode": "hnsw",
+            "reason": None,
+            "selectivity": round(selectivity, 6) if selectivity is not None else None,
+            "estimated_rows": estimated_rows,
+            "ef_search": None,
+            "probes": None,
+            "max_scan_tuples": None,
+            "overfetch_limit": None,
+            "pgvector": ".".join(str(part) for part in version) or None,
+        }
+        
+        # 필터 통과 행 1개를 얻기 위해 필요한 후보 수 (선택도 미상이면 계산 불가)
+        needed = None
+        if selectivity is not None:
+            needed = int(np.ceil(limit / max(selectivity, 1e-6) * overfetch_factor))
+        
+        if version < (0, 5, 0):
+            mode, reason = "exact", "hnsw_unsupported"
+        elif forced_mode in ("exact", "hnsw", "overfetch"):
+            mode, reason = forced_mode, "forced"
+        elif estimated_rows is not None and estimated_rows <= exact_max_rows:
+            mode, reason = "exact", "selective_filter"
+        elif version >= (0, 8, 0):
+            mode, reason = "hnsw", "iterative_scan"
+        elif selectivity == 1.0:
+            mode, reason = ("hnsw", "unfiltered") if limit <= 1000 else ("exact", "limit_exceeds_ef_search")
+        elif needed is not None and needed <= 1000:
+            mode, reason = "overfetch", "broad_filter"
+        else:
+            mode, reason = "exact", "overfetch_exceeds_ef_search" if needed is not None else "unknown_selectivity"
+        
+        ann_params = ann_params or {}
+        ef_search_override = ann_params.get("ef_search")
+        plan["mode"], plan["reason"] = mode, reason
+        if mode == "hnsw":
+            plan["ef_search"] = min(max(int(limit), 40), 1000)
+            if version >= (0, 8, 0):
+                max_scan_tuples = int(os.environ.get("VECTOR_MAX_SCAN_TUPLES", "1000000"))
+                plan["max_scan_tuples"] = min(max(needed or 20000, 20000), max_scan_tuples)
+                if ef_search_override:
+                    plan["ef_search"] = min(max(int(ef_search_override), 1), 1000)
+            elif ef_search_override:
+                plan["ef_search"] = min(max(int(ef_search_override), plan["ef_search"]), 1000)
+        elif mode == "overfetch":
+            plan["overfetch_limit"] = min(max(needed or limit, limit), 1000)
+            plan["ef_search"] = min(max(plan["overfetch_limit"], int(ef_search_override or 40)), 1000)
+        if mode != "exact" and ann_params.get("probes"):
+            plan["probes"] = max(int(ann_params["probes"]), 1)
+        return plan
+    
+    def _choose_binary_plan(
+        self,
+        cur,
+        limit: int,
+        ann_params: Optional[Dict[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        이진 양자화 사전 필터 실행 계획
+        - 후보 수: limit × VECTOR_BINARY_OVERFETCH_FACTOR (기본 10), 최대 VECTOR_BINARY_MAX_CANDIDATES (기본 50000)
+        - 후보 1000개 이하: 해밍 HNSW 인덱스 (ef_search = 후보 수)
+        - 1000개 초과: pgvector 0.8+는 iterative scan, 그 미만은 인덱스 없이 해밍 거리 전수 계산
+          (bit(256)은 행당 32바이트라 float 벡터 전수 계산보다 훨씬 가벼움)
+        
+        Returns:
+            _choose_search_plan과 같은 형태 + binary_candidates (pgvector 0.7 미만이면 None)
+        """
+        version = self._get_pgvector_version(cur)
+        if version < (0, 7, 0):
+            print(f"[WARN] 이진 양자화 검색은 pgvector 0.7 이상 필요 (현재 {version}) → 일반 실행 계획 사용")
+            return None
+        
+        factor = float(os.environ.get("VECTOR_BINARY_OVERFETCH_FACTOR", "10"))
+        max_candidates = int(os.environ.get("VECTOR_BINARY_MAX_CANDIDATES", "50000"))
+        candidates = min(max(int(np.ceil(limit * factor)), limit), max(max_candidates, limit))
+        ef_search_override = (ann_params or {}).get("ef_search")
+        
+        plan: Dict[str, Any] = {
+            "mode": "binary",
+            "reason": None,
+            "selectivity": None,
+            "estimated_rows": None,
+            "ef_search": None,
+            "probes": None,
+            "max_scan_tuples": None,
+            "overfetch_limit": None,
+            "binary_candidates": candidates,
+            "index_scan": True,
+            "pgvector": ".".join(str(part) for part in version) or None,
+        }
+        if candidates <= 1000:
+            plan["reason"] = "hamming_hnsw"
+            plan["ef_search"] = min(max(candidates, int(ef_search_override or 40)), 1000)
+        elif version >= (0, 8, 0):
+            plan["reason"] = "hamming_iterative_scan"
+            plan["ef_search"] = min(max(int(ef_search_override or 1000), 1), 1000)
+            max_scan_tuples = int(os.environ.get("VECTOR_MAX_SCAN_TUPLES", "1000000"))
+            plan["max_scan_tuples"] = min(max(candidates * 2, 20000), max_scan_tuples)
+        else:
+            plan["reason"] = "hamming_seq_scan"
+            plan["index_scan"] = False
+        return plan
+    
+    def _apply_search_plan_settings(self, cur, search_plan: Dict[str, Any]) -> None:
+        """
+        실행 계획별 세션 설정 (트랜잭션 범위 SET LOCAL)
+        - exact: 인덱스 스캔 비활성화 (HNSW는 ef_search개 후보만 반환하므로 전수 계산을 강제)
+        - hnsw: ef_search 상향, pgvector 0.8+는 iterative scan(strict_order) + max_scan_tuples
+        - overfetch: ef_search를 overfetch_limit에 맞춤
+        - binary: 해밍 HNSW 인덱스에 같은 규칙 적용 (index_scan=False면 해밍 거리 전수 계산)
+        - probes가 지정되면 ivfflat.probes 설정 (IVFFlat 인덱스 사용 시)
+        """
+        if search_plan["mode"] == "exact" or search_plan.get("index_scan") is False:
+            cur.execute("SET LOCAL enable_indexscan = off")
+            return
+        if search_plan.get("ef_search"):
+            cur.execute(f"SET LOCAL hnsw.ef_search = {int(search_plan['ef_search'])}")
+        if search_plan.get("probes"):
+            cur.execute(f"SET LOCAL ivfflat.probes = {int(search_plan['probes'])}")
+        if search_plan.get("max_scan_tuples"):
+            cur.execute("SET LOCAL hnsw.iterative_scan = strict_order")
+            cur.execute(f"SET LOCAL hnsw.max_scan_tuples = {int(search_plan['max_scan_tuples'])}")
+    
+    def _count_matches(self, from_where_sql: str, params: Dict[str, Any], count_mode: str) -> Optional[int]:
+        """
+        top-k 쿼리와 같은 FROM/WHERE 조건의 전체 개수 (별도 연결 사용)
+        
+        Args:
+            from_where_sql: FROM ... WHERE ... 절
+            params: 쿼리 파라미터
+            count_mode: exact (COUNT 쿼리) | estimate (EXPLAIN 추정 행 수)
+        
+        Returns:
+            개수 (실패 시 None - 검색 결과 자체는 유지)
+        """
+        from app.db.connection import get_db_connection, return_db_connection
+        started = time.perf_counter()
+        conn = None
+        try:
+            conn = get_db_connection()
+            with conn.cursor() as cur:
+                if count_mode == "estimate":
+                    cur.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_where_sql}", params)
+                    plan = cur.fetchone()[0]
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    count = int(plan[0]["Plan"]["Plan Rows"])
+                else:
+                    cur.execute("SET LOCAL statement_timeout = 120000;")
+                    cur.execute(f"SELECT COUNT(*) AS total_count {from_where_sql}", params)
+                    count = int(cur.fetchone()[0])
+            print(f"[DEBUG] total_count 계산 ({count_mode}): {count}개 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+            return count
+        except Exception as e:
+            print(f"[WARN] total_count 계산 실패 ({count_mode}): {e}")
+            return None
+        finally:
+            if conn is not None:
+                return_db_connection(conn)
+    
     def _rerank_by_keyword_match(
         self, 
         results: List[Dict[str, Any]], 
-        semantic_keywords: List[str]
+        semantic_keywords: List[str],
+        keyword_matches: Optional[Dict[Any, set]] = None
     ) -> List[Dict[str, Any]]:
         """
         키워드 매칭 빈도를 고려한 결과 재랭킹
@@ -530,6 +1557,8 @@ class VectorSearchService(Singleton):
         Args:
             results: 검색 결과 리스트
             semantic_keywords: 의미 키워드 리스트
+            keyword_matches: {respondent_id: 일치한 키워드 집합} (keyword_posting 조회 결과)
+                주어지면 json_doc 문자열 스캔 없이 집합 크기로 점수 계산
         
         Returns:
             재랭킹된 결과 리스트
@@ -537,59 +1566,40 @@ class VectorSearchService(Singleton):
         if not results or not semantic_keywords:
             return results
         
-        # 키워드 정제 (조사 제거 등)
-        stop_words = {
-            '사용', '하는', '하는데', '한다', '한다고', '한다는', '한다면',
-            '을', '를', '이', '가', '은', '는', '에', '에서', '로', '으로',
-            '와', '과', '의', '도', '만', '부터', '까지', '보다', '처럼',
-            '같이', '만큼', '정도', '여부', '경험', '전제품', '해주', '주세요'
-        }
-        
-        clean_keywords = []
-        for kw in semantic_keywords:
-            if not kw or not kw.strip():
-                continue
-            words = kw.strip().split()
-            for word in words:
-                word_clean = word.strip()
-                for particle in ['을', '를', '이', '가', '은', '는', '에', '에서', '로', '으로', '와', '과', '의', '도', '만']:
-                    if word_clean.endswith(particle):
-                        word_clean = word_clean[:-len(particle)]
-                        break
-                if word_clean and len(word_clean) >= 2 and word_clean not in stop_words:
-                    clean_keywords.append(word_clean.lower())
+        # 키워드 정제 (조사 제거 등) - SQL 키워드 조건과 같은 규칙
+        clean_keywords = [keyword.lower() for keyword in clean_search_keywords(semantic_keywords)]
         
         if not clean_keywords:
             return results
+        keyword_matcher = get_keyword_matcher(tuple(clean_keywords), ignore_case=True)
         
         # 각 결과에 대해 키워드 매칭 점수 계산
         for result in results:
+            if keyword_matches is not None:
+                matched = keyword_matches.get(result.get('respondent_id'), ())
+                result['keyword_match_score'] = len(matched) / len(clean_keywords)
+                continue
+            
             json_doc = result.get('json_doc', '') or result.get('content', '')
             if not json_doc:
                 result['keyword_match_score'] = 0.0
                 continue
             
-            json_doc_lower = json_doc.lower()
             match_count = 0
             total_keywords = len(clean_keywords)
             
-            # 키워드 매칭 빈도 계산 (부정 표현 제외)
-            for keyword in clean_keywords:
-                if keyword in json_doc_lower:
-                    # 부정 표현 체크
-                    keyword_pos = json_doc_lower.find(keyword)
-                    if keyword_pos != -1:
-                        # 키워드 주변 텍스트 확인 (앞뒤 50자)
-                        context_start = max(0, keyword_pos - 50)
-                        context_end = min(len(json_doc_lower), keyword_pos + len(keyword) + 50)
-                        context = json_doc_lower[context_start:context_end]
-                        
-                        # 부정 표현 패턴 체크
-                        neg_patterns = ['없다', '없음', '없습니다', '없어요', '안', '하지않', '못', '키워본적없']
-                        is_negative = any(neg in context for neg in neg_patterns)
-                        
-                        if not is_negative:
-                            match_count += 1
+            # 키워드 매칭 빈도 계산 (부정 표현 제외) - 키워드 매처로 모든 키워드의 첫 위치
+            for keyword, keyword_pos in keyword_matcher.first_positions(json_doc).items():
+                # 키워드 주변 텍스트 확인 (앞뒤 50자)
+                context_start = max(0, keyword_pos - 50)
+                context_end = min(len(json_doc), keyword_pos + len(keyword) + 50)
+                context = json_doc[context_start:context_end].lower()
+                
+                # 부정 표현 패턴 체크
+                is_negative = any(neg in context for neg in RERANK_NEGATION_PATTERNS)
+                
+                if not is_negative:
+                    match_count += 1
             
             # 키워드 매칭 점수 (0.0 ~ 1.0)
             keyword_match_score = match_count / total_keywords if total_keywords > 0 else 0.0
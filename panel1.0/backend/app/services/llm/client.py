@@ -5,7 +5,7 @@ from decimal import Decimal
 import os
 from anthropic import Anthropic
 from app.services.data.executor import execute_sql_safe
-from app.services.common.singleton import Singleton
+from app.services.common.singleton import Singleton, singleton_init
 from app.services.llm.prompts import SQL_TOOL_SYSTEM_HINT_TEMPLATE, QUERY_CLASSIFICATION_PROMPT, SQL_GENERATION_PROMPT
 
 
@@ -28,12 +28,8 @@ SQL_TOOL = {
 class LlmService(Singleton):
     """Singleton LlmService - 서버 시작 시 1회만 초기화"""
     
-    _initialized = False
-    
+    @singleton_init
     def __init__(self) -> None:
-        if LlmService._initialized:
-            return
-        
         api_key = os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise RuntimeError("ANTHROPIC_API_KEY 환경변수가 필요합니다.")
@@ -56,8 +52,6 @@ class LlmService(Singleton):
         env_model = os.environ.get("ANTHROPIC_MODEL")
         self._default_model = env_model if env_model else "claude-sonnet-4-5"
         print(f"[INFO] [SINGLETON] LlmService 초기화: 사용 중인 Claude 모델 = {self._default_model}")
-        
-        LlmService._initialized = True
 
     def get_default_model(self) -> str:
         return self._default_model
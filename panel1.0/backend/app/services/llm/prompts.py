@@ -498,7 +498,8 @@ widgets는 최대 3개까지 포함하며, 가장 중요한 통계를 우선순
    - embedding: VECTOR(768)
 7. 성별은 '남'/'여' 값을 사용합니다.
 8. 연령대 필터링:
-   - birth_year 컬럼: (EXTRACT(YEAR FROM CURRENT_DATE) - r_info.birth_year) BETWEEN 20 AND 29
+   - birth_year 컬럼: r_info.birth_year BETWEEN EXTRACT(YEAR FROM CURRENT_DATE) - 29 AND EXTRACT(YEAR FROM CURRENT_DATE) - 20
+     (birth_year에 식을 씌우지 않아야 인덱스 사용 가능)
 9. 지역 필터링: region LIKE '%서울%' 형식 사용
 10. JOIN 예시: core_v2.respondent와 core_v2.respondent_json을 respondent_id로 조인하여 필터링
 11. 패널 검색 결과가 제공되면 SQL을 실행하지 말고, 제공된 데이터를 기반으로 분석 결과를 설명하세요.
@@ -5,6 +5,7 @@
 """
 from typing import Dict, Any, Optional, List
 from collections import Counter
+import os
 import re
 from app.services.llm.parser import LlmStructuredParser
 from app.services.search.strategy.selector import StrategySelector
@@ -22,6 +23,8 @@ class SearchService:
         self._filter_search = None
         self._semantic_search = None
         self._hybrid_search = None
+        # 확장 필드(features / common_features) 생성에 사용할 상위 패널 수
+        self.feature_panel_limit = int(os.environ.get("SEARCH_FEATURE_PANEL_LIMIT", "200"))
     
     @property
     def filter_search(self):
@@ -128,43 +131,28 @@ class SearchService:
             try:
                 print(f"[INFO] {strategy} 전략 확장 필드 생성 시작 (semantic_keywords: {len(semantic_keywords) if semantic_keywords else 0}개)...")
                 from app.services.semantic.auto_dictionary import generate_expanded_keywords
-                from app.services.semantic.features import extract_panel_features
+                from app.services.semantic.features import extract_panel_features_batch, panel_text_of
                 from app.services.semantic.match_reason import generate_match_reasons
                 from app.services.semantic.common_insights import generate_common_features
                 from app.services.semantic.semantic_keywords import generate_semantic_keywords
                 
                 results = result.get("results", [])
-                top_panels = results[:20]  # 상위 20개만 처리 (성능 최적화)
+                top_panels = results[:self.feature_panel_limit]  # 상위 N개만 처리 (SEARCH_FEATURE_PANEL_LIMIT, 기본 200)
                 
                 # 0. 자동 사전 생성 (expanded_keywords)
                 expanded_keywords = generate_expanded_keywords(user_query)
                 print(f"[INFO] 자동 사전 생성 완료: {len(expanded_keywords)}개 키워드")
                 
                 # 패널 텍스트 수집 (TF-IDF 계산용)
-                all_panel_texts = []
-                for panel_row in top_panels:
-                    panel_text = panel_row.get("json_doc") or panel_row.get("content") or ""
-                    if isinstance(panel_text, dict):
-                        import json
-                        panel_text = json.dumps(panel_text, ensure_ascii=False)
-                    elif not isinstance(panel_text, str):
-                        panel_text = str(panel_text)
-                    all_panel_texts.append(panel_text)
+                all_panel_texts = [panel_text_of(panel_row) for panel_row in top_panels]
                 
                 # 1. 각 패널의 features 추출 (TF-IDF 기반 affinity 포함)
-                # 주의: extract_panel_features 내부에서 extract_car_entities를 개별 호출하지 않도록 수정 필요
-                panel_features_list = []
-                for idx, panel_row in enumerate(top_panels):
-                    try:
-                        features = extract_panel_features(
-                            panel_row,
-                            expanded_keywords=expanded_keywords,
-                            all_panel_texts=all_panel_texts  # 전체 텍스트 전달 (TF-IDF 계산용)
-                        )
-                        panel_features_list.append(features)
-                    except Exception as e:
-                        print(f"[WARN] 패널 {idx} features 추출 실패 (무시): {e}")
-                        continue
+                # 휴리스틱 feature는 행렬 연산으로 한 번에, TF-IDF는 결과 집합당 한 번만 계산 (실패한 패널은 경고 후 제외)
+                panel_features_list = extract_panel_features_batch(
+                    top_panels,
+                    expanded_keywords=expanded_keywords,
+                    all_panel_texts=all_panel_texts
+                )
                 
                 # 2. common_features 생성 (상위 10개 패널만 사용 - 성능 최적화)
                 common_features = []
@@ -40,36 +40,18 @@ class FilterFirstSearch(SearchStrategy):
         
         filters = filters or {}
         
-        # SQL 쿼리 실행
-        results = self.sql_builder.execute_filter_query(filters, limit)
+        # 결과 행 + 분포 통계 (필터 결과와 전체 데이터셋 통계를 단일 집계 쿼리로 함께 계산)
+        results, stats = self.sql_builder.execute_filter_search(filters, limit, include_dataset_stats=True)
+        # 통계 쿼리가 실패해도 반환된 결과 수(하한값)는 유지
+        total_count = max(stats.total_count, len(results))
+        gender_stats = stats.gender_stats
+        region_stats = stats.region_stats
+        age_stats = stats.age_stats
         
-        # 전체 개수 및 통계 추출 (결과에서 메타데이터로 전달된 경우)
-        total_count = len(results)
-        gender_stats = []
-        region_stats = []
-        age_stats = []
-        if results and len(results) > 0:
-            if '_total_count' in results[0]:
-                total_count = results[0]['_total_count']
-            if '_gender_stats' in results[0]:
-                gender_stats = results[0]['_gender_stats']
-            if '_region_stats' in results[0]:
-                region_stats = results[0]['_region_stats']
-            if '_age_stats' in results[0]:
-                age_stats = results[0]['_age_stats']
-            # 메타데이터 제거
-            for result in results:
-                if '_total_count' in result:
-                    del result['_total_count']
-                if '_gender_stats' in result:
-                    del result['_gender_stats']
-                if '_region_stats' in result:
-                    del result['_region_stats']
-                if '_age_stats' in result:
-                    del result['_age_stats']
-        
-        # 전체 데이터셋 통계 계산 (기준 집단)
-        total_dataset_stats = self.sql_builder.get_total_dataset_stats()
+        # 전체 데이터셋 통계 (기준 집단)
+        total_dataset_stats = stats.dataset_stats
+        if total_dataset_stats is None:
+            total_dataset_stats = self.sql_builder.get_total_dataset_stats()
         print(f"[DEBUG] 전체 데이터셋 통계 계산 완료: total_count={total_dataset_stats.get('total_count', 0)}")
         
         result_dict = {
@@ -3,7 +3,7 @@
 """
 from typing import Dict, Any, List, Optional
 import os
-from app.services.data.vector import VectorSearchService
+from app.services.data.vector import VectorSearchService, ann_params_from_env
 from app.services.search.strategy.base import SearchStrategy
 
 
@@ -21,13 +21,23 @@ class HybridSearch(SearchStrategy):
             self.distance_threshold = float(hybrid_threshold_env)
         else:
             self.distance_threshold = None  # 기본값: 제한 없음
+        # 전체 개수(total_count) 계산 방식: exact | estimate | none
+        # 미설정 시 VectorSearchService 기본값(VECTOR_COUNT_MODE, 기본 exact) 사용
+        self.count_mode = os.environ.get("HYBRID_COUNT_MODE") or None
+        # ANN 인덱스 파라미터: HYBRID_HNSW_EF_SEARCH, HYBRID_IVFFLAT_PROBES (미설정 시 자동 계산/서버 기본값)
+        self.ann_params = ann_params_from_env("HYBRID")
+        # 키워드 매칭 필수 여부: true면 키워드 중 하나 이상 일치하는 패널만 (기본값),
+        # false면 키워드는 재랭킹 점수로만 반영
+        self.require_keyword_match = os.environ.get("HYBRID_REQUIRE_KEYWORD_MATCH", "true").lower() in ("1", "true", "yes")
     
     def search(
         self,
         filters: Optional[Dict[str, Any]] = None,
         semantic_keywords: Optional[List[str]] = None,
         search_text: Optional[str] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        count_mode: Optional[str] = None,
+        ann_params: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         하이브리드 검색 실행 (SQL 필터 + 벡터 검색)
@@ -37,6 +47,8 @@ class HybridSearch(SearchStrategy):
             semantic_keywords: 의미 키워드 리스트 (키워드 필터링용)
             search_text: LLM이 생성한 풍부한 설명 문장 (벡터 검색용, 우선순위 높음)
             limit: 결과 제한 수
+            count_mode: 전체 개수 계산 방식 (exact | estimate | none, None이면 전략 기본값)
+            ann_params: 요청별 ANN 파라미터 {"ef_search": int, "probes": int} (전략 기본값을 덮어씀)
         
         Returns:
             {
@@ -79,22 +91,34 @@ class HybridSearch(SearchStrategy):
                 filters=filters,
                 limit=effective_limit,
                 distance_threshold=self.distance_threshold,  # None 또는 0.75 - 구조적 필터 통과자는 모두 보여주고 벡터로 정렬만
-                semantic_keywords=semantic_keywords  # 키워드 필터링을 위한 키워드 리스트 전달
+                semantic_keywords=semantic_keywords,  # 키워드 필터링을 위한 키워드 리스트 전달
+                require_keyword_match=self.require_keyword_match,
+                count_mode=count_mode or self.count_mode,
+                ann_params={**self.ann_params, **(ann_params or {})}
             )
             
             # total_count 추출 (메타데이터에서)
+            # count_mode=none이면 _total_count가 None이므로 반환된 결과 수(하한값)로 대체
             total_count = len(results) if results else 0
+            total_count_mode = "exact"
+            search_plan = None
             if results and len(results) > 0 and '_total_count' in results[0]:
-                total_count = results[0]['_total_count']
+                total_count_mode = results[0].get('_total_count_mode', "exact")
+                search_plan = results[0].get('_search_plan')
+                if results[0]['_total_count'] is not None:
+                    total_count = results[0]['_total_count']
                 # 메타데이터 제거
                 for result in results:
-                    if '_total_count' in result:
-                        del result['_total_count']
+                    result.pop('_total_count', None)
+                    result.pop('_total_count_mode', None)
+                    result.pop('_search_plan', None)
             
             return {
                 "results": results or [],
                 "count": len(results) if results else 0,
                 "total_count": total_count,  # ★ TRUE Total matches in DB
+                "total_count_mode": total_count_mode,  # exact | estimate | none (none이면 total_count는 하한값)
+                "search_plan": search_plan,  # 벡터 검색 실행 방식 (exact | hnsw | overfetch, 선택도 추정치)
                 "strategy": "hybrid",
                 "filters_applied": filters or {},
                 "keywords_used": semantic_keywords,
@@ -3,7 +3,7 @@
 """
 from typing import Dict, Any, List, Optional
 import os
-from app.services.data.vector import VectorSearchService
+from app.services.data.vector import VectorSearchService, ann_params_from_env
 from app.services.search.strategy.base import SearchStrategy
 
 
@@ -19,13 +19,24 @@ class SemanticFirstSearch(SearchStrategy):
         self.distance_threshold = float(
             os.environ.get("SEMANTIC_DISTANCE_THRESHOLD", "0.60")
         )
+        # 전체 개수(total_count) 계산 방식: exact | estimate | none
+        # 미설정 시 VectorSearchService 기본값(VECTOR_COUNT_MODE, 기본 exact) 사용
+        self.count_mode = os.environ.get("SEMANTIC_COUNT_MODE") or None
+        # ANN 인덱스 파라미터: SEMANTIC_HNSW_EF_SEARCH, SEMANTIC_IVFFLAT_PROBES (미설정 시 자동 계산/서버 기본값)
+        self.ann_params = ann_params_from_env("SEMANTIC")
+        # 이진 양자화 사전 필터 (해밍 거리 후보 → 코사인 재정렬): SEMANTIC_BINARY_PREFILTER (기본 false)
+        # 전체 코퍼스 대상 검색에서 읽는 페이지 수를 줄이는 근사 모드 (scripts/migrate_binary_quantize.py 필요)
+        self.binary_prefilter = os.environ.get("SEMANTIC_BINARY_PREFILTER", "false").lower() in ("1", "true", "yes")
     
     def search(
         self,
         filters: Optional[Dict[str, Any]] = None,
         semantic_keywords: Optional[List[str]] = None,
         search_text: Optional[str] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        count_mode: Optional[str] = None,
+        ann_params: Optional[Dict[str, int]] = None,
+        binary_prefilter: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         의미 기반 벡터 검색 실행 (Pure Sentence-based Vector Search)
@@ -35,6 +46,9 @@ class SemanticFirstSearch(SearchStrategy):
             semantic_keywords: 의미 키워드 리스트 (deprecated - use search_text instead)
             search_text: 풍부한 설명 문장 (LLM이 생성한 descriptive sentence)
             limit: 결과 제한 수
+            count_mode: 전체 개수 계산 방식 (exact | estimate | none, None이면 전략 기본값)
+            ann_params: 요청별 ANN 파라미터 {"ef_search": int, "probes": int} (전략 기본값을 덮어씀)
+            binary_prefilter: 이진 양자화 사전 필터 사용 여부 (None이면 전략 기본값)
         
         Returns:
             {
@@ -72,25 +86,37 @@ class SemanticFirstSearch(SearchStrategy):
                 filters=None,  # semantic_first는 필터 없음
                 limit=effective_limit,
                 distance_threshold=self.distance_threshold,
-                semantic_keywords=None  # 키워드 필터링 제거 - 벡터 검색만으로 의미 매칭
+                semantic_keywords=None,  # 키워드 필터링 제거 - 벡터 검색만으로 의미 매칭
+                count_mode=count_mode or self.count_mode,
+                ann_params={**self.ann_params, **(ann_params or {})},
+                binary_prefilter=self.binary_prefilter if binary_prefilter is None else binary_prefilter
             )
             
             # total_count 추출 (메타데이터에서)
             # vector.py에서 distance threshold를 포함한 COUNT 쿼리 결과를 전달
+            # count_mode=none이면 _total_count가 None이므로 반환된 결과 수(하한값)로 대체
             total_count = len(results) if results else 0
+            total_count_mode = "exact"
+            search_plan = None
             if results and len(results) > 0 and '_total_count' in results[0]:
-                total_count = results[0]['_total_count']
+                total_count_mode = results[0].get('_total_count_mode', "exact")
+                search_plan = results[0].get('_search_plan')
+                if results[0]['_total_count'] is not None:
+                    total_count = results[0]['_total_count']
                 # 메타데이터 제거
                 for result in results:
-                    if '_total_count' in result:
-                        del result['_total_count']
+                    result.pop('_total_count', None)
+                    result.pop('_total_count_mode', None)
+                    result.pop('_search_plan', None)
             
-            print(f"[DEBUG] semantic_first total_count: {total_count} (벡터 검색 distance threshold 포함 COUNT)")
+            print(f"[DEBUG] semantic_first total_count: {total_count} ({total_count_mode})")
             
             return {
                 "results": results or [],
                 "count": len(results) if results else 0,
                 "total_count": total_count,  # ★ 실제 반환된 결과 개수 (벡터 검색 특성상)
+                "total_count_mode": total_count_mode,  # exact | estimate | none (none이면 total_count는 하한값)
+                "search_plan": search_plan,  # 벡터 검색 실행 방식 (exact | hnsw | overfetch | binary | local, 선택도 추정치)
                 "strategy": "semantic_first",
                 "search_text_used": search_text,
                 "has_results": len(results) > 0 if results else False
@@ -3,15 +3,21 @@
 
 - PanelFeatures: 설명 가능한 feature 구조
 - extract_panel_features: DB row 및 json_doc에서 PanelFeatures 생성
+- extract_panel_features_batch: 검색 결과 집합 단위 추출 (휴리스틱 feature는 행렬 연산, TF-IDF affinity는 결과 집합당 한 번)
+- heuristic_feature_records: 응답자별 feature 저장소(core_v2.respondent_feature) 적재용 레코드
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import math
 
+import numpy as np
+
+from app.services.semantic.keyword_matcher import KeywordMatcher
+
 
 @dataclass
 class CategoryAffinity:
@@ -81,115 +87,183 @@ def _load_json_doc(panel_row: Dict[str, Any]) -> Dict[str, Any]:
     return {}
 
 
-def _infer_device_brand(json_doc: Dict[str, Any]) -> Optional[str]:
-  text_blob = json.dumps(json_doc, ensure_ascii=False)
-  text_blob_lower = text_blob.lower()
-  if "iphone" in text_blob_lower or "ios" in text_blob_lower or "애플" in text_blob:
-    return "Apple"
-  if "galaxy" in text_blob_lower or "android" in text_blob_lower or "삼성" in text_blob:
-    return "Samsung"
-  return None
-
-
-def _infer_lifestyle_tags(json_doc: Dict[str, Any]) -> List[str]:
-  text = json.dumps(json_doc, ensure_ascii=False)
-  tags: List[str] = []
-  if any(k in text for k in ["헬스", "운동", "피트니스", "헬스장"]):
-    tags.append("fitness")
-  if any(k in text for k in ["프리미엄", "명품", "하이엔드", "고가"]):
-    tags.append("premium")
-  if any(k in text for k in ["게임", "콘솔", "PC방"]):
-    tags.append("gaming")
-  if any(k in text for k in ["여행", "항공", "호텔", "에어비앤비"]):
-    tags.append("travel")
-  if any(k in text for k in ["뷰티", "화장품", "스킨케어"]):
-    tags.append("beauty")
-  # 중복 제거
-  return list(dict.fromkeys(tags))
-
-
-def _infer_spending_level(panel_row: Dict[str, Any], json_doc: Dict[str, Any]) -> Optional[str]:
-  # 간단한 휴리스틱: 응답 JSON 내 "지출", "소비" 관련 키워드 빈도
-  text = json.dumps(json_doc, ensure_ascii=False)
-  high_keywords = ["명품", "프리미엄", "고가", "비싼 편"]
-  low_keywords = ["가성비", "저렴", "할인만", "쿠폰만"]
+# 설명용 feature 키워드 사전 ({그룹명: 키워드}) - import 시 한 번 만들어 모든 문서에 재사용
+FEATURE_KEYWORDS: Dict[str, List[str]] = {
+  "device:apple": ["iphone", "ios", "애플"],
+  "device:samsung": ["galaxy", "android", "삼성"],
+  "lifestyle:fitness": ["헬스", "운동", "피트니스", "헬스장"],
+  "lifestyle:premium": ["프리미엄", "명품", "하이엔드", "고가"],
+  "lifestyle:gaming": ["게임", "콘솔", "PC방"],
+  "lifestyle:travel": ["여행", "항공", "호텔", "에어비앤비"],
+  "lifestyle:beauty": ["뷰티", "화장품", "스킨케어"],
+  "spending:high": ["명품", "프리미엄", "고가", "비싼 편"],
+  "spending:low": ["가성비", "저렴", "할인만", "쿠폰만"],
+  "tech": ["앱", "모바일", "스트리밍", "OTT", "온라인", "구독", "디지털", "스마트폰"],
+  "category:beauty": ["뷰티", "화장품", "스킨케어"],
+  "category:finance": ["카드", "예금", "투자", "주식", "펀드"],
+  "category:gaming": ["게임", "콘솔", "모바일 게임"],
+  "category:food": ["배달", "음식", "식당", "맛집"],
+  "category:fashion": ["의류", "패션", "옷", "신발"],
+  "category:travel": ["여행", "항공", "호텔", "리조트"],
+  "sentiment:positive": ["만족", "좋다", "행복", "즐겁", "기쁘"],
+  "sentiment:stress": ["스트레스", "피곤", "지치", "우울", "불안"],
+  "sentiment:intent": ["구매", "사고 싶", "이용 의향", "사용 의향"],
+}
+_FEATURE_MATCHER = KeywordMatcher(FEATURE_KEYWORDS, ignore_case_groups=("device:apple", "device:samsung"))
+_LIFESTYLE_TAGS = ["fitness", "premium", "gaming", "travel", "beauty"]
 
-  high_score = sum(text.count(k) for k in high_keywords)
-  low_score = sum(text.count(k) for k in low_keywords)
 
-  if high_score == 0 and low_score == 0:
-    return None
-  if high_score > low_score:
-    return "high"
-  if low_score > high_score:
-    return "low"
-  return "medium"
-
-
-def _infer_tech_usage_level(json_doc: Dict[str, Any]) -> Optional[float]:
-  text = json.dumps(json_doc, ensure_ascii=False)
-  tech_keywords = [
-    "앱",
-    "모바일",
-    "스트리밍",
-    "OTT",
-    "온라인",
-    "구독",
-    "디지털",
-    "스마트폰",
-  ]
-  hits = sum(text.count(k) for k in tech_keywords)
-  if hits == 0:
-    return None
-  # 간단 정규화: 0~1 사이
-  return min(1.0, hits / 10.0)
+# 그룹 합계 행렬의 열 번호
+_FEATURE_COLUMNS = {group: i for i, group in enumerate(_FEATURE_MATCHER.groups)}
+_CATEGORY_FIELDS = ["beauty", "finance", "gaming", "food", "fashion", "travel"]
+_SENTIMENT_FIELDS = [("positive_ratio", "sentiment:positive"), ("stress_ratio", "sentiment:stress"), ("purchase_intent", "sentiment:intent")]
 
 
-def _infer_category_affinity(json_doc: Dict[str, Any]) -> CategoryAffinity:
-  text = json.dumps(json_doc, ensure_ascii=False)
+def _json_doc_text(json_doc: Dict[str, Any]) -> str:
+  """휴리스틱 feature 키워드를 셀 json_doc 직렬화 텍스트"""
+  return json.dumps(json_doc, ensure_ascii=False) if json_doc else ""
 
-  def count_any(keywords: List[str]) -> int:
-    return sum(text.count(k) for k in keywords)
 
-  beauty = count_any(["뷰티", "화장품", "스킨케어"])
-  finance = count_any(["카드", "예금", "투자", "주식", "펀드"])
-  gaming = count_any(["게임", "콘솔", "모바일 게임"])
-  food = count_any(["배달", "음식", "식당", "맛집"])
-  fashion = count_any(["의류", "패션", "옷", "신발"])
-  travel = count_any(["여행", "항공", "호텔", "리조트"])
+def _feature_count_matrix(texts: List[str]) -> np.ndarray:
+  """json_doc 직렬화 텍스트 목록 → 패널 × 그룹 키워드 등장 횟수 행렬"""
+  return _FEATURE_MATCHER.group_count_matrix(texts)
 
-  total = max(1, beauty + finance + gaming + food + fashion + travel)
 
-  return CategoryAffinity(
-    beauty=beauty / total if beauty else None,
-    finance=finance / total if finance else None,
-    gaming=gaming / total if gaming else None,
-    food=food / total if food else None,
-    fashion=fashion / total if fashion else None,
-    travel=travel / total if travel else None,
-  )
+def _columns(counts: np.ndarray, groups: List[str]) -> np.ndarray:
+  return counts[:, [_FEATURE_COLUMNS[group] for group in groups]]
 
 
-def _infer_sentiment_profile(json_doc: Dict[str, Any]) -> SentimentProfile:
-  text = json.dumps(json_doc, ensure_ascii=False)
+def _ratios(hits: np.ndarray) -> List[List[Optional[float]]]:
+  """그룹별 횟수 → 행 합계 대비 비율 (0회 그룹은 None)"""
+  totals = np.maximum(1, hits.sum(axis=1, keepdims=True))
+  ratios = (hits / totals).astype(object)
+  ratios[hits == 0] = None
+  return ratios.tolist()
 
-  positive_keywords = ["만족", "좋다", "행복", "즐겁", "기쁘"]
-  stress_keywords = ["스트레스", "피곤", "지치", "우울", "불안"]
-  intent_keywords = ["구매", "사고 싶", "이용 의향", "사용 의향"]
 
-  def score(words: List[str]) -> int:
-    return sum(text.count(w) for w in words)
+def _infer_heuristic_features(counts: np.ndarray) -> List[Dict[str, Any]]:
+  """
+  패널 × 그룹 횟수 행렬 → 패널별 휴리스틱 feature (행렬 연산으로 전체 패널을 한 번에 계산)
+  키: device_brand, lifestyle_tags, spending_level, tech_usage_level, category_affinity, sentiment_profile
+  """
+  n = counts.shape[0]
 
-  pos = score(positive_keywords)
-  stress = score(stress_keywords)
-  intent = score(intent_keywords)
-  total = max(1, pos + stress + intent)
+  apple = counts[:, _FEATURE_COLUMNS["device:apple"]] > 0
+  samsung = counts[:, _FEATURE_COLUMNS["device:samsung"]] > 0
+  device_brand = np.full(n, None, dtype=object)
+  device_brand[samsung] = "Samsung"
+  device_brand[apple] = "Apple"
+
+  lifestyle_hits = _columns(counts, [f"lifestyle:{tag}" for tag in _LIFESTYLE_TAGS]) > 0
+
+  # 간단한 휴리스틱: 응답 JSON 내 "지출", "소비" 관련 키워드 빈도
+  high = counts[:, _FEATURE_COLUMNS["spending:high"]]
+  low = counts[:, _FEATURE_COLUMNS["spending:low"]]
+  spending_level = np.full(n, "medium", dtype=object)
+  spending_level[high > low] = "high"
+  spending_level[low > high] = "low"
+  spending_level[(high == 0) & (low == 0)] = None
+
+  # 간단 정규화: 0~1 사이
+  tech_hits = counts[:, _FEATURE_COLUMNS["tech"]]
+  tech_usage_level = np.minimum(1.0, tech_hits / 10.0).astype(object)  # Python float
+  tech_usage_level[tech_hits == 0] = None
+
+  category = _ratios(_columns(counts, [f"category:{name}" for name in _CATEGORY_FIELDS]))
+  sentiment = _ratios(_columns(counts, [group for _, group in _SENTIMENT_FIELDS]))
+
+  return [
+    {
+      "device_brand": device_brand[i],
+      "lifestyle_tags": [tag for tag, hit in zip(_LIFESTYLE_TAGS, lifestyle_hits[i]) if hit],
+      "spending_level": spending_level[i],
+      "tech_usage_level": tech_usage_level[i],
+      "category_affinity": CategoryAffinity(**dict(zip(_CATEGORY_FIELDS, category[i]))),
+      "sentiment_profile": SentimentProfile(**{name: value for (name, _), value in zip(_SENTIMENT_FIELDS, sentiment[i])}),
+    }
+    for i in range(n)
+  ]
+
+
+def heuristic_feature_records(json_docs: List[Any]) -> List[Dict[str, Any]]:
+  """json_doc 목록 → 휴리스틱 feature 레코드 (feature 저장소 적재용, dataclass는 dict로 변환)"""
+  heuristics = _infer_heuristic_features(_feature_count_matrix([_json_doc_text(_load_json_doc({"json_doc": doc})) for doc in json_docs]))
+  return [
+    {**values, "category_affinity": asdict(values["category_affinity"]), "sentiment_profile": asdict(values["sentiment_profile"])}
+    for values in heuristics
+  ]
+
+
+def _heuristics_from_record(record: Dict[str, Any]) -> Dict[str, Any]:
+  """feature 저장소 레코드 → _infer_heuristic_features와 같은 형태"""
+  category = record.get("category_affinity") or {}
+  sentiment = record.get("sentiment_profile") or {}
+  return {
+    "device_brand": record.get("device_brand"),
+    "lifestyle_tags": list(record.get("lifestyle_tags") or []),
+    "spending_level": record.get("spending_level"),
+    "tech_usage_level": record.get("tech_usage_level"),
+    "category_affinity": CategoryAffinity(**{name: category.get(name) for name in _CATEGORY_FIELDS}),
+    "sentiment_profile": SentimentProfile(**{name: sentiment.get(name) for name, _ in _SENTIMENT_FIELDS}),
+  }
+
+
+def _panel_heuristics(panel_rows: List[Dict[str, Any]], panel_texts: List[str]) -> List[Dict[str, Any]]:
+  """
+  panel row 목록 → 휴리스틱 feature 목록
+  PANEL_FEATURE_STORE=true면 feature 저장소(respondent_id) 값을 먼저 쓰고, 저장된 값이 없는 row만 json_doc에서 계산
+  panel_texts: row별 panel_text_of 결과 (json_doc이 dict면 직렬화 텍스트가 같으므로 다시 직렬화하지 않음)
+  """
+  heuristics: List[Optional[Dict[str, Any]]] = [None] * len(panel_rows)
+
+  from app.services.data.feature_store import is_feature_store_enabled, load_feature_records
+  if is_feature_store_enabled():
+    records = load_feature_records([panel_row.get("respondent_id") for panel_row in panel_rows])
+    for idx, panel_row in enumerate(panel_rows):
+      record = records.get(panel_row.get("respondent_id"))
+      if record is not None:
+        heuristics[idx] = _heuristics_from_record(record)
+
+  missing = [idx for idx, values in enumerate(heuristics) if values is None]
+  if missing:
+    texts = [
+      panel_texts[idx] if isinstance(panel_rows[idx].get("json_doc"), dict) and panel_rows[idx]["json_doc"]
+      else _json_doc_text(_load_json_doc(panel_rows[idx]))
+      for idx in missing
+    ]
+    computed = _infer_heuristic_features(_feature_count_matrix(texts))
+    for idx, values in zip(missing, computed):
+      heuristics[idx] = values
+  return heuristics
+
+
+def panel_text_of(panel_row: Dict[str, Any]) -> str:
+  """panel row → TF-IDF / 매칭 근거용 텍스트 (json_doc 또는 content 문자열)"""
+  panel_text = panel_row.get("json_doc") or panel_row.get("content") or ""
+  if isinstance(panel_text, dict):
+    panel_text = json.dumps(panel_text, ensure_ascii=False)
+  elif not isinstance(panel_text, str):
+    panel_text = str(panel_text)
+  return panel_text
 
-  return SentimentProfile(
-    positive_ratio=pos / total if pos else None,
-    stress_ratio=stress / total if stress else None,
-    purchase_intent=intent / total if intent else None,
-  )
+
+class _TfidfAffinityContext:
+  """
+  결과 집합 단위 TF-IDF affinity
+  같은 문서 집합 / 같은 키워드 목록이면 calculate_tfidf_affinity 결과가 같으므로 키워드 목록별로 한 번만 계산
+  (패널마다 TfidfVectorizer를 다시 학습하지 않음)
+  """
+
+  def __init__(self, all_panel_texts: List[str]):
+    self.all_panel_texts = all_panel_texts
+    self._cache: Dict[Tuple[str, ...], Dict[str, float]] = {}
+
+  def affinity(self, keywords: List[str]) -> Dict[str, float]:
+    key = tuple(keywords)
+    if key not in self._cache:
+      from app.services.semantic.tfidf_affinity import calculate_tfidf_affinity
+      self._cache[key] = calculate_tfidf_affinity(self.all_panel_texts, list(keywords))
+    return self._cache[key]
 
 
 def extract_panel_features(
@@ -199,6 +273,7 @@ def extract_panel_features(
 ) -> PanelFeatures:
   """
   DB에서 읽어온 panel row(dict)를 PanelFeatures 구조로 변환.
+  여러 패널을 같은 all_panel_texts로 처리할 때는 extract_panel_features_batch 사용 (TF-IDF 1회 계산)
   
   Args:
     panel_row: 패널 데이터 row
@@ -208,13 +283,58 @@ def extract_panel_features(
   Returns:
     PanelFeatures 객체
   """
-  json_doc = _load_json_doc(panel_row)
-  panel_text = panel_row.get("json_doc") or panel_row.get("content") or ""
-  if isinstance(panel_text, dict):
-    panel_text = json.dumps(panel_text, ensure_ascii=False)
-  elif not isinstance(panel_text, str):
-    panel_text = str(panel_text)
+  tfidf_context = _TfidfAffinityContext(all_panel_texts) if all_panel_texts else None
+  panel_text = panel_text_of(panel_row)
+  heuristics = _panel_heuristics([panel_row], [panel_text])[0]
+  return _extract_panel_features(panel_row, panel_text, heuristics, expanded_keywords, tfidf_context)
+
 
+def extract_panel_features_batch(
+    panel_rows: List[Dict[str, Any]],
+    expanded_keywords: List[str] | None = None,
+    all_panel_texts: List[str] | None = None
+) -> List[PanelFeatures]:
+  """
+  검색 결과 집합의 panel row들을 PanelFeatures 목록으로 변환 (패널별 extract_panel_features와 같은 결과)
+  - json_doc은 row당 한 번만 파싱 / 스캔하고, 휴리스틱 feature는 패널 × 키워드 그룹 행렬 연산으로 한 번에 계산
+    (PANEL_FEATURE_STORE=true면 feature 저장소에 있는 패널은 json_doc을 스캔하지 않음)
+  - keyword_affinity / lifestyle_affinity의 TF-IDF는 결과 집합당 키워드 목록별로 한 번만 계산
+  
+  Args:
+    panel_rows: 패널 데이터 row 목록
+    expanded_keywords: 확장된 키워드 리스트 (TF-IDF 계산용)
+    all_panel_texts: TF-IDF 문서 집합 (None이면 panel_rows의 텍스트)
+  
+  Returns:
+    PanelFeatures 목록 (추출에 실패한 row는 경고 후 제외)
+  """
+  panel_texts = [panel_text_of(panel_row) for panel_row in panel_rows]
+  if all_panel_texts is None:
+    all_panel_texts = panel_texts
+  tfidf_context = _TfidfAffinityContext(all_panel_texts) if all_panel_texts else None
+  heuristics = _panel_heuristics(panel_rows, panel_texts)
+  features_list: List[PanelFeatures] = []
+  for idx, panel_row in enumerate(panel_rows):
+    try:
+      features_list.append(_extract_panel_features(panel_row, panel_texts[idx], heuristics[idx], expanded_keywords, tfidf_context))
+    except Exception as e:
+      print(f"[WARN] 패널 {idx} features 추출 실패 (무시): {e}")
+  return features_list
+
+
+def _extract_panel_features(
+    panel_row: Dict[str, Any],
+    panel_text: str,
+    heuristics: Dict[str, Any],
+    expanded_keywords: List[str] | None,
+    tfidf_context: Optional[_TfidfAffinityContext]
+) -> PanelFeatures:
+  """
+  PanelFeatures 생성
+  panel_text: panel_text_of(panel_row) (batch에서 row당 한 번 계산)
+  heuristics: 휴리스틱 feature (feature 저장소 또는 json_doc에서 추론, row에 값이 있으면 row 우선)
+  tfidf_context: 결과 집합에서 공유하는 TF-IDF 계산 결과
+  """
   # ① 기본 demographic feature
   age = None
   if panel_row.get("age"):
@@ -227,7 +347,7 @@ def extract_panel_features(
   region = panel_row.get("region")
 
   # 기존 features
-  device_brand = panel_row.get("device_brand") or _infer_device_brand(json_doc)
+  device_brand = panel_row.get("device_brand") or heuristics["device_brand"]
 
   lifestyle_tags: List[str] = []
   if panel_row.get("lifestyle_tags"):
@@ -235,14 +355,14 @@ def extract_panel_features(
       lifestyle_tags.extend([str(t) for t in panel_row["lifestyle_tags"]])
     else:
       lifestyle_tags.extend(str(panel_row["lifestyle_tags"]).split(","))
-  lifestyle_tags.extend(_infer_lifestyle_tags(json_doc))
+  lifestyle_tags.extend(heuristics["lifestyle_tags"])
   lifestyle_tags = list(dict.fromkeys([t.strip() for t in lifestyle_tags if t]))
 
-  spending_level = panel_row.get("spending_level") or _infer_spending_level(panel_row, json_doc)
+  spending_level = panel_row.get("spending_level") or heuristics["spending_level"]
 
   tech_usage_level = _safe_float(panel_row.get("tech_usage_level"))
   if tech_usage_level is None:
-    tech_usage_level = _infer_tech_usage_level(json_doc)
+    tech_usage_level = heuristics["tech_usage_level"]
 
   cat = CategoryAffinity()
   cat_raw = panel_row.get("category_affinity")
@@ -256,7 +376,7 @@ def extract_panel_features(
       travel=_safe_float(cat_raw.get("travel")),
     )
   else:
-    cat = _infer_category_affinity(json_doc)
+    cat = heuristics["category_affinity"]
 
   sent = SentimentProfile()
   sent_raw = panel_row.get("sentiment_profile")
@@ -267,7 +387,7 @@ def extract_panel_features(
       purchase_intent=_safe_float(sent_raw.get("purchase_intent")),
     )
   else:
-    sent = _infer_sentiment_profile(json_doc)
+    sent = heuristics["sentiment_profile"]
 
   # ② 자동 affinity feature (TF-IDF 기반)
   keyword_affinity: Dict[str, float] = {}
@@ -275,13 +395,11 @@ def extract_panel_features(
   car_type_affinity: Dict[str, float] = {}
   lifestyle_affinity: Dict[str, float] = {}
   
-  if expanded_keywords and all_panel_texts:
+  if expanded_keywords and tfidf_context is not None:
     try:
-      from app.services.semantic.tfidf_affinity import calculate_tfidf_affinity
-      
       # keyword_affinity 계산 (전체 패널 텍스트로 TF-IDF 계산 후, 현재 패널의 점수만 추출)
-      # 전체 문서 집합으로 TF-IDF 계산
-      all_keyword_affinity = calculate_tfidf_affinity(all_panel_texts, expanded_keywords)
+      # 전체 문서 집합으로 TF-IDF 계산 (결과 집합당 한 번)
+      all_keyword_affinity = tfidf_context.affinity(expanded_keywords)
       
       # 현재 패널 텍스트에서 키워드가 나타나는지 확인하여 점수 추출
       # (간단히: 전체 결과에서 해당 키워드의 TF-IDF 점수를 사용)
@@ -302,7 +420,7 @@ def extract_panel_features(
       
       # lifestyle_affinity 계산 (lifestyle_tags 기반)
       if lifestyle_tags:
-        all_lifestyle_affinity = calculate_tfidf_affinity(all_panel_texts, lifestyle_tags)
+        all_lifestyle_affinity = tfidf_context.affinity(lifestyle_tags)
         lifestyle_affinity = {}
         for tag, score in all_lifestyle_affinity.items():
           tag_lower = tag.lower()
@@ -0,0 +1,157 @@
+"""
+다중 키워드 매처 (키워드 사전 / 그룹을 한 번 정리해 두고 문서마다 재사용)
+
+- 키워드별 횟수/위치는 str.count / str.find로 계산 (C 구현 부분 문자열 검색)
+  · 대소문자를 무시하는 키워드는 문서를 한 번만 소문자로 바꿔 같은 방식으로 셈
+  · 키워드별 횟수는 text.count(keyword)와 같음 (같은 키워드끼리는 겹치지 않게, 다른 키워드끼리는 겹쳐도 각각 셈)
+  · 정규식 alternation(lookahead)으로 한 번 스캔하는 방식은 위치마다 regex 엔진을 다시 시작해
+    이 사전 크기(수십~수백 개)에서는 키워드별 str.count보다 느림 (8KB 문서 기준 약 4배)
+- 키워드 그룹({그룹명: [키워드]})을 지원해 그룹별 합계(예: 카테고리별 언급 수)를 한 번에 계산
+- 여러 문서는 count_matrix / group_count_matrix로 문서 × 키워드(그룹) 행렬을 한 번에 만듦
+- 고정 사전 매처는 모듈 import 시 생성하고, 요청마다 바뀌는 키워드는 get_keyword_matcher로 캐시
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Sequence, Set, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+
+class KeywordMatcher:
+    """
+    키워드(또는 키워드 그룹) 매처
+
+    Args:
+        keywords: 키워드 목록 또는 {그룹명: 키워드 목록} (목록이면 키워드 자체가 그룹명)
+        ignore_case: 모든 키워드의 대소문자 무시
+        ignore_case_groups: 대소문자를 무시할 그룹명 (나머지 그룹은 정확히 일치)
+    """
+
+    def __init__(
+        self,
+        keywords: Union[Iterable[str], Mapping[str, Iterable[str]]],
+        ignore_case: bool = False,
+        ignore_case_groups: Iterable[str] = ()
+    ):
+        if not isinstance(keywords, Mapping):
+            keywords = {keyword: [keyword] for keyword in keywords if keyword}
+        ignore_case_groups = set(ignore_case_groups)
+
+        self._entries: List[Tuple[str, bool]] = []  # (비교용 패턴, 대소문자 무시 여부)
+        self._keywords: List[str] = []  # 엔트리별 원래 키워드
+        self._groups: List[List[str]] = []  # 엔트리가 속한 그룹
+        self._group_names: List[str] = []  # 그룹 순서 (group_count_matrix 열 순서)
+        index: Dict[Tuple[str, bool], int] = {}
+        for group, group_keywords in keywords.items():
+            if group not in self._group_names:
+                self._group_names.append(group)
+            group_ignore_case = ignore_case or group in ignore_case_groups
+            for keyword in group_keywords:
+                if not keyword:
+                    continue
+                key = (keyword.lower() if group_ignore_case else keyword, group_ignore_case)
+                if key not in index:
+                    index[key] = len(self._entries)
+                    self._entries.append(key)
+                    self._keywords.append(keyword)
+                    self._groups.append([])
+                if group not in self._groups[index[key]]:
+                    self._groups[index[key]].append(group)
+
+        # 원문에서 찾을 엔트리 / 소문자 문서에서 찾을 엔트리
+        self._exact = [(idx, pattern) for idx, (pattern, entry_ignore_case) in enumerate(self._entries) if not entry_ignore_case]
+        self._folded = [(idx, pattern) for idx, (pattern, entry_ignore_case) in enumerate(self._entries) if entry_ignore_case]
+
+        # 엔트리 × 그룹 소속 행렬 (키워드 횟수 행렬 @ 소속 행렬 = 그룹 합계 행렬)
+        group_index = {group: i for i, group in enumerate(self._group_names)}
+        self._group_incidence = np.zeros((len(self._entries), len(self._group_names)), dtype=np.int64)
+        for idx, groups in enumerate(self._groups):
+            for group in groups:
+                self._group_incidence[idx, group_index[group]] = 1
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._keywords)
+
+    @property
+    def groups(self) -> List[str]:
+        return list(self._group_names)
+
+    def _entry_counts(self, text: str) -> List[Tuple[int, int]]:
+        """[(엔트리 번호, 등장 횟수)] (등장한 엔트리만, text.count와 같은 규칙)"""
+        if not text:
+            return []
+        found = []
+        for idx, pattern in self._exact:
+            count = text.count(pattern)
+            if count:
+                found.append((idx, count))
+        if self._folded:
+            folded = text.lower()
+            for idx, pattern in self._folded:
+                count = folded.count(pattern)
+                if count:
+                    found.append((idx, count))
+        return found
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """{키워드: 등장 횟수} (등장한 키워드만)"""
+        return {self._keywords[idx]: count for idx, count in self._entry_counts(text)}
+
+    def group_counts(self, text: str) -> Dict[str, int]:
+        """{그룹명: 그룹 키워드 등장 횟수 합계} (등장한 그룹만)"""
+        counts: Dict[str, int] = {}
+        for idx, count in self._entry_counts(text):
+            for group in self._groups[idx]:
+                counts[group] = counts.get(group, 0) + count
+        return counts
+
+    def first_positions(self, text: str) -> Dict[str, int]:
+        """{키워드: 처음 등장한 위치} (text.find와 같음, 대소문자 무시 키워드는 소문자 문서 기준, 등장한 키워드만)"""
+        positions: Dict[str, int] = {}
+        if not text:
+            return positions
+        for idx, pattern in self._exact:
+            position = text.find(pattern)
+            if position != -1:
+                positions.setdefault(self._keywords[idx], position)
+        if self._folded:
+            folded = text.lower()
+            for idx, pattern in self._folded:
+                position = folded.find(pattern)
+                if position != -1:
+                    positions.setdefault(self._keywords[idx], position)
+        return positions
+
+    def matched(self, text: str) -> Set[str]:
+        """등장한 키워드 집합"""
+        return {self._keywords[idx] for idx, _ in self._entry_counts(text)}
+
+    def _count_array(self, texts: Sequence[str]) -> np.ndarray:
+        """문서 × 키워드 등장 횟수 (dense, 각 원소는 text.count와 같음, 키워드마다 문서 목록을 한 번에 셈)"""
+        counts = np.zeros((len(texts), len(self._entries)), dtype=np.int64)
+        if not texts:
+            return counts
+        documents = [text or "" for text in texts]
+        folded = [doc.lower() for doc in documents] if self._folded else []
+        for entries, docs in ((self._exact, documents), (self._folded, folded)):
+            if entries:
+                counts[:, [idx for idx, _ in entries]] = np.array(
+                    [[doc.count(pattern) for doc in docs] for _, pattern in entries], dtype=np.int64
+                ).T
+        return counts
+
+    def count_matrix(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """문서 × 키워드 등장 횟수 희소 행렬 (행: texts 순서, 열: keywords 순서)"""
+        return sparse.csr_matrix(self._count_array(texts))
+
+    def group_count_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """문서 × 그룹 등장 횟수 합계 행렬 (열: groups 순서, 각 행은 group_counts와 같음)"""
+        return self._count_array(texts) @ self._group_incidence
+
+
+@lru_cache(maxsize=256)
+def get_keyword_matcher(keywords: Tuple[str, ...], ignore_case: bool = False) -> KeywordMatcher:
+    """키워드 튜플 → 컴파일된 매처 (같은 키워드 목록은 재사용)"""
+    return KeywordMatcher(keywords, ignore_case=ignore_case)
@@ -3,9 +3,11 @@ TF-IDF 기반 Category Affinity 계산 모듈
 scikit-learn 기반 최적화 버전
 """
 
-from typing import List, Dict
+from typing import List, Dict, Set
 import re
 
+from app.services.semantic.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
     SKLEARN_AVAILABLE = True
@@ -57,6 +59,27 @@ def _check_keyword_match(text: str, keyword: str) -> float:
     return 0.0
 
 
+def keyword_dictionary_matcher(keywords: List[str]) -> KeywordMatcher:
+    """키워드 사전 → 대소문자 무시 매처 (같은 사전은 한 번만 컴파일)"""
+    return get_keyword_matcher(tuple(dict.fromkeys(kw.lower().strip() for kw in keywords if kw and kw.strip())), True)
+
+
+def _document_keyword_hits(panel_texts: List[str], keywords: List[str]) -> List[Set[str]]:
+    """
+    문서별 등장 키워드 집합 (소문자, 문서당 한 번 계산)
+    _check_keyword_match는 키워드가 텍스트에 포함될 때만 0보다 크므로(공백 없는 키워드),
+    포함되지 않은 키워드는 상세 검사를 건너뛰는 데 사용
+    """
+    matcher = keyword_dictionary_matcher(keywords)
+    return [matcher.matched(text) if text else set() for text in panel_texts]
+
+
+def _may_match(doc_hits: Set[str], keyword: str) -> bool:
+    """등장 키워드 집합으로 _check_keyword_match 호출이 필요한지 (공백 포함 구문은 항상 검사)"""
+    kw_lower = keyword.lower().strip()
+    return ' ' in kw_lower or kw_lower in doc_hits
+
+
 def calculate_tfidf_affinity(
     panel_texts: List[str],
     expanded_keywords: List[str]
@@ -112,7 +135,9 @@ def calculate_tfidf_affinity(
         
         # 4. 각 키워드별 점수 집계
         affinity_scores: Dict[str, float] = {}
-        feature_names = vectorizer.get_feature_names_out()
+        vocabulary = vectorizer.vocabulary_  # {키워드: 열 번호} (feature_names 선형 탐색 대신 사용)
+        column_matrix = tfidf_matrix.tocsc()  # 열(키워드) 단위 슬라이싱용
+        doc_hits = _document_keyword_hits(panel_texts, expanded_keywords)
         
         for keyword in expanded_keywords:
             kw_lower = keyword.lower().strip()
@@ -120,17 +145,19 @@ def calculate_tfidf_affinity(
                 continue
             
             # scikit-learn에서 계산된 점수 사용
-            if kw_lower in feature_names:
+            if kw_lower in vocabulary:
                 try:
-                    col_idx = list(feature_names).index(kw_lower)
+                    col_idx = vocabulary[kw_lower]
                     # 해당 키워드의 모든 문서 점수 합산
-                    scores = tfidf_matrix[:, col_idx].toarray().flatten()
+                    scores = column_matrix[:, col_idx].toarray().flatten()
                     total_score = float(scores.sum())
                     
                     # 부분 매칭 보정: scikit-learn이 놓친 부분 매칭 추가 계산
                     # (구문이나 부분 포함된 경우)
                     partial_match_bonus = 0.0
                     for doc_idx, doc_text in enumerate(panel_texts):
+                        if not _may_match(doc_hits[doc_idx], keyword):
+                            continue
                         match_strength = _check_keyword_match(doc_text, keyword)
                         if match_strength > 0 and scores[doc_idx] == 0:
                             # scikit-learn이 놓친 부분 매칭에 대해 보너스 점수 추가
@@ -143,7 +170,9 @@ def calculate_tfidf_affinity(
                 except (ValueError, IndexError):
                     # 키워드가 vocabulary에 없으면 부분 매칭만으로 점수 계산
                     partial_score = 0.0
-                    for doc_text in panel_texts:
+                    for doc_idx, doc_text in enumerate(panel_texts):
+                        if not _may_match(doc_hits[doc_idx], keyword):
+                            continue
                         match_strength = _check_keyword_match(doc_text, keyword)
                         if match_strength > 0:
                             partial_score += match_strength
@@ -5,6 +5,8 @@
 """
 from typing import Dict, Any, List, Optional
 from app.services.data.executor import execute_sql_safe
+from app.services.data.demographic_table import get_demographic_snapshot
+from app.services.data.filter_compiler import compile_demographic_filters
 from app.utils.panel_schema import ensure_interests_column_exists
 
 
@@ -29,85 +31,49 @@ def calculate_panel_count(
     # interests 컬럼이 없으면 자동 생성
     ensure_interests_column_exists()
     
-    where_conditions = []
-    where_params = {}
+    # 인구통계 컬럼 테이블이 켜져 있으면 메모리 마스크로 계산 (DEMOGRAPHIC_TABLE_ENABLED)
+    snapshot = get_demographic_snapshot()
+    if snapshot is not None:
+        total_count = snapshot.count(snapshot.mask_from_filters({
+            "age": age_range, "gender": gender, "region": region, "tags": tags
+        }))
+        print(f"[DEBUG] 계산된 패널 수 (인구통계 컬럼 테이블): {total_count}")
+        return total_count
+    
+    # 연령대(birth_year 범위, sargable) / 성별 / 지역 / 태그 필터 - SQLBuilder와 같은 필터 컴파일러 사용
+    # 태그는 interests 배열과 교집합 (대소문자 구분 없이 하나라도 일치하면 매칭)
+    where_conditions, where_params = compile_demographic_filters(
+        {"age": age_range, "gender": gender, "region": region, "tags": tags}
+    )
     
-    # 연령대 필터
-    if age_range:
-        if age_range == '10s':
-            where_conditions.append("(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 10 AND 19")
-        elif age_range == '20s':
-            where_conditions.append("(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 20 AND 29")
-        elif age_range == '30s':
-            where_conditions.append("(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 30 AND 39")
-        elif age_range == '40s':
-            where_conditions.append("(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 40 AND 49")
-        elif age_range == '50s':
-            where_conditions.append("(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 50 AND 59")
-        elif age_range == '60s' or age_range == '60s+':
-            where_conditions.append("(EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) >= 60")
-    
-    # 성별 필터
-    if gender:
-        if gender in ['M', '남']:
-            where_conditions.append("gender = %(gender)s")
-            where_params['gender'] = '남'
-        elif gender in ['F', '여']:
-            where_conditions.append("gender = %(gender)s")
-            where_params['gender'] = '여'
-    
-    # 지역 필터
-    if region:
-        where_conditions.append("region LIKE %(region)s")
-        where_params['region'] = f"%{region}%"
-    
-    # 태그 필터 (interests 배열과 교집합)
-    # tags가 1개 이상이면 "interests && ARRAY[...]::text[]" 조건으로 매칭
-    # 겹치는 항목이 1개 이상이면 매칭됨 (PostgreSQL 배열 교집합 연산자 &&)
-    # NULL 체크 추가: interests IS NOT NULL AND interests && ARRAY[...]
-    # 대소문자 구분 없이 매칭하기 위해 LOWER() 사용
     if tags and isinstance(tags, list) and len(tags) > 0:
-        # 빈 문자열 제거 및 공백 제거
         clean_tags = [tag.strip() for tag in tags if tag and tag.strip()]
         if clean_tags:
-            # 대소문자 구분 없이 매칭하기 위해 배열의 각 요소를 LOWER()로 변환하여 비교
-            # PostgreSQL에서는 배열 연산자와 함께 LOWER()를 직접 사용할 수 없으므로
-            # EXISTS 서브쿼리를 사용하여 대소문자 구분 없이 매칭
-            tag_conditions = []
-            for i, tag in enumerate(clean_tags):
-                param_name = f'tag_{i}'
-                # 개행 제거하여 SQL 안전성 검사 통과
-                tag_conditions.append(f"EXISTS (SELECT 1 FROM unnest(interests) AS interest WHERE LOWER(interest) = LOWER(%({param_name})s))")
-                where_params[param_name] = tag
-            
-            if tag_conditions:
-                where_conditions.append(f"(interests IS NOT NULL AND ({' OR '.join(tag_conditions)}))")
-                
-                # 디버깅: interests 데이터 현황 확인
+            # 디버깅: interests 데이터 현황 확인
+            try:
+                from app.db.connection import get_db_connection, return_db_connection
+                conn = get_db_connection()
                 try:
-                    from app.db.connection import get_db_connection, return_db_connection
-                    conn = get_db_connection()
-                    try:
-                        with conn.cursor() as cursor:
-                            cursor.execute('SELECT COUNT(*) as count FROM "core_v2"."respondent" WHERE interests IS NOT NULL')
-                            interests_count = cursor.fetchone()[0] or 0
-                            print(f"[DEBUG] interests가 NULL이 아닌 패널 수: {interests_count}명")
-                            
-                            if interests_count == 0:
-                                print(f"[WARN] interests 컬럼에 데이터가 없습니다. 태그 필터링이 작동하지 않습니다.")
-                                print(f"[INFO] interests 데이터를 채우려면 패널 데이터에 관심사 정보를 추가해야 합니다.")
-                            else:
-                                # 실제 interests 값 샘플 확인
-                                cursor.execute('SELECT DISTINCT interests FROM "core_v2"."respondent" WHERE interests IS NOT NULL AND array_length(interests, 1) > 0 LIMIT 5')
-                                sample_rows = cursor.fetchall()
-                                if sample_rows:
-                                    print(f"[DEBUG] interests 값 샘플:")
-                                    for row in sample_rows:
-                                        print(f"  {row[0]}")
-                    finally:
-                        return_db_connection(conn)
-                except Exception as debug_err:
-                    print(f"[WARN] interests 데이터 확인 실패: {debug_err}")
+                    with conn.cursor() as cursor:
+                        cursor.execute('SELECT COUNT(*) as count FROM "core_v2"."respondent" WHERE interests IS NOT NULL')
+                        interests_count = cursor.fetchone()[0] or 0
+                        print(f"[DEBUG] interests가 NULL이 아닌 패널 수: {interests_count}명")
+                        
+                        if interests_count == 0:
+                            print(f"[WARN] interests 컬럼에 데이터가 없습니다. 태그 필터링이 작동하지 않습니다.")
+                            print(f"[INFO] interests 데이터를 채우려면 패널 데이터에 관심사 정보를 추가해야 합니다.")
+                        else:
+                            # 실제 interests 값 샘플 확인
+                            cursor.execute('SELECT DISTINCT interests FROM "core_v2"."respondent" WHERE interests IS NOT NULL AND array_length(interests, 1) > 0 LIMIT 5')
+                            sample_rows = cursor.fetchall()
+                            if sample_rows:
+                                print(f"[DEBUG] interests 값 샘플:")
+                                for row in sample_rows:
+                                    print(f"  {row[0]}")
+                finally:
+                    return_db_connection(conn)
+            except Exception as debug_err:
+                print(f"[WARN] interests 데이터 확인 실패: {debug_err}")
     
     # WHERE 절 구성
     where_clause = ""
@@ -128,7 +94,8 @@ def calculate_panel_count(
         count_result = execute_sql_safe(
             query=count_query,
             params=where_params if where_params else None,
-            limit=1
+            limit=1,
+            prepare=True
         )
         
         total_count = count_result[0]['total_count'] if count_result and len(count_result) > 0 else 0
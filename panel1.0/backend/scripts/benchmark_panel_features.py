@@ -0,0 +1,104 @@
+"""
+PanelFeatures 추출 성능 벤치마크 스크립트
+패널별 extract_panel_features 반복(패널마다 TF-IDF 재계산) vs extract_panel_features_batch(결과 집합당 1회) 비교
+DB 없이 feature 키워드 사전으로 만든 합성 패널로 측정하고, 두 방식의 PanelFeatures가 같은지 확인
+
+사용법:
+    python benchmark_panel_features.py
+    python benchmark_panel_features.py --panels 20,100,200 --repeats 5
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.semantic.features import (
+    FEATURE_KEYWORDS,
+    extract_panel_features,
+    extract_panel_features_batch,
+    panel_text_of,
+)
+
+# 검색 의미 키워드 확장 결과와 비슷한 키워드 목록
+EXPANDED_KEYWORDS = ["아이폰", "iphone", "운동", "헬스장", "여행", "호텔", "구독", "OTT", "배달", "맛집"]
+
+FILLER_ANSWERS = ["잘 모르겠다", "보통이다", "주말에는 집에 있다", "가족과 함께 산다", "회사원"]
+
+
+def build_panels(n: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """feature 키워드 / 확장 키워드를 섞은 합성 패널 row"""
+    rng = random.Random(seed)
+    vocabulary = [kw for keywords in FEATURE_KEYWORDS.values() for kw in keywords] + EXPANDED_KEYWORDS
+    panels = []
+    for i in range(n):
+        answers = {
+            f"Q{q}": " ".join(rng.sample(vocabulary, 3)) + " " + rng.choice(FILLER_ANSWERS)
+            for q in range(rng.randint(10, 30))
+        }
+        panels.append({
+            "respondent_id": f"w{i:06d}",
+            "gender": rng.choice(["남", "여"]),
+            "region": rng.choice(["서울", "부산", "경기"]),
+            "age": rng.randint(20, 69),
+            "json_doc": answers,
+        })
+    return panels
+
+
+def _time(fn, repeats: int) -> float:
+    """repeats회 실행 중앙값 (초)"""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PanelFeatures 추출: 패널별 vs 결과 집합 batch")
+    parser.add_argument("--panels", default="20,100,200", help="결과 집합 크기 목록 (쉼표 구분)")
+    parser.add_argument("--repeats", type=int, default=3, help="크기별 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    print(f"{'패널 수':>8} | {'패널별 (ms)':>12} | {'batch (ms)':>12} | {'속도 향상':>8}")
+    print("-" * 52)
+    for n in [int(value) for value in args.panels.split(",") if value.strip()]:
+        panels = build_panels(n)
+        all_panel_texts = [panel_text_of(panel) for panel in panels]
+
+        def per_panel():
+            return [
+                extract_panel_features(panel, expanded_keywords=EXPANDED_KEYWORDS, all_panel_texts=all_panel_texts)
+                for panel in panels
+            ]
+
+        def batch():
+            return extract_panel_features_batch(
+                panels, expanded_keywords=EXPANDED_KEYWORDS, all_panel_texts=all_panel_texts
+            )
+
+        expected = [features.to_dict() for features in per_panel()]
+        actual = [features.to_dict() for features in batch()]
+        if expected != actual:
+            print(f"❌ {n}개 패널: batch 결과가 패널별 결과와 다릅니다")
+            sys.exit(1)
+
+        per_panel_sec = _time(per_panel, args.repeats)
+        batch_sec = _time(batch, args.repeats)
+        print(
+            f"{n:>8} | {per_panel_sec * 1000:>12.1f} | {batch_sec * 1000:>12.1f} | "
+            f"{per_panel_sec / max(batch_sec, 1e-9):>7.1f}x"
+        )
+
+    print("✅ 모든 크기에서 PanelFeatures 동일")
+
+
+if __name__ == "__main__":
+    main()
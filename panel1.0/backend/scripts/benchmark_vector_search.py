@@ -1,25 +1,37 @@
 """
 벡터 검색 성능 벤치마크 스크립트
-768차원 vs 256차원 벡터 검색 성능 비교
+768차원 vs 256차원 vs 2단계(256→768 재정렬) 벡터 검색 성능 비교
 
 사용법:
     python benchmark_vector_search.py
+    python benchmark_vector_search.py --sweep --ef-search 40,100,200,400 --probes 1,10 --top-k 100 --repeats 5
+      (ANN 파라미터별 exact 검색 대비 recall@k, p50/p95 지연시간 비교)
+    python benchmark_vector_search.py --storage halfvec [--sweep ...]
+      (scripts/migrate_halfvec.py 적용 후 halfvec 컬럼 검색; 스윕의 exact 기준값은 float32 컬럼이므로
+       recall에 양자화 손실까지 포함)
+    python benchmark_vector_search.py --sweep --ef-search "" --binary-factors 4,10,20 --top-k 100
+      (scripts/migrate_binary_quantize.py 적용 후 해밍 거리 후보 top-k × factor → 코사인 재정렬의 recall/지연시간)
 
 요구사항:
     - sentence-transformers
     - psycopg2
-    - pgvector
     - tf-keras (256차원 인코더용, 선택사항)
     - numpy
 """
+import argparse
+import os
+import sys
 import time
 from typing import List, Tuple, Set, Optional
 
 import numpy as np
 import psycopg2
-from pgvector.psycopg2 import register_vector
 from sentence_transformers import SentenceTransformer
 
+# 프로젝트 루트를 Python 경로에 추가 (pgvector 파라미터 어댑터 사용)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from app.db.vector_adapter import PgVector
+
 # 256차원 인코더 로드 (선택사항)
 # ==========================================
 # 인코더 모델 경로 설정 방법:
@@ -28,10 +40,27 @@ from sentence_transformers import SentenceTransformer
 #    예시: ENCODER_PATH = "C:/path/to/encoder_tf_256.keras"
 #    또는: ENCODER_PATH = "../model_cache/encoders/encoder_tf_256.keras"
 # ==========================================
-import os
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ENCODER_PATH = os.path.join(_SCRIPT_DIR, "encoder_tf_256.keras")  # 스크립트와 같은 디렉토리
 
+# 검색 대상 저장 형식 (--storage): vector(float32) | halfvec(float16 사본 컬럼)
+# VectorSearchService의 VECTOR_STORAGE 설정과 같은 컬럼 매핑
+STORAGE_COLUMNS = {
+    "vector": {"embedding_256": "embedding_256", "embedding_768": "embedding_768"},
+    "halfvec": {"embedding_256": "embedding_256_half", "embedding_768": "embedding_768_half"},
+}
+STORAGE = "vector"
+
+
+def _column(name: str, storage: Optional[str] = None) -> str:
+    """저장 형식에 맞는 임베딩 컬럼명"""
+    return STORAGE_COLUMNS[storage or STORAGE][name]
+
+
+def _query_vector(emb: np.ndarray, storage: Optional[str] = None) -> PgVector:
+    """저장 형식에 맞게 캐스팅되는 질의 벡터 파라미터"""
+    return PgVector(emb, type_name=storage or STORAGE)
+
 encoder = None
 try:
     import tf_keras as keras
@@ -82,7 +111,7 @@ TEST_QUERIES = [
             SELECT r.respondent_id
             FROM core_v2.respondent r
             JOIN core_v2.respondent_flags f USING (respondent_id)
-            WHERE (EXTRACT(YEAR FROM CURRENT_DATE) - r.birth_year) BETWEEN 30 AND 39
+            WHERE r.birth_year BETWEEN EXTRACT(YEAR FROM CURRENT_DATE) - 39 AND EXTRACT(YEAR FROM CURRENT_DATE) - 30
               AND r.gender = '남'
               AND f.is_smoker = TRUE
         """
@@ -94,7 +123,7 @@ TEST_QUERIES = [
             SELECT r.respondent_id
             FROM core_v2.respondent r
             JOIN core_v2.respondent_flags f USING (respondent_id)
-            WHERE (EXTRACT(YEAR FROM CURRENT_DATE) - r.birth_year) BETWEEN 40 AND 49
+            WHERE r.birth_year BETWEEN EXTRACT(YEAR FROM CURRENT_DATE) - 49 AND EXTRACT(YEAR FROM CURRENT_DATE) - 40
               AND r.gender = '여'
               AND r.region = '서울'
               AND f.is_drinker = TRUE
@@ -107,7 +136,7 @@ TEST_QUERIES = [
             SELECT r.respondent_id
             FROM core_v2.respondent r
             JOIN core_v2.respondent_flags f USING (respondent_id)
-            WHERE (EXTRACT(YEAR FROM CURRENT_DATE) - r.birth_year) >= 50
+            WHERE r.birth_year <= EXTRACT(YEAR FROM CURRENT_DATE) - 50
               AND r.gender = '남'
               AND r.region = '경기'
               AND (f.is_smoker = FALSE OR f.is_smoker IS NULL)
@@ -120,7 +149,7 @@ TEST_QUERIES = [
             SELECT r.respondent_id
             FROM core_v2.respondent r
             JOIN core_v2.survey_qa_flat_simple s USING (respondent_id)
-            WHERE (EXTRACT(YEAR FROM CURRENT_DATE) - r.birth_year) BETWEEN 20 AND 29
+            WHERE r.birth_year BETWEEN EXTRACT(YEAR FROM CURRENT_DATE) - 29 AND EXTRACT(YEAR FROM CURRENT_DATE) - 20
               AND r.gender = '여'
               AND s.question_label = '보유 휴대폰 단말기 브랜드'
               AND s.answer_text ILIKE '%아이폰%'
@@ -185,14 +214,15 @@ def search_by_vector_768(cur, q_emb: np.ndarray, top_k: int = TOP_K) -> List[Tup
     Returns:
         [(respondent_id, distance), ...] 리스트
     """
-    cur.execute("""
+    column = _column("embedding_768")
+    cur.execute(f"""
         SELECT respondent_id,
-               embedding_768 <=> %s::vector AS distance
+               {column} <=> %s AS distance
         FROM core_v2.doc_embedding
-        WHERE embedding_768 IS NOT NULL
+        WHERE {column} IS NOT NULL
         ORDER BY distance
         LIMIT %s
-    """, (q_emb, top_k))
+    """, (_query_vector(q_emb), top_k))
 
     return cur.fetchall()
 
@@ -209,14 +239,15 @@ def search_by_vector_256(cur, q_emb_256: np.ndarray, top_k: int = TOP_K) -> List
     Returns:
         [(respondent_id, distance), ...] 리스트
     """
-    cur.execute("""
+    column = _column("embedding_256")
+    cur.execute(f"""
         SELECT respondent_id,
-               embedding_256 <=> %s::vector AS distance
+               {column} <=> %s AS distance
         FROM core_v2.doc_embedding
-        WHERE embedding_256 IS NOT NULL
+        WHERE {column} IS NOT NULL
         ORDER BY distance
         LIMIT %s
-    """, (q_emb_256, top_k))
+    """, (_query_vector(q_emb_256), top_k))
 
     return cur.fetchall()
 
@@ -247,6 +278,165 @@ def timed_search_256(cur, q_emb_256: np.ndarray, top_k: int = TOP_K) -> Tuple[Li
     return res, elapsed_ms
 
 
+def search_two_stage(cur, q_emb_768: np.ndarray, q_emb_256: np.ndarray,
+                     top_k: int = TOP_K, factor: int = 5) -> Tuple[List[Tuple[int, float]], float]:
+    """
+    2단계 검색: 256차원으로 top_k × factor개 후보 → 저장된 768차원으로 정밀 재정렬
+    (VectorSearchService의 VECTOR_RERANK_768 모드와 같은 방식)
+    
+    Returns:
+        ([(respondent_id, 768차원 거리), ...], 소요 시간(ms)) 튜플
+    """
+    start = time.perf_counter()
+    candidates = search_by_vector_256(cur, q_emb_256, top_k * factor)
+    column_768 = _column("embedding_768")
+    cur.execute(
+        f"SELECT respondent_id, {column_768}::text FROM core_v2.doc_embedding "
+        f"WHERE respondent_id = ANY(%s) AND {column_768} IS NOT NULL",
+        ([r[0] for r in candidates],)
+    )
+    rows = cur.fetchall()
+    if not rows:
+        return [], (time.perf_counter() - start) * 1000.0
+    ids = [r[0] for r in rows]
+    matrix = np.stack([np.fromstring(r[1].strip("[]"), dtype=np.float32, sep=",") for r in rows])
+    query = np.asarray(q_emb_768, dtype=np.float32)
+    distances = 1.0 - (matrix @ query) / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+    order = np.argsort(distances)[:top_k]
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return [(ids[i], float(distances[i])) for i in order], elapsed_ms
+
+
+# ==========================================
+# ANN 파라미터 스윕 (hnsw.ef_search / ivfflat.probes)
+# ==========================================
+SWEEP_SQL = """
+    SELECT respondent_id
+    FROM core_v2.doc_embedding
+    WHERE {column} IS NOT NULL
+    ORDER BY {column} <=> %(vector)s
+    LIMIT %(limit)s
+"""
+
+# 이진 양자화 사전 필터: 해밍 거리로 후보를 뽑고 후보만 코사인 거리로 재정렬
+# (VectorSearchService의 binary 실행 계획과 같은 형태)
+BINARY_SWEEP_SQL = """
+    WITH bq AS (
+        SELECT respondent_id
+        FROM core_v2.doc_embedding
+        WHERE embedding_256_bit IS NOT NULL
+        ORDER BY embedding_256_bit <~> binary_quantize(%(vector)s)::bit(256)
+        LIMIT %(candidates)s
+    )
+    SELECT pe.respondent_id
+    FROM bq JOIN core_v2.doc_embedding pe ON pe.respondent_id = bq.respondent_id
+    WHERE pe.{column} IS NOT NULL
+    ORDER BY pe.{column} <=> %(vector)s
+    LIMIT %(limit)s
+"""
+
+
+def exact_top_k(cur, q_emb_256: np.ndarray, top_k: int) -> List[int]:
+    """인덱스 스캔을 끈 전수 거리 계산 top-k (recall 기준값, 항상 float32 컬럼)"""
+    try:
+        cur.execute("SET LOCAL enable_indexscan = off")
+        cur.execute(
+            SWEEP_SQL.format(column=_column("embedding_256", "vector")),
+            {"vector": _query_vector(q_emb_256, "vector"), "limit": top_k}
+        )
+        return [r[0] for r in cur.fetchall()]
+    finally:
+        cur.connection.rollback()
+
+
+def ann_top_k(cur, q_emb_256: np.ndarray, top_k: int, setting: dict) -> Tuple[List[int], float]:
+    """SET LOCAL로 ANN 파라미터를 적용한 top-k 및 소요 시간(ms)"""
+    try:
+        if setting.get("binary_factor"):
+            candidates = top_k * int(setting["binary_factor"])
+            # HNSW는 ef_search(최대 1000)개까지만 반환하므로 그보다 많으면 해밍 거리 전수 계산
+            if candidates <= 1000:
+                cur.execute(f"SET LOCAL hnsw.ef_search = {candidates}")
+            else:
+                cur.execute("SET LOCAL enable_indexscan = off")
+            start = time.perf_counter()
+            cur.execute(
+                BINARY_SWEEP_SQL.format(column=_column("embedding_256")),
+                {"vector": _query_vector(q_emb_256), "candidates": candidates, "limit": top_k}
+            )
+            ids = [r[0] for r in cur.fetchall()]
+            return ids, (time.perf_counter() - start) * 1000.0
+        if setting.get("ef_search"):
+            cur.execute(f"SET LOCAL hnsw.ef_search = {int(setting['ef_search'])}")
+        if setting.get("probes"):
+            cur.execute(f"SET LOCAL ivfflat.probes = {int(setting['probes'])}")
+        start = time.perf_counter()
+        cur.execute(
+            SWEEP_SQL.format(column=_column("embedding_256")),
+            {"vector": _query_vector(q_emb_256), "limit": top_k}
+        )
+        ids = [r[0] for r in cur.fetchall()]
+        return ids, (time.perf_counter() - start) * 1000.0
+    finally:
+        cur.connection.rollback()
+
+
+def _parse_int_list(value: Optional[str]) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()] if value else []
+
+
+def run_sweep(ef_search_values: List[int], probes_values: List[int], top_k: int, repeats: int,
+              binary_factors: Optional[List[int]] = None):
+    """
+    ANN 파라미터 스윕
+    - 각 TEST_QUERIES 질의에 대해 exact top-k를 기준으로 recall@k 계산
+    - 설정별 p50/p95 지연시간은 (질의 수 × repeats)번 측정값으로 계산
+    - 결과 표를 보고 전략별 SEMANTIC_/HYBRID_HNSW_EF_SEARCH, *_IVFFLAT_PROBES 값을 선택
+    - binary_factors: 이진 양자화 사전 필터 후보 배수별 측정 (VECTOR_BINARY_OVERFETCH_FACTOR 선택용)
+    """
+    if encoder is None:
+        print("❌ 스윕은 256차원 인코더가 필요합니다 (encoder_tf_256.keras).")
+        return
+
+    settings = [{"ef_search": ef} for ef in ef_search_values] + [{"probes": p} for p in probes_values]
+    settings += [{"binary_factor": f} for f in (binary_factors or [])]
+    if not settings:
+        settings = [{}]  # 서버 기본값만 측정
+
+    print("🔹 Loading KoSimCSE model...")
+    model = SentenceTransformer("BM-K/KoSimCSE-roberta-multitask")
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor()
+
+    # 질의 임베딩 및 exact 기준값은 한 번만 계산
+    queries = []
+    for test in TEST_QUERIES:
+        q_emb_768 = model.encode(test["nl_query"], convert_to_numpy=True)
+        q_emb_256 = encoder.predict(q_emb_768.reshape(1, -1), verbose=0)[0]
+        queries.append((test["name"], q_emb_256, exact_top_k(cur, q_emb_256, top_k)))
+    print(f"✅ 질의 {len(queries)}개 exact top-{top_k} 계산 완료")
+
+    print(f"   저장 형식: {STORAGE} ({_column('embedding_256')})")
+    print("=" * 80)
+    print(f"{'setting':<20} {'recall@' + str(top_k):>10} {'p50 ms':>10} {'p95 ms':>10}")
+    print("-" * 80)
+    for setting in settings:
+        label = ", ".join(f"{k}={v}" for k, v in setting.items()) or "server default"
+        recalls, latencies = [], []
+        for _, q_emb_256, exact_ids in queries:
+            for _ in range(repeats):
+                ids, elapsed_ms = ann_top_k(cur, q_emb_256, top_k, setting)
+                latencies.append(elapsed_ms)
+            recalls.append(len(set(ids) & set(exact_ids)) / len(exact_ids) if exact_ids else 0.0)
+        print(
+            f"{label:<20} {np.mean(recalls):>10.3f} "
+            f"{np.percentile(latencies, 50):>10.2f} {np.percentile(latencies, 95):>10.2f}"
+        )
+
+    cur.close()
+    conn.close()
+
+
 # ==========================================
 # 메인 벤치마크 루프
 # ==========================================
@@ -261,9 +451,9 @@ def main():
     print("🔹 Connecting to database...")
     try:
         conn = psycopg2.connect(**DB_CONFIG)
-        register_vector(conn)  # pgvector 확장 등록 (numpy 배열 자동 변환)
         cur = conn.cursor()
         print("✅ Database connected.")
+        print(f"   저장 형식: {STORAGE}")
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         return
@@ -338,6 +528,12 @@ def main():
                 print("   ▶ 256차원 Top 5 예시:")
                 for rid, dist in res_256[:5]:
                     print(f"      - {rid} (dist={dist:.4f})")
+
+                # 2단계 검색 (256차원 후보 5×k → 768차원 재정렬)
+                res_2s, search_2s_ms = search_two_stage(cur, q_emb_768, q_emb_256, TOP_K)
+                p2s, r2s = precision_recall_at_k([r[0] for r in res_2s], gt_ids)
+                print(f"   📊 2단계(256→768) 결과: P@{TOP_K} = {p2s:.3f}, R@{TOP_K} = {r2s:.3f}")
+                print(f"   ⚡ 2단계: 검색+재정렬 {search_2s_ms:.2f} ms")
             except Exception as e:
                 print(f"   ❌ 256차원 벤치마크 실행 실패: {e}")
                 import traceback
@@ -354,5 +550,22 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="벡터 검색 성능 벤치마크")
+    parser.add_argument("--sweep", action="store_true", help="ANN 파라미터 스윕 모드 (recall@k, p50/p95)")
+    parser.add_argument("--ef-search", default="40,100,200,400", help="스윕할 hnsw.ef_search 값 (쉼표 구분)")
+    parser.add_argument("--probes", default="", help="스윕할 ivfflat.probes 값 (쉼표 구분, IVFFlat 인덱스 사용 시)")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="recall 계산 k")
+    parser.add_argument("--repeats", type=int, default=5, help="설정/질의별 반복 측정 횟수")
+    parser.add_argument("--storage", choices=sorted(STORAGE_COLUMNS), default="vector",
+                        help="검색할 임베딩 저장 형식 (halfvec: migrate_halfvec.py 적용 필요)")
+    parser.add_argument("--binary-factors", default="",
+                        help="스윕할 이진 양자화 후보 배수 (쉼표 구분, migrate_binary_quantize.py 적용 필요)")
+    args = parser.parse_args()
+    STORAGE = args.storage
+
+    if args.sweep:
+        run_sweep(_parse_int_list(args.ef_search), _parse_int_list(args.probes), args.top_k, args.repeats,
+                  _parse_int_list(args.binary_factors))
+    else:
+        main()
 
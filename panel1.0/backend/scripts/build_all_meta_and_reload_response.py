@@ -1238,6 +1238,8 @@ def main():
         conn.commit()
         
         logger.info("모든 작업 완료 및 커밋")
+        logger.info("다음 단계: respondent_json 적재 후 scripts/build_keyword_postings.py로 키워드 포스팅 재생성")
+        logger.info("다음 단계: scripts/build_panel_features.py로 응답자별 feature 저장소 갱신 (바뀐 응답자만 계산)")
     
     except Exception as e:
         logger.error(f"오류 발생: {e}")
@@ -0,0 +1,137 @@
+"""
+키워드 포스팅 적재: core_v2.respondent_json.json_doc → core_v2.keyword_posting (term, respondent_id, weight)
+build_all_meta_and_reload_response.py / respondent_json 적재 후 1회 실행
+응답자별 답변을 한 번만 토큰화하고 부정 표현 답변을 제외해 저장하므로
+하이브리드 검색(VECTOR_KEYWORD_POSTINGS=true)의 키워드 조건과 재랭킹이 요청마다 json_doc을 스캔하지 않음
+
+사용법:
+    python build_keyword_postings.py
+    python build_keyword_postings.py --batch-size 5000
+
+동작:
+    - core_v2.keyword_posting_new에 적재하고 인덱스를 만든 뒤 한 트랜잭션에서 기존 테이블과 교체
+      (적재 중에도 검색은 이전 포스팅을 사용)
+    - 인덱스: (term text_pattern_ops, respondent_id) - 키워드 접두 일치 조건
+              (respondent_id, term text_pattern_ops) - 후보 행 EXISTS / 재랭킹 조회
+    - 토큰화 / 부정 표현 규칙: app/services/data/keyword_postings.py
+
+환경변수 설정 (.env 파일 또는 시스템 환경변수):
+    DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+"""
+import os
+import sys
+import time
+import argparse
+
+import psycopg2
+from psycopg2.extras import execute_batch
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.data.keyword_postings import build_postings
+
+# python-dotenv 사용 (선택사항)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass  # dotenv가 없어도 환경변수 직접 설정 가능
+
+STAGING_TABLE = "core_v2.keyword_posting_new"
+
+SOURCE_SQL = """
+    SELECT respondent_id, json_doc
+    FROM core_v2.respondent_json
+    WHERE json_doc IS NOT NULL
+    ORDER BY respondent_id
+"""
+
+CREATE_STAGING_SQL = [
+    f"DROP TABLE IF EXISTS {STAGING_TABLE}",
+    f"""
+    CREATE TABLE {STAGING_TABLE} (
+        term TEXT NOT NULL,
+        respondent_id VARCHAR NOT NULL,
+        weight REAL NOT NULL
+    )
+    """,
+]
+
+INSERT_SQL = f"INSERT INTO {STAGING_TABLE} (term, respondent_id, weight) VALUES (%s, %s, %s)"
+
+INDEX_SQL = [
+    f"CREATE UNIQUE INDEX keyword_posting_new_term_idx ON {STAGING_TABLE} (term text_pattern_ops, respondent_id)",
+    f"CREATE INDEX keyword_posting_new_respondent_idx ON {STAGING_TABLE} (respondent_id, term text_pattern_ops)",
+]
+
+SWAP_SQL = [
+    "DROP TABLE IF EXISTS core_v2.keyword_posting",
+    f"ALTER TABLE {STAGING_TABLE} RENAME TO keyword_posting",
+    "ALTER INDEX core_v2.keyword_posting_new_term_idx RENAME TO keyword_posting_term_idx",
+    "ALTER INDEX core_v2.keyword_posting_new_respondent_idx RENAME TO keyword_posting_respondent_idx",
+]
+
+
+def get_connection():
+    """환경변수에서 DB 연결 정보를 읽어 PostgreSQL 연결 생성"""
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST"),
+        port=int(os.environ.get("DB_PORT", "5432")),
+        dbname=os.environ.get("DB_NAME"),
+        user=os.environ.get("DB_USER"),
+        password=os.environ.get("DB_PASSWORD")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="respondent_json → keyword_posting 키워드 포스팅 적재")
+    parser.add_argument("--batch-size", type=int, default=5000, help="서버 측 커서 fetch 크기 (응답자 수)")
+    args = parser.parse_args()
+
+    started = time.time()
+    conn = get_connection()
+    respondents = 0
+    postings = 0
+    try:
+        with conn.cursor() as write_cur:
+            for sql in CREATE_STAGING_SQL:
+                write_cur.execute(sql)
+
+            # 서버 측(named) 커서로 나눠 읽고 응답자 batch 단위로 삽입
+            with conn.cursor(name="build_keyword_postings") as read_cur:
+                read_cur.itersize = args.batch_size
+                read_cur.execute(SOURCE_SQL)
+                records = []
+                for respondent_id, json_doc in read_cur:
+                    respondents += 1
+                    records.extend((term, respondent_id, weight) for term, weight in build_postings(json_doc).items())
+                    if respondents % args.batch_size == 0:
+                        execute_batch(write_cur, INSERT_SQL, records, page_size=10000)
+                        postings += len(records)
+                        records = []
+                        print(f"   {respondents:,}명 처리, 포스팅 {postings:,}행")
+                if records:
+                    execute_batch(write_cur, INSERT_SQL, records, page_size=10000)
+                    postings += len(records)
+
+            print("   인덱스 생성 / 테이블 교체 중...")
+            for sql in INDEX_SQL + SWAP_SQL:
+                write_cur.execute(sql)
+        conn.commit()
+
+        with conn.cursor() as cur:
+            cur.execute("ANALYZE core_v2.keyword_posting")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"✅ 적재 완료: 응답자 {respondents:,}명, 포스팅 {postings:,}행 ({time.time() - started:.1f}초)")
+    print("   VECTOR_KEYWORD_POSTINGS=true 로 하이브리드 검색에서 사용")
+
+
+if __name__ == "__main__":
+    main()
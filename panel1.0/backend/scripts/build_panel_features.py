@@ -0,0 +1,200 @@
+"""
+응답자별 feature 저장소 적재: core_v2.respondent_json.json_doc → core_v2.respondent_feature
+build_all_meta_and_reload_response.py / respondent_json 적재 후 실행 (다시 실행하면 바뀐 응답자만 계산)
+검색(PANEL_FEATURE_STORE=true) 시 extract_panel_features가 json_doc을 스캔하지 않고 저장된 휴리스틱 feature를 사용
+
+사용법:
+    python build_panel_features.py
+    python build_panel_features.py --batch-size 5000
+    python build_panel_features.py --full      # 전체 다시 계산
+
+동작:
+    - 테이블 / 무효화 트리거가 없으면 생성
+    - 증분: feature 행이 없거나, md5(json_doc) 또는 FEATURE_VERSION이 다른 응답자만 계산해 upsert
+    - respondent_json에서 사라진(또는 json_doc이 NULL인) 응답자의 feature 행 삭제
+    - 트리거: respondent_json의 json_doc 변경 / 행 삭제 시 feature 행 삭제,
+      respondent_json TRUNCATE(재적재) 시 feature 테이블도 TRUNCATE (행 트리거는 TRUNCATE에서 실행되지 않음)
+      (다음 적재 전까지 검색은 오래된 값 대신 json_doc으로 계산)
+    - feature 규칙: app/services/semantic/features.py, 버전: app/services/data/feature_store.py의 FEATURE_VERSION
+
+환경변수 설정 (.env 파일 또는 시스템 환경변수):
+    DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+"""
+import os
+import sys
+import time
+import argparse
+
+import psycopg2
+from psycopg2.extras import Json, execute_batch
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.data.feature_store import FEATURE_TABLE, FEATURE_VERSION
+from app.services.semantic.features import heuristic_feature_records
+
+# python-dotenv 사용 (선택사항)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass  # dotenv가 없어도 환경변수 직접 설정 가능
+
+SETUP_SQL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {FEATURE_TABLE} (
+        respondent_id VARCHAR PRIMARY KEY,
+        device_brand TEXT,
+        lifestyle_tags TEXT[] NOT NULL DEFAULT '{{}}',
+        spending_level TEXT,
+        tech_usage_level DOUBLE PRECISION,
+        category_affinity JSONB NOT NULL DEFAULT '{{}}',
+        sentiment_profile JSONB NOT NULL DEFAULT '{{}}',
+        source_hash TEXT NOT NULL,
+        feature_version INTEGER NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION core_v2.invalidate_respondent_feature() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' OR NEW.json_doc IS DISTINCT FROM OLD.json_doc THEN
+            DELETE FROM {FEATURE_TABLE} WHERE respondent_id = OLD.respondent_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_invalidate_respondent_feature ON core_v2.respondent_json",
+    """
+    CREATE TRIGGER trg_invalidate_respondent_feature
+        AFTER UPDATE OF json_doc OR DELETE ON core_v2.respondent_json
+        FOR EACH ROW EXECUTE FUNCTION core_v2.invalidate_respondent_feature()
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION core_v2.truncate_respondent_feature() RETURNS trigger AS $$
+    BEGIN
+        TRUNCATE {FEATURE_TABLE};
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_truncate_respondent_feature ON core_v2.respondent_json",
+    """
+    CREATE TRIGGER trg_truncate_respondent_feature
+        BEFORE TRUNCATE ON core_v2.respondent_json
+        FOR EACH STATEMENT EXECUTE FUNCTION core_v2.truncate_respondent_feature()
+    """,
+]
+
+# 계산 대상: feature 행이 없거나 답변(md5) / 규칙 버전이 바뀐 응답자 (--full이면 전체)
+SOURCE_SQL = f"""
+    SELECT r.respondent_id, r.json_doc, md5(r.json_doc::text)
+    FROM core_v2.respondent_json r
+    LEFT JOIN {FEATURE_TABLE} f ON f.respondent_id = r.respondent_id
+    WHERE r.json_doc IS NOT NULL
+      AND (%(full)s OR f.respondent_id IS NULL
+           OR f.feature_version <> %(version)s OR f.source_hash <> md5(r.json_doc::text))
+    ORDER BY r.respondent_id
+"""
+
+UPSERT_SQL = f"""
+    INSERT INTO {FEATURE_TABLE} (
+        respondent_id, device_brand, lifestyle_tags, spending_level, tech_usage_level,
+        category_affinity, sentiment_profile, source_hash, feature_version, updated_at
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, now())
+    ON CONFLICT (respondent_id) DO UPDATE SET
+        device_brand = EXCLUDED.device_brand,
+        lifestyle_tags = EXCLUDED.lifestyle_tags,
+        spending_level = EXCLUDED.spending_level,
+        tech_usage_level = EXCLUDED.tech_usage_level,
+        category_affinity = EXCLUDED.category_affinity,
+        sentiment_profile = EXCLUDED.sentiment_profile,
+        source_hash = EXCLUDED.source_hash,
+        feature_version = EXCLUDED.feature_version,
+        updated_at = EXCLUDED.updated_at
+"""
+
+DELETE_ORPHANS_SQL = f"""
+    DELETE FROM {FEATURE_TABLE} f
+    WHERE NOT EXISTS (
+        SELECT 1 FROM core_v2.respondent_json r
+        WHERE r.respondent_id = f.respondent_id AND r.json_doc IS NOT NULL
+    )
+"""
+
+
+def get_connection():
+    """환경변수에서 DB 연결 정보를 읽어 PostgreSQL 연결 생성"""
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST"),
+        port=int(os.environ.get("DB_PORT", "5432")),
+        dbname=os.environ.get("DB_NAME"),
+        user=os.environ.get("DB_USER"),
+        password=os.environ.get("DB_PASSWORD")
+    )
+
+
+def _upsert(cur, batch):
+    """(respondent_id, json_doc, source_hash) batch → feature 행렬 연산 후 upsert"""
+    records = heuristic_feature_records([json_doc for _, json_doc, _ in batch])
+    execute_batch(cur, UPSERT_SQL, [
+        (
+            respondent_id, record["device_brand"], record["lifestyle_tags"], record["spending_level"],
+            record["tech_usage_level"], Json(record["category_affinity"]), Json(record["sentiment_profile"]),
+            source_hash, FEATURE_VERSION
+        )
+        for (respondent_id, _, source_hash), record in zip(batch, records)
+    ], page_size=1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="respondent_json → respondent_feature 응답자별 feature 적재")
+    parser.add_argument("--batch-size", type=int, default=5000, help="서버 측 커서 fetch / 계산 batch 크기 (응답자 수)")
+    parser.add_argument("--full", action="store_true", help="바뀌지 않은 응답자까지 전체 다시 계산")
+    args = parser.parse_args()
+
+    started = time.time()
+    conn = get_connection()
+    computed = 0
+    try:
+        with conn.cursor() as write_cur:
+            for sql in SETUP_SQL:
+                write_cur.execute(sql)
+
+            # 서버 측(named) 커서로 나눠 읽고 batch 단위로 계산 / upsert
+            with conn.cursor(name="build_panel_features") as read_cur:
+                read_cur.itersize = args.batch_size
+                read_cur.execute(SOURCE_SQL, {"full": args.full, "version": FEATURE_VERSION})
+                batch = []
+                for row in read_cur:
+                    batch.append(row)
+                    if len(batch) >= args.batch_size:
+                        _upsert(write_cur, batch)
+                        computed += len(batch)
+                        batch = []
+                        print(f"   {computed:,}명 계산")
+                if batch:
+                    _upsert(write_cur, batch)
+                    computed += len(batch)
+
+            write_cur.execute(DELETE_ORPHANS_SQL)
+            removed = write_cur.rowcount
+        conn.commit()
+
+        with conn.cursor() as cur:
+            cur.execute(f"ANALYZE {FEATURE_TABLE}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"✅ 적재 완료: 계산 {computed:,}명, 삭제 {removed:,}명 ({time.time() - started:.1f}초, feature_version={FEATURE_VERSION})")
+    print("   PANEL_FEATURE_STORE=true 로 검색 시 저장된 feature 사용")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ core_v2.panel_embedding 테이블에 저장
 """
 
 import os
+import sys
 import time
 import logging
 import psycopg2
@@ -13,6 +14,10 @@ from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+# 프로젝트 루트를 Python 경로에 추가 (pgvector 파라미터 어댑터 사용)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from app.db.vector_adapter import PgVector
+
 # 1. 환경 변수 로드
 load_dotenv()
 
@@ -76,10 +81,10 @@ def main():
             logger.warning("데이터가 없습니다.")
             return
 
-        # SQL 쿼리 (명시적 vector 캐스팅)
+        # SQL 쿼리 (PgVector 어댑터가 '[...]'::vector 리터럴로 직렬화)
         upsert_query = f"""
             INSERT INTO {DB_SCHEMA}.{TARGET_TABLE} (respondent_id, embedding, updated_at)
-            VALUES (%s, %s::vector, NOW()) 
+            VALUES (%s, %s, NOW()) 
             ON CONFLICT (respondent_id) 
             DO UPDATE SET 
                 embedding = EXCLUDED.embedding,
@@ -102,10 +107,10 @@ def main():
                         show_progress_bar=False
                     )
                     
-                    # 벡터 문자열 변환
+                    # 벡터 파라미터 변환 (float32 최소 자릿수 직렬화)
                     batch_records = []
                     for r_id, vec in zip(ids, embeddings):
-                        batch_records.append((r_id, str(vec.tolist())))
+                        batch_records.append((r_id, PgVector(vec)))
                     
                     # DB 저장
                     execute_batch(cursor, upsert_query, batch_records, page_size=BATCH_SIZE)
@@ -0,0 +1,188 @@
+"""
+Autoencoder 인코더 가중치 내보내기: encoder_tf_256.keras → encoder_tf_256.npz
+VectorSearchService가 TensorFlow 없이 NumPy로 768차원 → 256차원 압축을 수행하도록
+Dense 레이어 가중치와 활성화 함수를 .npz 파일로 저장
+생성된 .npz는 저장소에 커밋하지 않음 - 배포 시 scripts/install_dependencies.sh에서 생성 (모델 교체 시에도 다시 실행)
+
+사용법:
+    python export_encoder_npz.py
+    python export_encoder_npz.py --input encoder_tf_256.keras --output encoder_tf_256.npz
+
+동작:
+    - tf_keras가 설치되어 있으면 keras로 모델을 로드하여 가중치 추출
+      (Windows에서 저장된 아카이브는 가중치 경로에 '\\'가 섞여 Linux keras 로드가 실패하므로
+       경로를 '/'로 바꾼 임시 사본으로 다시 로드)
+    - keras가 없으면 .keras 아카이브(config.json + model.weights.h5)를 h5py로 직접 읽음
+    - 저장 후 keras 출력과 NumPy 출력을 비교하여 최대 오차 출력 (tf_keras가 있을 때)
+"""
+import os
+import sys
+import io
+import json
+import zipfile
+import argparse
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.data.encoder import (
+    NumpyDenseEncoder,
+    export_dense_weights,
+    extract_keras_dense_weights,
+)
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT = os.path.join(_SCRIPT_DIR, "encoder_tf_256.keras")
+DEFAULT_OUTPUT = os.path.join(_SCRIPT_DIR, "encoder_tf_256.npz")
+
+
+def normalize_keras_archive(path: str, output_path: str) -> str:
+    """
+    .keras 아카이브의 model.weights.h5 그룹 경로('layers\\dense')를 '/'로 바꾼 사본 저장 (h5py 필요)
+    Windows에서 저장된 아카이브를 Linux keras가 가중치까지 로드할 수 있게 함
+    """
+    import h5py
+
+    with zipfile.ZipFile(path) as archive:
+        files = {name: archive.read(name) for name in archive.namelist()}
+
+    weights = io.BytesIO()
+    with h5py.File(io.BytesIO(files["model.weights.h5"]), "r") as source, h5py.File(weights, "w") as target:
+        def _copy(name, obj):
+            name = name.replace("\\", "/")
+            if isinstance(obj, h5py.Dataset):
+                target.create_dataset(name, data=obj[()])
+            else:
+                target.require_group(name)
+
+        source.visititems(_copy)
+    files["model.weights.h5"] = weights.getvalue()
+
+    with zipfile.ZipFile(output_path, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return output_path
+
+
+def load_keras_model(path: str) -> Any:
+    """
+    tf_keras(또는 tensorflow.keras)로 모델 로드, 설치되지 않았으면 None
+    가중치 로드가 실패하면(ValueError) 경로를 정규화한 사본으로 다시 로드
+    """
+    try:
+        os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+        try:
+            import tf_keras as keras
+        except ImportError:
+            from tensorflow import keras
+    except ImportError:
+        return None
+    try:
+        return keras.models.load_model(path, compile=False)
+    except ValueError:
+        with tempfile.TemporaryDirectory() as tmp:
+            normalized = normalize_keras_archive(path, os.path.join(tmp, os.path.basename(path)))
+            return keras.models.load_model(normalized, compile=False)
+
+
+def read_dense_weights_from_archive(path: str) -> Dict[str, List[Any]]:
+    """
+    .keras 아카이브에서 직접 Dense 가중치 읽기 (TensorFlow 불필요, h5py 필요)
+    - config.json: 레이어 순서와 활성화 함수
+    - model.weights.h5: layers/<layer>/vars/0 (kernel), vars/1 (bias)
+    """
+    import h5py
+
+    with zipfile.ZipFile(path) as archive:
+        config = json.loads(archive.read("config.json"))
+        weights_bytes = archive.read("model.weights.h5")
+
+    dense_layers = [
+        layer for layer in config["config"]["layers"]
+        if layer["class_name"] == "Dense"
+    ]
+
+    kernels, biases, activations = [], [], []
+    with h5py.File(io.BytesIO(weights_bytes), "r") as h5:
+        # Windows에서 저장된 아카이브는 그룹 경로가 'layers\\dense' 형태일 수 있음
+        groups = {}
+
+        def _collect(name, obj):
+            if isinstance(obj, h5py.Dataset):
+                groups[name.replace("\\", "/")] = obj
+
+        h5.visititems(_collect)
+
+        # h5 안의 Dense 레이어 이름은 저장 시 자동 부여(dense, dense_1, dense_2 ...)되므로
+        # config 순서대로 매칭한다
+        h5_dense_names = sorted(
+            {name.split("/")[1] for name in groups if name.startswith("layers/dense")},
+            key=lambda n: 0 if n == "dense" else int(n.rsplit("_", 1)[1])
+        )
+        if len(h5_dense_names) != len(dense_layers):
+            raise ValueError(
+                f"Dense 레이어 개수 불일치: config={len(dense_layers)}, weights={len(h5_dense_names)}"
+            )
+
+        for layer, h5_name in zip(dense_layers, h5_dense_names):
+            kernels.append(np.array(groups[f"layers/{h5_name}/vars/0"]))
+            biases.append(np.array(groups[f"layers/{h5_name}/vars/1"]))
+            activations.append(layer["config"].get("activation", "linear"))
+
+    return {"kernels": kernels, "biases": biases, "activations": activations}
+
+
+def export_encoder(input_path: str, output_path: str) -> Tuple[NumpyDenseEncoder, Any]:
+    """
+    .keras → .npz 내보내기
+
+    Returns:
+        (내보낸 .npz로 로드한 NumpyDenseEncoder, keras 모델 또는 None)
+    """
+    try:
+        model = load_keras_model(input_path)
+    except Exception as e:
+        print(f"⚠️ keras 모델 로드 실패: {e}")
+        model = None
+
+    if model is not None:
+        print(f"🔹 keras로 모델 로드: {input_path}")
+        weights = extract_keras_dense_weights(model)
+    else:
+        print(f"🔹 아카이브에서 직접 가중치를 읽습니다: {input_path}")
+        weights = read_dense_weights_from_archive(input_path)
+
+    export_dense_weights(output_path, **weights)
+    return NumpyDenseEncoder.load(output_path), model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="encoder_tf_256.keras → .npz 가중치 내보내기")
+    parser.add_argument("--input", default=DEFAULT_INPUT, help=".keras 모델 경로")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="저장할 .npz 경로")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ 인코더 모델 파일을 찾을 수 없습니다: {args.input}")
+        sys.exit(1)
+
+    encoder, model = export_encoder(args.input, args.output)
+    layer_desc = " → ".join(
+        f"{k.shape[1]}({a})" for k, a in zip(encoder.kernels, encoder.activations)
+    )
+    print(f"✅ 저장 완료: {args.output}")
+    print(f"   구조: {encoder.input_dim} → {layer_desc}")
+
+    if model is not None:
+        sample = np.random.default_rng(0).standard_normal((8, encoder.input_dim)).astype(np.float32)
+        expected = model.predict(sample, verbose=0)
+        actual = encoder.predict(sample)
+        print(f"   keras 대비 최대 오차: {float(np.max(np.abs(expected - actual))):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+로컬 벡터 인덱스 내보내기: core_v2.doc_embedding.embedding_256 → 메모리 매핑 .npy
+VectorSearchService가 VECTOR_LOCAL_INDEX=true일 때 Postgres 대신 NumPy로 top-k를 계산하도록
+respondent_id와 embedding_256 행렬을 저장 (ETL/임베딩 적재 후 1회 실행)
+
+사용법:
+    python export_vector_index.py
+    python export_vector_index.py --output /srv/panel/vector_index --batch-size 5000
+
+동작:
+    - 검색 대상과 같은 조건(embedding_256 IS NOT NULL, json_doc 존재)의 행만 내보냄
+    - 데이터 파일을 쓴 뒤 version.json을 원자적으로 교체 → 실행 중인 워커는 다음 버전 확인 때 자동 교체
+      (VECTOR_LOCAL_INDEX_CHECK_SECONDS, 기본 30초)
+
+환경변수 설정 (.env 파일 또는 시스템 환경변수):
+    DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import psycopg2
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.data.local_index import DEFAULT_INDEX_DIR, export_vector_index
+
+# python-dotenv 사용 (선택사항)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass  # dotenv가 없어도 환경변수 직접 설정 가능
+
+EXPORT_SQL = """
+    SELECT pe.respondent_id, pe.embedding_256::text
+    FROM core_v2.doc_embedding pe
+    WHERE pe.embedding_256 IS NOT NULL
+      AND EXISTS (
+          SELECT 1 FROM core_v2.respondent_json r_json
+          WHERE r_json.respondent_id = pe.respondent_id AND r_json.json_doc IS NOT NULL
+      )
+    ORDER BY pe.respondent_id
+"""
+
+
+def get_connection():
+    """환경변수에서 DB 연결 정보를 읽어 PostgreSQL 연결 생성"""
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST"),
+        port=int(os.environ.get("DB_PORT", "5432")),
+        dbname=os.environ.get("DB_NAME"),
+        user=os.environ.get("DB_USER"),
+        password=os.environ.get("DB_PASSWORD")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="embedding_256 → 로컬 메모리 매핑 벡터 인덱스 내보내기")
+    parser.add_argument("--output", default=os.environ.get("VECTOR_LOCAL_INDEX_DIR") or DEFAULT_INDEX_DIR,
+                        help="인덱스 디렉토리 (기본: VECTOR_LOCAL_INDEX_DIR 또는 backend/vector_index)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="서버 측 커서 fetch 크기")
+    parser.add_argument("--keep-versions", type=int, default=2, help="남겨 둘 이전 버전 수")
+    args = parser.parse_args()
+
+    started = time.time()
+    conn = get_connection()
+    try:
+        ids, vectors = [], []
+        # 서버 측(named) 커서로 나눠 읽어 클라이언트 메모리 사용량 제한
+        with conn.cursor(name="export_vector_index") as cur:
+            cur.itersize = args.batch_size
+            cur.execute(EXPORT_SQL)
+            for respondent_id, embedding_text in cur:
+                ids.append(respondent_id)
+                vectors.append(np.fromstring(embedding_text.strip("[]"), dtype=np.float32, sep=","))
+    finally:
+        conn.close()
+
+    if not ids:
+        print("❌ 내보낼 임베딩이 없습니다.")
+        sys.exit(1)
+
+    meta = export_vector_index(args.output, ids, np.stack(vectors), keep_versions=args.keep_versions)
+    size_mb = meta["rows"] * meta["dim"] * 4 / (1024 * 1024)
+    print(f"✅ 저장 완료: {args.output} (버전 {meta['version']})")
+    print(f"   {meta['rows']:,}행 × {meta['dim']}차원, 약 {size_mb:.1f} MB, {time.time() - started:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
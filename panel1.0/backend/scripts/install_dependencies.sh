@@ -26,4 +26,8 @@ python3 -c "import sentence_transformers; print('✅ sentence-transformers 설
 python3 -c "import tensorflow; print(f'✅ tensorflow: {tensorflow.__version__}')" || echo "⚠️ tensorflow 설치 실패"
 python3 -c "import gunicorn; print('✅ gunicorn 설치됨')" || echo "⚠️ gunicorn 설치 실패"
 
+# ✅ NumPy 인코더 가중치 생성 (encoder_tf_256.keras → encoder_tf_256.npz, 저장소에 커밋하지 않음)
+echo "[AfterInstall] Exporting encoder weights for NumPy inference..."
+python3 scripts/export_encoder_npz.py || echo "⚠️ encoder_tf_256.npz 생성 실패 (TensorFlow 인코더로 대체)"
+
 echo "[AfterInstall] ✅ Python dependencies installed."
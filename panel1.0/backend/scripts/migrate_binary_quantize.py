@@ -0,0 +1,178 @@
+"""
+doc_embedding 이진 양자화(binary_quantize) 마이그레이션 / 백필 스크립트
+core_v2.doc_embedding.embedding_256의 부호 비트를 bit(256) 사본 컬럼(embedding_256_bit)으로 저장하고
+해밍 거리 HNSW 인덱스를 생성한다.
+
+- 컬럼: embedding_256_bit bit(256) (행당 32바이트, float32 벡터의 1/32)
+- 트리거: INSERT/UPDATE 시 embedding_256에서 자동 갱신 (ETL 수정 불필요)
+- 인덱스: embedding_256_bit (bit_hamming_ops, HNSW, CONCURRENTLY)
+- 백필은 --batch-size 단위로 커밋하므로 중단 후 다시 실행하면 남은 행만 처리
+
+적용 후 SEMANTIC_BINARY_PREFILTER=true(semantic_first)로
+구조화 필터/키워드가 없는 검색에서 해밍 거리 후보 → 코사인 재정렬 검색을 사용한다.
+recall/지연시간은 benchmark_vector_search.py --sweep --binary-factors 4,10,20 으로 측정.
+
+사용법:
+    python migrate_binary_quantize.py
+    python migrate_binary_quantize.py --skip-index
+
+요구사항:
+    - pgvector 0.7.0 이상 (binary_quantize, bit 타입 HNSW)
+"""
+import argparse
+import os
+import time
+import logging
+import psycopg2
+from dotenv import load_dotenv
+
+# 1. 환경 변수 로드
+load_dotenv()
+
+# 2. 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 설정
+DB_SCHEMA = 'core_v2'
+TARGET_TABLE = 'doc_embedding'
+MIN_PGVECTOR_VERSION = (0, 7, 0)
+
+ADD_COLUMN_SQL = f"""
+    ALTER TABLE {DB_SCHEMA}.{TARGET_TABLE}
+        ADD COLUMN IF NOT EXISTS embedding_256_bit bit(256)
+"""
+
+SYNC_TRIGGER_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION {DB_SCHEMA}.sync_doc_embedding_bit() RETURNS trigger AS $$
+    BEGIN
+        NEW.embedding_256_bit := binary_quantize(NEW.embedding_256)::bit(256);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"DROP TRIGGER IF EXISTS trg_sync_doc_embedding_bit ON {DB_SCHEMA}.{TARGET_TABLE}",
+    f"""
+    CREATE TRIGGER trg_sync_doc_embedding_bit
+        BEFORE INSERT OR UPDATE OF embedding_256 ON {DB_SCHEMA}.{TARGET_TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {DB_SCHEMA}.sync_doc_embedding_bit()
+    """,
+]
+
+BACKFILL_SQL = f"""
+    UPDATE {DB_SCHEMA}.{TARGET_TABLE} t
+    SET embedding_256_bit = binary_quantize(t.embedding_256)::bit(256)
+    WHERE t.respondent_id IN (
+        SELECT respondent_id
+        FROM {DB_SCHEMA}.{TARGET_TABLE}
+        WHERE embedding_256_bit IS NULL AND embedding_256 IS NOT NULL
+        LIMIT %s
+    )
+"""
+
+INDEX_SQL = f"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS doc_embedding_256_bit_hnsw_idx
+    ON {DB_SCHEMA}.{TARGET_TABLE} USING hnsw (embedding_256_bit bit_hamming_ops)
+    WITH (m = %s, ef_construction = %s)
+"""
+
+
+def get_db_connection():
+    """데이터베이스 연결 반환"""
+    return psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        database=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        port=os.getenv("DB_PORT", 5432)
+    )
+
+
+def check_pgvector_version(conn):
+    """binary_quantize 지원 버전(0.7.0+) 확인"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        row = cursor.fetchone()
+    if not row:
+        raise RuntimeError("pgvector 확장이 설치되어 있지 않습니다.")
+    version = tuple(int(part) for part in row[0].split(".")[:3])
+    if version < MIN_PGVECTOR_VERSION:
+        raise RuntimeError(f"binary_quantize는 pgvector 0.7.0 이상이 필요합니다 (현재 {row[0]}).")
+    logger.info(f"pgvector 버전: {row[0]}")
+
+
+def add_column_and_trigger(conn):
+    """bit(256) 컬럼과 동기화 트리거 추가"""
+    with conn.cursor() as cursor:
+        cursor.execute(ADD_COLUMN_SQL)
+        for sql in SYNC_TRIGGER_SQL:
+            cursor.execute(sql)
+    conn.commit()
+    logger.info("embedding_256_bit 컬럼 / 동기화 트리거 준비 완료")
+
+
+def backfill(conn, batch_size):
+    """기존 행 이진 양자화 사본 백필 (배치 단위 커밋)"""
+    total = 0
+    started = time.time()
+    while True:
+        with conn.cursor() as cursor:
+            cursor.execute(BACKFILL_SQL, (batch_size,))
+            updated = cursor.rowcount
+        conn.commit()
+        if updated == 0:
+            break
+        total += updated
+        logger.info(f"  백필 진행: {total:,}건 ({total / max(time.time() - started, 1e-6):.0f}건/초)")
+    logger.info(f"백필 완료: {total:,}건")
+
+
+def create_index(conn, m, ef_construction):
+    """해밍 거리 HNSW 인덱스 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)"""
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            logger.info(f"embedding_256_bit HNSW 인덱스 생성 중... (m={m}, ef_construction={ef_construction})")
+            started = time.time()
+            cursor.execute(INDEX_SQL, (m, ef_construction))
+            logger.info(f"  완료 ({time.time() - started:.1f}초)")
+    finally:
+        conn.autocommit = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="doc_embedding 이진 양자화 마이그레이션 / 백필")
+    parser.add_argument("--batch-size", type=int, default=5000, help="백필 배치 크기")
+    parser.add_argument("--skip-backfill", action="store_true", help="백필 생략")
+    parser.add_argument("--skip-index", action="store_true", help="인덱스 생성 생략")
+    parser.add_argument("--m", type=int, default=16, help="HNSW m")
+    parser.add_argument("--ef-construction", type=int, default=64, help="HNSW ef_construction")
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        check_pgvector_version(conn)
+        add_column_and_trigger(conn)
+        if not args.skip_backfill:
+            backfill(conn, args.batch_size)
+        if not args.skip_index:
+            create_index(conn, args.m, args.ef_construction)
+        logger.info("마이그레이션 완료 - SEMANTIC_BINARY_PREFILTER=true 로 전환 가능")
+    except Exception as e:
+        logger.error(f"치명적 오류: {e}", exc_info=True)
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+            logger.info("DB 연결 종료")
+
+
+if __name__ == "__main__":
+    main()
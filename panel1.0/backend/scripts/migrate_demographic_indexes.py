@@ -0,0 +1,120 @@
+"""
+core_v2.respondent 인구통계 필터 인덱스 마이그레이션
+필터 컴파일러(app/services/data/filter_compiler.py)가 연령대를 birth_year 범위 조건
+(birth_year BETWEEN 올해-29 AND 올해-20)으로 만들기 때문에 아래 B-tree 인덱스를 사용할 수 있다.
+
+- respondent_gender_birth_year_region_idx (gender, birth_year, region)
+    성별 + 연령대 필터를 인덱스 범위 스캔으로 처리
+    분포 집계(FILTER_STATS_SQL)가 읽는 컬럼을 모두 포함하므로 Index Only Scan 가능
+- respondent_birth_year_idx (birth_year)
+    성별 없이 연령대만 지정한 필터
+- 인덱스 생성 후 ANALYZE로 플래너 통계 갱신
+
+region LIKE '%서울%' 부분 일치는 B-tree로 처리되지 않으므로 복합 인덱스의 마지막 컬럼(필터 후 검사)으로만 사용한다.
+적용 전/후 실행 계획은 RUN_DB_PLAN_TESTS=true python -m pytest tests/test_filter_compiler.py -s 로 확인.
+
+사용법:
+    python migrate_demographic_indexes.py
+    python migrate_demographic_indexes.py --skip-analyze
+"""
+import argparse
+import os
+import time
+import logging
+import psycopg2
+from dotenv import load_dotenv
+
+# 1. 환경 변수 로드
+load_dotenv()
+
+# 2. 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 설정
+DB_SCHEMA = 'core_v2'
+TARGET_TABLE = 'respondent'
+
+INDEX_SQL = {
+    "respondent_gender_birth_year_region_idx": f"""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS respondent_gender_birth_year_region_idx
+        ON {DB_SCHEMA}.{TARGET_TABLE} (gender, birth_year, region)
+    """,
+    "respondent_birth_year_idx": f"""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS respondent_birth_year_idx
+        ON {DB_SCHEMA}.{TARGET_TABLE} (birth_year)
+    """,
+}
+
+
+def get_db_connection():
+    """데이터베이스 연결 반환"""
+    return psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        database=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        port=os.getenv("DB_PORT", 5432)
+    )
+
+
+def create_indexes(conn, maintenance_work_mem):
+    """인구통계 B-tree 인덱스 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)"""
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            if maintenance_work_mem:
+                cursor.execute("SET maintenance_work_mem = %s", (maintenance_work_mem,))
+            for name, sql in INDEX_SQL.items():
+                logger.info(f"{name} 인덱스 생성 중...")
+                started = time.time()
+                cursor.execute(sql)
+                logger.info(f"  완료 ({time.time() - started:.1f}초)")
+
+            cursor.execute(
+                "SELECT indexname, pg_size_pretty(pg_relation_size(format('%%I.%%I', schemaname, indexname))) "
+                "FROM pg_indexes WHERE schemaname = %s AND tablename = %s ORDER BY indexname",
+                (DB_SCHEMA, TARGET_TABLE)
+            )
+            for name, size in cursor.fetchall():
+                logger.info(f"  인덱스 {name}: {size}")
+    finally:
+        conn.autocommit = False
+
+
+def analyze(conn):
+    """플래너 통계 갱신 (새 인덱스의 선택도 추정용)"""
+    with conn.cursor() as cursor:
+        cursor.execute(f"ANALYZE {DB_SCHEMA}.{TARGET_TABLE}")
+    conn.commit()
+    logger.info(f"ANALYZE {DB_SCHEMA}.{TARGET_TABLE} 완료")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="core_v2.respondent 인구통계 필터 인덱스 생성")
+    parser.add_argument("--skip-analyze", action="store_true", help="ANALYZE 생략")
+    parser.add_argument("--maintenance-work-mem", default="256MB", help="인덱스 생성 시 maintenance_work_mem")
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        create_indexes(conn, args.maintenance_work_mem)
+        if not args.skip_analyze:
+            analyze(conn)
+        logger.info("마이그레이션 완료")
+    except Exception as e:
+        logger.error(f"치명적 오류: {e}", exc_info=True)
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+doc_embedding halfvec 마이그레이션 / 백필 스크립트
+core_v2.doc_embedding의 embedding_256, embedding_768을 halfvec(float16) 사본 컬럼으로 복사하고
+halfvec HNSW 인덱스를 생성한다.
+
+- 컬럼: embedding_256_half halfvec(256), embedding_768_half halfvec(768)
+- 트리거: INSERT/UPDATE 시 원본 컬럼에서 halfvec 사본 자동 갱신 (ETL 수정 불필요)
+- 인덱스: embedding_256_half (halfvec_cosine_ops, HNSW, CONCURRENTLY)
+          --index-768 지정 시 embedding_768_half 인덱스도 생성
+- 백필은 --batch-size 단위로 커밋하므로 중단 후 다시 실행하면 남은 행만 처리
+
+적용 후 VECTOR_STORAGE=halfvec 환경변수로 VectorSearchService가 halfvec 컬럼을 검색한다.
+recall 변화는 benchmark_vector_search.py --storage halfvec (--sweep)으로 측정.
+
+사용법:
+    python migrate_halfvec.py                   # 컬럼/트리거 추가 + 백필 + 256 인덱스
+    python migrate_halfvec.py --index-768       # 768 halfvec 인덱스도 생성
+    python migrate_halfvec.py --skip-index      # 인덱스 생성 생략
+
+요구사항:
+    - pgvector 0.7.0 이상 (halfvec 타입)
+"""
+import argparse
+import os
+import time
+import logging
+import psycopg2
+from dotenv import load_dotenv
+
+# 1. 환경 변수 로드
+load_dotenv()
+
+# 2. 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 설정
+DB_SCHEMA = 'core_v2'
+TARGET_TABLE = 'doc_embedding'
+MIN_PGVECTOR_VERSION = (0, 7, 0)
+
+ADD_COLUMNS_SQL = f"""
+    ALTER TABLE {DB_SCHEMA}.{TARGET_TABLE}
+        ADD COLUMN IF NOT EXISTS embedding_256_half halfvec(256),
+        ADD COLUMN IF NOT EXISTS embedding_768_half halfvec(768)
+"""
+
+SYNC_TRIGGER_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION {DB_SCHEMA}.sync_doc_embedding_halfvec() RETURNS trigger AS $$
+    BEGIN
+        NEW.embedding_256_half := NEW.embedding_256::halfvec(256);
+        NEW.embedding_768_half := NEW.embedding_768::halfvec(768);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"DROP TRIGGER IF EXISTS trg_sync_doc_embedding_halfvec ON {DB_SCHEMA}.{TARGET_TABLE}",
+    f"""
+    CREATE TRIGGER trg_sync_doc_embedding_halfvec
+        BEFORE INSERT OR UPDATE OF embedding_256, embedding_768 ON {DB_SCHEMA}.{TARGET_TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {DB_SCHEMA}.sync_doc_embedding_halfvec()
+    """,
+]
+
+BACKFILL_SQL = f"""
+    UPDATE {DB_SCHEMA}.{TARGET_TABLE} t
+    SET embedding_256_half = t.embedding_256::halfvec(256),
+        embedding_768_half = t.embedding_768::halfvec(768)
+    WHERE t.respondent_id IN (
+        SELECT respondent_id
+        FROM {DB_SCHEMA}.{TARGET_TABLE}
+        WHERE (embedding_256_half IS NULL AND embedding_256 IS NOT NULL)
+           OR (embedding_768_half IS NULL AND embedding_768 IS NOT NULL)
+        LIMIT %s
+    )
+"""
+
+INDEX_SQL = {
+    "256": f"""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS doc_embedding_256_half_hnsw_idx
+        ON {DB_SCHEMA}.{TARGET_TABLE} USING hnsw (embedding_256_half halfvec_cosine_ops)
+        WITH (m = %s, ef_construction = %s)
+    """,
+    "768": f"""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS doc_embedding_768_half_hnsw_idx
+        ON {DB_SCHEMA}.{TARGET_TABLE} USING hnsw (embedding_768_half halfvec_cosine_ops)
+        WITH (m = %s, ef_construction = %s)
+    """,
+}
+
+
+def get_db_connection():
+    """데이터베이스 연결 반환"""
+    return psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        database=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        port=os.getenv("DB_PORT", 5432)
+    )
+
+
+def check_pgvector_version(conn):
+    """halfvec 지원 버전(0.7.0+) 확인"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        row = cursor.fetchone()
+    if not row:
+        raise RuntimeError("pgvector 확장이 설치되어 있지 않습니다.")
+    version = tuple(int(part) for part in row[0].split(".")[:3])
+    if version < MIN_PGVECTOR_VERSION:
+        raise RuntimeError(f"halfvec은 pgvector 0.7.0 이상이 필요합니다 (현재 {row[0]}).")
+    logger.info(f"pgvector 버전: {row[0]}")
+
+
+def add_columns_and_trigger(conn):
+    """halfvec 컬럼과 동기화 트리거 추가"""
+    with conn.cursor() as cursor:
+        cursor.execute(ADD_COLUMNS_SQL)
+        for sql in SYNC_TRIGGER_SQL:
+            cursor.execute(sql)
+    conn.commit()
+    logger.info("halfvec 컬럼 / 동기화 트리거 준비 완료")
+
+
+def backfill(conn, batch_size):
+    """기존 행 halfvec 사본 백필 (배치 단위 커밋)"""
+    total = 0
+    started = time.time()
+    while True:
+        with conn.cursor() as cursor:
+            cursor.execute(BACKFILL_SQL, (batch_size,))
+            updated = cursor.rowcount
+        conn.commit()
+        if updated == 0:
+            break
+        total += updated
+        logger.info(f"  백필 진행: {total:,}건 ({total / max(time.time() - started, 1e-6):.0f}건/초)")
+    logger.info(f"백필 완료: {total:,}건")
+
+
+def create_indexes(conn, include_768, m, ef_construction, maintenance_work_mem):
+    """halfvec HNSW 인덱스 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)"""
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            if maintenance_work_mem:
+                cursor.execute("SET maintenance_work_mem = %s", (maintenance_work_mem,))
+            targets = ["256", "768"] if include_768 else ["256"]
+            for dim in targets:
+                logger.info(f"embedding_{dim}_half HNSW 인덱스 생성 중... (m={m}, ef_construction={ef_construction})")
+                started = time.time()
+                cursor.execute(INDEX_SQL[dim], (m, ef_construction))
+                logger.info(f"  완료 ({time.time() - started:.1f}초)")
+
+            # 크기 비교 (halfvec 인덱스는 vector 인덱스의 약 절반)
+            cursor.execute(
+                "SELECT indexname, pg_size_pretty(pg_relation_size(format('%%I.%%I', schemaname, indexname))) "
+                "FROM pg_indexes WHERE schemaname = %s AND tablename = %s ORDER BY indexname",
+                (DB_SCHEMA, TARGET_TABLE)
+            )
+            for name, size in cursor.fetchall():
+                logger.info(f"  인덱스 {name}: {size}")
+    finally:
+        conn.autocommit = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="doc_embedding halfvec 마이그레이션 / 백필")
+    parser.add_argument("--batch-size", type=int, default=5000, help="백필 배치 크기")
+    parser.add_argument("--skip-backfill", action="store_true", help="백필 생략")
+    parser.add_argument("--skip-index", action="store_true", help="인덱스 생성 생략")
+    parser.add_argument("--index-768", action="store_true", help="embedding_768_half HNSW 인덱스도 생성")
+    parser.add_argument("--m", type=int, default=16, help="HNSW m")
+    parser.add_argument("--ef-construction", type=int, default=64, help="HNSW ef_construction")
+    parser.add_argument("--maintenance-work-mem", default="1GB", help="인덱스 생성 시 maintenance_work_mem")
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        check_pgvector_version(conn)
+        add_columns_and_trigger(conn)
+        if not args.skip_backfill:
+            backfill(conn, args.batch_size)
+        if not args.skip_index:
+            create_indexes(conn, args.index_768, args.m, args.ef_construction, args.maintenance_work_mem)
+        logger.info("마이그레이션 완료 - VECTOR_STORAGE=halfvec 으로 전환 가능")
+    except Exception as e:
+        logger.error(f"치명적 오류: {e}", exc_info=True)
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+            logger.info("DB 연결 종료")
+
+
+if __name__ == "__main__":
+    main()
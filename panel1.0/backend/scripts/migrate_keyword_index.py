@@ -0,0 +1,183 @@
+"""
+respondent_json 키워드 검색 인덱스 마이그레이션 / 백필 스크립트
+하이브리드 검색의 키워드 조건(json_doc ILIKE + 키워드마다 부정 표현 ILIKE 11개)을
+미리 계산한 tsvector 컬럼과 GIN 인덱스 조건 하나로 대체한다.
+
+- 컬럼: core_v2.respondent_json.search_tsv tsvector
+- 함수: core_v2.keyword_search_tsv(text)
+    json_doc을 문장/항목 단위(. ! ? 줄바꿈 " , ; { } [ ])로 나누고 부정 표현이 있는 조각은 제외한 뒤
+    to_tsvector('simple', ...)로 변환 ("반려동물을 키워본 적 없다" 같은 답변은 키워드로 검색되지 않음)
+- 트리거: INSERT/UPDATE OF json_doc 시 search_tsv 자동 갱신 (ETL 적재 시점에 계산, ETL 수정 불필요)
+- 인덱스: respondent_json_search_tsv_gin (GIN, CONCURRENTLY)
+- 백필은 --batch-size 단위로 커밋하므로 중단 후 다시 실행하면 남은 행만 처리
+
+적용 후 VECTOR_KEYWORD_INDEX=true 환경변수로 VectorSearchService가
+r_json.search_tsv @@ to_tsquery('simple', '키워드1':* | '키워드2':*) 조건을 사용한다.
+'simple' 사전은 공백 단위로 토큰을 나누므로 접두 일치로 조사가 붙은 단어("아이폰을")까지 찾지만,
+합성어 중간에 들어간 키워드("갤럭시아이폰"의 "아이폰")는 찾지 않는다.
+
+사용법:
+    python migrate_keyword_index.py
+    python migrate_keyword_index.py --skip-index
+    python migrate_keyword_index.py --rebuild      # 부정 표현 규칙 변경 후 전체 다시 계산
+"""
+import argparse
+import os
+import time
+import logging
+import psycopg2
+from dotenv import load_dotenv
+
+# 1. 환경 변수 로드
+load_dotenv()
+
+# 2. 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 설정
+DB_SCHEMA = 'core_v2'
+TARGET_TABLE = 'respondent_json'
+
+# 문장/항목 구분자와 부정 표현 (PostgreSQL 정규식)
+CLAUSE_SEPARATOR = r'[.!?\n\r",;{}\[\]]+'
+NEGATION_PATTERN = r'(없다|없음|없습|없어|없었|않|못했|못함|못해|(^|\s)안\s|(^|\s)못\s|적\s*없)'
+
+ADD_COLUMN_SQL = f"""
+    ALTER TABLE {DB_SCHEMA}.{TARGET_TABLE}
+        ADD COLUMN IF NOT EXISTS search_tsv tsvector
+"""
+
+FUNCTION_SQL = f"""
+    CREATE OR REPLACE FUNCTION {DB_SCHEMA}.keyword_search_tsv(doc text) RETURNS tsvector
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $fn$
+        SELECT to_tsvector('simple', COALESCE(string_agg(clause, ' '), ''))
+        FROM regexp_split_to_table(lower(COALESCE(doc, '')), '{CLAUSE_SEPARATOR}') AS clause
+        WHERE clause !~ '{NEGATION_PATTERN}'
+    $fn$
+"""
+
+SYNC_TRIGGER_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION {DB_SCHEMA}.sync_respondent_json_search_tsv() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_tsv := {DB_SCHEMA}.keyword_search_tsv(NEW.json_doc::text);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    f"DROP TRIGGER IF EXISTS trg_sync_respondent_json_search_tsv ON {DB_SCHEMA}.{TARGET_TABLE}",
+    f"""
+    CREATE TRIGGER trg_sync_respondent_json_search_tsv
+        BEFORE INSERT OR UPDATE OF json_doc ON {DB_SCHEMA}.{TARGET_TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {DB_SCHEMA}.sync_respondent_json_search_tsv()
+    """,
+]
+
+BACKFILL_SQL = f"""
+    UPDATE {DB_SCHEMA}.{TARGET_TABLE} t
+    SET search_tsv = {DB_SCHEMA}.keyword_search_tsv(t.json_doc::text)
+    WHERE t.respondent_id IN (
+        SELECT respondent_id
+        FROM {DB_SCHEMA}.{TARGET_TABLE}
+        WHERE search_tsv IS NULL AND json_doc IS NOT NULL
+        LIMIT %s
+    )
+"""
+
+INDEX_SQL = f"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS respondent_json_search_tsv_gin
+    ON {DB_SCHEMA}.{TARGET_TABLE} USING gin (search_tsv)
+"""
+
+
+def get_db_connection():
+    """데이터베이스 연결 반환"""
+    return psycopg2.connect(
+        host=os.getenv("DB_HOST"),
+        database=os.getenv("DB_NAME"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        port=os.getenv("DB_PORT", 5432)
+    )
+
+
+def add_column_and_trigger(conn, rebuild):
+    """search_tsv 컬럼 / 계산 함수 / 동기화 트리거 추가 (rebuild면 기존 값 초기화)"""
+    with conn.cursor() as cursor:
+        cursor.execute(ADD_COLUMN_SQL)
+        cursor.execute(FUNCTION_SQL)
+        for sql in SYNC_TRIGGER_SQL:
+            cursor.execute(sql)
+        if rebuild:
+            cursor.execute(f"UPDATE {DB_SCHEMA}.{TARGET_TABLE} SET search_tsv = NULL WHERE search_tsv IS NOT NULL")
+            logger.info(f"기존 search_tsv 초기화: {cursor.rowcount:,}건")
+    conn.commit()
+    logger.info("search_tsv 컬럼 / 함수 / 동기화 트리거 준비 완료")
+
+
+def backfill(conn, batch_size):
+    """기존 행 search_tsv 백필 (배치 단위 커밋)"""
+    total = 0
+    started = time.time()
+    while True:
+        with conn.cursor() as cursor:
+            cursor.execute(BACKFILL_SQL, (batch_size,))
+            updated = cursor.rowcount
+        conn.commit()
+        if updated == 0:
+            break
+        total += updated
+        logger.info(f"  백필 진행: {total:,}건 ({total / max(time.time() - started, 1e-6):.0f}건/초)")
+    logger.info(f"백필 완료: {total:,}건")
+
+
+def create_index(conn, maintenance_work_mem):
+    """search_tsv GIN 인덱스 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)"""
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            if maintenance_work_mem:
+                cursor.execute("SET maintenance_work_mem = %s", (maintenance_work_mem,))
+            logger.info("respondent_json_search_tsv_gin 인덱스 생성 중...")
+            started = time.time()
+            cursor.execute(INDEX_SQL)
+            logger.info(f"  완료 ({time.time() - started:.1f}초)")
+            cursor.execute(f"ANALYZE {DB_SCHEMA}.{TARGET_TABLE}")
+    finally:
+        conn.autocommit = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="respondent_json 키워드 검색 인덱스(search_tsv) 마이그레이션 / 백필")
+    parser.add_argument("--batch-size", type=int, default=5000, help="백필 배치 크기")
+    parser.add_argument("--skip-backfill", action="store_true", help="백필 생략")
+    parser.add_argument("--skip-index", action="store_true", help="인덱스 생성 생략")
+    parser.add_argument("--rebuild", action="store_true", help="기존 search_tsv를 지우고 전체 다시 계산")
+    parser.add_argument("--maintenance-work-mem", default="1GB", help="인덱스 생성 시 maintenance_work_mem")
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        add_column_and_trigger(conn, args.rebuild)
+        if not args.skip_backfill:
+            backfill(conn, args.batch_size)
+        if not args.skip_index:
+            create_index(conn, args.maintenance_work_mem)
+        logger.info("마이그레이션 완료 - VECTOR_KEYWORD_INDEX=true 로 전환 가능")
+    except Exception as e:
+        logger.error(f"치명적 오류: {e}", exc_info=True)
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
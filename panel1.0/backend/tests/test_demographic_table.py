@@ -0,0 +1,97 @@
+"""
+인구통계 컬럼형 인메모리 테이블 테스트
+"""
+import unittest
+from datetime import datetime
+from app.services.data.demographic_table import DemographicSnapshot, DemographicTable, parse_age_ranges
+from app.services.data.sql_builder import SQLBuilder
+
+YEAR = datetime.now().year
+
+ROWS = [
+    ("r1", "남", YEAR - 25, "서울 강남구", "강남구", ["OTT", "금융"]),
+    ("r2", "여", YEAR - 34, "서울 마포구", "마포구", ["ott"]),
+    ("r3", "여", YEAR - 45, "부산", None, None),
+    ("r4", "남", YEAR - 72, "경기 수원시", "수원시", ["여행"]),
+    ("r5", None, None, None, None, []),
+]
+
+
+class _VersionCursor:
+    """버전 스탬프 / 스냅샷 조회만 흉내 내는 커서"""
+
+    def __init__(self):
+        self.version = (10, 0, 0)
+        self.snapshot_loads = 0
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        if "pg_stat_user_tables" in sql:
+            self._rows = [self.version]
+        else:
+            self.snapshot_loads += 1
+            self._rows = list(ROWS)
+
+    def fetchone(self):
+        return self._rows[0]
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestDemographicSnapshot(unittest.TestCase):
+    """마스크 / 분포 계산 테스트"""
+
+    def setUp(self):
+        self.snapshot = DemographicSnapshot(ROWS)
+
+    def _ids(self, **filters):
+        return self.snapshot.ids_for(self.snapshot.mask_from_filters(filters))
+
+    def test_filters_match_sql_builder_semantics(self):
+        """성별(M/F), 연령대(쉼표 OR, 60s 이상), 지역 부분 일치, 태그(대소문자 무시 OR)"""
+        self.assertEqual(self._ids(gender="F"), ["r2", "r3"])
+        self.assertEqual(self._ids(age="20s,40s"), ["r1", "r3"])
+        self.assertEqual(self._ids(age="60s+"), ["r4"])
+        self.assertEqual(self._ids(region="서울"), ["r1", "r2"])
+        self.assertEqual(self._ids(tags=["OTT"]), ["r1", "r2"])
+        self.assertEqual(self._ids(tags=["없는태그"]), [])
+        self.assertEqual(self._ids(gender="M", region="서울", tags=["금융", "여행"]), ["r1"])
+        self.assertEqual(parse_age_ranges("30s"), [(30, 39)])
+
+    def test_distributions(self):
+        """성별/대표 지역/연령대 분포 (NULL 제외, 연령 미상은 '기타')"""
+        mask = self.snapshot.mask()
+        self.assertEqual(dict(self.snapshot.gender_counts(mask)), {"남": 2, "여": 2})
+        self.assertEqual(self.snapshot.main_region_counts(mask)[0], ("서울", 2))
+        ages = dict(self.snapshot.age_group_counts(mask))
+        self.assertEqual(ages["70대"], 1)
+        self.assertEqual(ages["기타"], 1)
+        self.assertNotIn("기타", dict(self.snapshot.age_group_counts(mask, include_unknown=False)))
+
+    def test_in_memory_filter_stats_shape(self):
+        """get_filter_stats 메모리 경로: SQL 집계 경로와 같은 FilterStats 형식"""
+        stats = SQLBuilder._get_filter_stats_in_memory(self.snapshot, {"region": "서울"})
+        self.assertEqual(stats.total_count, 2)
+        self.assertEqual(stats.gender_stats[0]["gender_count"], 1)
+        self.assertEqual(stats.region_stats[0]["region_count"], 1)
+        self.assertIsNone(stats.dataset_stats)
+        rows = self.snapshot.rows_for(self.snapshot.mask_from_filters({"region": "서울"}), 1)
+        self.assertEqual(rows[0]["interests"], ["OTT", "금융"])
+
+class TestDemographicTableRefresh(unittest.TestCase):
+    """버전 스탬프 기반 재적재 테스트"""
+
+    def test_reloads_only_when_version_changes(self):
+        cur = _VersionCursor()
+        table = DemographicTable(check_interval_seconds=0)
+        self.assertTrue(table.refresh_if_changed(cur))
+        self.assertFalse(table.refresh_if_changed(cur))
+        cur.version = (11, 0, 0)
+        self.assertTrue(table.refresh_if_changed(cur))
+        self.assertEqual(cur.snapshot_loads, 2)
+        self.assertEqual(table.snapshot.size, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+질의 임베딩 캐시 테스트
+"""
+import unittest
+from unittest.mock import patch
+from app.services.data.vector import QueryEmbeddingCache
+
+
+class TestQueryEmbeddingCache(unittest.TestCase):
+    """질의 임베딩 LRU 캐시 테스트"""
+
+    def test_normalize_key(self):
+        """공백 정리 후 동일 키"""
+        self.assertEqual(
+            QueryEmbeddingCache.normalize_key("  운동을   좋아하는\n사람 "),
+            "운동을 좋아하는 사람"
+        )
+
+    def test_hit_and_miss(self):
+        """hit/miss 카운터"""
+        cache = QueryEmbeddingCache(max_size=2, ttl_seconds=0)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_lru_eviction(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = QueryEmbeddingCache(max_size=2, ttl_seconds=0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_ttl_expiry(self):
+        """TTL 경과 시 만료"""
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=5)
+        with patch("app.services.data.vector.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("app.services.data.vector.time.monotonic", return_value=106.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_disabled(self):
+        """max_size=0 이면 비활성화"""
+        cache = QueryEmbeddingCache(max_size=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+임베딩 마이크로 배칭 스케줄러 테스트
+"""
+import threading
+import unittest
+from app.services.data.vector import EmbeddingBatchScheduler
+
+
+class TestEmbeddingBatchScheduler(unittest.TestCase):
+    """임베딩 마이크로 배칭 스케줄러 테스트"""
+
+    def test_concurrent_requests_are_batched(self):
+        """동시 요청이 하나의 배치로 묶임"""
+        calls = []
+
+        def encode_batch(texts):
+            calls.append(list(texts))
+            return [f"emb:{t}" for t in texts]
+
+        scheduler = EmbeddingBatchScheduler(encode_batch, max_batch_size=8, max_wait_ms=200)
+        results = {}
+        barrier = threading.Barrier(4)
+
+        def worker(text):
+            barrier.wait()
+            results[text] = scheduler.embed(text, timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(f"q{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, {f"q{i}": f"emb:q{i}" for i in range(4)})
+        self.assertEqual(sum(len(c) for c in calls), 4)
+        self.assertLess(len(calls), 4)
+
+    def test_duplicate_texts_encoded_once(self):
+        """같은 배치 안의 동일 텍스트는 한 번만 임베딩"""
+        calls = []
+
+        def encode_batch(texts):
+            calls.append(list(texts))
+            return [t.upper() for t in texts]
+
+        scheduler = EmbeddingBatchScheduler(encode_batch, max_batch_size=8, max_wait_ms=100)
+        futures = [scheduler.submit("abc") for _ in range(3)]
+        self.assertEqual([f.result(timeout=5) for f in futures], ["ABC"] * 3)
+        self.assertEqual(calls, [["abc"]])
+
+    def test_error_propagates_to_callers(self):
+        """배치 임베딩 실패 시 모든 호출자에게 예외 전달"""
+        def encode_batch(texts):
+            raise RuntimeError("boom")
+
+        scheduler = EmbeddingBatchScheduler(encode_batch, max_batch_size=4, max_wait_ms=1)
+        with self.assertRaises(RuntimeError):
+            scheduler.embed("x", timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+인구통계 필터 컴파일러 테스트
+- 단위 테스트: birth_year 범위 조건이 기존 나이 식과 같은 행을 고르는지, 각 경로가 컴파일러를 사용하는지
+- 실행 계획 전/후 비교: RUN_DB_PLAN_TESTS=true이고 DB에 연결 가능할 때만 실행
+  (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) 식 조건과 birth_year BETWEEN 조건의 EXPLAIN을 출력하고
+  birth_year 인덱스가 Index Cond로 쓰이는지 확인 (scripts/migrate_demographic_indexes.py 적용 후)
+  UPDATE_PLAN_SNAPSHOTS=true이면 tests/plan_snapshots/에 실행 계획 텍스트 저장
+"""
+import os
+import unittest
+from datetime import datetime
+from app.services.data.filter_compiler import compile_age_condition, compile_demographic_filters
+from app.services.data.sql_builder import SQLBuilder
+from app.services.data.vector import VectorSearchService
+
+RUN_DB_PLAN_TESTS = os.environ.get("RUN_DB_PLAN_TESTS", "false").lower() in ("1", "true", "yes")
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_snapshots")
+YEAR = datetime.now().year
+
+
+def _matches(condition, params, birth_year):
+    """컴파일된 조건을 birth_year 하나에 대해 평가 (BETWEEN / <= 형태만 사용)"""
+    for clause in condition.strip("()").split(" OR "):
+        if " BETWEEN " in clause:
+            low, high = [params[name.strip()[2:-2]] for name in clause.split(" BETWEEN ")[1].split(" AND ")]
+            if low <= birth_year <= high:
+                return True
+        else:
+            if birth_year <= params[clause.split(" <= ")[1][2:-2]]:
+                return True
+    return False
+
+
+class TestAgeCompilation(unittest.TestCase):
+    """연령대 → birth_year 범위 변환 테스트"""
+
+    def test_equivalent_to_extract_predicate(self):
+        """모든 birth_year에 대해 (올해 - birth_year) 구간 조건과 같은 결과"""
+        expected_ranges = {"10s": (10, 19), "20s": (20, 29), "50s": (50, 59), "60s+": (60, None), "80s": (80, None)}
+        for age_range, (age_min, age_max) in expected_ranges.items():
+            condition, params = compile_age_condition(age_range)
+            self.assertNotIn("EXTRACT", condition)
+            for birth_year in range(YEAR - 110, YEAR + 1):
+                age = YEAR - birth_year
+                old = age >= age_min and (age_max is None or age <= age_max)
+                self.assertEqual(_matches(condition, params, birth_year), old, f"{age_range}, {birth_year}")
+
+    def test_multiple_ranges_and_alias(self):
+        conditions, params = compile_demographic_filters(
+            {"age": "20s,60s", "gender": "F", "region": "서울", "tags": ["OTT"]}, alias="r_info", current_year=2025
+        )
+        self.assertEqual(
+            conditions[0],
+            "(r_info.birth_year BETWEEN %(birth_year_min_0)s AND %(birth_year_max_0)s OR r_info.birth_year <= %(birth_year_max_1)s)"
+        )
+        self.assertEqual((params["birth_year_min_0"], params["birth_year_max_0"], params["birth_year_max_1"]), (1996, 2005, 1965))
+        self.assertEqual(params["gender"], "여")
+        self.assertIn("unnest(r_info.interests)", conditions[-1])
+        self.assertEqual(compile_demographic_filters({"age": "unknown", "gender": "X"}), ([], {}))
+
+    def test_all_paths_use_sargable_predicate(self):
+        """SQLBuilder / VectorSearchService 필터 모두 birth_year에 식을 씌우지 않음"""
+        query, _ = SQLBuilder.build_filter_query({"age": "30s", "gender": "M"})
+        self.assertIn("birth_year BETWEEN", query)
+        self.assertNotIn("EXTRACT", query)
+
+        VectorSearchService.reset_instance()
+        try:
+            service = VectorSearchService.__new__(VectorSearchService)
+            conditions, params = service._build_search_conditions({"age_range": "30s,40s"}, None)
+        finally:
+            VectorSearchService.reset_instance()
+        self.assertIn("r_info.birth_year BETWEEN", conditions[1])
+        self.assertEqual(params["birth_year_max_0"], YEAR - 30)
+
+
+@unittest.skipUnless(RUN_DB_PLAN_TESTS, "RUN_DB_PLAN_TESTS=true일 때만 실행 (DB 필요)")
+class TestAgePredicatePlan(unittest.TestCase):
+    """EXPLAIN 전/후 비교 - 식 조건은 Filter, birth_year 범위 조건은 Index Cond"""
+
+    @classmethod
+    def setUpClass(cls):
+        from app.db.connection import get_db_connection
+        cls.conn = get_db_connection()
+        with cls.conn.cursor() as cur:
+            cur.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = 'core_v2' AND tablename = 'respondent' AND indexdef ILIKE '%%birth_year%%'"
+            )
+            cls.birth_year_indexes = [row[0] for row in cur.fetchall()]
+        cls.conn.rollback()
+
+    @classmethod
+    def tearDownClass(cls):
+        from app.db.connection import return_db_connection
+        return_db_connection(cls.conn)
+
+    def setUp(self):
+        if not self.birth_year_indexes:
+            self.skipTest("core_v2.respondent에 birth_year 인덱스 없음 (migrate_demographic_indexes.py 미적용)")
+
+    def _explain(self, name, where_clause, params):
+        try:
+            with self.conn.cursor() as cur:
+                # 테이블이 작아도 인덱스 사용 가능 여부가 드러나도록 순차 스캔 비활성화
+                cur.execute("SET LOCAL enable_seqscan = off")
+                cur.execute(f"EXPLAIN (ANALYZE, BUFFERS) SELECT COUNT(*) FROM core_v2.respondent WHERE {where_clause}", params)
+                explain = "\n".join(row[0] for row in cur.fetchall())
+        finally:
+            self.conn.rollback()
+
+        print(f"\n[PLAN] {name}\n{explain}")
+        if os.environ.get("UPDATE_PLAN_SNAPSHOTS", "false").lower() in ("1", "true", "yes"):
+            os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+            with open(os.path.join(SNAPSHOT_DIR, f"{name}.txt"), "w", encoding="utf-8") as f:
+                f.write(explain + "\n")
+        return explain
+
+    def _index_cond_lines(self, plan):
+        return [line for line in plan.splitlines() if "Index Cond" in line and "birth_year" in line]
+
+    def test_age_filter_plan_before_after(self):
+        before = self._explain(
+            "age_filter_before_extract",
+            "gender = %(gender)s AND (EXTRACT(YEAR FROM CURRENT_DATE) - birth_year) BETWEEN 30 AND 39",
+            {"gender": "남"}
+        )
+        conditions, params = compile_demographic_filters({"age": "30s", "gender": "M"})
+        after = self._explain("age_filter_after_birth_year_range", " AND ".join(conditions), params)
+
+        self.assertEqual(self._index_cond_lines(before), [], f"식 조건이 Index Cond로 쓰임:\n{before}")
+        self.assertTrue(self._index_cond_lines(after), f"birth_year 범위가 Index Cond로 쓰이지 않음:\n{after}")
+
+
+if __name__ == '__main__':
+    unittest.main()
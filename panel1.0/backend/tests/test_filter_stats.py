@@ -0,0 +1,73 @@
+"""
+필터 통계 단일 집계 쿼리 (GROUPING SETS) 테스트
+"""
+import unittest
+from app.services.data.sql_builder import FilterStats, SQLBuilder
+
+
+def _row(grouping_id, filtered, dataset, aged=None, **keys):
+    row = {"grouping_id": grouping_id, "gender": None, "region": None, "main_region": None, "age_group": None,
+           "filtered_count": filtered, "dataset_count": dataset,
+           "dataset_aged_count": dataset if aged is None else aged}
+    row.update(keys)
+    return row
+
+
+ROWS = [
+    _row(15, 3, 10),
+    _row(7, 2, 6, gender="여"),
+    _row(7, 1, 3, gender="남"),
+    _row(7, 0, 1, gender=None),
+    _row(11, 2, 4, region="서울 강남구"),
+    _row(11, 1, 2, region="서울 마포구"),
+    _row(11, 0, 4, region="부산 해운대구"),
+    _row(13, 3, 6, main_region="서울"),
+    _row(13, 0, 4, main_region="부산"),
+    _row(14, 2, 5, age_group="30대"),
+    _row(14, 1, 5, aged=2, age_group="기타"),
+]
+
+
+class TestFilterStatsQuery(unittest.TestCase):
+    """집계 쿼리 생성 테스트"""
+
+    def test_filters_go_to_where_without_dataset(self):
+        query, params = SQLBuilder.build_filter_stats_query({"gender": "F", "age": "20s,30s"})
+        self.assertIn("GROUPING SETS", query)
+        self.assertIn("WHERE (", query)
+        self.assertIn("TRUE AS matched", query)
+        self.assertEqual(params["gender"], "여")
+        self.assertEqual(params["birth_year_min_1"], params["birth_year_max_1"] - 9)
+
+    def test_filters_go_to_filter_clause_with_dataset(self):
+        """기준 집단과 함께 계산할 때는 전체 스캔 + FILTER 집계"""
+        query, _ = SQLBuilder.build_filter_stats_query({"region": "서울"}, include_dataset=True)
+        self.assertIn("(region LIKE %(region)s) AS matched", query)
+        self.assertNotIn("WHERE region", query)
+        query, params = SQLBuilder.build_filter_stats_query({})
+        self.assertEqual(params, {})
+        self.assertNotIn("WHERE", query.split("FILTER")[0])
+
+
+class TestFilterStatsParsing(unittest.TestCase):
+    """GROUPING SETS 결과 → FilterStats 변환 테스트"""
+
+    def test_filtered_distributions(self):
+        stats = FilterStats.from_grouping_rows(ROWS)
+        self.assertEqual(stats.total_count, 3)
+        self.assertEqual(stats.gender_stats, [{"gender": "여", "gender_count": 2}, {"gender": "남", "gender_count": 1}])
+        self.assertEqual([r["region"] for r in stats.region_stats], ["서울 강남구", "서울 마포구"])
+        self.assertEqual(stats.age_stats[0], {"age_group": "30대", "age_count": 2})
+        self.assertIsNone(stats.dataset_stats)
+
+    def test_dataset_distributions(self):
+        """기준 집단: 대표 지역 기준, 성별 NULL 제외, 연령 미상 제외"""
+        dataset = FilterStats.from_grouping_rows(ROWS, include_dataset=True).dataset_stats
+        self.assertEqual(dataset["total_count"], 10)
+        self.assertEqual(len(dataset["gender_stats"]), 2)
+        self.assertEqual(dataset["region_stats"], [{"region": "서울", "count": 6}, {"region": "부산", "count": 4}])
+        self.assertEqual(dict((r["age_group"], r["count"]) for r in dataset["age_stats"]), {"30대": 5, "기타": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
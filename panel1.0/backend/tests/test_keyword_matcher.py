@@ -0,0 +1,67 @@
+"""
+다중 키워드 매처 테스트 (한 번 스캔 결과가 키워드별 str.count / find와 같은지)
+"""
+import unittest
+from app.services.semantic.features import extract_panel_features
+from app.services.semantic.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """KeywordMatcher 횟수 / 위치 / 그룹 테스트"""
+
+    TEXT = "모바일 게임과 게임 콘솔, 아이오닉5와 아이오닉 시승. 아아아"
+
+    def test_counts_equal_str_count(self):
+        """접두어 관계 / 겹치는 키워드도 키워드별 str.count와 같게 셈"""
+        keywords = ["게임", "모바일 게임", "아이오닉", "아이오닉5", "아아", "없는말"]
+        counts = KeywordMatcher(keywords).counts(self.TEXT)
+        self.assertEqual(counts, {k: self.TEXT.count(k) for k in keywords if k in self.TEXT})
+        positions = KeywordMatcher(keywords).first_positions(self.TEXT)
+        self.assertEqual(positions, {k: self.TEXT.find(k) for k in keywords if k in self.TEXT})
+
+    def test_ignore_case_equals_lowered_str_count(self):
+        """ignore_case 키워드는 소문자 문서의 str.count / find와 같음"""
+        text = "iPhone, IPHONE 그리고 Galaxy. OTT는 ott"
+        keywords = ["iphone", "Galaxy", "ott", "없는말"]
+        matcher = KeywordMatcher(keywords, ignore_case=True)
+        lowered = text.lower()
+        self.assertEqual(matcher.counts(text), {k: lowered.count(k.lower()) for k in keywords if k.lower() in lowered})
+        self.assertEqual(matcher.first_positions(text), {k: lowered.find(k.lower()) for k in keywords if k.lower() in lowered})
+        self.assertEqual(matcher.matched(text), {"iphone", "Galaxy", "ott"})
+
+    def test_groups_and_case(self):
+        matcher = KeywordMatcher(
+            {"apple": ["iphone", "애플"], "ott": ["OTT"], "gaming": ["게임", "콘솔"]},
+            ignore_case_groups=("apple",)
+        )
+        counts = matcher.group_counts("iPhone과 IPHONE, ott 말고 OTT, 게임 콘솔")
+        self.assertEqual(counts, {"apple": 2, "ott": 1, "gaming": 2})
+        self.assertEqual(KeywordMatcher([]).counts("아무 텍스트"), {})
+
+    def test_group_count_matrix_matches_group_counts(self):
+        matcher = KeywordMatcher({"a": ["게임", "게임기"], "b": ["게임기", "콘솔"], "c": ["없는말"]})
+        texts = ["게임기 게임 콘솔", "", "콘솔 콘솔"]
+        matrix = matcher.group_count_matrix(texts)
+        self.assertEqual(matrix.shape, (3, 3))
+        for row, text in zip(matrix.tolist(), texts):
+            counts = matcher.group_counts(text)
+            self.assertEqual(row, [counts.get(group, 0) for group in matcher.groups])
+        self.assertEqual(KeywordMatcher([]).group_count_matrix(["텍스트"]).shape, (1, 0))
+
+
+class TestFeatureKeywordCounts(unittest.TestCase):
+    """features 추론이 한 번 스캔 결과로 기존 규칙과 같은 값을 내는지"""
+
+    def test_inferred_features(self):
+        row = {"json_doc": {"Q1": "iPhone 사용, 헬스장 다니고 해외 여행 좋아함", "Q2": "명품보다는 가성비, 가성비 OTT 구독"}}
+        features = extract_panel_features(row)
+        self.assertEqual(features.device_brand, "Apple")
+        self.assertEqual(features.lifestyle_tags, ["fitness", "premium", "travel"])
+        self.assertEqual(features.spending_level, "low")
+        self.assertAlmostEqual(features.tech_usage_level, 0.2)
+        self.assertEqual(features.category_affinity.travel, 1.0)
+        self.assertIsNone(features.sentiment_profile.positive_ratio)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+하이브리드 검색 키워드 조건 테스트 (keyword_posting / search_tsv GIN 인덱스 / ILIKE / 소프트 점수)
+"""
+import json
+import unittest
+from app.services.data.keyword_postings import build_postings, extract_answers, match_keywords
+from app.services.data.vector import VectorSearchService, build_keyword_tsquery, clean_search_keywords
+
+
+class TestKeywordSearchConditions(unittest.TestCase):
+    """키워드 → WHERE 조건 생성 테스트"""
+
+    def setUp(self):
+        VectorSearchService.reset_instance()
+        self.service = VectorSearchService.__new__(VectorSearchService)
+
+    def tearDown(self):
+        VectorSearchService.reset_instance()
+
+    def _keyword_conditions(self, conditions):
+        return [c for c in conditions if "r_json." in c]
+
+    def test_index_mode_single_condition(self):
+        """키워드 수와 관계없이 tsvector 조건 하나, 부정 표현 파라미터 없음"""
+        conditions, params = self.service._build_search_conditions(
+            {"gender": "M"}, ["아이폰을 사용", "갤럭시"], keyword_index=True
+        )
+        keyword_conditions = self._keyword_conditions(conditions)
+        self.assertEqual(keyword_conditions, ["r_json.search_tsv @@ to_tsquery('simple', %(keyword_tsquery)s)"])
+        self.assertEqual(params["keyword_tsquery"], "'아이폰':* | '갤럭시':*")
+        self.assertFalse([name for name in params if name.startswith("neg_")])
+
+    def test_postings_mode_single_exists(self):
+        """포스팅 모드: keyword_posting EXISTS 조건 하나 (접두 일치, LIKE 특수문자 이스케이프)"""
+        conditions, params = self.service._build_search_conditions(
+            None, ["아이폰을", "100%_주스"], keyword_index=True, keyword_postings=True
+        )
+        self.assertEqual(len(conditions), 2)
+        self.assertTrue(conditions[1].startswith("EXISTS (SELECT 1 FROM core_v2.keyword_posting kp"))
+        self.assertIn("kp.respondent_id = pe.respondent_id", conditions[1])
+        self.assertEqual(params["keyword_prefix_0"], "아이폰%")
+        self.assertEqual(params["keyword_prefix_1"], "100\\%\\_주스%")
+        self.assertNotIn("keyword_tsquery", params)
+
+    def test_legacy_ilike_when_index_disabled(self):
+        conditions, params = self.service._build_search_conditions(
+            None, ["아이폰"], keyword_index=False, keyword_postings=False
+        )
+        keyword_conditions = self._keyword_conditions(conditions)
+        self.assertEqual(len(keyword_conditions), 1)
+        self.assertIn("r_json.json_doc ILIKE %(keyword_0)s", keyword_conditions[0])
+        self.assertEqual(params["keyword_0"], "%아이폰%")
+
+    def test_soft_mode_has_no_keyword_condition(self):
+        """require_keyword_match=False면 SQL 키워드 조건 없이 재랭킹 점수로만 반영"""
+        for keyword_index in (True, False):
+            conditions, params = self.service._build_search_conditions(
+                None, ["아이폰"], require_keyword_match=False, keyword_index=keyword_index, keyword_postings=keyword_index
+            )
+            self.assertEqual(self._keyword_conditions(conditions), [])
+            self.assertNotIn("keyword_tsquery", params)
+            self.assertNotIn("keyword_0", params)
+
+    def test_rerank_with_postings_matches(self):
+        """포스팅 조회 결과가 있으면 json_doc 없이 일치 키워드 수로 점수 계산"""
+        results = [
+            {"respondent_id": "a", "distance": 0.40, "json_doc": None},
+            {"respondent_id": "b", "distance": 0.42, "json_doc": None},
+        ]
+        reranked = self.service._rerank_by_keyword_match(
+            results, ["아이폰", "갤럭시"], keyword_matches={"b": {"아이폰", "갤럭시"}}
+        )
+        self.assertEqual([row["respondent_id"] for row in reranked], ["b", "a"])
+        self.assertNotIn("keyword_match_score", reranked[0])
+
+
+class TestKeywordPostings(unittest.TestCase):
+    """ETL 포스팅 생성 테스트 (답변 단위 부정 표현 처리)"""
+
+    DOC = json.dumps({
+        "보유 휴대폰": "아이폰15 프로",
+        "반려동물": "반려동물을 키워본 적 없다",
+        "차량": ["현대 아반떼", "차량은 없습니다"],
+        "items": [{"question": "선호 브랜드는 아이폰인가요?", "answer": "갤럭시를 선호. 아이폰은 안 씀"}],
+    }, ensure_ascii=False)
+
+    def test_negated_answers_and_questions_excluded(self):
+        postings = build_postings(self.DOC)
+        self.assertEqual(postings["아이폰15"], 1.0)
+        self.assertIn("갤럭시", postings)
+        self.assertIn("아반떼", postings)
+        self.assertNotIn("반려동물", postings)
+        self.assertNotIn("차량", postings)
+        self.assertNotIn("아이폰인가요", postings)
+        self.assertNotIn("아이폰", postings)
+
+    def test_weight_counts_answers(self):
+        postings = build_postings("넷플릭스 구독. 넷플릭스 자주 봄! 유튜브")
+        self.assertEqual(postings["넷플릭스"], 2.0)
+        self.assertEqual(postings["유튜브"], 1.0)
+        self.assertEqual(extract_answers(None), [])
+
+    def test_prefix_match(self):
+        self.assertEqual(match_keywords(["아이폰15", "갤럭시"], ["아이폰", "에어팟", "갤럭시"]), {"아이폰", "갤럭시"})
+
+
+class TestKeywordHelpers(unittest.TestCase):
+    """키워드 정제 / tsquery 생성 테스트"""
+
+    def test_clean_search_keywords(self):
+        self.assertEqual(clean_search_keywords(["아이폰을 사용", "아이폰", "차 경험", "", None]), ["아이폰"])
+
+    def test_tsquery_escapes_operators(self):
+        self.assertEqual(build_keyword_tsquery(["o'reilly", "a&b|!c", "(:*)"]), "'oreilly':* | 'abc':*")
+        self.assertIsNone(build_keyword_tsquery([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+메모리 매핑 로컬 벡터 인덱스 테스트
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from app.services.data.local_index import LocalVectorIndex, export_vector_index
+from app.services.data.vector import VectorSearchService
+
+
+class _RespondentCursor:
+    """core_v2.respondent 인구통계 조회만 흉내 내는 커서"""
+
+    description = [(name,) for name in ("respondent_id", "gender", "region", "district", "birth_year")]
+
+    def __init__(self, known_ids):
+        self.known_ids = set(known_ids)
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self._rows = [(rid, "여", "서울", None, 1990) for rid in params["ids"] if rid in self.known_ids]
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestLocalVectorIndex(unittest.TestCase):
+    """내보내기 / top-k / 버전 교체 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.index_dir = self._tmp.name
+        rng = np.random.default_rng(0)
+        self.ids = [f"w{i:04d}" for i in range(200)]
+        self.matrix = rng.standard_normal((200, 256)).astype(np.float32)
+        export_vector_index(self.index_dir, self.ids, self.matrix)
+        self.index = LocalVectorIndex(self.index_dir, check_interval_seconds=0)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_topk_matches_brute_force_cosine(self):
+        """top-k 순서와 거리가 전수 코사인 거리와 일치"""
+        query = self.matrix[7] + 0.1
+        hits, total = self.index.search(query, 10)
+
+        unit = self.matrix / np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        expected = 1.0 - unit @ (query / np.linalg.norm(query))
+        order = np.argsort(expected)[:10]
+        self.assertEqual([rid for rid, _ in hits], [self.ids[i] for i in order])
+        self.assertAlmostEqual(hits[0][1], float(expected[order[0]]), places=5)
+        self.assertEqual(total, 200)
+
+    def test_threshold_counts_all_matches(self):
+        """임계값 미만 전체 개수는 LIMIT과 무관하게 계산"""
+        query = self.matrix[0]
+        hits, total = self.index.search(query, 3, distance_threshold=1.0)
+        self.assertEqual(len(hits), 3)
+        self.assertGreater(total, 3)
+        self.assertTrue(all(distance < 1.0 for _, distance in hits))
+
+    def test_reloads_when_version_changes(self):
+        """version.json이 바뀌면 새 버전 매핑, 오래된 버전 파일은 정리"""
+        self.assertTrue(self.index.is_available())
+        first_version = self.index.version
+        export_vector_index(self.index_dir, ["a", "b"], np.eye(2, 256, dtype=np.float32))
+        export_vector_index(self.index_dir, ["c"], np.ones((1, 256), dtype=np.float32))
+        hits, _ = self.index.search(np.ones(256), 5)
+        self.assertNotEqual(self.index.version, first_version)
+        self.assertEqual([rid for rid, _ in hits], ["c"])
+        self.assertEqual(len([name for name in os.listdir(self.index_dir) if name.startswith("embeddings_")]), 2)
+
+    def test_service_hydrates_display_columns(self):
+        """VectorSearchService: 로컬 top-k 후 respondent 컬럼만 DB에서 조회 (없는 id는 제외)"""
+        VectorSearchService.reset_instance()
+        try:
+            service = VectorSearchService.__new__(VectorSearchService)
+            query = self.matrix[3]
+            results, total = service._run_local_knn(
+                _RespondentCursor(self.ids[:100]), self.index, query, 5, None
+            )
+        finally:
+            VectorSearchService.reset_instance()
+        self.assertEqual(results[0]["respondent_id"], "w0003")
+        self.assertAlmostEqual(results[0]["distance"], 0.0, places=5)
+        self.assertEqual(results[0]["gender"], "여")
+        self.assertTrue(all(row["respondent_id"] in self.ids[:100] for row in results))
+        self.assertEqual(total, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
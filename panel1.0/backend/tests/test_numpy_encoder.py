@@ -0,0 +1,96 @@
+"""
+NumPy Autoencoder 인코더 테스트 (Keras 출력과의 parity 포함)
+"""
+import os
+import tempfile
+import unittest
+import importlib.util
+import numpy as np
+from app.services.data.encoder import NumpyDenseEncoder, export_dense_weights
+
+_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+KERAS_PATH = os.path.join(_SCRIPTS_DIR, "encoder_tf_256.keras")
+EXPORTER_PATH = os.path.join(_SCRIPTS_DIR, "export_encoder_npz.py")
+
+try:
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+    import tf_keras as keras
+except ImportError:
+    keras = None
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+class TestNumpyDenseEncoder(unittest.TestCase):
+    """NumPy Dense 인코더 테스트"""
+
+    def test_export_and_load_roundtrip(self):
+        """저장한 가중치로 동일한 출력"""
+        rng = np.random.default_rng(1)
+        kernels = [rng.standard_normal((6, 4)), rng.standard_normal((4, 3))]
+        biases = [rng.standard_normal(4), rng.standard_normal(3)]
+        activations = ["relu", "linear"]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = export_dense_weights(os.path.join(tmp, "enc.npz"), kernels, biases, activations)
+            encoder = NumpyDenseEncoder.load(path)
+
+        x = rng.standard_normal((5, 6)).astype(np.float32)
+        expected = np.maximum(x @ kernels[0] + biases[0], 0) @ kernels[1] + biases[1]
+        np.testing.assert_allclose(encoder.predict(x, verbose=0), expected, rtol=1e-5, atol=1e-5)
+        self.assertEqual(encoder.predict(x[0]).shape, (1, 3))
+
+    def test_rejects_mismatched_layers(self):
+        """레이어 차원이 맞지 않으면 오류"""
+        with self.assertRaises(ValueError):
+            NumpyDenseEncoder([np.zeros((4, 3)), np.zeros((2, 2))], [np.zeros(3), np.zeros(2)], ["relu", "linear"])
+
+
+def _load_exporter():
+    """scripts/export_encoder_npz.py 모듈 로드 (배포 시 실제로 .npz를 만드는 코드)"""
+    spec = importlib.util.spec_from_file_location("export_encoder_npz", EXPORTER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(os.path.exists(KERAS_PATH), "encoder_tf_256.keras 없음")
+@unittest.skipUnless(keras is not None or h5py is not None, "tf_keras / h5py 미설치")
+class TestExportedEncoder(unittest.TestCase):
+    """실제 encoder_tf_256.keras를 내보낸 .npz 테스트 (.npz는 커밋하지 않으므로 임시 디렉토리에 생성)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.exporter = _load_exporter()
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.encoder, _ = cls.exporter.export_encoder(KERAS_PATH, os.path.join(cls._tmp.name, "encoder_tf_256.npz"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_exported_encoder_shape(self):
+        """내보낸 인코더: 768 → 256"""
+        self.assertEqual((self.encoder.input_dim, self.encoder.output_dim), (768, 256))
+        out = self.encoder.predict(np.zeros((2, 768), dtype=np.float32))
+        self.assertEqual(out.shape, (2, 256))
+        self.assertEqual(out.dtype, np.float32)
+
+    @unittest.skipUnless(keras is not None, "tf_keras 미설치")
+    def test_parity_with_keras(self):
+        """keras가 직접 로드한 실제 가중치의 predict와 내보낸 .npz / h5py 직접 읽기 결과 일치"""
+        model = self.exporter.load_keras_model(KERAS_PATH)
+        x = np.random.default_rng(0).standard_normal((16, 768)).astype(np.float32)
+        expected = model.predict(x, verbose=0)
+        np.testing.assert_allclose(self.encoder.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+        # keras 없이 배포할 때의 경로 (아카이브를 h5py로 직접 읽음)
+        archive_encoder = NumpyDenseEncoder(**self.exporter.read_dense_weights_from_archive(KERAS_PATH))
+        np.testing.assert_allclose(archive_encoder.predict(x), expected, rtol=1e-4, atol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+PanelFeatures 추출 테스트 (semantic.features)
+"""
+import importlib.util
+import json
+import os
+import unittest
+from unittest import mock
+
+from app.services.data import feature_store
+from app.services.semantic import features, tfidf_affinity
+
+
+PANELS = [
+    {"respondent_id": "w1", "gender": "남", "age": 31,
+     "json_doc": {"Q1": "아이폰으로 OTT 구독, 헬스장 운동", "Q2": "명품보다 가성비"}},
+    {"respondent_id": "w2", "gender": "여", "age": 45,
+     "json_doc": {"Q1": "galaxy 사용, 해외 여행과 호텔", "Q2": "배달 음식 만족"}},
+    {"respondent_id": "w3", "content": "스트레스가 많아 게임과 콘솔로 푼다"},
+]
+KEYWORDS = ["아이폰", "운동", "여행", "호텔", "게임"]
+BUILDER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts", "build_panel_features.py")
+
+
+class TestPanelFeaturesBatch(unittest.TestCase):
+    """extract_panel_features_batch == 패널별 extract_panel_features"""
+
+    def test_batch_matches_per_panel(self):
+        texts = [features.panel_text_of(panel) for panel in PANELS]
+        expected = [
+            features.extract_panel_features(panel, expanded_keywords=KEYWORDS, all_panel_texts=texts).to_dict()
+            for panel in PANELS
+        ]
+        actual = [f.to_dict() for f in features.extract_panel_features_batch(PANELS, expanded_keywords=KEYWORDS)]
+        self.assertEqual(actual, expected)
+        self.assertTrue(expected[0]["keyword_affinity"])
+
+    def test_row_values_override_inferred(self):
+        rows = PANELS + [{"json_doc": {"Q1": "iPhone 명품"}, "device_brand": "LG", "spending_level": "low"}]
+        result = features.extract_panel_features_batch(rows)
+        self.assertEqual([f.device_brand for f in result], [None, "Samsung", None, "LG"])
+        self.assertEqual([f.spending_level for f in result], ["medium", None, None, "low"])
+
+    def test_tfidf_computed_once_per_keyword_list(self):
+        with mock.patch.object(tfidf_affinity, "calculate_tfidf_affinity", wraps=tfidf_affinity.calculate_tfidf_affinity) as calc:
+            features.extract_panel_features_batch(PANELS, expanded_keywords=KEYWORDS)
+        keyword_lists = [tuple(call.args[1]) for call in calc.call_args_list]
+        self.assertEqual(len(keyword_lists), len(set(keyword_lists)))
+
+
+# 고정 코퍼스: 토큰 일치 / 조사가 붙은 부분 일치(부분 매칭 보정) / 공백 포함 구문 / 대소문자
+TFIDF_CORPUS = [
+    {"respondent_id": "t1", "json_doc": {"Q1": "아이폰 쓰고 운동 매일, 해외 여행 좋아함", "Q2": "OTT 구독"}},
+    {"respondent_id": "t2", "json_doc": {"Q1": "운동을 싫어하고 호텔 여행 자주", "Q2": "iPhone 말고 갤럭시"}},
+    {"respondent_id": "t3", "json_doc": {"Q1": "게임 게임 게임, 콘솔 게임기", "Q2": "여행은 가끔"}},
+    {"respondent_id": "t4", "content": "해외 여행 중 호텔 헬스장에서 운동"},
+    {"respondent_id": "t5", "json_doc": {"Q1": "특별한 취미 없음"}},
+]
+TFIDF_KEYWORDS = ["아이폰", "iphone", "운동", "여행", "해외 여행", "호텔", "게임", "ott", "없는키워드"]
+
+
+def _baseline_tfidf_affinity(panel_texts, keywords):
+    """패널마다 새로 학습하던 기존 방식: TfidfVectorizer 학습 → feature_names.index() 열 합계 + 부분 매칭 보정"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    vectorizer = TfidfVectorizer(
+        vocabulary=[kw.lower().strip() for kw in keywords if kw and kw.strip()],
+        tokenizer=tfidf_affinity._custom_tokenizer, token_pattern=None, lowercase=True,
+        ngram_range=(1, 3), min_df=1, max_df=1.0, norm='l2', sublinear_tf=True
+    )
+    tfidf_matrix = vectorizer.fit_transform([text if text and text.strip() else " " for text in panel_texts])
+    feature_names = list(vectorizer.get_feature_names_out())
+    scores_by_keyword = {}
+    for keyword in keywords:
+        scores = tfidf_matrix[:, feature_names.index(keyword.lower().strip())].toarray().flatten()
+        total = float(scores.sum())
+        for doc_idx, doc_text in enumerate(panel_texts):
+            strength = tfidf_affinity._check_keyword_match(doc_text, keyword)
+            if strength > 0 and scores[doc_idx] == 0:
+                total += strength * 0.3
+        if total > 0:
+            scores_by_keyword[keyword] = total
+    return dict(sorted(scores_by_keyword.items(), key=lambda item: item[1], reverse=True)[:50])
+
+
+@unittest.skipUnless(tfidf_affinity.SKLEARN_AVAILABLE, "scikit-learn 필요")
+class TestTfidfAffinityBaseline(unittest.TestCase):
+    """결과 집합당 1회 계산한 TF-IDF affinity == 패널마다 TfidfVectorizer를 새로 학습한 기존 값"""
+
+    def setUp(self):
+        self.texts = [features.panel_text_of(panel) for panel in TFIDF_CORPUS]
+
+    def _assert_scores_equal(self, actual, expected):
+        self.assertEqual(list(actual), list(expected))
+        for keyword, score in expected.items():
+            self.assertAlmostEqual(actual[keyword], score, places=12)
+
+    def test_result_set_affinity_matches_baseline(self):
+        expected = _baseline_tfidf_affinity(self.texts, TFIDF_KEYWORDS)
+        # 부분 매칭 보정("운동을")과 구문("해외 여행")이 모두 포함된 코퍼스인지 확인
+        self.assertIn("해외 여행", expected)
+        self.assertNotIn("없는키워드", expected)
+        self._assert_scores_equal(tfidf_affinity.calculate_tfidf_affinity(self.texts, TFIDF_KEYWORDS), expected)
+        self._assert_scores_equal(features._TfidfAffinityContext(self.texts).affinity(TFIDF_KEYWORDS), expected)
+
+    def test_batch_panel_affinity_matches_per_panel_baseline(self):
+        batch = features.extract_panel_features_batch(TFIDF_CORPUS, expanded_keywords=TFIDF_KEYWORDS)
+        self.assertEqual(len(batch), len(TFIDF_CORPUS))
+        for text, panel_features in zip(self.texts, batch):
+            # 패널마다 전체 코퍼스로 다시 학습한 점수 중 현재 패널 텍스트에 나타나는 키워드만
+            text_lower = text.lower()
+            expected_keyword = {
+                kw: score for kw, score in _baseline_tfidf_affinity(self.texts, TFIDF_KEYWORDS).items()
+                if kw.lower() in text_lower or any(part in text_lower for part in kw.lower().split())
+            }
+            self._assert_scores_equal(panel_features.keyword_affinity, expected_keyword)
+            tags = panel_features.lifestyle_tags
+            expected_lifestyle = {
+                tag: score for tag, score in (_baseline_tfidf_affinity(self.texts, tags) if tags else {}).items()
+                if tag.lower() in text_lower
+            }
+            self._assert_scores_equal(panel_features.lifestyle_affinity, expected_lifestyle)
+        self.assertTrue(any(panel_features.keyword_affinity for panel_features in batch))
+
+
+class TestFeatureStore(unittest.TestCase):
+    """feature 저장소 레코드로 만든 PanelFeatures == json_doc에서 계산한 PanelFeatures"""
+
+    def _stored_records(self):
+        # JSON 왕복 (jsonb 저장 / 조회)
+        records = features.heuristic_feature_records([panel.get("json_doc") for panel in PANELS])
+        return {panel["respondent_id"]: json.loads(json.dumps(record)) for panel, record in zip(PANELS, records)}
+
+    def test_precomputed_features_match_computed(self):
+        expected = [f.to_dict() for f in features.extract_panel_features_batch(PANELS, expanded_keywords=KEYWORDS)]
+        with mock.patch.dict(os.environ, {"PANEL_FEATURE_STORE": "true"}), \
+                mock.patch.object(feature_store, "load_feature_records", return_value=self._stored_records()), \
+                mock.patch.object(features, "_feature_count_matrix", wraps=features._feature_count_matrix) as scan:
+            actual = [f.to_dict() for f in features.extract_panel_features_batch(PANELS, expanded_keywords=KEYWORDS)]
+        self.assertEqual(actual, expected)
+        scan.assert_not_called()
+
+    def test_missing_rows_fall_back_to_json_doc(self):
+        stored = self._stored_records()
+        del stored["w2"]
+        with mock.patch.dict(os.environ, {"PANEL_FEATURE_STORE": "true"}), \
+                mock.patch.object(feature_store, "load_feature_records", return_value=stored), \
+                mock.patch.object(features, "_feature_count_matrix", wraps=features._feature_count_matrix) as scan:
+            result = features.extract_panel_features_batch(PANELS)
+        self.assertEqual(result[1].device_brand, "Samsung")
+        self.assertEqual(len(scan.call_args.args[0]), 1)
+
+    def test_fetch_requires_current_source_hash(self):
+        """조회는 현재 json_doc의 md5와 source_hash가 같은 행만 (트리거를 거치지 않은 답변 변경 대비)"""
+        cur = mock.Mock()
+        cur.fetchall.return_value = [("w1", "Apple", ["fitness"], "medium", 0.2, {}, {})]
+        records = feature_store.fetch_feature_records(cur, ["w1", "w2"])
+        sql, params = cur.execute.call_args.args
+        self.assertIn("JOIN core_v2.respondent_json r ON r.respondent_id = f.respondent_id", sql)
+        self.assertIn("f.source_hash = md5(r.json_doc::text)", sql)
+        self.assertEqual(params, {"ids": ["w1", "w2"], "version": feature_store.FEATURE_VERSION})
+        self.assertEqual(records, {"w1": dict(zip(feature_store.FEATURE_COLUMNS, cur.fetchall.return_value[0][1:]))})
+
+    def test_setup_truncates_features_with_respondent_json(self):
+        """respondent_json TRUNCATE(재적재)는 행 트리거를 실행하지 않으므로 문장 트리거로 feature 테이블도 비움"""
+        spec = importlib.util.spec_from_file_location("build_panel_features", BUILDER_PATH)
+        builder = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(builder)
+        setup_sql = "\n".join(builder.SETUP_SQL)
+        self.assertIn("BEFORE TRUNCATE ON core_v2.respondent_json", setup_sql)
+        self.assertIn("FOR EACH STATEMENT EXECUTE FUNCTION core_v2.truncate_respondent_feature()", setup_sql)
+        self.assertIn(f"TRUNCATE {feature_store.FEATURE_TABLE};", setup_sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
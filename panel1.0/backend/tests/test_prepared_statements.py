@@ -0,0 +1,148 @@
+"""
+서버측 prepared statement 실행 테스트 (executor.execute_sql_safe(prepare=True))
+"""
+import unittest
+from unittest.mock import patch
+from psycopg2 import extensions
+from app.db import connection
+from app.services.data import executor
+from app.services.data.filter_compiler import compile_demographic_filters
+
+
+class _PgError(Exception):
+    def __init__(self, pgcode):
+        super().__init__(pgcode)
+        self.pgcode = pgcode
+
+
+class _FakeConn:
+    def __init__(self, backend_pid):
+        self.backend_pid = backend_pid
+        self.rollbacks = 0
+
+    def get_backend_pid(self):
+        return self.backend_pid
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class _PooledConn(_FakeConn):
+    """ThreadedConnectionPool이 다루는 연결 (psycopg2.connect 대체)"""
+
+    class info:
+        transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    def __init__(self, backend_pid):
+        super().__init__(backend_pid)
+        self.closed = 0
+
+    def close(self):
+        self.closed = 1
+
+    def set_client_encoding(self, encoding):
+        pass
+
+
+class _FakeCursor:
+    """PREPARE / EXECUTE 문장만 기록하는 커서 (lost=True면 첫 EXECUTE가 26000으로 실패)"""
+
+    def __init__(self, lost=False):
+        self.statements = []
+        self.lost = lost
+
+    def execute(self, sql, args=None):
+        self.statements.append((sql, args))
+        if sql.startswith("EXECUTE") and self.lost:
+            self.lost = False
+            raise _PgError("26000")
+
+
+class TestPreparedStatements(unittest.TestCase):
+    """statement 텍스트 정규화 / 연결별 1회 준비 테스트"""
+
+    QUERY = "SELECT COUNT(*) AS total_count FROM core_v2.respondent WHERE gender = %(gender)s AND region LIKE %(region)s"
+
+    def setUp(self):
+        executor._prepared_by_conn.clear()
+
+    def _prepares(self, cur):
+        return [sql for sql, _ in cur.statements if sql.startswith("PREPARE")]
+
+    def test_template_uses_positional_params_and_limit(self):
+        name, sql, names = executor._prepared_template("SELECT 1 WHERE a = %(x)s OR b = %(x)s AND c LIKE 'a%%'")
+        self.assertEqual(names, ("x",))
+        self.assertEqual(sql, "WITH _orig AS (SELECT 1 WHERE a = $1 OR b = $1 AND c LIKE 'a%') SELECT * FROM _orig LIMIT $2")
+        self.assertTrue(name.startswith("panel_"))
+
+    def test_prepared_once_per_backend_connection(self):
+        conn, cur = _FakeConn(101), _FakeCursor()
+        executor._execute_prepared(conn, cur, self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+        executor._execute_prepared(conn, cur, self.QUERY, {"gender": "여", "region": "%부산%"}, 1, 5000)
+        self.assertEqual(len(self._prepares(cur)), 1)
+        self.assertEqual(cur.statements[-1][1], ["여", "%부산%", 1])
+
+        other_cur = _FakeCursor()
+        executor._execute_prepared(_FakeConn(202), other_cur, self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+        self.assertEqual(len(self._prepares(other_cur)), 1)
+
+    def test_new_connection_with_recycled_pid_prepares_without_retry(self):
+        """닫힌 연결의 pid를 새 연결이 재사용해도 기록은 연결 객체 기준 - 26000 재시도 없이 준비"""
+        executor._execute_prepared(_FakeConn(404), _FakeCursor(), self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+        conn, cur = _FakeConn(404), _FakeCursor()
+        executor._execute_prepared(conn, cur, self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+        self.assertEqual(len(self._prepares(cur)), 1)
+        self.assertEqual(conn.rollbacks, 0)
+
+    def _count_pool_prepares(self, env, rounds=5, concurrency=4):
+        """동시 요청 concurrency개를 rounds번 반복할 때 PREPARE 횟수 (풀 반환 후 연결 재사용 측정)"""
+        pids = iter(range(1000, 2000))
+        prepares = 0
+        config = {"host": "db", "port": 5432, "database": "panel", "user": "u", "password": "p"}
+        with patch.dict("os.environ", env), \
+                patch.object(connection.Config, "get_db_config", return_value=config), \
+                patch("psycopg2.connect", side_effect=lambda *a, **k: _PooledConn(next(pids))):
+            connection.close_all_connections()
+            connection._last_db_config = None
+            try:
+                for _ in range(rounds):
+                    conns = [connection.get_db_connection() for _ in range(concurrency)]
+                    for conn in conns:
+                        cur = _FakeCursor()
+                        executor._execute_prepared(conn, cur, self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+                        prepares += len(self._prepares(cur))
+                    for conn in conns:
+                        connection.return_db_connection(conn)
+            finally:
+                connection.close_all_connections()
+                connection._last_db_config = None
+        return prepares
+
+    def test_pool_keeps_prepared_connections(self):
+        """DB_PREPARED_STATEMENTS=true: 반환된 연결을 닫지 않아 연결 수만큼만 PREPARE"""
+        self.assertEqual(self._count_pool_prepares({"DB_PREPARED_STATEMENTS": "true"}), 4)
+        # minconn=1이면 매 라운드 연결 3개가 닫히고 새 연결에서 다시 준비
+        self.assertEqual(self._count_pool_prepares({"DB_PREPARED_STATEMENTS": "true", "DB_POOL_MINCONN": "1"}), 4 + 3 * 4)
+
+    def test_reprepares_when_session_lost_statement(self):
+        """풀 연결이 다시 만들어져 statement가 없으면(26000) 롤백 후 다시 준비"""
+        conn = _FakeConn(303)
+        executor._execute_prepared(conn, _FakeCursor(), self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+        cur = _FakeCursor(lost=True)
+        executor._execute_prepared(conn, cur, self.QUERY, {"gender": "남", "region": "%서울%"}, 1, 5000)
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertEqual(len(self._prepares(cur)), 1)
+        self.assertTrue(cur.statements[-1][0].startswith("EXECUTE"))
+
+    def test_same_filter_shape_same_statement(self):
+        """값만 다른 필터는 같은 SQL 조각 → 같은 prepared statement"""
+        a, params_a = compile_demographic_filters({"age": "20s", "gender": "M", "tags": ["OTT"]})
+        b, params_b = compile_demographic_filters({"age": "40s", "gender": "F", "tags": ["금융"]})
+        self.assertEqual(a, b)
+        self.assertNotEqual(params_a, params_b)
+        c, _ = compile_demographic_filters({"age": "60s+", "gender": "F", "tags": ["금융"]})
+        self.assertNotEqual(a, c)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Singleton 초기화 테스트
+"""
+import threading
+import time
+import unittest
+from app.services.common.singleton import Singleton, singleton_init
+
+
+class TestSingletonInit(unittest.TestCase):
+    """Lock 기반 1회 초기화 테스트"""
+
+    def test_concurrent_init_runs_once(self):
+        """동시에 생성해도 __init__은 1회만 실행"""
+        calls = []
+
+        class SlowService(Singleton):
+            @singleton_init
+            def __init__(self):
+                calls.append(threading.get_ident())
+                time.sleep(0.05)
+                self.model = "loaded"
+
+        instances = []
+        threads = [threading.Thread(target=lambda: instances.append(SlowService())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(i is instances[0] for i in instances))
+        self.assertTrue(all(i.model == "loaded" for i in instances))
+        self.assertTrue(SlowService.is_initialized())
+        self.assertIsNotNone(SlowService.get_init_stats()["duration_ms"])
+        SlowService.reset_instance()
+
+    def test_failed_init_is_retried(self):
+        """초기화 실패 시 다음 호출에서 재시도"""
+        attempts = []
+
+        class FlakyService(Singleton):
+            @singleton_init
+            def __init__(self):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise RuntimeError("모델 로딩 실패")
+
+        with self.assertRaises(RuntimeError):
+            FlakyService()
+        self.assertFalse(FlakyService.is_initialized())
+        self.assertEqual(FlakyService.get_init_stats()["error"], "모델 로딩 실패")
+
+        FlakyService()
+        self.assertTrue(FlakyService.wait_until_initialized(timeout=1))
+        self.assertEqual(len(attempts), 2)
+        FlakyService.reset_instance()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+pgvector 파라미터 어댑터 테스트
+"""
+import os
+import re
+import unittest
+from importlib.metadata import version
+import numpy as np
+from psycopg2.extensions import adapt
+from app.db.vector_adapter import PgVector
+
+
+class TestPgVector(unittest.TestCase):
+    """PgVector 직렬화 테스트"""
+
+    def test_float32_roundtrip(self):
+        """텍스트 표현에서 float32 값이 정확히 복원됨"""
+        values = np.random.default_rng(0).standard_normal(256).astype(np.float32)
+        text = PgVector(values).to_text()
+        parsed = np.array([float(v) for v in text.strip("[]").split(",")], dtype=np.float32)
+        np.testing.assert_array_equal(parsed, values)
+
+    def test_shorter_than_str_float(self):
+        """기존 str(float) 직렬화보다 짧음"""
+        values = np.random.default_rng(1).standard_normal(256).astype(np.float32)
+        legacy = '[' + ','.join(str(v) for v in values.tolist()) + ']'
+        self.assertLess(len(PgVector(values).to_text()), len(legacy))
+
+    def test_adapter_quotes_and_casts(self):
+        """psycopg2 어댑터: '[...]'::vector 리터럴"""
+        quoted = adapt(PgVector([1.0, -0.5, 2.5e-05])).getquoted()
+        self.assertEqual(quoted, b"'[1,-0.5,2.49999994e-05]'::vector")
+        self.assertTrue(adapt(PgVector([1.0], type_name="halfvec")).getquoted().endswith(b"::halfvec"))
+
+    def test_rejects_invalid(self):
+        """NaN/빈 벡터/알 수 없는 타입 거부"""
+        with self.assertRaises(ValueError):
+            PgVector([float("nan")])
+        with self.assertRaises(ValueError):
+            PgVector([])
+        with self.assertRaises(ValueError):
+            PgVector([1.0], type_name="text")
+
+
+class TestPgvectorRequirement(unittest.TestCase):
+    """requirements.txt의 pgvector 최소 버전이 어댑터가 쓰는 API를 제공하는지"""
+
+    # 최상위 pgvector 패키지(HalfVector, Vector)는 0.4.0부터 (0.3.x는 pgvector.utils)
+    MIN_TOP_LEVEL_PACKAGE = (0, 4, 0)
+
+    @staticmethod
+    def _parse(text):
+        return tuple(int(part) for part in re.findall(r"\d+", text)[:3])
+
+    def _pinned_minimum(self):
+        path = os.path.join(os.path.dirname(__file__), "..", "requirements.txt")
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                match = re.match(r"pgvector>=([\d.]+)", line.strip())
+                if match:
+                    return self._parse(match.group(1))
+        self.fail("requirements.txt에 pgvector>= 항목이 없음")
+
+    def test_pinned_minimum_has_top_level_api(self):
+        """최소 버전이 최상위 HalfVector/Vector import를 지원"""
+        self.assertGreaterEqual(self._pinned_minimum(), self.MIN_TOP_LEVEL_PACKAGE)
+
+    def test_installed_version_satisfies_pin(self):
+        """설치된 pgvector가 최소 버전 이상이고 어댑터가 쓰는 API 제공"""
+        self.assertGreaterEqual(self._parse(version("pgvector")), self._pinned_minimum())
+        from pgvector import HalfVector, Vector
+        for cls in (Vector, HalfVector):
+            self.assertTrue(hasattr(cls, "from_binary"))
+            self.assertTrue(hasattr(cls, "to_numpy"))
+
+
+if __name__ == '__main__':
+    unittest.main()
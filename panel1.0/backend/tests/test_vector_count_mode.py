@@ -0,0 +1,203 @@
+"""
+하이브리드 검색 total_count 분리 (count_mode) / json_doc 지연 조회 테스트
+"""
+import unittest
+from unittest.mock import patch
+import numpy as np
+from app.services.data.vector import VectorSearchService
+
+
+class _FakeCursor:
+    """실행된 SQL을 기록하고 쿼리 종류에 맞는 결과를 반환하는 커서"""
+
+    def __init__(self, db):
+        self.db = db
+        self.description = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.db.executed.append(sql)
+        if "pg_extension" in sql:
+            self._rows = [(self.db.pgvector_version,)]
+        elif "EXPLAIN (FORMAT JSON)" in sql:
+            self._rows = [([{"Plan": {"Plan Rows": self.db.estimate}}],)]
+        elif "COUNT(*)" in sql:
+            self._rows = [(self.db.exact,)]
+        elif "GROUP BY gender, birth_year, region" in sql:
+            self._rows = list(self.db.histogram)
+        elif "knn AS (" in sql:
+            columns = ["respondent_id", "gender", "region", "district", "birth_year", "distance"]
+            # 이진 양자화 쿼리는 해밍 거리 후보 안에서 필터/임계값을 통과한 행만 반환
+            knn_rows = self.db.binary_rows if "bq AS (" in sql else self.db.knn_rows
+            rows = [(f"r{i}", "남", "서울", None, 1990, 0.1 * i) for i in range(knn_rows)]
+            if "r_doc.json_doc" in sql:
+                columns.append("json_doc")
+                rows = [row + (f'{{"id": "{row[0]}"}}',) for row in rows]
+            self.description = [(name,) for name in columns]
+            self._rows = rows
+        elif "= ANY(%(ids)s)" in sql:
+            self.db.hydrated_ids = list(params["ids"])
+            self._rows = [(rid, f'{{"id": "{rid}"}}') for rid in params["ids"]]
+        else:
+            self._rows = []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _FakeDb:
+    def __init__(self, knn_rows, exact=1234, estimate=1500, pgvector_version="0.8.0", histogram=(), binary_rows=None):
+        self.knn_rows = knn_rows
+        self.binary_rows = knn_rows if binary_rows is None else binary_rows
+        self.exact = exact
+        self.estimate = estimate
+        self.pgvector_version = pgvector_version
+        self.executed = []
+        self.hydrated_ids = []
+        self.histogram = histogram
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+class TestVectorCountMode(unittest.TestCase):
+    """top-k 쿼리와 개수 쿼리 분리 테스트"""
+
+    def setUp(self):
+        VectorSearchService.reset_instance()
+        # 모델 로딩 없이 인스턴스만 생성 (__init__ 미호출)
+        self.service = VectorSearchService.__new__(VectorSearchService)
+        self.service.local_embedding_model = object()
+        self.service.encoder_model = object()
+        self.service.embed_query = lambda text: (np.zeros(768, np.float32), np.full(256, 0.5, np.float32))
+
+    def tearDown(self):
+        VectorSearchService.reset_instance()
+
+    def _search(self, db, **kwargs):
+        with patch("app.db.connection.get_db_connection", return_value=db), \
+                patch("app.db.connection.return_db_connection"):
+            return self.service.execute_hybrid_search_sql("테스트", limit=5, **kwargs)
+
+    def test_topk_query_has_no_window_count(self):
+        """top-k 쿼리에 COUNT(*) OVER()가 없음"""
+        db = _FakeDb(knn_rows=5)
+        self._search(db, count_mode="exact")
+        knn_sql = next(sql for sql in db.executed if "knn AS (" in sql)
+        self.assertNotIn("OVER()", knn_sql)
+        self.assertIn("hnsw.iterative_scan", " ".join(db.executed))
+
+    def test_exact_runs_separate_count(self):
+        """exact: LIMIT만큼 채워지면 별도 COUNT 쿼리"""
+        db = _FakeDb(knn_rows=5)
+        results = self._search(db, count_mode="exact")
+        self.assertEqual(results[0]["_total_count"], 1234)
+        self.assertEqual(results[0]["_total_count_mode"], "exact")
+        self.assertEqual(results[0]["_search_plan"]["mode"], "hnsw")
+
+    def test_partial_page_skips_count_query(self):
+        """LIMIT보다 적게 반환되면 COUNT 쿼리 없이 결과 수가 정확한 개수"""
+        db = _FakeDb(knn_rows=3)
+        results = self._search(db, count_mode="exact")
+        self.assertEqual(results[0]["_total_count"], 3)
+        self.assertFalse(any(sql.startswith("SELECT COUNT(*)") for sql in db.executed))
+
+    def test_estimate_uses_planner_rows(self):
+        """estimate: EXPLAIN 추정 행 수"""
+        db = _FakeDb(knn_rows=5)
+        results = self._search(db, count_mode="estimate")
+        self.assertEqual(results[0]["_total_count"], 1500)
+        self.assertEqual(results[0]["_total_count_mode"], "estimate")
+
+    def test_none_skips_count(self):
+        """none: 개수 계산 생략"""
+        db = _FakeDb(knn_rows=5)
+        results = self._search(db, count_mode="none")
+        self.assertIsNone(results[0]["_total_count"])
+        self.assertEqual(results[0]["_total_count_mode"], "none")
+        self.assertFalse(any("COUNT(*)" in sql for sql in db.executed))
+
+    def test_parallel_exact_count(self):
+        """VECTOR_COUNT_PARALLEL=true: 병렬 COUNT 결과 사용"""
+        db = _FakeDb(knn_rows=5)
+        with patch.dict("os.environ", {"VECTOR_COUNT_PARALLEL": "true"}):
+            results = self._search(db, count_mode="exact")
+        self.assertEqual(results[0]["_total_count"], 1234)
+
+    def test_legacy_pgvector_unknown_selectivity_uses_exact_scan(self):
+        """pgvector 0.8 미만 + 선택도 미상 필터: HNSW 결과 잘림 방지를 위해 인덱스 스캔 비활성화"""
+        db = _FakeDb(knn_rows=5, pgvector_version="0.7.4")
+        self._search(db, count_mode="none", filters={"gender": "남"})
+        self.assertIn("SET LOCAL enable_indexscan = off", db.executed)
+
+    def test_json_doc_limit_hydrates_displayed_rows_only(self):
+        """json_doc_limit: 상위 행만 json_doc 조회"""
+        db = _FakeDb(knn_rows=5)
+        results = self._search(db, count_mode="none", json_doc_limit=2)
+        self.assertEqual(db.hydrated_ids, ["r0", "r1"])
+        self.assertIsNotNone(results[1]["content"])
+        self.assertIsNone(results[2]["json_doc"])
+
+    def test_unbounded_json_doc_joined_in_topk_query(self):
+        """json_doc_limit 미설정: 모든 행의 json_doc을 top-k 쿼리에서 함께 조회 (별도 왕복 없음)"""
+        db = _FakeDb(knn_rows=5)
+        results = self._search(db, count_mode="none")
+        knn_sql = next(sql for sql in db.executed if "knn AS (" in sql)
+        self.assertIn("LEFT JOIN core_v2.respondent_json r_doc", knn_sql)
+        self.assertFalse(any("= ANY(%(ids)s)" in sql for sql in db.executed))
+        self.assertTrue(all(row["json_doc"] for row in results))
+
+    def test_rerank_768_hydrates_after_trim(self):
+        """rerank_768: 후보를 자른 뒤 남은 행의 json_doc만 별도 조회"""
+        db = _FakeDb(knn_rows=25)
+        with patch.object(VectorSearchService, "_rerank_with_768", lambda self, cur, rows, q, w: rows):
+            results = self._search(db, count_mode="none", rerank_768=True)
+        knn_sql = next(sql for sql in db.executed if "knn AS (" in sql)
+        self.assertNotIn("r_doc", knn_sql)
+        self.assertEqual(db.hydrated_ids, [row["respondent_id"] for row in results])
+        self.assertEqual(len(results), 5)
+
+    def test_binary_prefilter_skipped_with_selective_filter(self):
+        """구조화 필터가 있으면 이진 양자화 미사용 - 결과 수가 exact 실행과 같음"""
+        exact_db = _FakeDb(knn_rows=5, binary_rows=1)
+        exact = self._search(exact_db, count_mode="none", filters={"gender": "여"}, binary_prefilter=False)
+        db = _FakeDb(knn_rows=5, binary_rows=1)
+        results = self._search(db, count_mode="none", filters={"gender": "여"}, binary_prefilter=True)
+        self.assertFalse(any("bq AS (" in sql for sql in db.executed))
+        self.assertNotEqual(results[0]["_search_plan"]["mode"], "binary")
+        self.assertEqual(len(results), len(exact))
+
+    def test_binary_prefilter_shortfall_falls_back_to_exact(self):
+        """해밍 후보가 LIMIT을 채우지 못하면 (거리 임계값 등) exact로 재실행"""
+        db = _FakeDb(knn_rows=5, binary_rows=2)
+        results = self._search(db, count_mode="exact", binary_prefilter=True, distance_threshold=0.5)
+        self.assertTrue(any("bq AS (" in sql for sql in db.executed))
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0]["_search_plan"]["mode"], "exact")
+        self.assertEqual(results[0]["_search_plan"]["fallback_from"], "binary")
+        self.assertIn("SET LOCAL enable_indexscan = off", db.executed)
+
+    def test_binary_prefilter_without_filters(self):
+        """필터/키워드가 없고 LIMIT을 채우면 binary 결과 그대로 사용"""
+        db = _FakeDb(knn_rows=5)
+        results = self._search(db, count_mode="none", binary_prefilter=True)
+        self.assertEqual(results[0]["_search_plan"]["mode"], "binary")
+        self.assertEqual(len(results), 5)
+
+    def test_invalid_count_mode(self):
+        """지원하지 않는 count_mode는 오류"""
+        with self.assertRaises(ValueError):
+            self._search(_FakeDb(knn_rows=5), count_mode="approx")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,301 @@
+"""
+k-NN 우선 쿼리 형태 / 실행 방식 선택 테스트
+- 단위 테스트: 생성된 SQL 구조 (ANN 스캔 먼저, 인구통계/json_doc은 나중에)
+- 실행 계획 스냅샷: RUN_DB_PLAN_TESTS=true이고 DB에 연결 가능할 때만 실행
+  EXPLAIN (ANALYZE, BUFFERS) 결과에서 doc_embedding의 HNSW 인덱스 사용을 확인
+  UPDATE_PLAN_SNAPSHOTS=true이면 tests/plan_snapshots/에 실행 계획 텍스트 저장
+"""
+import os
+import unittest
+from unittest.mock import patch
+import numpy as np
+from app.db.vector_adapter import PgVector
+from app.services.data.filter_compiler import compile_demographic_filters
+from app.services.data.histogram import DemographicHistogram
+from app.services.data.vector import VectorSearchService, ann_params_from_env, get_vector_storage
+
+RUN_DB_PLAN_TESTS = os.environ.get("RUN_DB_PLAN_TESTS", "false").lower() in ("1", "true", "yes")
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_snapshots")
+
+
+def _make_service() -> VectorSearchService:
+    """모델 로딩 없이 쿼리 생성 메서드만 사용하는 인스턴스"""
+    VectorSearchService.reset_instance()
+    return VectorSearchService.__new__(VectorSearchService)
+
+
+class TestKnnQueryShape(unittest.TestCase):
+    """k-NN 우선 쿼리 SQL 구조 테스트"""
+
+    def setUp(self):
+        self.service = _make_service()
+
+    def tearDown(self):
+        VectorSearchService.reset_instance()
+
+    def test_unfiltered_query_scans_embeddings_only(self):
+        """필터가 없으면 knn CTE는 doc_embedding만 스캔 (json_doc 존재 여부는 EXISTS)"""
+        conditions, _ = self.service._build_search_conditions(None, None)
+        where_clause = " AND ".join(conditions)
+        from_where = self.service._build_from_where(where_clause)
+        sql = self.service._build_knn_query({"mode": "hnsw"}, where_clause, from_where)
+        knn_cte = sql.split("SELECT \n")[0]
+        self.assertNotIn("JOIN core_v2.respondent ", knn_cte)
+        self.assertIn("EXISTS (SELECT 1 FROM core_v2.respondent_json", from_where)
+        self.assertIn("ORDER BY pe.embedding_256 <=> %(vector)s", knn_cte)
+        self.assertNotIn("json_doc,", sql)
+
+    def test_filtered_query_joins_only_referenced_tables(self):
+        """구조화 필터는 respondent, 키워드는 respondent_json만 knn CTE에 조인"""
+        conditions, params = self.service._build_search_conditions({"gender": "남"}, None)
+        from_where = self.service._build_from_where(" AND ".join(conditions))
+        self.assertIn("JOIN core_v2.respondent r_info", from_where)
+        self.assertNotIn("JOIN core_v2.respondent_json", from_where)
+
+        conditions, params = self.service._build_search_conditions(None, ["골프"])
+        from_where = self.service._build_from_where(" AND ".join(conditions))
+        self.assertIn("JOIN core_v2.respondent_json r_json", from_where)
+        self.assertIn("r_json.json_doc IS NOT NULL", from_where)
+
+    def test_overfetch_query_filters_after_ann(self):
+        """overfetch: 필터 없는 ANN 후보를 먼저 뽑고 필터는 후보에만 적용"""
+        conditions, _ = self.service._build_search_conditions({"gender": "여"}, None)
+        where_clause = " AND ".join(conditions)
+        sql = self.service._build_knn_query(
+            {"mode": "overfetch"}, where_clause, self.service._build_from_where(where_clause)
+        )
+        ann_cte, knn_cte = sql.split("), knn AS (")[:2]
+        self.assertIn("LIMIT %(overfetch_limit)s", ann_cte)
+        self.assertNotIn("r_info", ann_cte)
+        self.assertIn("r_info.gender = %(gender)s", knn_cte)
+
+    def test_binary_query_reranks_hamming_candidates(self):
+        """binary: 해밍 거리 후보를 먼저 뽑고 후보만 코사인 거리로 정렬"""
+        where_clause = "pe.embedding_256 <=> %(vector)s < %(distance_threshold)s"
+        sql = self.service._build_knn_query(
+            {"mode": "binary"}, where_clause, self.service._build_from_where(where_clause)
+        )
+        bq_cte, knn_cte = sql.split("), knn AS (")[:2]
+        self.assertIn("ORDER BY pe.embedding_256_bit <~> binary_quantize(%(vector)s)::bit(256)", bq_cte)
+        self.assertIn("LIMIT %(binary_candidates)s", bq_cte)
+        self.assertNotIn("distance_threshold", bq_cte)
+        self.assertIn("ORDER BY pe.embedding_256 <=> %(vector)s", knn_cte)
+        self.assertIn("distance_threshold", knn_cte)
+
+    def test_fusion_query_ranks_both_lists_in_one_statement(self):
+        """rrf: 벡터 top-N(필터만)과 키워드 top-N(search_tsv)을 한 쿼리에서 결합"""
+        conditions, params = self.service._build_search_conditions({"gender": "남"}, ["골프"], require_keyword_match=False)
+        where_clause = " AND ".join(conditions)
+        sql = self.service._build_fusion_query(
+            {"mode": "hnsw", "fusion": {"mode": "rrf"}}, where_clause, self.service._build_from_where(where_clause)
+        )
+        knn_cte, rest = sql.split("), txt AS (")
+        txt_cte, fused = rest.split("), fused AS (")
+        self.assertNotIn("search_tsv", knn_cte)
+        self.assertIn("r_json.search_tsv @@ to_tsquery('simple', %(fusion_tsquery)s)", txt_cte)
+        self.assertIn("r_info.gender = %(gender)s", txt_cte)
+        self.assertIn("FULL OUTER JOIN", fused)
+        self.assertIn("LIMIT %(fused_limit)s", fused)
+
+    def test_fusion_run_uses_candidate_limit(self):
+        """rrf 실행 시 각 순위 목록은 후보 수, 결합 결과는 limit개"""
+        class _Cursor:
+            description = [("respondent_id",), ("_rrf_score",)]
+
+            def execute(self, sql, params=None):
+                self.sql, self.params = sql, params
+
+            def fetchall(self):
+                return [("r1", 0.03)]
+
+        cur = _Cursor()
+        rows = self.service._run_knn_query(
+            cur, {"mode": "hnsw", "fusion": {"mode": "rrf"}}, "1=1", self.service._build_from_where("1=1"),
+            {"limit": 10, "fusion_candidates": 200, "fusion_tsquery": "'골프':*", "rrf_k": 60}
+        )
+        self.assertEqual(rows, [{"respondent_id": "r1", "_rrf_score": 0.03}])
+        self.assertEqual((cur.params["limit"], cur.params["fused_limit"]), (200, 10))
+        self.assertIn("txt AS (", cur.sql)
+
+    def test_halfvec_storage_queries_half_columns(self):
+        """VECTOR_STORAGE=halfvec: embedding_256_half 컬럼으로 정렬/필터"""
+        with patch.dict("os.environ", {"VECTOR_STORAGE": "halfvec"}):
+            self.assertEqual(get_vector_storage(), "halfvec")
+            from_where = self.service._build_from_where("")
+            sql = self.service._build_knn_query({"mode": "hnsw"}, "", from_where)
+        self.assertIn("pe.embedding_256_half IS NOT NULL", from_where)
+        self.assertIn("ORDER BY pe.embedding_256_half <=> %(vector)s", sql)
+        with patch.dict("os.environ", {"VECTOR_STORAGE": "float8"}):
+            with self.assertRaises(ValueError):
+                get_vector_storage()
+
+
+class TestSearchPlanSelection(unittest.TestCase):
+    """필터 선택도 기반 실행 방식 선택 테스트"""
+
+    # 2000년생 남/서울 100명, 1980년생 여/부산 9900명
+    HISTOGRAM_ROWS = [("남", 2000, "서울", 100), ("여", 1980, "부산", 9900)]
+
+    def setUp(self):
+        self.service = _make_service()
+        histogram = DemographicHistogram(ttl_seconds=3600)
+        histogram.load_rows(self.HISTOGRAM_ROWS)
+        self.service._demographic_histogram = histogram
+
+    def tearDown(self):
+        VectorSearchService.reset_instance()
+
+    def _plan(self, filters, limit=100, version=(0, 7, 4), ann_params=None):
+        self.service._pgvector_version = version
+        conditions, params = self.service._build_search_conditions(filters, None)
+        return self.service._choose_search_plan(None, params, " AND ".join(conditions), limit, ann_params)
+
+    def test_histogram_selectivity(self):
+        """성별/지역/연령대 파라미터로 선택도 추정"""
+        histogram = self.service._demographic_histogram
+        self.assertAlmostEqual(histogram.estimate_selectivity({"gender": "남"}), 0.01)
+        self.assertAlmostEqual(histogram.estimate_selectivity({"region": "%부산%"}), 0.99)
+        self.assertEqual(histogram.estimate_matches({}), 10000)
+
+    def test_histogram_reads_compiled_filter_params(self):
+        """compile_demographic_filters 파라미터(birth_year_min_N/max_N, main_region)로 선택도 추정"""
+        histogram = self.service._demographic_histogram
+
+        def selectivity(filters):
+            _, params = compile_demographic_filters(filters, alias="r_info", current_year=2026)
+            return histogram.estimate_selectivity(params)
+
+        self.assertAlmostEqual(selectivity({"age": "20s"}), 0.01)
+        self.assertAlmostEqual(selectivity({"age": "40s", "gender": "F"}), 0.99)
+        self.assertAlmostEqual(selectivity({"age": "20s", "gender": "F"}), 0.0)
+        self.assertAlmostEqual(selectivity({"age": "20s,40s"}), 1.0)
+        self.assertAlmostEqual(selectivity({"age": "60s"}), 0.0)
+        self.assertAlmostEqual(selectivity({"main_region": "부산"}), 0.99)
+
+    def test_selective_filter_uses_exact(self):
+        """필터 통과 행이 적으면 exact"""
+        plan = self._plan({"gender": "남"})
+        self.assertEqual(plan["mode"], "exact")
+        self.assertEqual(plan["estimated_rows"], 100)
+
+    def test_broad_filter_uses_overfetch_on_legacy_pgvector(self):
+        """pgvector 0.8 미만 + 넓은 필터: overfetch"""
+        with patch.dict("os.environ", {"VECTOR_EXACT_SCAN_MAX_ROWS": "50"}):
+            plan = self._plan({"gender": "여"})
+        self.assertEqual(plan["mode"], "overfetch")
+        self.assertGreaterEqual(plan["overfetch_limit"], 100)
+
+    def test_broad_filter_uses_iterative_hnsw(self):
+        """pgvector 0.8+ + 넓은 필터: iterative scan HNSW"""
+        with patch.dict("os.environ", {"VECTOR_EXACT_SCAN_MAX_ROWS": "50"}):
+            plan = self._plan({"gender": "여"}, version=(0, 8, 0))
+        self.assertEqual(plan["mode"], "hnsw")
+        self.assertIsNotNone(plan["max_scan_tuples"])
+
+    def test_unfiltered_large_limit_on_legacy_pgvector_uses_exact(self):
+        """pgvector 0.8 미만 + 필터 없음 + LIMIT > 1000: exact"""
+        self.assertEqual(self._plan(None, limit=100)["mode"], "hnsw")
+        self.assertEqual(self._plan(None, limit=5000)["mode"], "exact")
+
+    def test_ann_params_override(self):
+        """전략/요청별 ef_search, probes 적용"""
+        plan = self._plan(None, limit=100, version=(0, 8, 0), ann_params={"ef_search": 64, "probes": 10})
+        self.assertEqual((plan["ef_search"], plan["probes"]), (64, 10))
+        # pgvector 0.8 미만은 결과가 잘리지 않도록 ef_search >= LIMIT 유지
+        plan = self._plan(None, limit=100, ann_params={"ef_search": 64})
+        self.assertEqual(plan["ef_search"], 100)
+
+    def test_binary_plan(self):
+        """binary 후보 수와 해밍 인덱스 스캔 방식"""
+        self.service._pgvector_version = (0, 7, 4)
+        plan = self.service._choose_binary_plan(None, 50)
+        self.assertEqual((plan["mode"], plan["binary_candidates"], plan["ef_search"]), ("binary", 500, 500))
+        # 후보가 ef_search 최대값(1000)을 넘으면: 0.8 미만은 해밍 전수 계산, 0.8+는 iterative scan
+        self.assertFalse(self.service._choose_binary_plan(None, 5000)["index_scan"])
+        self.service._pgvector_version = (0, 8, 0)
+        self.assertIsNotNone(self.service._choose_binary_plan(None, 5000)["max_scan_tuples"])
+        # binary_quantize 미지원 버전은 일반 실행 계획으로 대체
+        self.service._pgvector_version = (0, 6, 0)
+        self.assertIsNone(self.service._choose_binary_plan(None, 50))
+
+    def test_ann_params_from_env(self):
+        """{prefix}_HNSW_EF_SEARCH / {prefix}_IVFFLAT_PROBES 환경변수"""
+        with patch.dict("os.environ", {"SEMANTIC_HNSW_EF_SEARCH": "200", "SEMANTIC_IVFFLAT_PROBES": "8"}):
+            self.assertEqual(ann_params_from_env("SEMANTIC"), {"ef_search": 200, "probes": 8})
+        self.assertEqual(ann_params_from_env("NOT_CONFIGURED"), {})
+
+
+@unittest.skipUnless(RUN_DB_PLAN_TESTS, "RUN_DB_PLAN_TESTS=true일 때만 실행 (DB 필요)")
+class TestKnnQueryPlan(unittest.TestCase):
+    """EXPLAIN (ANALYZE, BUFFERS) 스냅샷 - HNSW 인덱스 사용 확인"""
+
+    @classmethod
+    def setUpClass(cls):
+        from app.db.connection import get_db_connection
+        cls.conn = get_db_connection()
+        with cls.conn.cursor() as cur:
+            cur.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = 'core_v2' AND tablename = 'doc_embedding' "
+                "AND indexdef ILIKE '%%hnsw%%' AND indexdef ILIKE '%%embedding_256%%'"
+            )
+            cls.hnsw_indexes = [row[0] for row in cur.fetchall()]
+        cls.conn.rollback()
+
+    @classmethod
+    def tearDownClass(cls):
+        from app.db.connection import return_db_connection
+        return_db_connection(cls.conn)
+
+    def setUp(self):
+        if not self.hnsw_indexes:
+            self.skipTest("core_v2.doc_embedding(embedding_256)에 HNSW 인덱스 없음")
+        self.service = _make_service()
+
+    def tearDown(self):
+        VectorSearchService.reset_instance()
+
+    def _explain(self, name, filters=None, limit=100, distance_threshold=None):
+        conditions, params = self.service._build_search_conditions(filters, None)
+        if distance_threshold is not None:
+            conditions.append("pe.embedding_256 <=> %(vector)s < %(distance_threshold)s")
+            params["distance_threshold"] = distance_threshold
+        where_clause = " AND ".join(conditions)
+        params["vector"] = PgVector(np.random.default_rng(0).standard_normal(256))
+        params["limit"] = limit
+        try:
+            with self.conn.cursor() as cur:
+                plan = self.service._choose_search_plan(cur, params, where_clause, limit)
+                self.service._apply_search_plan_settings(cur, plan)
+                if plan.get("overfetch_limit"):
+                    params["overfetch_limit"] = plan["overfetch_limit"]
+                sql = self.service._build_knn_query(plan, where_clause, self.service._build_from_where(where_clause))
+                cur.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params)
+                explain = "\n".join(row[0] for row in cur.fetchall())
+        finally:
+            self.conn.rollback()
+
+        print(f"\n[PLAN] {name} ({plan['mode']})\n{explain}")
+        if os.environ.get("UPDATE_PLAN_SNAPSHOTS", "false").lower() in ("1", "true", "yes"):
+            os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+            with open(os.path.join(SNAPSHOT_DIR, f"{name}.txt"), "w", encoding="utf-8") as f:
+                f.write(explain + "\n")
+        return explain
+
+    def _assert_uses_hnsw(self, plan):
+        self.assertTrue(
+            any(f"Index Scan using {index}" in plan for index in self.hnsw_indexes),
+            f"HNSW 인덱스({self.hnsw_indexes})를 사용하지 않는 실행 계획:\n{plan}"
+        )
+
+    def test_semantic_first_plan_uses_hnsw(self):
+        """semantic_first 형태 (필터 없음 + 거리 임계값)"""
+        self._assert_uses_hnsw(self._explain("semantic_first_knn", limit=100, distance_threshold=0.6))
+
+    def test_unfiltered_plan_uses_hnsw(self):
+        """필터 없는 top-k"""
+        self._assert_uses_hnsw(self._explain("unfiltered_knn", limit=100))
+
+
+if __name__ == '__main__':
+    unittest.main()
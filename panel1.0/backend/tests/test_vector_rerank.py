@@ -0,0 +1,85 @@
+"""
+2단계 검색 (256차원 후보 → 768차원 재정렬) 테스트
+"""
+import unittest
+from unittest.mock import patch
+import numpy as np
+from pgvector import HalfVector, Vector
+from app.services.data.vector import VectorSearchService
+
+
+class _EmbeddingCursor:
+    """vector_send / halfvec_send(embedding_768) 바이너리 조회만 흉내 내는 커서"""
+
+    def __init__(self, vectors, vector_type=Vector):
+        self.vectors = vectors
+        self.vector_type = vector_type
+        self.sql = None
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.sql = sql
+        self._rows = [
+            (rid, memoryview(self.vector_type(self.vectors[rid]).to_binary()))
+            for rid in params["ids"] if rid in self.vectors
+        ]
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestRerankWith768(unittest.TestCase):
+    """768차원 재정렬 테스트"""
+
+    def setUp(self):
+        VectorSearchService.reset_instance()
+        self.service = VectorSearchService.__new__(VectorSearchService)
+
+    def tearDown(self):
+        VectorSearchService.reset_instance()
+
+    def test_reorders_by_exact_768_distance(self):
+        """1단계 순서와 무관하게 768차원 코사인 거리순으로 재정렬"""
+        rng = np.random.default_rng(0)
+        query = rng.standard_normal(768).astype(np.float32)
+        vectors = {
+            "far": -query,
+            "near": query + 0.01 * rng.standard_normal(768).astype(np.float32),
+            "mid": query + rng.standard_normal(768).astype(np.float32),
+        }
+        results = [{"respondent_id": rid, "distance": 0.1 * i} for i, rid in enumerate(["far", "mid", "near"])]
+
+        cur = _EmbeddingCursor(vectors)
+        reranked = self.service._rerank_with_768(cur, results, query, window=10)
+
+        self.assertIn("vector_send(embedding_768)", cur.sql)
+        self.assertEqual([row["respondent_id"] for row in reranked], ["near", "mid", "far"])
+        self.assertAlmostEqual(reranked[-1]["distance"], 2.0, places=4)
+        self.assertEqual(reranked[-1]["distance_256"], 0.0)
+
+    def test_rows_outside_window_keep_first_stage_order(self):
+        """window 밖 후보와 embedding_768이 없는 후보는 뒤에 그대로 유지"""
+        query = np.ones(768, dtype=np.float32)
+        vectors = {"a": -query, "b": query}
+        results = [{"respondent_id": rid, "distance": 0.0} for rid in ["a", "b", "missing", "c"]]
+
+        reranked = self.service._rerank_with_768(_EmbeddingCursor(vectors), results, query, window=3)
+
+        self.assertEqual([row["respondent_id"] for row in reranked], ["b", "a", "missing", "c"])
+        self.assertNotIn("distance_256", reranked[2])
+
+    def test_halfvec_storage_decodes_binary(self):
+        """VECTOR_STORAGE=halfvec: halfvec_send(embedding_768_half) 바이너리 디코딩"""
+        query = np.ones(768, dtype=np.float32)
+        vectors = {"a": -query, "b": query}
+        cur = _EmbeddingCursor(vectors, vector_type=HalfVector)
+        with patch.dict("os.environ", {"VECTOR_STORAGE": "halfvec"}):
+            reranked = self.service._rerank_with_768(cur, [{"respondent_id": "a", "distance": 0.0},
+                                                           {"respondent_id": "b", "distance": 0.1}], query, window=10)
+        self.assertIn("halfvec_send(embedding_768_half)", cur.sql)
+        self.assertEqual([row["respondent_id"] for row in reranked], ["b", "a"])
+        self.assertAlmostEqual(reranked[0]["distance"], 0.0, places=4)
+
+
+if __name__ == '__main__':
+    unittest.main()